@@ -5,6 +5,10 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
+
+Serve it (e.g. ``uvicorn ambu_backend_drf.asgi:application``) to enable the
+buzon server-sent events stream (patient_transport_report/list_buzon/stream/);
+under WSGI that endpoint answers 501 and clients poll list_buzon/changes/.
 """
 
 import os
@@ -52,7 +52,7 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'staff.authentication.CachedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -220,6 +220,83 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# ============================================================================
+# Diagnosis search index (CIE-10 autocomplete)
+# ============================================================================
+
+# Search backend: 'memory' (per-worker index), 'trigram' (PostgreSQL pg_trgm +
+# unaccent, see migration 0005) or 'icontains'. 'trigram' on any other
+# database fails the system checks at startup.
+DIAGNOSIS_SEARCH_BACKEND = os.getenv('DIAGNOSIS_SEARCH_BACKEND', 'memory')
+
+# Seconds before each worker rebuilds its in-memory diagnosis index
+DIAGNOSIS_INDEX_TTL_SECONDS = int(os.getenv('DIAGNOSIS_INDEX_TTL_SECONDS', '300'))
+
+# ============================================================================
+# Token authentication cache (staff.authentication.CachedTokenAuthentication)
+# ============================================================================
+
+# Per-worker LRU: revoked tokens stay valid on other workers for at most
+# AUTH_TOKEN_CACHE_LOCAL_TTL_SECONDS
+AUTH_TOKEN_CACHE_LOCAL_MAX_ENTRIES = int(os.getenv('AUTH_TOKEN_CACHE_LOCAL_MAX_ENTRIES', '1024'))
+AUTH_TOKEN_CACHE_LOCAL_TTL_SECONDS = int(os.getenv('AUTH_TOKEN_CACHE_LOCAL_TTL_SECONDS', '60'))
+
+# Optional shared tier: alias of an entry in CACHES (e.g. Redis). Disabled when empty
+AUTH_TOKEN_CACHE_ALIAS = os.getenv('AUTH_TOKEN_CACHE_ALIAS') or None
+AUTH_TOKEN_CACHE_SHARED_TTL_SECONDS = int(os.getenv('AUTH_TOKEN_CACHE_SHARED_TTL_SECONDS', '300'))
+
+# ============================================================================
+# Buzon (inbox) of patient transport reports
+# ============================================================================
+
+# Hours of reports shown in list_buzon/
+BUZON_WINDOW_HOURS = int(os.getenv('BUZON_WINDOW_HOURS', '48'))
+
+# Shared cache (alias in CACHES, e.g. Redis) for the per-user change counters
+# of list_buzon/changes/; idle polls skip the database. Disabled when empty
+BUZON_CHANGES_CACHE_ALIAS = os.getenv('BUZON_CHANGES_CACHE_ALIAS') or None
+
+# Seconds list_buzon/changes/ re-reads behind each cursor, so saves whose
+# transaction commits after a later one are still sent. Must exceed the
+# longest report-writing transaction
+BUZON_CHANGES_OVERLAP_SECONDS = int(os.getenv('BUZON_CHANGES_OVERLAP_SECONDS', '30'))
+
+# list_buzon/stream/ (SSE, ASGI only): seconds between checks and stream lifetime
+BUZON_SSE_POLL_SECONDS = int(os.getenv('BUZON_SSE_POLL_SECONDS', '5'))
+BUZON_SSE_MAX_SECONDS = int(os.getenv('BUZON_SSE_MAX_SECONDS', '300'))
+
+# ============================================================================
+# Offline sync of patient transport reports
+# ============================================================================
+
+# Maximum number of reports accepted by one sync_reports/ batch
+REPORT_SYNC_MAX_ITEMS = int(os.getenv('REPORT_SYNC_MAX_ITEMS', '50'))
+
+# ============================================================================
+# Autosave of draft reports
+# ============================================================================
+
+# Successive autosaves of one client less than this many seconds apart form
+# one session: they are accepted on any version written by that session
+REPORT_AUTOSAVE_COALESCE_SECONDS = int(os.getenv('REPORT_AUTOSAVE_COALESCE_SECONDS', '10'))
+
+# ============================================================================
+# Ambulance inventory checks
+# ============================================================================
+
+# Seconds before each worker reloads its in-memory checklist catalog
+INVENTORY_CATALOG_TTL_SECONDS = int(os.getenv('INVENTORY_CATALOG_TTL_SECONDS', '300'))
+
+# Maximum number of checks accepted by one submit_checks/ batch
+INVENTORY_SUBMIT_MAX_CHECKS = int(os.getenv('INVENTORY_SUBMIT_MAX_CHECKS', '20'))
+
+# An ambulance is ready only if its latest check is at most this many days old
+INVENTORY_READINESS_MAX_AGE_DAYS = int(os.getenv('INVENTORY_READINESS_MAX_AGE_DAYS', '1'))
+
+# Days averaged by the rolling consumption rate of the daily rollups
+# (written by the calcular_consumo_inventario command)
+INVENTORY_CONSUMPTION_WINDOW_DAYS = int(os.getenv('INVENTORY_CONSUMPTION_WINDOW_DAYS', '7'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/6.0/ref/settings/#default-auto-field
 
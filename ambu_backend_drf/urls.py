@@ -24,4 +24,5 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('staff/', include('staff.urls')),
     path('patient_transport_report/', include('patient_transport_report.urls')),
+    path('daily_monthly_inventory/', include('daily_monthly_inventory.urls')),
 ]
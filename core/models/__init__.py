@@ -1,9 +1,13 @@
 from .time_stamped_model import TimeStampedModel
 from .audited_model import AuditedModel
+from .audited_queryset_model import AuditedQuerySet
 from .active_manager_model import ActiveManager
+from .active_index_model import active_index
 
 __all__ = [
     'TimeStampedModel',
     'AuditedModel',
-    'ActiveManager'
+    'AuditedQuerySet',
+    'ActiveManager',
+    'active_index'
 ]
\ No newline at end of file
@@ -0,0 +1,24 @@
+from django.db import models
+
+def active_index(
+    *fields: str,
+    name: str
+) -> models.Index:
+    '''
+    Partial index over the rows of an AuditedModel that are not soft-deleted.
+
+    ActiveManager adds is_deleted=False to every query, which lets the
+    planner use an index with that same condition. Deleted history then no
+    longer grows the indexes of the hot access paths. Partial indexes need
+    an explicit name.
+
+    Example:
+        indexes = [
+            active_index('created_by', '-created_at', name='ptr_active_author_idx')
+        ]
+    '''
+    return models.Index(
+        fields=list(fields),
+        name=name,
+        condition=models.Q(is_deleted=False)
+    )
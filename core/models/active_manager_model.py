@@ -1,6 +1,7 @@
 from django.db import models
+from .audited_queryset_model import AuditedQuerySet
 
-class ActiveManager(models.Manager):
+class ActiveManager(models.Manager.from_queryset(AuditedQuerySet)):
     '''Manager that excludes soft-deleted records by default'''
     def get_queryset(self):
-        return super().get_queryset().filter(is_deleted=False)
\ No newline at end of file
+        return super().get_queryset().filter(is_deleted=False)
@@ -29,9 +29,10 @@ class AuditedModel(TimeStampedModel):
     )
     
     # Campos opcionales para casos especiales
+    # Not indexed on its own (two values): subclasses declare partial
+    # indexes over their active rows with active_index()
     is_deleted = models.BooleanField(
         default=False,
-        db_index=True,
         help_text='Soft delete flag for GDPR compliance'
     )
     deleted_at = models.DateTimeField(
@@ -48,6 +49,10 @@ class AuditedModel(TimeStampedModel):
         help_text='User who soft deleted this record'
     )
     
+    # Columns read by the model's list serializer, loaded by
+    # AuditedQuerySet.summary(). Related columns use "relation__field".
+    SUMMARY_FIELDS: tuple[str, ...] = ()
+    
     class Meta:
         abstract = True
     
@@ -62,14 +67,14 @@ class AuditedModel(TimeStampedModel):
         self.is_deleted = True
         self.deleted_at = timezone.now()
         self.deleted_by = user
-        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by'])
+        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_at'])
     
     def restore(self):
         '''Restore a soft-deleted record'''
         self.is_deleted = False
         self.deleted_at = None
         self.deleted_by = None
-        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by'])
+        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_at'])
 
 
 class ActiveManager(models.Manager):
@@ -0,0 +1,30 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+
+class AuditedQuerySet(models.QuerySet):
+    '''QuerySet of AuditedModel subclasses with a list-view projection'''
+
+    def summary(
+        self,
+        *extra_fields: str
+    ) -> 'AuditedQuerySet':
+        '''
+        Load only the columns declared in the model's SUMMARY_FIELDS.
+
+        Related paths ("patient__patient_name") are joined with
+        select_related and restricted to the listed columns as well, so
+        wide rows (base64 payloads, password hashes) are never fetched.
+
+        Args:
+            *extra_fields: Columns needed on top of SUMMARY_FIELDS
+
+        Returns:
+            QuerySet with select_related() and only() applied
+        '''
+        fields: tuple[str, ...] = (*self.model.SUMMARY_FIELDS, *extra_fields)
+        if not fields:
+            raise ImproperlyConfigured(
+                f'{self.model.__name__} does not declare SUMMARY_FIELDS'
+            )
+        related: list[str] = sorted({field.rsplit('__', 1)[0] for field in fields if '__' in field})
+        return self.select_related(*related).only(*fields)
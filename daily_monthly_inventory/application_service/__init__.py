@@ -0,0 +1,11 @@
+from .submit_inventory_checks_application_service import SubmitInventoryChecksApplicationService
+from .get_restock_report_application_service import GetRestockReportApplicationService
+from .get_fleet_readiness_application_service import GetFleetReadinessApplicationService
+from .get_item_consumption_application_service import GetItemConsumptionApplicationService
+
+__all__ = [
+    'SubmitInventoryChecksApplicationService',
+    'GetRestockReportApplicationService',
+    'GetFleetReadinessApplicationService',
+    'GetItemConsumptionApplicationService'
+]
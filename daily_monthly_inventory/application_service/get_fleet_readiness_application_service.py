@@ -0,0 +1,65 @@
+from typing import Any
+from django.contrib.auth.models import User
+from ..domain_service import FleetReadinessDomainService
+from ..serializers.out import FleetReadinessSerializer
+from ..types.dataclass import FleetReadiness
+from staff.domain_service import StaffRoleResolver
+from staff.types.dataclass import StaffRole
+import logging
+
+class GetFleetReadinessApplicationService:
+    '''
+    Application service for the readiness summary of the ambulance fleet.
+
+    Business logic:
+    - Verify user is staff (crew or administrative)
+    - Read the readiness of every active ambulance from its latest check
+    '''
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.fleet_readiness_service: FleetReadinessDomainService = FleetReadinessDomainService()
+
+    def get_fleet_readiness(
+        self,
+        user: User
+    ) -> dict[str, Any]:
+        '''
+        Get the readiness summary of the fleet.
+
+        Args:
+            user: Authenticated user making the request
+
+        Returns:
+            dict: {
+                'response': Success/error message
+                'msg': 1 for success, -1 for error
+                'status_code_http': HTTP status code
+                'data': Readiness summary (FleetReadinessSerializer)
+            }
+        '''
+        try:
+            staff_role: StaffRole = StaffRoleResolver().for_user(user)
+            if not (staff_role.is_healthcare or staff_role.is_driver or staff_role.is_admin):
+                return {
+                    'response': 'Solamente el personal puede consultar el estado de la flota.',
+                    'msg': -1,
+                    'status_code_http': 403
+                }
+            fleet: FleetReadiness = self.fleet_readiness_service.summary()
+            return {
+                'response': 'Estado de la flota obtenido exitosamente.',
+                'msg': 1,
+                'status_code_http': 200,
+                'data': FleetReadinessSerializer(fleet).data
+            }
+        except Exception as e:
+            self.logger.error(
+                f'Error in get fleet readiness application service: {str(e)}',
+                exc_info=True
+            )
+            return {
+                'response': 'Ocurrió un error al obtener el estado de la flota.',
+                'msg': -1,
+                'status_code_http': 500
+            }
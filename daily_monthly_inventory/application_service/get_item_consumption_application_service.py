@@ -0,0 +1,104 @@
+from datetime import date
+from typing import Any
+from django.conf import settings
+from django.contrib.auth.models import User
+from ..domain_service import ConsumptionAnalyticsDomainService
+from ..serializers.out import ItemConsumptionSerializer
+from ..types.dataclass import (
+    ChecklistItem,
+    ItemConsumption
+)
+from staff.domain_service import StaffRoleResolver
+from staff.types.dataclass import StaffRole
+import logging
+
+class GetItemConsumptionApplicationService:
+    '''
+    Application service for the consumption analytics of one inventory item.
+
+    Business logic:
+    - Verify user is staff (crew or administrative)
+    - Read the daily rollups of the item, never the inventory checks
+    '''
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.consumption_service: ConsumptionAnalyticsDomainService = ConsumptionAnalyticsDomainService()
+
+    def get_item_consumption(
+        self,
+        user: User,
+        component: str,
+        code: str,
+        ambulance_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None
+    ) -> dict[str, Any]:
+        '''
+        Get the daily consumption of an item.
+
+        Args:
+            user: Authenticated user making the request
+            component: Checklist section of the item
+            code: Code of the item
+            ambulance_id: ID of an ambulance (the whole fleet when None)
+            date_from: First date included (optional)
+            date_to: Last date included (optional)
+
+        Returns:
+            dict: {
+                'response': Success/error message
+                'msg': 1 for success, -1 for error
+                'status_code_http': HTTP status code
+                'data': Item, rolling window and consumption per ambulance and day
+            }
+        '''
+        try:
+            staff_role: StaffRole = StaffRoleResolver().for_user(user)
+            if not (staff_role.is_healthcare or staff_role.is_driver or staff_role.is_admin):
+                return {
+                    'response': 'Solamente el personal puede consultar el consumo del inventario.',
+                    'msg': -1,
+                    'status_code_http': 403
+                }
+            item: ChecklistItem
+            series: list[ItemConsumption]
+            item, series = self.consumption_service.item_consumption(
+                component=component,
+                code=code,
+                ambulance_id=ambulance_id,
+                date_from=date_from,
+                date_to=date_to
+            )
+            return {
+                'response': 'Consumo obtenido exitosamente.',
+                'msg': 1,
+                'status_code_http': 200,
+                'data': {
+                    'component': item.component,
+                    'code': item.code,
+                    'name': item.name,
+                    'window_days': getattr(
+                        settings,
+                        'INVENTORY_CONSUMPTION_WINDOW_DAYS',
+                        ConsumptionAnalyticsDomainService.DEFAULT_WINDOW_DAYS
+                    ),
+                    'series': ItemConsumptionSerializer(series, many=True).data
+                }
+            }
+        except ValueError as e:
+            return {
+                'response': str(e),
+                'msg': -1,
+                'status_code_http': 400
+            }
+        except Exception as e:
+            self.logger.error(
+                f'Error in get item consumption application service: {str(e)}',
+                exc_info=True
+            )
+            return {
+                'response': 'Ocurrió un error al obtener el consumo del inventario.',
+                'msg': -1,
+                'status_code_http': 500
+            }
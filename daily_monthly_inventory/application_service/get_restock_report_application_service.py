@@ -0,0 +1,66 @@
+from typing import Any
+from django.contrib.auth.models import User
+from ..domain_service import StockDeficitDomainService
+from ..serializers.out import FleetRestockReportSerializer
+from ..types.dataclass import FleetRestockReport
+from staff.domain_service import StaffRoleResolver
+from staff.types.dataclass import StaffRole
+import logging
+
+class GetRestockReportApplicationService:
+    '''
+    Application service for the restock report of the ambulance fleet.
+
+    Business logic:
+    - Verify user is staff (crew or administrative)
+    - Compare the latest check of every active ambulance with the targets
+    - Return the missing items per ambulance and for the whole fleet
+    '''
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.stock_deficit_service: StockDeficitDomainService = StockDeficitDomainService()
+
+    def get_restock_report(
+        self,
+        user: User
+    ) -> dict[str, Any]:
+        '''
+        Compute the restock report of the fleet.
+
+        Args:
+            user: Authenticated user making the request
+
+        Returns:
+            dict: {
+                'response': Success/error message
+                'msg': 1 for success, -1 for error
+                'status_code_http': HTTP status code
+                'data': Restock report (FleetRestockReportSerializer)
+            }
+        '''
+        try:
+            staff_role: StaffRole = StaffRoleResolver().for_user(user)
+            if not (staff_role.is_healthcare or staff_role.is_driver or staff_role.is_admin):
+                return {
+                    'response': 'Solamente el personal puede consultar el reporte de reabastecimiento.',
+                    'msg': -1,
+                    'status_code_http': 403
+                }
+            report: FleetRestockReport = self.stock_deficit_service.fleet_report()
+            return {
+                'response': 'Reporte de reabastecimiento generado exitosamente.',
+                'msg': 1,
+                'status_code_http': 200,
+                'data': FleetRestockReportSerializer(report).data
+            }
+        except Exception as e:
+            self.logger.error(
+                f'Error in get restock report application service: {str(e)}',
+                exc_info=True
+            )
+            return {
+                'response': 'Ocurrió un error al generar el reporte de reabastecimiento.',
+                'msg': -1,
+                'status_code_http': 500
+            }
@@ -0,0 +1,91 @@
+from typing import Any
+from django.contrib.auth.models import User
+from ..domain_service import InventoryChecklistDomainService
+from ..models import InventoryCheck
+from ..serializers.input import SubmitInventoryCheckSerializer
+from ..serializers.out import InventoryCheckSummarySerializer
+from ..types.dataclass import InventoryCheckEntry
+from staff.domain_service import StaffRoleResolver
+from staff.types.dataclass import StaffRole
+import logging
+
+class SubmitInventoryChecksApplicationService:
+    '''
+    Application service for the submission of ambulance inventory checks.
+
+    Business logic:
+    - Verify user is ambulance crew (Healthcare or Driver staff)
+    - Store every check of the batch in one transaction, or none
+    - Return the stored checks
+    '''
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.checklist_service: InventoryChecklistDomainService = InventoryChecklistDomainService()
+
+    def submit_checks(
+        self,
+        checks: list[dict[str, Any]],
+        user: User
+    ) -> dict[str, Any]:
+        '''
+        Store a batch of complete inventory checks.
+
+        Args:
+            checks: Validated checks (SubmitInventoryCheckSerializer format)
+            user: Authenticated user making the request
+
+        Returns:
+            dict: {
+                'response': Success/error message
+                'msg': 1 for success, -1 for error
+                'status_code_http': HTTP status code
+                'checks': Stored checks, in request order
+            }
+        '''
+        try:
+            staff_role: StaffRole = StaffRoleResolver().for_user(user)
+            if not (staff_role.is_healthcare or staff_role.is_driver):
+                return {
+                    'response': 'Solamente la tripulación de la ambulancia puede registrar inventarios.',
+                    'msg': -1,
+                    'status_code_http': 403
+                }
+            inventory_checks: list[InventoryCheck] = self.checklist_service.record_many(
+                [self._entry(check) for check in checks],
+                user
+            )
+            return {
+                'response': 'Inventario registrado exitosamente.',
+                'msg': 1,
+                'status_code_http': 201,
+                'checks': InventoryCheckSummarySerializer(inventory_checks, many=True).data
+            }
+        except ValueError as e:
+            return {
+                'response': str(e),
+                'msg': -1,
+                'status_code_http': 400
+            }
+        except Exception as e:
+            self.logger.error(
+                f'Error in submit inventory checks application service: {str(e)}',
+                exc_info=True
+            )
+            return {
+                'response': 'Ocurrió un error al registrar el inventario.',
+                'msg': -1,
+                'status_code_http': 500
+            }
+
+    def _entry(
+        self,
+        check: dict[str, Any]
+    ) -> InventoryCheckEntry:
+        '''Check of the batch with its counts grouped by section.'''
+        return InventoryCheckEntry(
+            ambulance_id=check['ambulance_id'],
+            check_date=check['date'],
+            counts={section: dict(check[section]) for section in SubmitInventoryCheckSerializer.SECTIONS},
+            observations=check['observations']
+        )
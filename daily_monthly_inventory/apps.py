@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class DailyMonthlyInventoryConfig(AppConfig):
     name = 'daily_monthly_inventory'
+
+    def ready(self):
+        from . import signals  # noqa: F401
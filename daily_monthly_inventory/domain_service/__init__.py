@@ -0,0 +1,13 @@
+from .inventory_catalog import InventoryCatalog
+from .inventory_checklist_domain_service import InventoryChecklistDomainService
+from .stock_deficit_domain_service import StockDeficitDomainService
+from .fleet_readiness_domain_service import FleetReadinessDomainService
+from .consumption_analytics_domain_service import ConsumptionAnalyticsDomainService
+
+__all__ = [
+    'InventoryCatalog',
+    'InventoryChecklistDomainService',
+    'StockDeficitDomainService',
+    'FleetReadinessDomainService',
+    'ConsumptionAnalyticsDomainService'
+]
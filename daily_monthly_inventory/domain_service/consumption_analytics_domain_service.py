@@ -0,0 +1,266 @@
+from collections import deque
+from datetime import (
+    date,
+    timedelta
+)
+from typing import (
+    Any,
+    Iterator
+)
+from django.conf import settings
+from django.db import transaction
+from django.db.models import (
+    Max,
+    OuterRef,
+    QuerySet,
+    Subquery
+)
+from django.db.models.fields.json import KeyTransform
+from ..models import (
+    Ambulance,
+    InventoryCheck,
+    InventoryConsumptionRollup
+)
+from ..types.dataclass import (
+    ChecklistItem,
+    ItemConsumption
+)
+from .inventory_catalog import InventoryCatalog
+import logging
+import numpy as np
+
+class RollingConsumption:
+    '''Running sum of the consumption of one ambulance over the last days.'''
+
+    def __init__(
+        self,
+        window_days: int,
+        size: int
+    ):
+        self.window_days: int = window_days
+        self.days: deque[tuple[date, np.ndarray]] = deque()
+        self.total: np.ndarray = np.zeros(size, dtype=np.int64)
+
+    def push(
+        self,
+        day: date,
+        consumed: np.ndarray
+    ) -> np.ndarray:
+        '''Add the consumption of a day and return the rate per day of the window ending on it.'''
+        self.days.append((day, consumed))
+        self.total += consumed
+        while self.days[0][0] <= day - timedelta(days=self.window_days):
+            self.total -= self.days.popleft()[1]
+        return self.total / self.window_days
+
+
+class ConsumptionAnalyticsDomainService:
+    '''
+    Daily consumption rollups of the ambulance inventories.
+
+    Checks are streamed in (ambulance, date) order through a server-side
+    cursor (QuerySet.iterator), so history is never loaded whole. The last
+    check of each day is compared with the previous check day of the same
+    ambulance: units that went down were consumed, units that went up were
+    restocked. A running window per ambulance gives the consumption per day
+    over the last INVENTORY_CONSUMPTION_WINDOW_DAYS days. Results are stored
+    as InventoryConsumptionRollup rows, which dashboards read instead of the
+    checks.
+
+    A rollup from a given date only reads the checks from that date on,
+    plus the previous check and the stored rollups of the window before it.
+    Every rollup records the highest check id read before the run started,
+    so the next run can pick up the checks saved while this one ran.
+    '''
+
+    DEFAULT_WINDOW_DAYS: int = 7
+    CHUNK_SIZE: int = 2000
+    BATCH_SIZE: int = 500
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.catalog: InventoryCatalog = InventoryCatalog.get_instance()
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def rollup(
+        self,
+        date_from: date | None = None
+    ) -> int:
+        '''
+        Recompute the daily rollups from a date on.
+
+        Args:
+            date_from: First day to recompute (the whole history when None)
+
+        Returns:
+            Number of rollups written
+        '''
+        window_days: int = getattr(settings, 'INVENTORY_CONSUMPTION_WINDOW_DAYS', self.DEFAULT_WINDOW_DAYS)
+        size: int = self.catalog.size()
+        checks: QuerySet[InventoryCheck] = InventoryCheck.objects.filter(ambulance__isnull=False)
+        rollups: QuerySet[InventoryConsumptionRollup] = InventoryConsumptionRollup.objects.all()
+        last_check_id: int = InventoryCheck.objects.aggregate(last=Max('id'))['last'] or 0
+        written: int = 0
+        with transaction.atomic():
+            previous: dict[int, tuple[date, np.ndarray]] = {}
+            windows: dict[int, RollingConsumption] = {}
+            if date_from is not None:
+                checks = checks.filter(date__gte=date_from)
+                rollups = rollups.filter(date__gte=date_from)
+                previous = self._previous_days(date_from, size)
+                windows = self._windows(date_from, window_days, size)
+            rollups.delete()
+
+            pending: list[InventoryConsumptionRollup] = []
+            for ambulance_id, day, quantities in self._days(checks, size):
+                before: tuple[date, np.ndarray] | None = previous.get(ambulance_id)
+                previous[ambulance_id] = (day, quantities)
+                if before is None:
+                    # First check of the ambulance: nothing to compare with
+                    continue
+                delta: np.ndarray = before[1] - quantities
+                consumed: np.ndarray = np.clip(delta, 0, None)
+                window: RollingConsumption = windows.setdefault(ambulance_id, RollingConsumption(window_days, size))
+                pending.append(InventoryConsumptionRollup(
+                    ambulance_id=ambulance_id,
+                    date=day,
+                    days=(day - before[0]).days,
+                    consumed=consumed.tolist(),
+                    restocked=np.clip(-delta, 0, None).tolist(),
+                    rolling_rate=np.round(window.push(day, consumed), 3).tolist(),
+                    last_check_id=last_check_id
+                ))
+                if len(pending) >= self.BATCH_SIZE:
+                    written += len(InventoryConsumptionRollup.objects.bulk_create(pending))
+                    pending = []
+            written += len(InventoryConsumptionRollup.objects.bulk_create(pending))
+        self.logger.info(f'Wrote {written} consumption rollups from {date_from or "the first check"}')
+        return written
+
+    def item_consumption(
+        self,
+        component: str,
+        code: str,
+        ambulance_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None
+    ) -> tuple[ChecklistItem, list[ItemConsumption]]:
+        '''
+        Daily consumption of one item, read from the rollups.
+
+        Only the values of the item are extracted from the stored vectors,
+        by the database.
+
+        Args:
+            component: Checklist section of the item
+            code: Code of the item
+            ambulance_id: ID of an ambulance (the whole fleet when None)
+            date_from: First date included (optional)
+            date_to: Last date included (optional)
+
+        Returns:
+            (the item, its consumption per ambulance and day)
+
+        Raises:
+            ValueError: If the item does not exist
+        '''
+        item: ChecklistItem | None = self.catalog.get(component, code)
+        if item is None:
+            raise ValueError(f'Ítem de inventario desconocido: {component}.{code}.')
+        filters: dict[str, Any] = {}
+        if ambulance_id is not None:
+            filters['ambulance_id'] = ambulance_id
+        if date_from is not None:
+            filters['date__gte'] = date_from
+        if date_to is not None:
+            filters['date__lte'] = date_to
+        position: str = str(item.position)
+        rows: QuerySet = InventoryConsumptionRollup.objects.filter(**filters).annotate(
+            item_consumed=KeyTransform(position, 'consumed'),
+            item_restocked=KeyTransform(position, 'restocked'),
+            item_rate=KeyTransform(position, 'rolling_rate')
+        ).order_by('ambulance_id', 'date').values_list(
+            'ambulance_id', 'date', 'days', 'item_consumed', 'item_restocked', 'item_rate'
+        )
+        # Items appended after a rollup are missing from its vectors
+        return item, [
+            ItemConsumption(
+                ambulance_id=row_ambulance_id,
+                date=day,
+                days=days,
+                consumed=consumed or 0,
+                restocked=restocked or 0,
+                rolling_rate=rate or 0.0
+            )
+            for row_ambulance_id, day, days, consumed, restocked, rate in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _days(
+        self,
+        checks: QuerySet[InventoryCheck],
+        size: int
+    ) -> Iterator[tuple[int, date, np.ndarray]]:
+        '''Stream the last check of each ambulance and day, in (ambulance, date) order.'''
+        current: tuple[int, date, list[int]] | None = None
+        for row in checks.order_by('ambulance_id', 'date', 'id').values_list(
+            'ambulance_id', 'date', 'quantities'
+        ).iterator(chunk_size=self.CHUNK_SIZE):
+            if current is not None and current[:2] != row[:2]:
+                yield current[0], current[1], self._vector(current[2], size)
+            current = row
+        if current is not None:
+            yield current[0], current[1], self._vector(current[2], size)
+
+    def _previous_days(
+        self,
+        date_from: date,
+        size: int
+    ) -> dict[int, tuple[date, np.ndarray]]:
+        '''Last check before a date of every ambulance (one lookup per ambulance on the history index).'''
+        latest_ids: QuerySet[Ambulance] = Ambulance.objects.annotate(
+            latest_check_id=Subquery(
+                InventoryCheck.objects.filter(
+                    ambulance=OuterRef('pk'),
+                    date__lt=date_from
+                ).order_by('-date', '-id').values('pk')[:1]
+            )
+        ).values('latest_check_id')
+        return {
+            ambulance_id: (day, self._vector(quantities, size))
+            for ambulance_id, day, quantities in InventoryCheck.objects.filter(
+                pk__in=latest_ids
+            ).order_by().values_list('ambulance_id', 'date', 'quantities')
+        }
+
+    def _windows(
+        self,
+        date_from: date,
+        window_days: int,
+        size: int
+    ) -> dict[int, RollingConsumption]:
+        '''Running windows of every ambulance, filled with the stored rollups just before a date.'''
+        windows: dict[int, RollingConsumption] = {}
+        for ambulance_id, day, consumed in InventoryConsumptionRollup.objects.filter(
+            date__gt=date_from - timedelta(days=window_days),
+            date__lt=date_from
+        ).order_by('ambulance_id', 'date').values_list('ambulance_id', 'date', 'consumed'):
+            windows.setdefault(
+                ambulance_id,
+                RollingConsumption(window_days, size)
+            ).push(day, self._vector(consumed, size))
+        return windows
+
+    def _vector(
+        self,
+        values: list[int],
+        size: int
+    ) -> np.ndarray:
+        '''Packed vector as an array as long as the catalog (missing positions count 0).'''
+        vector: np.ndarray = np.zeros(size, dtype=np.int64)
+        vector[:len(values)] = values[:size]
+        return vector
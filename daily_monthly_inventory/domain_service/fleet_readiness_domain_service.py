@@ -0,0 +1,169 @@
+from datetime import (
+    date,
+    timedelta
+)
+from django.conf import settings
+from django.db.models import (
+    OuterRef,
+    QuerySet,
+    Subquery
+)
+from django.utils import timezone
+from ..models import (
+    Ambulance,
+    AmbulanceReadiness,
+    InventoryCheck
+)
+from ..types.dataclass import (
+    AmbulanceReadinessStatus,
+    FleetReadiness
+)
+from .stock_deficit_domain_service import StockDeficitDomainService
+import logging
+import numpy as np
+
+class FleetReadinessDomainService:
+    '''
+    Maintains the AmbulanceReadiness projection and reads fleet readiness.
+
+    Each ambulance has at most one projection row: its latest check (by
+    date, then id) with the shortfall against the current targets. Rows are
+    refreshed after every check submission or deletion and, for the whole
+    fleet, when the checklist catalog changes. Finding the latest check of
+    an ambulance is one lookup on inventory_check_history_idx, so a refresh
+    costs two statements whatever the history size, and the readiness
+    summary reads one row per ambulance.
+
+    An ambulance is ready when its latest check is at most
+    INVENTORY_READINESS_MAX_AGE_DAYS old and nothing is missing.
+    '''
+
+    READY: str = 'ready'
+    MISSING_ITEMS: str = 'missing_items'
+    OUTDATED: str = 'outdated'
+    UNCHECKED: str = 'unchecked'
+    DEFAULT_MAX_AGE_DAYS: int = 1
+
+    UPDATE_FIELDS: list[str] = [
+        'latest_check',
+        'check_date',
+        'total_shortfall',
+        'missing_items',
+        'updated_at'
+    ]
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.stock_deficit_service: StockDeficitDomainService = StockDeficitDomainService()
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def refresh(
+        self,
+        ambulance_ids: list[int] | None = None
+    ) -> None:
+        '''
+        Recompute the projection rows of some ambulances from their history.
+
+        Args:
+            ambulance_ids: IDs of the ambulances (every ambulance when None)
+        '''
+        ambulances: QuerySet[Ambulance] = Ambulance.objects.all()
+        if ambulance_ids is not None:
+            ambulances = ambulances.filter(pk__in=ambulance_ids)
+        checks: list[InventoryCheck] = list(InventoryCheck.objects.filter(
+            pk__in=ambulances.annotate(
+                latest_check_id=Subquery(
+                    InventoryCheck.objects.filter(
+                        ambulance=OuterRef('pk')
+                    ).order_by('-date', '-id').values('pk')[:1]
+                )
+            ).values('latest_check_id')
+        ).only('ambulance_id', 'date', 'quantities').order_by())
+        if checks:
+            deficit: StockDeficitDomainService = self.stock_deficit_service
+            shortfall: np.ndarray = deficit.shortfall(
+                deficit.matrix([inventory_check.quantities for inventory_check in checks]),
+                deficit.targets()
+            )
+            totals: np.ndarray = shortfall.sum(axis=1)
+            missing: np.ndarray = np.count_nonzero(shortfall, axis=1)
+            AmbulanceReadiness.objects.bulk_create(
+                [
+                    AmbulanceReadiness(
+                        ambulance_id=inventory_check.ambulance_id,
+                        latest_check=inventory_check,
+                        check_date=inventory_check.date,
+                        total_shortfall=int(totals[row]),
+                        missing_items=int(missing[row])
+                    )
+                    for row, inventory_check in enumerate(checks)
+                ],
+                update_conflicts=True,
+                unique_fields=['ambulance'],
+                update_fields=self.UPDATE_FIELDS
+            )
+        checked_ids: set[int] = {inventory_check.ambulance_id for inventory_check in checks}
+        if ambulance_ids is None or checked_ids != set(ambulance_ids):
+            # Ambulances left without checks
+            stale: QuerySet[AmbulanceReadiness] = AmbulanceReadiness.objects.exclude(ambulance_id__in=checked_ids)
+            if ambulance_ids is not None:
+                stale = stale.filter(ambulance_id__in=ambulance_ids)
+            stale.delete()
+        self.logger.info(f'Refreshed readiness of {len(checks)} ambulances')
+
+    def summary(self) -> FleetReadiness:
+        '''
+        Readiness of the active ambulances, from the projection only.
+
+        Returns:
+            FleetReadiness with one status per ambulance
+        '''
+        max_age_days: int = getattr(settings, 'INVENTORY_READINESS_MAX_AGE_DAYS', self.DEFAULT_MAX_AGE_DAYS)
+        oldest: date = timezone.localdate() - timedelta(days=max_age_days)
+        fleet: FleetReadiness = FleetReadiness(
+            status_counts={status: 0 for status in (self.READY, self.MISSING_ITEMS, self.OUTDATED, self.UNCHECKED)}
+        )
+        for ambulance in Ambulance.objects.filter(is_active=True).select_related(
+            'readiness'
+        ).order_by('mobile_number', 'pk'):
+            status: AmbulanceReadinessStatus = self._status(ambulance, oldest)
+            fleet.ambulances.append(status)
+            fleet.status_counts[status.status] += 1
+        fleet.ready_count = fleet.status_counts[self.READY]
+        return fleet
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _status(
+        self,
+        ambulance: Ambulance,
+        oldest: date
+    ) -> AmbulanceReadinessStatus:
+        '''Readiness of an ambulance loaded with its projection row.'''
+        readiness: AmbulanceReadiness | None = getattr(ambulance, 'readiness', None)
+        if readiness is None:
+            return AmbulanceReadinessStatus(
+                ambulance_id=ambulance.pk,
+                mobile_number=ambulance.mobile_number,
+                license_plate=ambulance.license_plate,
+                status=self.UNCHECKED
+            )
+        if readiness.check_date < oldest:
+            status: str = self.OUTDATED
+        elif readiness.total_shortfall:
+            status = self.MISSING_ITEMS
+        else:
+            status = self.READY
+        return AmbulanceReadinessStatus(
+            ambulance_id=ambulance.pk,
+            mobile_number=ambulance.mobile_number,
+            license_plate=ambulance.license_plate,
+            status=status,
+            check_id=readiness.latest_check_id,
+            check_date=readiness.check_date,
+            total_shortfall=readiness.total_shortfall,
+            missing_items=readiness.missing_items
+        )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+from django.conf import settings
+from ..models import InventoryItem
+from ..types.dataclass import ChecklistItem
+import logging
+import threading
+import time
+
+class InventoryCatalog:
+    '''
+    Per-worker, in-memory copy of the inventory checklist catalog.
+
+    The catalog is small and changes only when items are added or retired,
+    so packing and unpacking checks never query it. Loaded on first use.
+
+    Invalidation:
+    - InventoryItem post_save/post_delete signals mark the copy as stale
+    - INVENTORY_CATALOG_TTL_SECONDS forces a periodic reload so changes made
+      by other processes are eventually picked up
+    '''
+
+    DEFAULT_TTL_SECONDS: int = 300
+
+    _instance: InventoryCatalog | None = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock: threading.Lock = threading.Lock()
+        self._items: tuple[ChecklistItem, ...] = ()
+        self._by_code: dict[tuple[str, str], ChecklistItem] = {}
+        self._loaded_at: float | None = None
+        self._stale: bool = True
+
+    @classmethod
+    def get_instance(cls) -> InventoryCatalog:
+        '''Return the process-wide catalog instance.'''
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def invalidate(self) -> None:
+        '''Mark the catalog as stale so it is reloaded on next use.'''
+        self._stale = True
+
+    def items(self) -> tuple[ChecklistItem, ...]:
+        '''Every item (retired ones included), ordered by position.'''
+        self._ensure_loaded()
+        return self._items
+
+    def get(
+        self,
+        component: str,
+        code: str
+    ) -> ChecklistItem | None:
+        '''Item of a section by code, or None when it does not exist.'''
+        self._ensure_loaded()
+        return self._by_code.get((component, code))
+
+    def size(self) -> int:
+        '''Length of a fully packed quantities vector.'''
+        items: tuple[ChecklistItem, ...] = self.items()
+        return items[-1].position + 1 if items else 0
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _ensure_loaded(self) -> None:
+        '''Load the catalog if it was never loaded, is stale or expired.'''
+        ttl: int = getattr(settings, 'INVENTORY_CATALOG_TTL_SECONDS', self.DEFAULT_TTL_SECONDS)
+        expired: bool = self._loaded_at is None or (time.monotonic() - self._loaded_at) > ttl
+        if not (self._stale or expired):
+            return
+        with self._lock:
+            expired = self._loaded_at is None or (time.monotonic() - self._loaded_at) > ttl
+            if self._stale or expired:
+                self._load()
+
+    def _load(self) -> None:
+        '''Read every catalog row.'''
+        # Clear the flag first so changes during the load trigger another one
+        self._stale = False
+        items: tuple[ChecklistItem, ...] = tuple(
+            ChecklistItem(*row)
+            for row in InventoryItem.objects.order_by('position').values_list(
+                'position', 'component', 'code', 'name', 'max_quantity', 'is_active'
+            )
+        )
+        self._by_code = {(item.component, item.code): item for item in items}
+        self._items = items
+        self._loaded_at = time.monotonic()
+        self.logger.info(f'Loaded inventory catalog ({len(items)} items)')
@@ -0,0 +1,183 @@
+from datetime import date
+from typing import Any
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import QuerySet
+from ..models import (
+    Ambulance,
+    InventoryCheck
+)
+from ..types.dataclass import (
+    ChecklistItem,
+    InventoryCheckEntry
+)
+from .inventory_catalog import InventoryCatalog
+from .fleet_readiness_domain_service import FleetReadinessDomainService
+import logging
+
+class InventoryChecklistDomainService:
+    '''
+    Columnar store of ambulance inventory checks.
+
+    Counts come grouped by checklist section, e.g.
+    {'circulatory': {'syringe_1cc': 4}, 'respiratory': {...}}, and are kept
+    in one InventoryCheck row as a vector indexed by catalog position
+    (items not given count 0). Recording a check is one INSERT and
+    reading history scans InventoryCheck alone; the catalog is resolved in
+    memory (InventoryCatalog). A batch of checks costs one ambulance lookup
+    and one INSERT, whatever its size, plus the refresh of the readiness
+    projection of its ambulances (FleetReadinessDomainService).
+    '''
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.catalog: InventoryCatalog = InventoryCatalog.get_instance()
+        self.readiness_service: FleetReadinessDomainService = FleetReadinessDomainService()
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def pack(
+        self,
+        counts: dict[str, dict[str, int]]
+    ) -> list[int]:
+        '''
+        Vector of a check, indexed by catalog position.
+
+        Args:
+            counts: Count per item code, grouped by section
+
+        Returns:
+            list of counts as long as the catalog
+
+        Raises:
+            ValueError: If an item is unknown or retired, or a count is out
+                of the range 0..max_quantity of its item
+        '''
+        quantities: list[int] = [0] * self.catalog.size()
+        for component, items in counts.items():
+            for code, quantity in items.items():
+                item: ChecklistItem | None = self.catalog.get(component, code)
+                if item is None:
+                    raise ValueError(f'Ítem de inventario desconocido: {component}.{code}.')
+                if not item.is_active:
+                    raise ValueError(f'El ítem {component}.{code} ya no hace parte del inventario.')
+                if isinstance(quantity, bool) or not isinstance(quantity, int) or not 0 <= quantity <= item.max_quantity:
+                    raise ValueError(
+                        f'La cantidad de {component}.{code} debe ser un entero entre 0 y {item.max_quantity}.'
+                    )
+                quantities[item.position] = quantity
+        return quantities
+
+    def unpack(
+        self,
+        quantities: list[int]
+    ) -> dict[str, dict[str, int]]:
+        '''Counts of a stored vector grouped by section, with every active item.'''
+        counts: dict[str, dict[str, int]] = {}
+        for item in self.catalog.items():
+            if item.is_active:
+                counts.setdefault(item.component, {})[item.code] = (
+                    quantities[item.position] if item.position < len(quantities) else 0
+                )
+        return counts
+
+    def record(
+        self,
+        ambulance_id: int,
+        user: User,
+        check_date: date,
+        counts: dict[str, dict[str, int]],
+        observations: str = ''
+    ) -> InventoryCheck:
+        '''
+        Store an inventory check (see record_many()).
+
+        Args:
+            ambulance_id: ID of the checked ambulance
+            user: Staff member who made the check
+            check_date: Date of the check
+            counts: Count per item code, grouped by section
+            observations: Free-text notes
+
+        Returns:
+            The new InventoryCheck
+
+        Raises:
+            ValueError: See record_many()
+        '''
+        return self.record_many([
+            InventoryCheckEntry(
+                ambulance_id=ambulance_id,
+                check_date=check_date,
+                counts=counts,
+                observations=observations
+            )
+        ], user)[0]
+
+    def record_many(
+        self,
+        entries: list[InventoryCheckEntry],
+        user: User
+    ) -> list[InventoryCheck]:
+        '''
+        Store a batch of inventory checks in one transaction.
+
+        Args:
+            entries: Checks to store, of active ambulances
+            user: Staff member who made the checks
+
+        Returns:
+            The new InventoryChecks, in the same order
+
+        Raises:
+            ValueError: If an ambulance does not exist or is inactive, or
+                see pack(); nothing is written
+        '''
+        inventory_checks: list[InventoryCheck] = [
+            InventoryCheck(
+                ambulance_id=entry.ambulance_id,
+                system_user=user,
+                date=entry.check_date,
+                quantities=self.pack(entry.counts),
+                observations=entry.observations
+            )
+            for entry in entries
+        ]
+        with transaction.atomic():
+            # Lock the ambulances so none is deactivated while the batch is written
+            active_ids: set[int] = set(Ambulance.objects.select_for_update().filter(
+                pk__in={entry.ambulance_id for entry in entries},
+                is_active=True
+            ).values_list('pk', flat=True))
+            for entry in entries:
+                if entry.ambulance_id not in active_ids:
+                    raise ValueError(f'No existe una ambulancia activa con ID {entry.ambulance_id}.')
+            InventoryCheck.objects.bulk_create(inventory_checks)
+            self.readiness_service.refresh(list(active_ids))
+        self.logger.info(
+            f'User {user.username} recorded {len(inventory_checks)} inventory checks of ambulances '
+            f'{", ".join(str(entry.ambulance_id) for entry in entries)}'
+        )
+        return inventory_checks
+
+    def history(
+        self,
+        ambulance_id: int,
+        date_from: date | None = None,
+        date_to: date | None = None
+    ) -> QuerySet[InventoryCheck]:
+        '''
+        Checks of one ambulance, newest first (inventory_check_history_idx).
+
+        Args:
+            ambulance_id: ID of the ambulance
+            date_from: First date included (optional)
+            date_to: Last date included (optional)
+        '''
+        filters: dict[str, Any] = {'ambulance_id': ambulance_id}
+        if date_from is not None:
+            filters['date__gte'] = date_from
+        if date_to is not None:
+            filters['date__lte'] = date_to
+        return InventoryCheck.objects.filter(**filters).order_by('-date', '-id')
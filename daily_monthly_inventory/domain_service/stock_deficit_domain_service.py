@@ -0,0 +1,137 @@
+from ..models import (
+    Ambulance,
+    InventoryCheck
+)
+from ..types.dataclass import (
+    AmbulanceRestock,
+    ChecklistItem,
+    FleetRestockReport,
+    ItemRestockTotal,
+    ItemShortfall
+)
+from .inventory_catalog import InventoryCatalog
+import logging
+import numpy as np
+
+class StockDeficitDomainService:
+    '''
+    Shortfall of every active ambulance against the checklist targets.
+
+    The target of an item is the max_quantity of the catalog, i.e. the
+    MaxValueValidator of its legacy column. The latest check of each
+    ambulance (AmbulanceReadiness) is loaded as one row of a matrix indexed
+    by catalog position (ambulances as rows, items as columns), and the
+    shortfall of the whole fleet is computed with one NumPy subtraction
+    against the target vector.
+    Retired items have a target of 0, so they never count as missing.
+    '''
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.catalog: InventoryCatalog = InventoryCatalog.get_instance()
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def fleet_report(self) -> FleetRestockReport:
+        '''
+        Restock needs of the active ambulances from their latest checks,
+        read with one query.
+
+        Returns:
+            FleetRestockReport with the ambulances missing items, the
+            missing units per item across the fleet and the ambulances
+            never checked
+        '''
+        ambulances: list[Ambulance] = list(Ambulance.objects.filter(is_active=True).select_related(
+            'readiness__latest_check'
+        ).order_by('mobile_number', 'pk'))
+        checks: dict[int, InventoryCheck] = {
+            ambulance.pk: ambulance.readiness.latest_check
+            for ambulance in ambulances
+            if hasattr(ambulance, 'readiness')
+        }
+        checked: list[Ambulance] = [ambulance for ambulance in ambulances if ambulance.pk in checks]
+
+        items: tuple[ChecklistItem, ...] = self.catalog.items()
+        targets: np.ndarray = self.targets()
+        quantities: np.ndarray = self.matrix([checks[ambulance.pk].quantities for ambulance in checked])
+        shortfall: np.ndarray = self.shortfall(quantities, targets)
+
+        by_position: dict[int, ChecklistItem] = {item.position: item for item in items}
+        report: FleetRestockReport = FleetRestockReport(
+            unchecked_ambulance_ids=[ambulance.pk for ambulance in ambulances if ambulance.pk not in checks]
+        )
+        for row, ambulance in enumerate(checked):
+            missing: np.ndarray = np.flatnonzero(shortfall[row])
+            if not missing.size:
+                continue
+            inventory_check: InventoryCheck = checks[ambulance.pk]
+            report.ambulances.append(AmbulanceRestock(
+                ambulance_id=ambulance.pk,
+                mobile_number=ambulance.mobile_number,
+                license_plate=ambulance.license_plate,
+                check_id=inventory_check.pk,
+                check_date=inventory_check.date,
+                total_shortfall=int(shortfall[row].sum()),
+                items=[
+                    ItemShortfall(
+                        component=by_position[position].component,
+                        code=by_position[position].code,
+                        name=by_position[position].name,
+                        target=int(targets[position]),
+                        quantity=int(quantities[row, position]),
+                        shortfall=int(shortfall[row, position])
+                    )
+                    for position in missing.tolist()
+                ]
+            ))
+        report.ambulances.sort(key=lambda restock: restock.total_shortfall, reverse=True)
+
+        fleet_shortfall: np.ndarray = shortfall.sum(axis=0)
+        ambulance_counts: np.ndarray = np.count_nonzero(shortfall, axis=0)
+        report.totals = [
+            ItemRestockTotal(
+                component=by_position[position].component,
+                code=by_position[position].code,
+                name=by_position[position].name,
+                shortfall=int(fleet_shortfall[position]),
+                ambulance_count=int(ambulance_counts[position])
+            )
+            for position in np.flatnonzero(fleet_shortfall).tolist()
+        ]
+        self.logger.info(
+            f'Computed restock report: {len(report.ambulances)} of {len(checked)} checked ambulances missing items'
+        )
+        return report
+
+    def targets(self) -> np.ndarray:
+        '''Target quantity per catalog position (0 for retired items).'''
+        targets: np.ndarray = np.zeros(self.catalog.size(), dtype=np.int64)
+        for item in self.catalog.items():
+            if item.is_active:
+                targets[item.position] = item.max_quantity
+        return targets
+
+    def matrix(
+        self,
+        vectors: list[list[int]]
+    ) -> np.ndarray:
+        '''
+        Stack packed quantity vectors into an (ambulances x items) matrix.
+
+        Vectors written before items were appended to the catalog are
+        shorter: the missing columns count 0.
+        '''
+        quantities: np.ndarray = np.zeros((len(vectors), self.catalog.size()), dtype=np.int64)
+        for row, vector in enumerate(vectors):
+            quantities[row, :len(vector)] = vector[:quantities.shape[1]]
+        return quantities
+
+    def shortfall(
+        self,
+        quantities: np.ndarray,
+        targets: np.ndarray
+    ) -> np.ndarray:
+        '''Missing units per ambulance and item (never negative).'''
+        return np.clip(targets - quantities, 0, None)
@@ -0,0 +1,71 @@
+import time
+from datetime import date
+from django.core.management.base import (
+    BaseCommand,
+    CommandError
+)
+from django.db.models import (
+    Max,
+    Min
+)
+from ...models import (
+    InventoryCheck,
+    InventoryConsumptionRollup
+)
+from ...domain_service import ConsumptionAnalyticsDomainService
+
+
+class Command(BaseCommand):
+    help: str = 'Calcula los acumulados diarios de consumo del inventario de las ambulancias'
+
+    def add_arguments(
+        self,
+        parser
+    ):
+        parser.add_argument(
+            '--desde',
+            type=date.fromisoformat,
+            help='Primer día a recalcular, AAAA-MM-DD (por defecto el día más antiguo con chequeos nuevos)'
+        )
+        parser.add_argument(
+            '--completo',
+            action='store_true',
+            help='Recalcular todo el historial'
+        )
+
+    def handle(
+        self,
+        *args: tuple,
+        **options: dict
+    ):
+        if options['completo'] and options['desde']:
+            raise CommandError('Use --desde o --completo, no ambos.')
+        desde: date | None = None
+        if options['desde']:
+            desde = options['desde']
+        elif not options['completo']:
+            # Último chequeo existente al iniciar la ejecución anterior: los
+            # guardados mientras corría quedan después de esta marca
+            ultimo_chequeo = InventoryConsumptionRollup.objects.aggregate(ultimo=Max('last_check_id'))['ultimo']
+            if ultimo_chequeo is not None:
+                # Los chequeos se pueden registrar con fecha atrasada: se recalcula
+                # desde el día más antiguo entre los posteriores a la marca
+                desde = InventoryCheck.objects.filter(
+                    id__gt=ultimo_chequeo,
+                    ambulance__isnull=False
+                ).aggregate(primero=Min('date'))['primero']
+                if desde is None:
+                    self.stdout.write(self.style.SUCCESS('Sin chequeos nuevos desde la última ejecución.'))
+                    return
+
+        inicio = time.perf_counter()
+        escritos: int = ConsumptionAnalyticsDomainService().rollup(desde)
+        duracion = time.perf_counter() - inicio
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Proceso completado:\n'
+                f'- Desde: {desde or "el primer chequeo"}\n'
+                f'- Acumulados escritos: {escritos}\n'
+                f'- Tiempo total: {duracion:.2f} s'
+            )
+        )
@@ -0,0 +1,132 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.core.validators import MaxValueValidator
+from django.db import migrations, models
+
+
+# Sections of the checklist: DailyMonthlyInventory foreign keys to the
+# legacy component tables, in declaration order (catalog positions follow
+# this order, then the column order of each table)
+COMPONENTS = [
+    'biomedical_equipment',
+    'accessories_case',
+    'respiratory',
+    'immobilization_and_safety',
+    'surgical',
+    'accessories',
+    'additionals',
+    'pediatric',
+    'circulatory',
+    'ambulance_kit',
+]
+BATCH_SIZE = 500
+
+
+def catalog_columns(apps):
+    '''(component, field) of every count column of the legacy tables.'''
+    inventory_model = apps.get_model('daily_monthly_inventory', 'DailyMonthlyInventory')
+    columns = []
+    for component in COMPONENTS:
+        component_model = inventory_model._meta.get_field(component).related_model
+        for field in component_model._meta.concrete_fields:
+            if isinstance(field, models.IntegerField) and not field.primary_key:
+                columns.append((component, field))
+    return columns
+
+
+def seed_catalog_and_pack_history(apps, schema_editor):
+    InventoryItem = apps.get_model('daily_monthly_inventory', 'InventoryItem')
+    InventoryCheck = apps.get_model('daily_monthly_inventory', 'InventoryCheck')
+    DailyMonthlyInventory = apps.get_model('daily_monthly_inventory', 'DailyMonthlyInventory')
+    columns = catalog_columns(apps)
+    items = []
+    for position, (component, field) in enumerate(columns):
+        limits = [validator.limit_value for validator in field.validators if isinstance(validator, MaxValueValidator)]
+        items.append(InventoryItem(
+            position=position,
+            component=component,
+            code=field.name,
+            name=(field.help_text or field.name).removesuffix(' quantity'),
+            max_quantity=min(limits) if limits else 0
+        ))
+    InventoryItem.objects.bulk_create(items)
+
+    legacy = DailyMonthlyInventory.objects.select_related(*COMPONENTS).order_by('id')
+    batch = []
+    for inventory in legacy.iterator(chunk_size=BATCH_SIZE):
+        quantities = []
+        for component, field in columns:
+            record = getattr(inventory, component)
+            quantities.append(getattr(record, field.attname) if record is not None else 0)
+        batch.append((InventoryCheck(
+            ambulance_id=inventory.ambulance_id,
+            system_user_id=inventory.system_user_id,
+            date=inventory.date,
+            quantities=quantities,
+            observations=inventory.observations
+        ), inventory.created_at))
+        if len(batch) == BATCH_SIZE:
+            insert_checks(InventoryCheck, batch)
+            batch = []
+    insert_checks(InventoryCheck, batch)
+
+
+def insert_checks(InventoryCheck, batch):
+    '''Insert packed checks keeping the created_at of their legacy rows.'''
+    if not batch:
+        return
+    checks = InventoryCheck.objects.bulk_create([check for check, _ in batch])
+    # auto_now_add overwrote created_at on insert
+    for check, (_, created_at) in zip(checks, batch):
+        check.created_at = created_at
+    InventoryCheck.objects.bulk_update(checks, ['created_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('daily_monthly_inventory', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InventoryItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField(help_text='Index in InventoryCheck.quantities', unique=True)),
+                ('component', models.CharField(help_text='Checklist section (legacy component table, e.g. circulatory)', max_length=50)),
+                ('code', models.CharField(help_text='Item code within its section (legacy column name)', max_length=100)),
+                ('name', models.CharField(max_length=200)),
+                ('max_quantity', models.PositiveSmallIntegerField(help_text='Stock of a fully equipped ambulance (upper bound of a count)')),
+                ('is_active', models.BooleanField(default=True)),
+            ],
+            options={
+                'verbose_name': 'Inventory Item',
+                'verbose_name_plural': 'Inventory Items',
+                'ordering': ['position'],
+                'constraints': [models.UniqueConstraint(fields=('component', 'code'), name='inventory_item_code_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='InventoryCheck',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('quantities', models.JSONField(default=list, help_text='Count per InventoryItem.position')),
+                ('observations', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('ambulance', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='inventory_checks', to='daily_monthly_inventory.ambulance')),
+                ('system_user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Inventory Check',
+                'verbose_name_plural': 'Inventory Checks',
+                'ordering': ['-date', '-id'],
+                'indexes': [models.Index(fields=['ambulance', '-date', '-id'], name='inventory_check_history_idx')],
+            },
+        ),
+        migrations.RunPython(seed_catalog_and_pack_history, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_projection(apps, schema_editor):
+    '''One AmbulanceReadiness row per ambulance with checks, from its latest check.'''
+    InventoryItem = apps.get_model('daily_monthly_inventory', 'InventoryItem')
+    InventoryCheck = apps.get_model('daily_monthly_inventory', 'InventoryCheck')
+    AmbulanceReadiness = apps.get_model('daily_monthly_inventory', 'AmbulanceReadiness')
+    targets = dict(
+        InventoryItem.objects.filter(is_active=True).values_list('position', 'max_quantity')
+    )
+    rows = []
+    seen = set()
+    for inventory_check in InventoryCheck.objects.filter(
+        ambulance__isnull=False
+    ).order_by('ambulance_id', '-date', '-id').only('ambulance_id', 'date', 'quantities').iterator():
+        if inventory_check.ambulance_id in seen:
+            continue
+        seen.add(inventory_check.ambulance_id)
+        quantities = inventory_check.quantities
+        shortfall = [
+            target - (quantities[position] if position < len(quantities) else 0)
+            for position, target in targets.items()
+        ]
+        missing = [units for units in shortfall if units > 0]
+        rows.append(AmbulanceReadiness(
+            ambulance_id=inventory_check.ambulance_id,
+            latest_check_id=inventory_check.pk,
+            check_date=inventory_check.date,
+            total_shortfall=sum(missing),
+            missing_items=len(missing)
+        ))
+    AmbulanceReadiness.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('daily_monthly_inventory', '0002_inventory_checklist_store'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AmbulanceReadiness',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('check_date', models.DateField()),
+                ('total_shortfall', models.PositiveIntegerField(default=0, help_text='Units missing against the checklist targets')),
+                ('missing_items', models.PositiveIntegerField(default=0, help_text='Checklist items with at least one unit missing')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Ambulance Readiness',
+                'verbose_name_plural': 'Ambulance Readiness',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='dailymonthlyinventory',
+            index=models.Index(fields=['ambulance', '-date', '-id'], name='daily_inventory_latest_idx'),
+        ),
+        migrations.AddField(
+            model_name='ambulancereadiness',
+            name='ambulance',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='readiness', to='daily_monthly_inventory.ambulance'),
+        ),
+        migrations.AddField(
+            model_name='ambulancereadiness',
+            name='latest_check',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='daily_monthly_inventory.inventorycheck'),
+        ),
+        migrations.AddIndex(
+            model_name='ambulancereadiness',
+            index=models.Index(fields=['total_shortfall', 'check_date'], name='ambulance_readiness_idx'),
+        ),
+        migrations.RunPython(build_projection, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('daily_monthly_inventory', '0003_ambulance_readiness_projection'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InventoryConsumptionRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('days', models.PositiveIntegerField(help_text='Days since the previous check of the ambulance')),
+                ('consumed', models.JSONField(default=list, help_text='Units consumed per InventoryItem.position')),
+                ('restocked', models.JSONField(default=list, help_text='Units restocked per InventoryItem.position')),
+                ('rolling_rate', models.JSONField(default=list, help_text='Average units consumed per day over the rolling window')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('ambulance', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='consumption_rollups', to='daily_monthly_inventory.ambulance')),
+            ],
+            options={
+                'verbose_name': 'Inventory Consumption Rollup',
+                'verbose_name_plural': 'Inventory Consumption Rollups',
+                'ordering': ['ambulance', 'date'],
+                'indexes': [models.Index(fields=['date'], name='consumption_rollup_date_idx')],
+                'constraints': [models.UniqueConstraint(fields=('ambulance', 'date'), name='consumption_rollup_day_uniq')],
+            },
+        ),
+    ]
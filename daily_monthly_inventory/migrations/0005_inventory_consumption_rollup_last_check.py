@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('daily_monthly_inventory', '0004_inventory_consumption_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='inventoryconsumptionrollup',
+            name='last_check_id',
+            field=models.PositiveBigIntegerField(default=0, help_text='Highest InventoryCheck id when the run that wrote this rollup started'),
+        ),
+    ]
@@ -12,6 +12,10 @@ from .circulatory import Circulatory
 from .ambulance_kit import AmbulanceKit
 from .daily_monthly_inventory import DailyMonthlyInventory
 from .ambulance import Ambulance
+from .inventory_item import InventoryItem
+from .inventory_check import InventoryCheck
+from .ambulance_readiness import AmbulanceReadiness
+from .inventory_consumption_rollup import InventoryConsumptionRollup
 
 __all__ = [
 	'BiomedicalEquipment',
@@ -27,5 +31,9 @@ __all__ = [
 	'DailyMonthlyInventory',
 	'DailyMonthlyInventory',
 	'Ambulance',
+	'InventoryItem',
+	'InventoryCheck',
+	'AmbulanceReadiness',
+	'InventoryConsumptionRollup',
 ]
 
@@ -0,0 +1,45 @@
+from django.db import models
+from .ambulance import Ambulance
+from .inventory_check import InventoryCheck
+
+class AmbulanceReadiness(models.Model):
+    '''
+    Latest inventory check of each ambulance, with its shortfall.
+
+    Projection of InventoryCheck kept up to date by
+    FleetReadinessDomainService on every check submission and catalog
+    change, so "which ambulances are ready" reads one row per ambulance
+    instead of the whole inventory history.
+    '''
+
+    ambulance = models.OneToOneField(
+        Ambulance,
+        on_delete=models.CASCADE,
+        related_name='readiness'
+    )
+    latest_check = models.ForeignKey(
+        InventoryCheck,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    check_date = models.DateField()
+    total_shortfall = models.PositiveIntegerField(
+        default=0,
+        help_text='Units missing against the checklist targets'
+    )
+    missing_items = models.PositiveIntegerField(
+        default=0,
+        help_text='Checklist items with at least one unit missing'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Ambulance Readiness'
+        verbose_name_plural = 'Ambulance Readiness'
+        indexes = [
+            # Ready ambulances: recent checks without shortfall
+            models.Index(fields=['total_shortfall', 'check_date'], name='ambulance_readiness_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'AmbulanceReadiness #{self.ambulance_id} ({self.check_date})'
@@ -97,5 +97,11 @@ class DailyMonthlyInventory(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Latest legacy inventory of an ambulance
+            models.Index(fields=['ambulance', '-date', '-id'], name='daily_inventory_latest_idx'),
+        ]
+
     def __str__(self):
         return f"DailyMonthlyInventory {self.date} ({self.pk})"
@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.db import models
+from .ambulance import Ambulance
+
+class InventoryCheck(models.Model):
+    '''
+    One inventory check of an ambulance, stored as a single packed row.
+
+    quantities holds the count of every InventoryItem at the index given by
+    its position (a JSON array of integers). Positions past the end of the
+    array, i.e. items added to the catalog after the check, count as 0.
+    Replaces the eleven-row layout of DailyMonthlyInventory: a check is one
+    INSERT and history scans read one narrow table.
+    '''
+
+    ambulance = models.ForeignKey(
+        Ambulance,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='inventory_checks'
+    )
+    system_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True
+    )
+    date = models.DateField()
+    quantities = models.JSONField(
+        default=list,
+        help_text='Count per InventoryItem.position'
+    )
+    observations = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Inventory Check'
+        verbose_name_plural = 'Inventory Checks'
+        ordering = ['-date', '-id']
+        indexes = [
+            # History of one ambulance, newest first
+            models.Index(fields=['ambulance', '-date', '-id'], name='inventory_check_history_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'InventoryCheck {self.date} ({self.pk})'
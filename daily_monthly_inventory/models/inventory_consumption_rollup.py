@@ -0,0 +1,58 @@
+from django.db import models
+from .ambulance import Ambulance
+
+class InventoryConsumptionRollup(models.Model):
+    '''
+    Daily consumption of one ambulance, pre-aggregated from its checks.
+
+    Vectors are indexed by InventoryItem.position, like
+    InventoryCheck.quantities. consumed and restocked are the units that
+    went down and up since the previous check day (days apart);
+    rolling_rate is the consumption per day over the last
+    INVENTORY_CONSUMPTION_WINDOW_DAYS days. last_check_id is the highest
+    InventoryCheck id that existed when the run that wrote the rollup
+    started. Written by ConsumptionAnalyticsDomainService, read by the
+    dashboards.
+    '''
+
+    ambulance = models.ForeignKey(
+        Ambulance,
+        on_delete=models.CASCADE,
+        related_name='consumption_rollups'
+    )
+    date = models.DateField()
+    days = models.PositiveIntegerField(
+        help_text='Days since the previous check of the ambulance'
+    )
+    consumed = models.JSONField(
+        default=list,
+        help_text='Units consumed per InventoryItem.position'
+    )
+    restocked = models.JSONField(
+        default=list,
+        help_text='Units restocked per InventoryItem.position'
+    )
+    rolling_rate = models.JSONField(
+        default=list,
+        help_text='Average units consumed per day over the rolling window'
+    )
+    last_check_id = models.PositiveBigIntegerField(
+        default=0,
+        help_text='Highest InventoryCheck id when the run that wrote this rollup started'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Inventory Consumption Rollup'
+        verbose_name_plural = 'Inventory Consumption Rollups'
+        ordering = ['ambulance', 'date']
+        constraints = [
+            models.UniqueConstraint(fields=['ambulance', 'date'], name='consumption_rollup_day_uniq'),
+        ]
+        indexes = [
+            # Fleet dashboards over a date range
+            models.Index(fields=['date'], name='consumption_rollup_date_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f'InventoryConsumptionRollup #{self.ambulance_id} {self.date}'
@@ -0,0 +1,41 @@
+from django.db import models
+
+class InventoryItem(models.Model):
+    '''
+    Entry of the fixed inventory checklist catalog.
+
+    position is the index of the item in the packed quantities of
+    InventoryCheck. Positions are never reused nor renumbered: retired
+    items are deactivated and new ones are appended, so every stored check
+    can still be read. Seeded from the columns of the legacy component
+    tables (BiomedicalEquipment, Circulatory, ...).
+    '''
+
+    position = models.PositiveSmallIntegerField(
+        unique=True,
+        help_text='Index in InventoryCheck.quantities'
+    )
+    component = models.CharField(
+        max_length=50,
+        help_text='Checklist section (legacy component table, e.g. circulatory)'
+    )
+    code = models.CharField(
+        max_length=100,
+        help_text='Item code within its section (legacy column name)'
+    )
+    name = models.CharField(max_length=200)
+    max_quantity = models.PositiveSmallIntegerField(
+        help_text='Stock of a fully equipped ambulance (upper bound of a count)'
+    )
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        verbose_name = 'Inventory Item'
+        verbose_name_plural = 'Inventory Items'
+        ordering = ['position']
+        constraints = [
+            models.UniqueConstraint(fields=['component', 'code'], name='inventory_item_code_uniq'),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.component}.{self.code} (#{self.position})'
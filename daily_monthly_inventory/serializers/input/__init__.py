@@ -0,0 +1,9 @@
+from .submit_inventory_check_serializer import SubmitInventoryCheckSerializer
+from .submit_inventory_checks_serializer import SubmitInventoryChecksSerializer
+from .item_consumption_query_serializer import ItemConsumptionQuerySerializer
+
+__all__ = [
+    'SubmitInventoryCheckSerializer',
+    'SubmitInventoryChecksSerializer',
+    'ItemConsumptionQuerySerializer'
+]
@@ -0,0 +1,108 @@
+from rest_framework import serializers
+from daily_monthly_inventory.models import (
+    BiomedicalEquipment,
+    AccessoriesCase,
+    Respiratory,
+    ImmobilizationAndSafety,
+    Surgical,
+    Accessories,
+    Additionals,
+    Pediatric,
+    Circulatory,
+    AmbulanceKit
+)
+
+class SectionCountsSerializer(serializers.ModelSerializer):
+    '''
+    Counts of one checklist section.
+
+    Fields come from the legacy component model, so every count is checked
+    against the MaxValueValidator of its column. Items left out count 0.
+    '''
+
+    def build_standard_field(self, field_name, model_field):
+        field_class, field_kwargs = super().build_standard_field(field_name, model_field)
+        if issubclass(field_class, serializers.IntegerField):
+            # The columns only bound the database range below: counts start at 0
+            field_kwargs['min_value'] = max(field_kwargs.get('min_value', 0), 0)
+        return field_class, field_kwargs
+
+
+class BiomedicalEquipmentCountsSerializer(SectionCountsSerializer):
+    '''Counts of the biomedical equipment section.'''
+
+    class Meta:
+        model = BiomedicalEquipment
+        exclude = ['id']
+
+
+class AccessoriesCaseCountsSerializer(SectionCountsSerializer):
+    '''Counts of the accessories case section.'''
+
+    class Meta:
+        model = AccessoriesCase
+        exclude = ['id']
+
+
+class RespiratoryCountsSerializer(SectionCountsSerializer):
+    '''Counts of the respiratory section.'''
+
+    class Meta:
+        model = Respiratory
+        exclude = ['id']
+
+
+class ImmobilizationAndSafetyCountsSerializer(SectionCountsSerializer):
+    '''Counts of the immobilization and safety section.'''
+
+    class Meta:
+        model = ImmobilizationAndSafety
+        exclude = ['id']
+
+
+class SurgicalCountsSerializer(SectionCountsSerializer):
+    '''Counts of the surgical section.'''
+
+    class Meta:
+        model = Surgical
+        exclude = ['id']
+
+
+class AccessoriesCountsSerializer(SectionCountsSerializer):
+    '''Counts of the accessories section.'''
+
+    class Meta:
+        model = Accessories
+        exclude = ['id']
+
+
+class AdditionalsCountsSerializer(SectionCountsSerializer):
+    '''Counts of the additionals section (notes go in the check observations).'''
+
+    class Meta:
+        model = Additionals
+        exclude = ['id', 'observations_comments']
+
+
+class PediatricCountsSerializer(SectionCountsSerializer):
+    '''Counts of the pediatric section.'''
+
+    class Meta:
+        model = Pediatric
+        exclude = ['id']
+
+
+class CirculatoryCountsSerializer(SectionCountsSerializer):
+    '''Counts of the circulatory section.'''
+
+    class Meta:
+        model = Circulatory
+        exclude = ['id']
+
+
+class AmbulanceKitCountsSerializer(SectionCountsSerializer):
+    '''Counts of the ambulance kit section.'''
+
+    class Meta:
+        model = AmbulanceKit
+        exclude = ['id']
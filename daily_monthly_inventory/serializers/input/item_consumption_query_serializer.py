@@ -0,0 +1,26 @@
+from typing import Any
+from rest_framework import serializers
+
+class ItemConsumptionQuerySerializer(serializers.Serializer):
+    '''Serializer for item consumption query parameters.'''
+    component: serializers.CharField = serializers.CharField(
+        help_text='Checklist section of the item (e.g. circulatory)'
+    )
+    code: serializers.CharField = serializers.CharField(
+        help_text='Code of the item (e.g. syringe_5cc)'
+    )
+    ambulance_id: serializers.IntegerField = serializers.IntegerField(
+        required=False,
+        min_value=1,
+        help_text='Only this ambulance (default: the whole fleet)'
+    )
+    date_from: serializers.DateField = serializers.DateField(required=False)
+    date_to: serializers.DateField = serializers.DateField(required=False)
+
+    def validate(
+        self,
+        attrs: dict[str, Any]
+    ) -> dict[str, Any]:
+        if attrs.get('date_from') and attrs.get('date_to') and attrs['date_from'] > attrs['date_to']:
+            raise serializers.ValidationError({'date_to': 'Debe ser posterior a date_from.'})
+        return attrs
@@ -0,0 +1,47 @@
+from rest_framework import serializers
+from .inventory_check_sections_serializer import (
+    BiomedicalEquipmentCountsSerializer,
+    AccessoriesCaseCountsSerializer,
+    RespiratoryCountsSerializer,
+    ImmobilizationAndSafetyCountsSerializer,
+    SurgicalCountsSerializer,
+    AccessoriesCountsSerializer,
+    AdditionalsCountsSerializer,
+    PediatricCountsSerializer,
+    CirculatoryCountsSerializer,
+    AmbulanceKitCountsSerializer
+)
+
+class SubmitInventoryCheckSerializer(serializers.Serializer):
+    '''
+    Serializer for a complete inventory check of one ambulance.
+
+    Every one of the ten sections is required, keyed by its catalog
+    component name; items left out of a section count 0.
+    '''
+    SECTIONS: tuple[str, ...] = (
+        'biomedical_equipment',
+        'accessories_case',
+        'respiratory',
+        'immobilization_and_safety',
+        'surgical',
+        'accessories',
+        'additionals',
+        'pediatric',
+        'circulatory',
+        'ambulance_kit'
+    )
+
+    ambulance_id: serializers.IntegerField = serializers.IntegerField(min_value=1)
+    date: serializers.DateField = serializers.DateField()
+    observations: serializers.CharField = serializers.CharField(required=False, allow_blank=True, default='')
+    biomedical_equipment: BiomedicalEquipmentCountsSerializer = BiomedicalEquipmentCountsSerializer()
+    accessories_case: AccessoriesCaseCountsSerializer = AccessoriesCaseCountsSerializer()
+    respiratory: RespiratoryCountsSerializer = RespiratoryCountsSerializer()
+    immobilization_and_safety: ImmobilizationAndSafetyCountsSerializer = ImmobilizationAndSafetyCountsSerializer()
+    surgical: SurgicalCountsSerializer = SurgicalCountsSerializer()
+    accessories: AccessoriesCountsSerializer = AccessoriesCountsSerializer()
+    additionals: AdditionalsCountsSerializer = AdditionalsCountsSerializer()
+    pediatric: PediatricCountsSerializer = PediatricCountsSerializer()
+    circulatory: CirculatoryCountsSerializer = CirculatoryCountsSerializer()
+    ambulance_kit: AmbulanceKitCountsSerializer = AmbulanceKitCountsSerializer()
@@ -0,0 +1,42 @@
+from typing import Any
+from django.conf import settings
+from rest_framework import serializers
+from .submit_inventory_check_serializer import SubmitInventoryCheckSerializer
+
+class SubmitInventoryChecksSerializer(serializers.Serializer):
+    '''
+    Serializer for one or several inventory checks submitted together.
+
+    A single check may be sent as the body itself; it is read as a batch of
+    one. The batch is all or nothing, so every check is validated here.
+    '''
+    DEFAULT_MAX_CHECKS: int = 20
+
+    checks: SubmitInventoryCheckSerializer = SubmitInventoryCheckSerializer(many=True, allow_empty=False)
+
+    def to_internal_value(
+        self,
+        data: Any
+    ) -> dict[str, Any]:
+        '''Read a body without checks as a batch of one check.'''
+        if isinstance(data, dict) and 'checks' not in data:
+            data = {'checks': [data]}
+        return super().to_internal_value(data)
+
+    def validate_checks(
+        self,
+        value: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        '''Limit the batch size (INVENTORY_SUBMIT_MAX_CHECKS) and reject repeated checks.'''
+        max_checks: int = getattr(settings, 'INVENTORY_SUBMIT_MAX_CHECKS', self.DEFAULT_MAX_CHECKS)
+        if len(value) > max_checks:
+            raise serializers.ValidationError(f'Se permiten como máximo {max_checks} chequeos por lote.')
+        keys: set[tuple[int, Any]] = set()
+        for check in value:
+            key: tuple[int, Any] = (check['ambulance_id'], check['date'])
+            if key in keys:
+                raise serializers.ValidationError(
+                    f'La ambulancia con ID {check["ambulance_id"]} está repetida para el {check["date"]}.'
+                )
+            keys.add(key)
+        return value
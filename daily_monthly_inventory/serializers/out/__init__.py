@@ -0,0 +1,11 @@
+from .inventory_check_summary_serializer import InventoryCheckSummarySerializer
+from .fleet_restock_report_serializer import FleetRestockReportSerializer
+from .fleet_readiness_serializer import FleetReadinessSerializer
+from .item_consumption_serializer import ItemConsumptionSerializer
+
+__all__ = [
+    'InventoryCheckSummarySerializer',
+    'FleetRestockReportSerializer',
+    'FleetReadinessSerializer',
+    'ItemConsumptionSerializer'
+]
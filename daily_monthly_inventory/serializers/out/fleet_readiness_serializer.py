@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+class AmbulanceReadinessStatusSerializer(serializers.Serializer):
+    '''Serializer for the readiness of one ambulance (AmbulanceReadinessStatus).'''
+    ambulance_id: serializers.IntegerField = serializers.IntegerField()
+    mobile_number: serializers.IntegerField = serializers.IntegerField()
+    license_plate: serializers.CharField = serializers.CharField()
+    status: serializers.CharField = serializers.CharField()
+    check_id: serializers.IntegerField = serializers.IntegerField(allow_null=True)
+    check_date: serializers.DateField = serializers.DateField(allow_null=True)
+    total_shortfall: serializers.IntegerField = serializers.IntegerField()
+    missing_items: serializers.IntegerField = serializers.IntegerField()
+
+
+class FleetReadinessSerializer(serializers.Serializer):
+    '''Serializer for the readiness of the fleet (FleetReadiness).'''
+    ready_count: serializers.IntegerField = serializers.IntegerField()
+    status_counts: serializers.DictField = serializers.DictField(child=serializers.IntegerField())
+    ambulances: AmbulanceReadinessStatusSerializer = AmbulanceReadinessStatusSerializer(many=True)
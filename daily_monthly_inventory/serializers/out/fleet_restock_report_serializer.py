@@ -0,0 +1,37 @@
+from rest_framework import serializers
+
+class ItemShortfallSerializer(serializers.Serializer):
+    '''Serializer for the missing units of one item in an ambulance (ItemShortfall).'''
+    component: serializers.CharField = serializers.CharField()
+    code: serializers.CharField = serializers.CharField()
+    name: serializers.CharField = serializers.CharField()
+    target: serializers.IntegerField = serializers.IntegerField()
+    quantity: serializers.IntegerField = serializers.IntegerField()
+    shortfall: serializers.IntegerField = serializers.IntegerField()
+
+
+class AmbulanceRestockSerializer(serializers.Serializer):
+    '''Serializer for the items missing in one ambulance (AmbulanceRestock).'''
+    ambulance_id: serializers.IntegerField = serializers.IntegerField()
+    mobile_number: serializers.IntegerField = serializers.IntegerField()
+    license_plate: serializers.CharField = serializers.CharField()
+    check_id: serializers.IntegerField = serializers.IntegerField()
+    check_date: serializers.DateField = serializers.DateField()
+    total_shortfall: serializers.IntegerField = serializers.IntegerField()
+    items: ItemShortfallSerializer = ItemShortfallSerializer(many=True)
+
+
+class ItemRestockTotalSerializer(serializers.Serializer):
+    '''Serializer for the fleet-wide shortfall of one item (ItemRestockTotal).'''
+    component: serializers.CharField = serializers.CharField()
+    code: serializers.CharField = serializers.CharField()
+    name: serializers.CharField = serializers.CharField()
+    shortfall: serializers.IntegerField = serializers.IntegerField()
+    ambulance_count: serializers.IntegerField = serializers.IntegerField()
+
+
+class FleetRestockReportSerializer(serializers.Serializer):
+    '''Serializer for the restock needs of the fleet (FleetRestockReport).'''
+    ambulances: AmbulanceRestockSerializer = AmbulanceRestockSerializer(many=True)
+    totals: ItemRestockTotalSerializer = ItemRestockTotalSerializer(many=True)
+    unchecked_ambulance_ids: serializers.ListField = serializers.ListField(child=serializers.IntegerField())
@@ -0,0 +1,16 @@
+from rest_framework import serializers
+from daily_monthly_inventory.models import InventoryCheck
+
+class InventoryCheckSummarySerializer(serializers.ModelSerializer):
+    '''Serializer for a stored inventory check, without its counts.'''
+
+    class Meta:
+        model = InventoryCheck
+        fields = [
+            'id',
+            'ambulance_id',
+            'date',
+            'observations',
+            'created_at'
+        ]
+        read_only_fields = fields
@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+class ItemConsumptionSerializer(serializers.Serializer):
+    '''Serializer for the daily consumption of one item in one ambulance (ItemConsumption).'''
+    ambulance_id: serializers.IntegerField = serializers.IntegerField()
+    date: serializers.DateField = serializers.DateField()
+    days: serializers.IntegerField = serializers.IntegerField()
+    consumed: serializers.IntegerField = serializers.IntegerField()
+    restocked: serializers.IntegerField = serializers.IntegerField()
+    rolling_rate: serializers.FloatField = serializers.FloatField()
@@ -0,0 +1,37 @@
+from django.db.models.signals import (
+    post_save,
+    post_delete
+)
+from django.dispatch import receiver
+from .models import (
+    InventoryItem,
+    InventoryCheck
+)
+from .domain_service import (
+    InventoryCatalog,
+    FleetReadinessDomainService
+)
+
+@receiver(post_save, sender=InventoryItem)
+@receiver(post_delete, sender=InventoryItem)
+def invalidate_inventory_catalog(
+    sender: type[InventoryItem],
+    **kwargs
+) -> None:
+    '''
+    Mark the in-memory checklist catalog as stale when the table changes,
+    and recompute the shortfall of the fleet against the new targets.
+    '''
+    InventoryCatalog.get_instance().invalidate()
+    FleetReadinessDomainService().refresh()
+
+
+@receiver(post_delete, sender=InventoryCheck)
+def refresh_ambulance_readiness(
+    sender: type[InventoryCheck],
+    instance: InventoryCheck,
+    **kwargs
+) -> None:
+    '''Fall back to the previous check when the latest one of an ambulance is deleted.'''
+    if instance.ambulance_id is not None:
+        FleetReadinessDomainService().refresh([instance.ambulance_id])
@@ -1,3 +1,460 @@
-from django.test import TestCase
+from io import StringIO
+from unittest import mock
+from datetime import (
+    date,
+    timedelta
+)
+from django.contrib.auth.models import User
+from django.db import connection
+from django.core.management import call_command
+from django.test import (
+    TestCase,
+    override_settings
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from staff.domain_service import AuthTokenCache
+from staff.models import (
+    BaseStaff,
+    Driver
+)
+from daily_monthly_inventory.domain_service import (
+    InventoryCatalog,
+    InventoryChecklistDomainService,
+    StockDeficitDomainService,
+    FleetReadinessDomainService,
+    ConsumptionAnalyticsDomainService
+)
+from daily_monthly_inventory.models import (
+    Ambulance,
+    AmbulanceReadiness,
+    InventoryConsumptionRollup,
+    Circulatory,
+    InventoryCheck,
+    InventoryItem
+)
 
-# Create your tests here.
+
+class InventoryChecklistTests(TestCase):
+    '''Inventory checks are stored as one packed row per check.'''
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('paramedic', 'paramedic@test.com', 'secret')
+        cls.ambulance = Ambulance.objects.create(mobile_number=1, license_plate='ABC123')
+
+    def setUp(self):
+        # Test transactions roll back without signals: start from the table
+        InventoryCatalog.get_instance().invalidate()
+        self.checklist_service = InventoryChecklistDomainService()
+
+    def test_catalog_is_seeded_from_legacy_columns(self):
+        item = InventoryItem.objects.get(component='circulatory', code='syringe_1cc')
+        self.assertEqual(item.name, 'Syringe 1cc')
+        self.assertEqual(item.max_quantity, 20)
+        self.assertEqual(InventoryItem.objects.filter(component='circulatory').count(), 23)
+        self.assertFalse(InventoryItem.objects.filter(code='observations_comments').exists())
+        self.assertEqual(
+            list(InventoryItem.objects.values_list('position', flat=True)),
+            list(range(InventoryItem.objects.count()))
+        )
+        self.assertEqual(
+            [field.name for field in Circulatory._meta.concrete_fields if not field.primary_key],
+            list(InventoryItem.objects.filter(component='circulatory').values_list('code', flat=True))
+        )
+
+    def test_record_inserts_a_single_check_row(self):
+        self.checklist_service.catalog.items()
+        with CaptureQueriesContext(connection) as queries:
+            inventory_check = self.checklist_service.record(
+                ambulance_id=self.ambulance.id,
+                user=self.user,
+                check_date=date(2026, 10, 18),
+                counts={'circulatory': {'syringe_1cc': 4}, 'respiratory': {'laryngeal_mask_4': 1}}
+            )
+        inserts = [query['sql'] for query in queries if query['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 2)
+        self.assertIn('inventorycheck', inserts[0])
+        self.assertIn('ambulancereadiness', inserts[1])
+        stored = InventoryCheck.objects.get(id=inventory_check.id)
+        self.assertEqual(len(stored.quantities), InventoryItem.objects.count())
+        counts = self.checklist_service.unpack(stored.quantities)
+        self.assertEqual(counts['circulatory']['syringe_1cc'], 4)
+        self.assertEqual(counts['respiratory']['laryngeal_mask_4'], 1)
+        self.assertEqual(counts['circulatory']['syringe_3cc'], 0)
+        self.assertEqual(sum(sum(section.values()) for section in counts.values()), 5)
+
+    def test_pack_rejects_unknown_items_and_out_of_range_counts(self):
+        with self.assertRaisesMessage(ValueError, 'circulatory.unknown'):
+            self.checklist_service.pack({'circulatory': {'unknown': 1}})
+        with self.assertRaisesMessage(ValueError, 'entre 0 y 20'):
+            self.checklist_service.pack({'circulatory': {'syringe_1cc': 21}})
+        with self.assertRaises(ValueError):
+            self.checklist_service.pack({'circulatory': {'syringe_1cc': -1}})
+
+    def test_items_appended_later_count_zero_in_older_checks(self):
+        quantities = self.checklist_service.pack({'circulatory': {'syringe_1cc': 2}})
+        InventoryItem.objects.create(
+            position=len(quantities),
+            component='circulatory',
+            code='tourniquet',
+            name='Tourniquet',
+            max_quantity=2
+        )
+        counts = self.checklist_service.unpack(quantities)
+        self.assertEqual(counts['circulatory']['tourniquet'], 0)
+        self.assertEqual(counts['circulatory']['syringe_1cc'], 2)
+        self.assertEqual(len(self.checklist_service.pack({})), len(quantities) + 1)
+
+
+class InventoryApiTestCase(TestCase):
+    '''Fixture: a driver, a user without staff profile and three ambulances.'''
+
+    SECTIONS = (
+        'biomedical_equipment',
+        'accessories_case',
+        'respiratory',
+        'immobilization_and_safety',
+        'surgical',
+        'accessories',
+        'additionals',
+        'pediatric',
+        'circulatory',
+        'ambulance_kit'
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('driver', 'driver@test.com', 'secret')
+        Driver.objects.create(
+            base_staff=BaseStaff.objects.create(
+                system_user=cls.user,
+                document_type='CC',
+                document_number='300',
+                type_personnel='Driver'
+            ),
+            license_number='LIC-1',
+            license_category='C2',
+            license_issue_date=date(2020, 1, 1),
+            license_expiry_date=date(2030, 1, 1),
+            blood_type='O+'
+        )
+        cls.token = Token.objects.create(user=cls.user)
+        cls.other_token = Token.objects.create(user=User.objects.create_user('clerk', 'clerk@test.com', 'secret'))
+        cls.ambulances = [
+            Ambulance.objects.create(mobile_number=number, license_plate=f'ABC12{number}')
+            for number in range(1, 4)
+        ]
+
+    def setUp(self):
+        AuthTokenCache.get_instance().clear()
+        InventoryCatalog.get_instance().invalidate()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def _check(self, ambulance, **counts):
+        check = {'ambulance_id': ambulance.id, 'date': '2026-10-18'}
+        check.update({section: {} for section in self.SECTIONS})
+        check.update(counts)
+        return check
+
+
+class SubmitInventoryChecksTests(InventoryApiTestCase):
+    '''submit_checks/ stores whole checks, one or a batch, in one transaction.'''
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('submit_inventory_checks')
+
+    def _statements(self, body):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url, body, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        return len(queries)
+
+    def test_single_check_is_stored_with_its_counts(self):
+        response = self.client.post(self.url, self._check(
+            self.ambulances[0],
+            circulatory={'syringe_1cc': 4},
+            biomedical_equipment={'monitor': 1}
+        ), format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(len(response.json()['checks']), 1)
+        inventory_check = InventoryCheck.objects.get(id=response.json()['checks'][0]['id'])
+        counts = InventoryChecklistDomainService().unpack(inventory_check.quantities)
+        self.assertEqual(counts['circulatory']['syringe_1cc'], 4)
+        self.assertEqual(counts['biomedical_equipment']['monitor'], 1)
+        self.assertEqual(counts['biomedical_equipment']['aed'], 0)
+
+    def test_batch_statements_do_not_grow_with_its_size(self):
+        # Warm the token cache and the checklist catalog
+        self.client.post(self.url, self._check(self.ambulances[0]), format='json')
+        single = self._statements({'checks': [self._check(self.ambulances[1])]})
+        batch = self._statements({'checks': [
+            self._check(ambulance, date='2026-10-19') for ambulance in self.ambulances
+        ]})
+        self.assertEqual(batch, single)
+        self.assertEqual(InventoryCheck.objects.filter(date=date(2026, 10, 19)).count(), 3)
+
+    def test_counts_are_validated_against_field_limits(self):
+        for counts in ({'syringe_1cc': 21}, {'syringe_1cc': -1}):
+            response = self.client.post(self.url, {'checks': [
+                self._check(self.ambulances[0]),
+                self._check(self.ambulances[1], circulatory=counts)
+            ]}, format='json')
+            self.assertEqual(response.status_code, 400)
+        body = self._check(self.ambulances[0])
+        del body['surgical']
+        self.assertEqual(self.client.post(self.url, body, format='json').status_code, 400)
+        self.assertFalse(InventoryCheck.objects.exists())
+
+    def test_batch_with_unknown_ambulance_writes_nothing(self):
+        unknown = self._check(self.ambulances[0])
+        unknown['ambulance_id'] = 999
+        response = self.client.post(self.url, {'checks': [self._check(self.ambulances[0]), unknown]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('999', response.json()['response'])
+        self.assertFalse(InventoryCheck.objects.exists())
+
+    def test_only_ambulance_crew_can_submit(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.other_token.key}')
+        response = self.client.post(self.url, self._check(self.ambulances[0]), format='json')
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(InventoryCheck.objects.exists())
+
+
+class RecordedChecksTestCase(InventoryApiTestCase):
+    '''Fixture helpers to record checks through the domain service.'''
+
+    def setUp(self):
+        super().setUp()
+        self.checklist_service = InventoryChecklistDomainService()
+
+    def _record(self, ambulance, check_date, **overrides):
+        # Every active item at its target, except the overrides
+        counts = {}
+        for item in self.checklist_service.catalog.items():
+            if item.is_active:
+                counts.setdefault(item.component, {})[item.code] = item.max_quantity
+        for component, items in overrides.items():
+            counts[component].update(items)
+        return self.checklist_service.record(self.ambulances[ambulance].id, self.user, check_date, counts)
+
+
+class RestockReportTests(RecordedChecksTestCase):
+    '''restock_report/ compares the latest check of each ambulance with the targets.'''
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('restock_report')
+
+    def test_report_lists_shortfalls_of_latest_checks(self):
+        self._record(0, date(2026, 10, 18), circulatory={'syringe_5cc': 14})
+        self._record(1, date(2026, 10, 17), circulatory={'syringe_5cc': 0})
+        self._record(1, date(2026, 10, 18))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()['data']
+        self.assertEqual([restock['ambulance_id'] for restock in data['ambulances']], [self.ambulances[0].id])
+        self.assertEqual(data['ambulances'][0]['total_shortfall'], 6)
+        self.assertEqual(data['ambulances'][0]['items'], [{
+            'component': 'circulatory',
+            'code': 'syringe_5cc',
+            'name': 'Syringe 5cc',
+            'target': 20,
+            'quantity': 14,
+            'shortfall': 6
+        }])
+        self.assertEqual(data['totals'], [{
+            'component': 'circulatory',
+            'code': 'syringe_5cc',
+            'name': 'Syringe 5cc',
+            'shortfall': 6,
+            'ambulance_count': 1
+        }])
+        self.assertEqual(data['unchecked_ambulance_ids'], [self.ambulances[2].id])
+
+    def test_statements_do_not_grow_with_the_fleet(self):
+        for ambulance in range(3):
+            self._record(ambulance, date(2026, 10, 17))
+            self._record(ambulance, date(2026, 10, 18), surgical={'surgical_soap': 0})
+        with self.assertNumQueries(1):
+            report = StockDeficitDomainService().fleet_report()
+        self.assertEqual(len(report.ambulances), 3)
+        self.assertEqual(report.totals[0].ambulance_count, 3)
+
+    def test_retired_and_appended_items(self):
+        self._record(0, date(2026, 10, 18), circulatory={'syringe_1cc': 0})
+        InventoryItem.objects.filter(component='circulatory', code='syringe_1cc').update(is_active=False)
+        InventoryItem.objects.create(
+            position=InventoryItem.objects.count(),
+            component='circulatory',
+            code='tourniquet',
+            name='Tourniquet',
+            max_quantity=2
+        )
+        InventoryCatalog.get_instance().invalidate()
+        report = StockDeficitDomainService().fleet_report()
+        self.assertEqual(
+            [(item.code, item.quantity, item.shortfall) for item in report.ambulances[0].items],
+            [('tourniquet', 0, 2)]
+        )
+
+    def test_only_staff_can_read_the_report(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.other_token.key}')
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class FleetReadinessTests(RecordedChecksTestCase):
+    '''fleet_readiness/ reads the latest-check projection, one row per ambulance.'''
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('fleet_readiness')
+        self.today = timezone.localdate()
+
+    def test_summary_statuses(self):
+        self._record(0, self.today)
+        self._record(1, self.today, circulatory={'syringe_5cc': 14})
+        self._record(2, self.today - timedelta(days=5))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()['data']
+        self.assertEqual(
+            [(ambulance['ambulance_id'], ambulance['status']) for ambulance in data['ambulances']],
+            [
+                (self.ambulances[0].id, FleetReadinessDomainService.READY),
+                (self.ambulances[1].id, FleetReadinessDomainService.MISSING_ITEMS),
+                (self.ambulances[2].id, FleetReadinessDomainService.OUTDATED)
+            ]
+        )
+        self.assertEqual(data['ambulances'][1]['total_shortfall'], 6)
+        self.assertEqual(data['ready_count'], 1)
+        self.assertEqual(data['status_counts'][FleetReadinessDomainService.UNCHECKED], 0)
+
+    def test_summary_statements_do_not_grow_with_history(self):
+        for days in range(5):
+            self._record(0, self.today - timedelta(days=days))
+        with self.assertNumQueries(1):
+            fleet = FleetReadinessDomainService().summary()
+        self.assertEqual(fleet.ambulances[0].status, FleetReadinessDomainService.READY)
+        self.assertEqual(fleet.ambulances[1].status, FleetReadinessDomainService.UNCHECKED)
+
+    def test_projection_keeps_the_latest_check(self):
+        latest = self._record(0, self.today)
+        # A check of an earlier day submitted late does not replace it
+        earlier = self._record(0, self.today - timedelta(days=1), circulatory={'syringe_5cc': 0})
+        readiness = AmbulanceReadiness.objects.get(ambulance=self.ambulances[0])
+        self.assertEqual(readiness.latest_check_id, latest.id)
+        latest.delete()
+        readiness = AmbulanceReadiness.objects.get(ambulance=self.ambulances[0])
+        self.assertEqual((readiness.latest_check_id, readiness.total_shortfall), (earlier.id, 20))
+        earlier.delete()
+        self.assertFalse(AmbulanceReadiness.objects.exists())
+
+    def test_catalog_changes_refresh_the_shortfall(self):
+        self._record(0, self.today)
+        InventoryItem.objects.create(
+            position=InventoryItem.objects.count(),
+            component='circulatory',
+            code='tourniquet',
+            name='Tourniquet',
+            max_quantity=2
+        )
+        readiness = AmbulanceReadiness.objects.get(ambulance=self.ambulances[0])
+        self.assertEqual((readiness.total_shortfall, readiness.missing_items), (2, 1))
+
+
+@override_settings(INVENTORY_CONSUMPTION_WINDOW_DAYS=3)
+class ConsumptionAnalyticsTests(RecordedChecksTestCase):
+    '''Daily consumption rollups computed from the streamed check history.'''
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('item_consumption')
+        self.consumption_service = ConsumptionAnalyticsDomainService()
+        for day, syringes in ((1, 20), (2, 16), (2, 15), (4, 20), (5, 17)):
+            self._record(0, date(2026, 10, day), circulatory={'syringe_5cc': syringes})
+        self._record(1, date(2026, 10, 1))
+
+    def _series(self):
+        _, series = self.consumption_service.item_consumption('circulatory', 'syringe_5cc')
+        return [(row.date.day, row.days, row.consumed, row.restocked, row.rolling_rate) for row in series]
+
+    def test_rollups_of_consumption_and_rolling_rate(self):
+        self.assertEqual(self.consumption_service.rollup(), 3)
+        self.assertEqual(self._series(), [
+            # Last check of the day counts; restocks are not consumption
+            (2, 1, 5, 0, 1.667),
+            (4, 2, 0, 5, 1.667),
+            (5, 1, 3, 0, 1.0)
+        ])
+        rollup = InventoryConsumptionRollup.objects.get(ambulance=self.ambulances[0], date=date(2026, 10, 5))
+        self.assertEqual(sum(rollup.consumed), 3)
+
+    def test_incremental_rollup_matches_full_rebuild(self):
+        self.consumption_service.rollup()
+        full = self._series()
+        self._record(0, date(2026, 10, 5), circulatory={'syringe_5cc': 14})
+        self._record(0, date(2026, 10, 6), circulatory={'syringe_5cc': 14})
+        self.assertEqual(self.consumption_service.rollup(date(2026, 10, 5)), 2)
+        incremental = self._series()
+        self.consumption_service.rollup()
+        self.assertEqual(incremental, self._series())
+        self.assertEqual(incremental[:2], full[:2])
+        self.assertEqual(incremental[2:], [(5, 1, 6, 0, 2.0), (6, 1, 0, 0, 2.0)])
+
+    def test_command_resumes_from_the_last_rollup(self):
+        call_command('calcular_consumo_inventario', '--completo', stdout=StringIO())
+        self._record(0, date(2026, 10, 6), circulatory={'syringe_5cc': 10})
+        call_command('calcular_consumo_inventario', stdout=StringIO())
+        self.assertEqual(self._series()[-1], (6, 1, 7, 0, 3.333))
+
+    def test_command_picks_up_checks_saved_during_a_run(self):
+        days = ConsumptionAnalyticsDomainService._days
+
+        def days_with_a_concurrent_check(service, checks, size):
+            for index, day in enumerate(days(service, checks, size)):
+                if index == 0:
+                    # Saved after the run read its checks, before its rollups are written
+                    self._record(0, date(2026, 10, 3), circulatory={'syringe_5cc': 12})
+                yield day
+
+        with mock.patch.object(ConsumptionAnalyticsDomainService, '_days', days_with_a_concurrent_check):
+            call_command('calcular_consumo_inventario', stdout=StringIO())
+        self.assertEqual(self._series()[1], (4, 2, 0, 5, 1.667))
+        call_command('calcular_consumo_inventario', stdout=StringIO())
+        self.assertEqual(self._series()[1], (3, 1, 3, 0, 2.667))
+
+    def test_command_recomputes_from_backdated_checks(self):
+        call_command('calcular_consumo_inventario', stdout=StringIO())
+        # Submitted after the run for a day already rolled up
+        self._record(0, date(2026, 10, 3), circulatory={'syringe_5cc': 12})
+        call_command('calcular_consumo_inventario', stdout=StringIO())
+        incremental = self._series()
+        self.assertEqual(incremental[1], (3, 1, 3, 0, 2.667))
+        self.consumption_service.rollup()
+        self.assertEqual(incremental, self._series())
+
+        output = StringIO()
+        call_command('calcular_consumo_inventario', stdout=output)
+        self.assertIn('Sin chequeos nuevos', output.getvalue())
+
+    def test_consumption_endpoint(self):
+        self.consumption_service.rollup()
+        response = self.client.get(self.url, {
+            'component': 'circulatory',
+            'code': 'syringe_5cc',
+            'ambulance_id': self.ambulances[0].id,
+            'date_from': '2026-10-03'
+        })
+        self.assertEqual(response.status_code, 200, response.content)
+        data = response.json()['data']
+        self.assertEqual(data['window_days'], 3)
+        self.assertEqual([row['date'] for row in data['series']], ['2026-10-04', '2026-10-05'])
+        self.assertEqual(data['series'][1]['consumed'], 3)
+        response = self.client.get(self.url, {'component': 'circulatory', 'code': 'unknown'})
+        self.assertEqual(response.status_code, 400)
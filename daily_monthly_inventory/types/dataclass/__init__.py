@@ -0,0 +1,21 @@
+from .checklist_item import ChecklistItem
+from .inventory_check_entry import InventoryCheckEntry
+from .item_shortfall import ItemShortfall
+from .ambulance_restock import AmbulanceRestock
+from .item_restock_total import ItemRestockTotal
+from .fleet_restock_report import FleetRestockReport
+from .ambulance_readiness_status import AmbulanceReadinessStatus
+from .fleet_readiness import FleetReadiness
+from .item_consumption import ItemConsumption
+
+__all__ = [
+    'ChecklistItem',
+    'InventoryCheckEntry',
+    'ItemShortfall',
+    'AmbulanceRestock',
+    'ItemRestockTotal',
+    'FleetRestockReport',
+    'AmbulanceReadinessStatus',
+    'FleetReadiness',
+    'ItemConsumption'
+]
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import date
+
+@dataclass(frozen=True)
+class AmbulanceReadinessStatus:
+    '''Data Transfer Object for the readiness of one ambulance'''
+    ambulance_id: int
+    mobile_number: int
+    license_plate: str
+    # ready, missing_items, outdated or unchecked
+    status: str
+    check_id: int | None = None
+    check_date: date | None = None
+    total_shortfall: int = 0
+    missing_items: int = 0
@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from datetime import date
+from .item_shortfall import ItemShortfall
+
+@dataclass
+class AmbulanceRestock:
+    '''Data Transfer Object for the items missing in an ambulance at its latest check'''
+    ambulance_id: int
+    mobile_number: int
+    license_plate: str
+    check_id: int
+    check_date: date
+    total_shortfall: int
+    # Only the items with a shortfall, in catalog order
+    items: list[ItemShortfall] = field(default_factory=list)
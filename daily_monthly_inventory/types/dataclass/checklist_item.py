@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class ChecklistItem:
+    '''Data Transfer Object for one entry of the inventory checklist catalog'''
+    position: int
+    component: str
+    code: str
+    name: str
+    max_quantity: int
+    is_active: bool
@@ -0,0 +1,10 @@
+from dataclasses import dataclass, field
+from .ambulance_readiness_status import AmbulanceReadinessStatus
+
+@dataclass
+class FleetReadiness:
+    '''Data Transfer Object for the readiness of every active ambulance'''
+    ready_count: int = 0
+    # Number of ambulances per status
+    status_counts: dict[str, int] = field(default_factory=dict)
+    ambulances: list[AmbulanceReadinessStatus] = field(default_factory=list)
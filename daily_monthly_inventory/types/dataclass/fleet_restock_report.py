@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+from .ambulance_restock import AmbulanceRestock
+from .item_restock_total import ItemRestockTotal
+
+@dataclass
+class FleetRestockReport:
+    '''Data Transfer Object for the restock needs of every active ambulance'''
+    # Ambulances with a shortfall, largest first
+    ambulances: list[AmbulanceRestock] = field(default_factory=list)
+    totals: list[ItemRestockTotal] = field(default_factory=list)
+    # Active ambulances never checked
+    unchecked_ambulance_ids: list[int] = field(default_factory=list)
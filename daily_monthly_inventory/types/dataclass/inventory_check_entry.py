@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import date
+
+@dataclass
+class InventoryCheckEntry:
+    '''Data Transfer Object for one inventory check of a submission batch'''
+    ambulance_id: int
+    check_date: date
+    # Count per item code, grouped by section
+    counts: dict[str, dict[str, int]]
+    observations: str = ''
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import date
+
+@dataclass(frozen=True)
+class ItemConsumption:
+    '''Data Transfer Object for the daily consumption of one item in one ambulance'''
+    ambulance_id: int
+    date: date
+    # Days since the previous check of the ambulance
+    days: int
+    consumed: int
+    restocked: int
+    # Units consumed per day over the rolling window
+    rolling_rate: float
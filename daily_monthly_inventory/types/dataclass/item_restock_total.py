@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class ItemRestockTotal:
+    '''Data Transfer Object for the fleet-wide shortfall of one checklist item'''
+    component: str
+    code: str
+    name: str
+    shortfall: int
+    # Ambulances missing at least one unit of the item
+    ambulance_count: int
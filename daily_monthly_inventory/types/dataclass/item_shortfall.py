@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class ItemShortfall:
+    '''Data Transfer Object for the missing units of one checklist item'''
+    component: str
+    code: str
+    name: str
+    # Target quantity of the item (MaxValueValidator of its legacy column)
+    target: int
+    quantity: int
+    shortfall: int
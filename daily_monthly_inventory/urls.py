@@ -0,0 +1,14 @@
+from django.urls import path
+from .views import (
+    SubmitInventoryChecksView,
+    GetRestockReportView,
+    GetFleetReadinessView,
+    GetItemConsumptionView
+)
+
+urlpatterns = [
+    path('submit_checks/', SubmitInventoryChecksView.as_view(), name='submit_inventory_checks'),
+    path('restock_report/', GetRestockReportView.as_view(), name='restock_report'),
+    path('fleet_readiness/', GetFleetReadinessView.as_view(), name='fleet_readiness'),
+    path('consumption/', GetItemConsumptionView.as_view(), name='item_consumption'),
+]
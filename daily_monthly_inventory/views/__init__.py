@@ -0,0 +1,11 @@
+from .submit_inventory_checks_view import SubmitInventoryChecksView
+from .get_restock_report_view import GetRestockReportView
+from .get_fleet_readiness_view import GetFleetReadinessView
+from .get_item_consumption_view import GetItemConsumptionView
+
+__all__ = [
+    'SubmitInventoryChecksView',
+    'GetRestockReportView',
+    'GetFleetReadinessView',
+    'GetItemConsumptionView'
+]
@@ -0,0 +1,77 @@
+from rest_framework.request import Request
+from rest_framework.response import Response
+from typing import Any
+from django.contrib.auth.models import User
+from rest_framework.permissions import IsAuthenticated
+from core.views.base_view import BaseView
+from daily_monthly_inventory.application_service import GetFleetReadinessApplicationService
+
+class GetFleetReadinessView(BaseView):
+    '''
+    API endpoint for the readiness summary of the ambulance fleet.
+
+    Reads the maintained latest-check projection, one row per ambulance,
+    never the inventory history.
+    '''
+
+    permission_classes = [IsAuthenticated]
+
+    def get(
+        self,
+        request: Request
+    ) -> Response:
+        '''
+        Which active ambulances are ready right now.
+
+        GET /daily_monthly_inventory/fleet_readiness/
+
+        Headers:
+            Authorization: Token <token_value>
+
+        Success Response (200 OK):
+            {
+                "response": "Estado de la flota obtenido exitosamente.",
+                "msg": 1,
+                "data": {
+                    "ready_count": 1,
+                    "status_counts": {
+                        "ready": 1,
+                        "missing_items": 1,
+                        "outdated": 0,
+                        "unchecked": 0
+                    },
+                    "ambulances": [
+                        {
+                            "ambulance_id": 3,
+                            "mobile_number": 2,
+                            "license_plate": "ABC123",
+                            "status": "missing_items",
+                            "check_id": 41,
+                            "check_date": "2026-10-18",
+                            "total_shortfall": 6,
+                            "missing_items": 1
+                        }
+                    ]
+                }
+            }
+
+            status is ready (recent check, nothing missing), missing_items,
+            outdated (latest check older than INVENTORY_READINESS_MAX_AGE_DAYS)
+            or unchecked.
+
+        Error Response (403 Forbidden):
+            {
+                "response": "Solamente el personal puede consultar el estado de la flota.",
+                "msg": -1
+            }
+        '''
+        def service_callback(user: User) -> dict[str, Any]:
+            fleet_readiness_service: GetFleetReadinessApplicationService = GetFleetReadinessApplicationService()
+            return fleet_readiness_service.get_fleet_readiness(user=user)
+
+        return self._handle_request(
+            request=request,
+            serializer_class=None,
+            service_method_callback=service_callback,
+            requires_auth=True
+        )
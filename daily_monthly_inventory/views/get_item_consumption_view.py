@@ -0,0 +1,94 @@
+from rest_framework.request import Request
+from rest_framework.response import Response
+from typing import Any
+from django.contrib.auth.models import User
+from rest_framework.permissions import IsAuthenticated
+from core.views.base_view import BaseView
+from daily_monthly_inventory.application_service import GetItemConsumptionApplicationService
+from daily_monthly_inventory.serializers.input import ItemConsumptionQuerySerializer
+
+class GetItemConsumptionView(BaseView):
+    '''
+    API endpoint for the consumption analytics of one inventory item.
+
+    Served from the daily rollups written by the calcular_consumo_inventario
+    command, so the cost depends on the days asked for, not on the history.
+    '''
+
+    permission_classes = [IsAuthenticated]
+
+    def get(
+        self,
+        request: Request
+    ) -> Response:
+        '''
+        Daily consumption of an item per ambulance.
+
+        GET /daily_monthly_inventory/consumption/?component=circulatory&code=syringe_5cc
+
+        Query Parameters:
+            component: Checklist section of the item
+            code: Code of the item
+            ambulance_id: Only this ambulance (optional, default the whole fleet)
+            date_from, date_to: Date range, YYYY-MM-DD (optional)
+
+        Headers:
+            Authorization: Token <token_value>
+
+        Success Response (200 OK):
+            {
+                "response": "Consumo obtenido exitosamente.",
+                "msg": 1,
+                "data": {
+                    "component": "circulatory",
+                    "code": "syringe_5cc",
+                    "name": "Syringe 5cc",
+                    "window_days": 7,
+                    "series": [
+                        {
+                            "ambulance_id": 3,
+                            "date": "2026-10-18",
+                            "days": 1,
+                            "consumed": 4,
+                            "restocked": 0,
+                            "rolling_rate": 1.571
+                        }
+                    ]
+                }
+            }
+
+            consumed and restocked are counted since the previous check day
+            of the ambulance (days before); rolling_rate is the units
+            consumed per day over the last window_days days.
+
+        Error Response (400 Bad Request):
+            {
+                "response": "Ítem de inventario desconocido: circulatory.unknown.",
+                "msg": -1
+            }
+        '''
+        validated_data: dict[str, Any] | None
+        validated_data, validation_error = self._validate_serializer(
+            ItemConsumptionQuerySerializer,
+            request.query_params
+        )
+        if validation_error:
+            return validation_error
+
+        def service_callback(user: User) -> dict[str, Any]:
+            item_consumption_service: GetItemConsumptionApplicationService = GetItemConsumptionApplicationService()
+            return item_consumption_service.get_item_consumption(
+                user=user,
+                component=validated_data['component'],
+                code=validated_data['code'],
+                ambulance_id=validated_data.get('ambulance_id'),
+                date_from=validated_data.get('date_from'),
+                date_to=validated_data.get('date_to')
+            )
+
+        return self._handle_request(
+            request=request,
+            serializer_class=None,
+            service_method_callback=service_callback,
+            requires_auth=True
+        )
@@ -0,0 +1,87 @@
+from rest_framework.request import Request
+from rest_framework.response import Response
+from typing import Any
+from django.contrib.auth.models import User
+from rest_framework.permissions import IsAuthenticated
+from core.views.base_view import BaseView
+from daily_monthly_inventory.application_service import GetRestockReportApplicationService
+
+class GetRestockReportView(BaseView):
+    '''
+    API endpoint for the restock report of the ambulance fleet.
+
+    Compares the latest inventory check of every active ambulance with the
+    target quantity of each checklist item.
+    '''
+
+    permission_classes = [IsAuthenticated]
+
+    def get(
+        self,
+        request: Request
+    ) -> Response:
+        '''
+        Missing items per ambulance and for the whole fleet.
+
+        GET /daily_monthly_inventory/restock_report/
+
+        Headers:
+            Authorization: Token <token_value>
+
+        Success Response (200 OK):
+            {
+                "response": "Reporte de reabastecimiento generado exitosamente.",
+                "msg": 1,
+                "data": {
+                    "ambulances": [
+                        {
+                            "ambulance_id": 3,
+                            "mobile_number": 2,
+                            "license_plate": "ABC123",
+                            "check_id": 41,
+                            "check_date": "2026-10-18",
+                            "total_shortfall": 6,
+                            "items": [
+                                {
+                                    "component": "circulatory",
+                                    "code": "syringe_5cc",
+                                    "name": "Syringe 5cc",
+                                    "target": 20,
+                                    "quantity": 14,
+                                    "shortfall": 6
+                                }
+                            ]
+                        }
+                    ],
+                    "totals": [
+                        {
+                            "component": "circulatory",
+                            "code": "syringe_5cc",
+                            "name": "Syringe 5cc",
+                            "shortfall": 6,
+                            "ambulance_count": 1
+                        }
+                    ],
+                    "unchecked_ambulance_ids": [5]
+                }
+            }
+
+            Ambulances are sorted by total_shortfall, largest first, and
+            only items with a shortfall are listed.
+
+        Error Response (403 Forbidden):
+            {
+                "response": "Solamente el personal puede consultar el reporte de reabastecimiento.",
+                "msg": -1
+            }
+        '''
+        def service_callback(user: User) -> dict[str, Any]:
+            restock_report_service: GetRestockReportApplicationService = GetRestockReportApplicationService()
+            return restock_report_service.get_restock_report(user=user)
+
+        return self._handle_request(
+            request=request,
+            serializer_class=None,
+            service_method_callback=service_callback,
+            requires_auth=True
+        )
@@ -0,0 +1,98 @@
+from rest_framework.request import Request
+from rest_framework.response import Response
+from typing import Any
+from django.contrib.auth.models import User
+from rest_framework.permissions import IsAuthenticated
+from core.views.base_view import BaseView
+from daily_monthly_inventory.application_service import SubmitInventoryChecksApplicationService
+from daily_monthly_inventory.serializers.input import SubmitInventoryChecksSerializer
+
+class SubmitInventoryChecksView(BaseView):
+    '''
+    API endpoint for the daily/monthly inventory check of ambulances.
+
+    A check covers the ten sections of the checklist. The crew may send
+    one check, or the checks of several ambulances at shift change; a batch
+    is stored whole or not at all.
+    '''
+
+    permission_classes = [IsAuthenticated]
+
+    def post(
+        self,
+        request: Request
+    ) -> Response:
+        '''
+        Store one or several inventory checks.
+
+        POST /daily_monthly_inventory/submit_checks/
+
+        Headers:
+            Authorization: Token <token_value>
+            Content-Type: application/json
+
+        Request Body:
+            {
+                "checks": [
+                    {
+                        "ambulance_id": 3,
+                        "date": "2026-10-18",
+                        "observations": "",
+                        "biomedical_equipment": {"monitor": 1, ...},
+                        "accessories_case": {...},
+                        "respiratory": {...},
+                        "immobilization_and_safety": {...},
+                        "surgical": {...},
+                        "accessories": {...},
+                        "additionals": {...},
+                        "pediatric": {...},
+                        "circulatory": {"syringe_1cc": 4, ...},
+                        "ambulance_kit": {...}
+                    }
+                ]
+            }
+
+            A single check may also be sent as the body itself. Every
+            section is required; items left out count 0 and each count must
+            be between 0 and the limit of its item.
+
+        Success Response (201 Created):
+            {
+                "response": "Inventario registrado exitosamente.",
+                "msg": 1,
+                "checks": [
+                    {
+                        "id": 41,
+                        "ambulance_id": 3,
+                        "date": "2026-10-18",
+                        "observations": "",
+                        "created_at": "2026-10-18T07:02:11.104Z"
+                    }
+                ]
+            }
+
+        Error Response (400 Bad Request):
+            {
+                "response": "No existe una ambulancia activa con ID 9.",
+                "msg": -1
+            }
+
+        Error Response (403 Forbidden):
+            {
+                "response": "Solamente la tripulación de la ambulancia puede registrar inventarios.",
+                "msg": -1
+            }
+        '''
+        def service_callback(validated_data: dict[str, Any], user: User) -> dict[str, Any]:
+            submit_checks_service: SubmitInventoryChecksApplicationService = SubmitInventoryChecksApplicationService()
+            return submit_checks_service.submit_checks(
+                checks=validated_data['checks'],
+                user=user
+            )
+
+        return self._handle_request(
+            request=request,
+            serializer_class=SubmitInventoryChecksSerializer,
+            service_method_callback=service_callback,
+            requires_auth=True
+        )
@@ -1,11 +1,19 @@
 from .list_diagnosis_application_service import ListDiagnosisApplicationService
-from .list_ips_application_service import ListIPSApplicationService
 from .list_buzon_application_service import ListBuzonApplicationService
 from .get_detail_report_application_service import GetDetailsReportApplicationService
+from .list_buzon_changes_application_service import ListBuzonChangesApplicationService
+from .get_signature_application_service import GetSignatureApplicationService
+from .create_report_application_service import CreateReportApplicationService
+from .sync_reports_application_service import SyncReportsApplicationService
+from .autosave_report_application_service import AutosaveReportApplicationService
 
 __all__ = [
     'ListDiagnosisApplicationService',
-    'ListIPSApplicationService',
     'ListBuzonApplicationService',
-    'GetDetailsReportApplicationService'
+    'GetDetailsReportApplicationService',
+    'ListBuzonChangesApplicationService',
+    'GetSignatureApplicationService',
+    'CreateReportApplicationService',
+    'SyncReportsApplicationService',
+    'AutosaveReportApplicationService'
 ]
\ No newline at end of file
@@ -0,0 +1,103 @@
+from typing import Any
+from django.contrib.auth.models import User
+from ..domain_service import ReportAutosaveDomainService
+from ..models import PatientTransportReport
+from ..serializers.out import ReportAutosaveResultSerializer
+from ..types.dataclass import ReportAutosaveResult
+from staff.domain_service import StaffRoleResolver
+from staff.types.dataclass import StaffRole
+import logging
+
+class AutosaveReportApplicationService:
+    '''
+    Application service for the autosave of draft reports.
+
+    Business logic:
+    - Verify user is Healthcare staff and the author or part of the assigned
+      crew of the report (crew members edit drafts together)
+    - Apply the merge patch if the version precondition holds
+    - A conflict returns the current version so the client can reload
+    '''
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.report_autosave_service: ReportAutosaveDomainService = ReportAutosaveDomainService()
+
+    def autosave_report(
+        self,
+        report_id: int,
+        autosave_data: dict[str, Any],
+        user: User
+    ) -> dict[str, Any]:
+        '''
+        Save the changes made to a draft report.
+
+        Args:
+            report_id: ID of the report
+            autosave_data: Validated data of AutosaveReportSerializer
+            user: Authenticated user making the request
+
+        Returns:
+            dict: {
+                'response': Success/error message
+                'msg': 1 for success, -1 for error
+                'status_code_http': HTTP status code
+                'autosave': Outcome with the current version (saved or conflict)
+            }
+        '''
+        try:
+            staff_role: StaffRole = StaffRoleResolver().for_user(user)
+            if not staff_role.is_healthcare:
+                return {
+                    'response': 'Solamente el personal de salud puede editar informes.',
+                    'msg': -1,
+                    'status_code_http': 403
+                }
+            patch: dict[str, Any] = {
+                section: data
+                for section, data in autosave_data.items()
+                if section not in ('version', 'client_id')
+            }
+            result: ReportAutosaveResult = self.report_autosave_service.autosave(
+                report_id=report_id,
+                patch=patch,
+                base_version=autosave_data['version'],
+                client_id=autosave_data['client_id'],
+                user=user,
+                staff_id=staff_role.base_staff.pk
+            )
+            if result.status == ReportAutosaveDomainService.FORBIDDEN:
+                return {
+                    'response': result.response,
+                    'msg': -1,
+                    'status_code_http': 403
+                }
+            saved: bool = result.status == ReportAutosaveDomainService.SAVED
+            return {
+                'response': result.response,
+                'msg': 1 if saved else -1,
+                'status_code_http': 200 if saved else 409,
+                'autosave': ReportAutosaveResultSerializer(result).data
+            }
+        except PatientTransportReport.DoesNotExist:
+            return {
+                'response': f'Informe con ID {report_id} no encontrado.',
+                'msg': -1,
+                'status_code_http': 404
+            }
+        except ValueError as e:
+            return {
+                'response': str(e),
+                'msg': -1,
+                'status_code_http': 400
+            }
+        except Exception as e:
+            self.logger.error(
+                f'Error in autosave report application service: {str(e)}',
+                exc_info=True
+            )
+            return {
+                'response': 'Ocurrió un error al guardar los cambios del informe.',
+                'msg': -1,
+                'status_code_http': 500
+            }
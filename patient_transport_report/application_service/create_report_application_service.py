@@ -0,0 +1,87 @@
+from typing import Any
+from django.contrib.auth.models import User
+from django.db import IntegrityError
+from ..domain_service import ReportCreationDomainService
+from ..models import PatientTransportReport
+from ..serializers.out import PatientTransportReportSummarySerializer
+from staff.domain_service import StaffRoleResolver
+from staff.types.dataclass import StaffRole
+import logging
+
+class CreateReportApplicationService:
+    '''
+    Application service for creating a full patient transport report.
+
+    Business logic:
+    - Verify user is Healthcare staff (the author of buzon reports)
+    - Write the report and every nested record in one transaction
+    - An existing patient (same identification number) is linked, not
+      duplicated, and the patient columns that changed are updated
+    '''
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.report_creation_service: ReportCreationDomainService = ReportCreationDomainService()
+
+    def create_report(
+        self,
+        report_data: dict[str, Any],
+        user: User
+    ) -> dict[str, Any]:
+        '''
+        Create a patient transport report.
+
+        Args:
+            report_data: Validated data of CreateReportSerializer
+            user: Authenticated user making the request
+
+        Returns:
+            dict: {
+                'response': Success/error message
+                'msg': 1 for success, -1 for error
+                'status_code_http': HTTP status code
+                'report': Summary of the new report (only on success)
+            }
+        '''
+        try:
+            staff_role: StaffRole = StaffRoleResolver().for_user(user)
+            if not staff_role.is_healthcare:
+                return {
+                    'response': 'Solamente el personal de salud puede crear informes.',
+                    'msg': -1,
+                    'status_code_http': 403
+                }
+            report: PatientTransportReport = self.report_creation_service.create(
+                report_data=report_data,
+                user=user
+            )
+            return {
+                'response': 'Informe creado con éxito.',
+                'msg': 1,
+                'status_code_http': 201,
+                'report': PatientTransportReportSummarySerializer(report).data
+            }
+        except ValueError as e:
+            return {
+                'response': str(e),
+                'msg': -1,
+                'status_code_http': 400
+            }
+        except IntegrityError as e:
+            # e.g. the same patient created by a concurrent request
+            self.logger.warning(f'Conflict creating report: {str(e)}')
+            return {
+                'response': 'El informe entra en conflicto con datos existentes, intente nuevamente.',
+                'msg': -1,
+                'status_code_http': 409
+            }
+        except Exception as e:
+            self.logger.error(
+                f'Error in create report application service: {str(e)}',
+                exc_info=True
+            )
+            return {
+                'response': 'Ocurrió un error al crear el informe.',
+                'msg': -1,
+                'status_code_http': 500
+            }
@@ -1,11 +1,9 @@
 from typing import Any
 from django.contrib.auth.models import User
 from ..models import PatientTransportReport
-from ..serializers.out import PatientTransportReportDetailSerializer
-from staff.models import (
-    Healthcare, 
-    Administrative
-)
+from ..domain_service import ReportSnapshotDomainService
+from staff.domain_service import StaffRoleResolver
+from staff.types.dataclass import StaffRole
 
 class GetDetailsReportApplicationService:
     '''
@@ -15,8 +13,16 @@ class GetDetailsReportApplicationService:
     - Verify user is Healthcare or Administrative staff
     - Retrieve complete report with all nested relationships
     - Return full serialized data
+
+    Completed reports are served from their stored snapshot with a single
+    lookup. Drafts (and completed reports whose snapshot was invalidated)
+    are loaded with one joined query plus one per M2M list and serialized
+    from memory; completed ones are stored again on the way out.
     '''
-    
+
+    def __init__(self):
+        self.report_snapshot_service: ReportSnapshotDomainService = ReportSnapshotDomainService()
+
     def get_report_details(
         self, 
         report_id: int,
@@ -42,54 +48,22 @@ class GetDetailsReportApplicationService:
         '''
         try:
             # Verify user has permission (Healthcare or Administrative)
-            is_healthcare: bool = Healthcare.objects.filter(user=user).exists()
-            is_administrative: bool = Administrative.objects.filter(user=user).exists()
-            if not (is_healthcare or is_administrative):
+            staff_role: StaffRole = StaffRoleResolver().for_user(user)
+            if not (staff_role.is_healthcare or staff_role.is_admin):
                 return {
                     'response': 'Solamente el personal de salud o administrativo puede acceder a este recurso.',
                     'msg': -1,
                     'status_code_http': 403
                 }                
-            # Retrieve report with all relationships using select_related and prefetch_related
-            report: PatientTransportReport = PatientTransportReport.objects.select_related(
-                'patient',
-                'patient__insurance_provider',
-                'informed_consent',
-                'informed_consent__companion',
-                'informed_consent__healthcare_staff',
-                'informed_consent__outgoing_entity',
-                'informed_consent__receiving_entity',
-                'care_transfer_report',
-                'care_transfer_report__driver',
-                'care_transfer_report__attending_staff',
-                'care_transfer_report__support_staff',
-                'care_transfer_report__ambulance',
-                'care_transfer_report__companion_1',
-                'care_transfer_report__companion_2',
-                'care_transfer_report__initial_physicial_examination',
-                'care_transfer_report__final_physical_examination',
-                'care_transfer_report__treatment',
-                'care_transfer_report__diagnosis_1',
-                'care_transfer_report__diagnosis_2',
-                'care_transfer_report__result',
-                'care_transfer_report__complications_transfer',
-                'care_transfer_report__receiving_entity',
-                'satisfaction_survey',
-                'created_by',
-                'updated_by'
-            ).prefetch_related(
-                'informed_consent__required_procedures',
-                'informed_consent__medication_administration',
-                'care_transfer_report__skin_conditions',
-                'care_transfer_report__hemodynamic_statuses'
-            ).get(id=report_id)
-            # Serialize complete report
-            serializer: PatientTransportReportDetailSerializer = PatientTransportReportDetailSerializer(report)
+            document: dict[str, Any] | None = self.report_snapshot_service.get_document(report_id)
+            if document is None:
+                report: PatientTransportReport = self.report_snapshot_service.get_report_queryset().get(id=report_id)
+                document = self.report_snapshot_service.render(report)
             return {
                 'response': 'Detalles del informe recuperados con éxito.',
                 'msg': 1,
                 'status_code_http': 200,
-                'report': serializer.data
+                'report': document
             }
         except PatientTransportReport.DoesNotExist:
             return {
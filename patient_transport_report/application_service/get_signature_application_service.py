@@ -0,0 +1,82 @@
+from typing import Any
+from django.contrib.auth.models import User
+from ..domain_service import SignatureStoreDomainService
+from ..models import SignatureBlob
+from staff.domain_service import StaffRoleResolver
+from staff.types.dataclass import StaffRole
+
+class GetSignatureApplicationService:
+    '''
+    Application service for retrieving one stored signature image.
+
+    Business logic:
+    - Verify user is Healthcare or Administrative staff (same as report details)
+    - Return the blob with its bytes; the view streams them as-is
+    - When the client already holds the blob (matching ETag), only check it
+      still exists and answer 304, after the role check so ids cannot be
+      probed
+    - Blobs outside the png/jpeg allow-list (kept by migration 0011) are
+      never served
+    '''
+
+    def get_signature(
+        self,
+        signature_id: int,
+        user: User,
+        etag_matches: bool = False
+    ) -> dict[str, Any]:
+        '''
+        Get a signature blob by id.
+
+        Args:
+            signature_id: ID of the SignatureBlob
+            user: Authenticated user making the request
+            etag_matches: The request's If-None-Match matches the blob's ETag
+
+        Returns:
+            dict: {
+                'response': Success/error message
+                'msg': 1 for success, -1 for error
+                'status_code_http': HTTP status code
+                'signature': SignatureBlob (only on 200)
+            }
+        '''
+        try:
+            staff_role: StaffRole = StaffRoleResolver().for_user(user)
+            if not (staff_role.is_healthcare or staff_role.is_admin):
+                return {
+                    'response': 'Solamente el personal de salud o administrativo puede acceder a este recurso.',
+                    'msg': -1,
+                    'status_code_http': 403
+                }
+            signatures = SignatureBlob.objects.filter(
+                pk=signature_id,
+                content_type__in=SignatureStoreDomainService.ALLOWED_CONTENT_TYPES
+            )
+            if etag_matches:
+                if not signatures.exists():
+                    raise SignatureBlob.DoesNotExist
+                return {
+                    'response': 'Firma sin cambios.',
+                    'msg': 1,
+                    'status_code_http': 304
+                }
+            signature: SignatureBlob = signatures.only('content', 'content_type').get()
+            return {
+                'response': 'Firma recuperada con éxito.',
+                'msg': 1,
+                'status_code_http': 200,
+                'signature': signature
+            }
+        except SignatureBlob.DoesNotExist:
+            return {
+                'response': f'Firma con ID {signature_id} no encontrada.',
+                'msg': -1,
+                'status_code_http': 404
+            }
+        except Exception as e:
+            return {
+                'response': f'Error al recuperar la firma: {str(e)}',
+                'msg': -1,
+                'status_code_http': 500
+            }
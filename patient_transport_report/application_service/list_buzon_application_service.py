@@ -1,11 +1,12 @@
 from typing import Any
+from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
 from django.contrib.auth.models import User
-from django.db.models import QuerySet
 from ..models import PatientTransportReport
 from ..serializers.out import PatientTransportReportSummarySerializer
-from staff.models import Healthcare
+from staff.domain_service import StaffRoleResolver
+from staff.types.dataclass import StaffRole
 
 class ListBuzonApplicationService:
     '''
@@ -13,25 +14,35 @@ class ListBuzonApplicationService:
     
     Business logic:
     - Filter reports by logged-in user (created_by)
-    - Filter reports created within last 48 hours
+    - Filter reports created within the buzon window (BUZON_WINDOW_HOURS, 48 by default)
     - Separate reports by status (draft vs completed)
     - Order by most recent first
+
+    The window is fetched with a single query, backed by the
+    (created_by, -created_at, status) index, and partitioned in Python.
+    Only the columns of the summary projection are loaded.
     '''
-    
+
+    DEFAULT_WINDOW_HOURS: int = 48
+    DRAFT_STATUS: str = 'borrador'
+    COMPLETED_STATUS: str = 'completado'
+
     def list_user_reports(
         self, 
-        user: User
+        user: User,
+        window_hours: int | None = None
     ) -> dict[str, Any]:
         '''    
         List transport reports for the authenticated user.
         
         Filters:
         - created_by: Only reports created by the logged-in user
-        - created_at: Only reports from the last 48 hours
+        - created_at: Only reports from the last window_hours hours
         - Separated by status: 'borrador' and 'completado'
         
         Args:
             user: Authenticated user making the request
+            window_hours: Size of the window in hours (defaults to BUZON_WINDOW_HOURS)
         
         Returns:
             dict: {
@@ -42,34 +53,38 @@ class ListBuzonApplicationService:
                 'list_report_completed': List of completed reports
                 'total_draft': Count of draft reports
                 'total_completed': Count of completed reports
-                'filter_hours': Number of hours filtered (48)
+                'filter_hours': Number of hours filtered
             }
         
         Raises:
             Exception: If database query fails
         '''
         try:
-            # Verify user has permission (Healthcare or Administrative)
-            is_healthcare: bool = Healthcare.objects.filter(user=user).exists()
-            if not (is_healthcare):
+            # Verify user has permission (Healthcare only); role is resolved once per request
+            staff_role: StaffRole = StaffRoleResolver().for_user(user)
+            if not staff_role.is_healthcare:
                 return {
                     'response': 'Solamente el personal de salud puede acceder a este recurso.',
                     'msg': -1,
                     'status_code_http': 403
                 }                  
-            # Calculate time threshold (48 hours ago)
-            time_threshold: timezone.datetime = timezone.now() - timedelta(hours=48)
-            # Base queryset: user's reports from last 48 hours
-            base_queryset: QuerySet[PatientTransportReport] = PatientTransportReport.objects.filter(
-                created_by=user,
-                created_at__gte=time_threshold
-            ).select_related(
-                'patient',
-                'created_by'
-            ).order_by('-created_at')
-            # Separate by status
-            draft_reports: QuerySet[PatientTransportReport] = base_queryset.filter(status='borrador')
-            completed_reports: QuerySet[PatientTransportReport] = base_queryset.filter(status='completado')
+            if window_hours is None:
+                window_hours = getattr(settings, 'BUZON_WINDOW_HOURS', self.DEFAULT_WINDOW_HOURS)
+            time_threshold: timezone.datetime = timezone.now() - timedelta(hours=window_hours)
+            # Single query: user's reports inside the window, most recent first
+            reports: list[PatientTransportReport] = list(
+                PatientTransportReport.objects.filter(
+                    created_by=user,
+                    created_at__gte=time_threshold
+                ).summary().order_by('-created_at')
+            )
+            # Separate by status in memory (order is preserved)
+            draft_reports: list[PatientTransportReport] = [
+                report for report in reports if report.status == self.DRAFT_STATUS
+            ]
+            completed_reports: list[PatientTransportReport] = [
+                report for report in reports if report.status == self.COMPLETED_STATUS
+            ]
             # Serialize data
             draft_serializer: PatientTransportReportSummarySerializer = PatientTransportReportSummarySerializer(draft_reports, many=True)
             completed_serializer: PatientTransportReportSummarySerializer = PatientTransportReportSummarySerializer(completed_reports, many=True)
@@ -79,8 +94,9 @@ class ListBuzonApplicationService:
                 'status_code_http': 200,
                 'list_report_draft': draft_serializer.data,
                 'list_report_completed': completed_serializer.data,
-                'total_draft': draft_reports.count(),
-                'total_completed': completed_reports.count()
+                'total_draft': len(draft_reports),
+                'total_completed': len(completed_reports),
+                'filter_hours': window_hours
             }
         except Exception as e:
             return {
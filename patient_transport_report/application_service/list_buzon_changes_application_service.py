@@ -0,0 +1,73 @@
+from typing import Any
+from django.contrib.auth.models import User
+from ..domain_service import BuzonChangeFeedDomainService
+from ..serializers.out import PatientTransportReportSummarySerializer
+from ..types.dataclass import (
+    BuzonChangeCursor,
+    BuzonChanges
+)
+from staff.domain_service import StaffRoleResolver
+from staff.types.dataclass import StaffRole
+
+class ListBuzonChangesApplicationService:
+    '''
+    Application service for the incremental buzon (inbox) change feed.
+
+    Business logic:
+    - Only Healthcare staff (same rule as list_buzon)
+    - Return the user's reports changed after the client's cursor
+    - Soft-deleted reports are returned as removed IDs
+    '''
+
+    def __init__(self):
+        self.change_feed_service: BuzonChangeFeedDomainService = BuzonChangeFeedDomainService()
+
+    def list_changes(
+        self,
+        user: User,
+        since: BuzonChangeCursor | None = None,
+        limit: int = BuzonChangeFeedDomainService.DEFAULT_LIMIT
+    ) -> dict[str, Any]:
+        '''
+        List the buzon reports of the authenticated user changed after a cursor.
+
+        Args:
+            user: Authenticated user making the request
+            since: Decoded next_since of the previous call, or None
+            limit: Maximum number of changed reports
+
+        Returns:
+            dict: {
+                'response': Success/error message
+                'msg': 1 for success, -1 for error
+                'status_code_http': HTTP status code
+                'list_report_changed': Changed reports (summary, any status)
+                'removed_report_ids': IDs of soft-deleted reports
+                'next_since': Cursor for the next call
+                'has_more': Whether more changes are pending
+            }
+        '''
+        try:
+            staff_role: StaffRole = StaffRoleResolver().for_user(user)
+            if not staff_role.is_healthcare:
+                return {
+                    'response': 'Solamente el personal de salud puede acceder a este recurso.',
+                    'msg': -1,
+                    'status_code_http': 403
+                }
+            changes: BuzonChanges = self.change_feed_service.get_changes(user.pk, since, limit)
+            return {
+                'response': 'Exito al recuperar los cambios del buzón.',
+                'msg': 1,
+                'status_code_http': 200,
+                'list_report_changed': PatientTransportReportSummarySerializer(changes.changed, many=True).data,
+                'removed_report_ids': changes.removed_ids,
+                'next_since': changes.next_cursor.encode(),
+                'has_more': changes.has_more
+            }
+        except Exception as e:
+            return {
+                'response': f'Error retrieving buzon changes: {str(e)}',
+                'msg': -1,
+                'status_code_http': 500
+            }
@@ -0,0 +1,142 @@
+from typing import (
+    Any,
+    Iterator
+)
+from uuid import UUID
+from django.contrib.auth.models import User
+from django.db import IntegrityError
+from ..domain_service import ReportSyncDomainService
+from ..serializers.input import SyncReportItemSerializer
+from ..serializers.out import ReportSyncResultSerializer
+from ..types.dataclass import (
+    ReportSyncItem,
+    ReportSyncResult
+)
+from staff.domain_service import StaffRoleResolver
+from staff.types.dataclass import StaffRole
+import hashlib
+import json
+import logging
+
+class SyncReportsApplicationService:
+    '''
+    Application service for the offline sync of reports captured in the ambulance.
+
+    Business logic:
+    - Verify user is Healthcare staff (the author of the reports)
+    - Validate each report on its own; invalid ones get their own result
+    - Upsert the valid ones by client UUID in one transaction
+    - Return one result per report with the server version
+    '''
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.report_sync_service: ReportSyncDomainService = ReportSyncDomainService()
+
+    def sync_reports(
+        self,
+        reports: list[dict[str, Any]],
+        user: User
+    ) -> dict[str, Any]:
+        '''
+        Create or update a batch of reports.
+
+        Args:
+            reports: Raw reports of the batch (SyncReportItemSerializer format)
+            user: Authenticated user making the request
+
+        Returns:
+            dict: {
+                'response': Success/error message
+                'msg': 1 for success, -1 for error
+                'status_code_http': HTTP status code
+                'results': One result per report, in request order
+            }
+        '''
+        try:
+            staff_role: StaffRole = StaffRoleResolver().for_user(user)
+            if not staff_role.is_healthcare:
+                return {
+                    'response': 'Solamente el personal de salud puede sincronizar informes.',
+                    'msg': -1,
+                    'status_code_http': 403
+                }
+            results: list[ReportSyncResult | None] = []
+            items: list[ReportSyncItem] = []
+            seen_uuids: set[UUID] = set()
+            for raw_report in reports:
+                item, result = self._validate(raw_report, seen_uuids)
+                if item is not None:
+                    items.append(item)
+                    seen_uuids.add(item.client_uuid)
+                results.append(result)
+            # Fill the slots of the valid reports with their sync results, in order
+            synced: Iterator[ReportSyncResult] = iter(
+                self.report_sync_service.sync(items, user) if items else []
+            )
+            results = [result if result is not None else next(synced) for result in results]
+            return {
+                'response': 'Sincronización completada.',
+                'msg': 1,
+                'status_code_http': 200,
+                'results': ReportSyncResultSerializer(results, many=True).data
+            }
+        except IntegrityError as e:
+            # e.g. the same UUID or patient written by a concurrent request
+            self.logger.warning(f'Conflict syncing reports: {str(e)}')
+            return {
+                'response': 'El lote entra en conflicto con datos existentes, intente nuevamente.',
+                'msg': -1,
+                'status_code_http': 409
+            }
+        except Exception as e:
+            self.logger.error(
+                f'Error in sync reports application service: {str(e)}',
+                exc_info=True
+            )
+            return {
+                'response': 'Ocurrió un error al sincronizar los informes.',
+                'msg': -1,
+                'status_code_http': 500
+            }
+
+    def _validate(
+        self,
+        raw_report: dict[str, Any],
+        seen_uuids: set[UUID]
+    ) -> tuple[ReportSyncItem | None, ReportSyncResult | None]:
+        '''Item to sync, or the result of a report rejected before writing.'''
+        serializer: SyncReportItemSerializer = SyncReportItemSerializer(data=raw_report)
+        if not serializer.is_valid():
+            client_uuid: UUID | None = None
+            if 'client_uuid' not in serializer.errors:
+                client_uuid = serializer.fields['client_uuid'].to_internal_value(raw_report['client_uuid'])
+            return None, ReportSyncResult(
+                client_uuid=client_uuid,
+                status=ReportSyncDomainService.INVALID,
+                response='Datos inválidos.',
+                errors=serializer.errors
+            )
+        data: dict[str, Any] = serializer.validated_data
+        if data['client_uuid'] in seen_uuids:
+            return None, ReportSyncResult(
+                client_uuid=data['client_uuid'],
+                status=ReportSyncDomainService.INVALID,
+                response='El UUID está repetido en el lote.'
+            )
+        return ReportSyncItem(
+            client_uuid=data['client_uuid'],
+            report_data=data,
+            digest=self._digest(raw_report),
+            base_version=data.get('base_version')
+        ), None
+
+    def _digest(
+        self,
+        raw_report: dict[str, Any]
+    ) -> str:
+        '''SHA-256 of the report as sent, without its sync precondition.'''
+        content: dict[str, Any] = {key: value for key, value in raw_report.items() if key != 'base_version'}
+        return hashlib.sha256(
+            json.dumps(content, sort_keys=True, separators=(',', ':'), default=str).encode()
+        ).hexdigest()
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class PatientTransportReportConfig(AppConfig):
     name = 'patient_transport_report'
+
+    def ready(self):
+        from . import checks, signals  # noqa: F401
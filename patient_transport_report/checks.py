@@ -0,0 +1,18 @@
+from typing import Any
+from django.core.checks import (
+    Error,
+    register
+)
+from .domain_service import DiagnosisSearchDomainService
+
+
+@register()
+def check_diagnosis_search_backend(
+    app_configs: Any,
+    **kwargs
+) -> list[Error]:
+    '''Refuse to start with a diagnosis search backend the database cannot serve.'''
+    error: str | None = DiagnosisSearchDomainService().configuration_error()
+    if error:
+        return [Error(error, id='patient_transport_report.E001')]
+    return []
@@ -0,0 +1,23 @@
+from .diagnosis_search_index import DiagnosisSearchIndex
+from .diagnosis_search_domain_service import DiagnosisSearchDomainService
+from .catalog_snapshot_domain_service import CatalogSnapshotDomainService
+from .catalog_reconciliation_domain_service import CatalogReconciliationDomainService
+from .report_snapshot_domain_service import ReportSnapshotDomainService
+from .buzon_change_feed_domain_service import BuzonChangeFeedDomainService
+from .signature_store_domain_service import SignatureStoreDomainService
+from .report_creation_domain_service import ReportCreationDomainService
+from .report_sync_domain_service import ReportSyncDomainService
+from .report_autosave_domain_service import ReportAutosaveDomainService
+
+__all__ = [
+    'DiagnosisSearchIndex',
+    'DiagnosisSearchDomainService',
+    'CatalogSnapshotDomainService',
+    'CatalogReconciliationDomainService',
+    'ReportSnapshotDomainService',
+    'BuzonChangeFeedDomainService',
+    'SignatureStoreDomainService',
+    'ReportCreationDomainService',
+    'ReportSyncDomainService',
+    'ReportAutosaveDomainService'
+]
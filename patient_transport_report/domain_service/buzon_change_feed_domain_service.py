@@ -0,0 +1,199 @@
+from datetime import (
+    datetime,
+    timedelta,
+    timezone as dt_timezone
+)
+from typing import Any
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import QuerySet
+from django.utils import timezone
+from ..models import PatientTransportReport
+from ..types.dataclass import (
+    BuzonChangeCursor,
+    BuzonChanges
+)
+import logging
+import time
+
+class BuzonChangeFeedDomainService:
+    '''
+    Incremental change feed of a user's buzon (inbox).
+
+    Clients keep a (updated_at, id) high-water mark and only receive the
+    reports that changed after it: new or edited reports in `changed`,
+    soft-deleted ones in `removed_ids`. Rows come from a range scan over the
+    (created_by, updated_at, id) index, limited to the buzon window.
+
+    updated_at is set when a row is written, not when its transaction
+    commits, so a save that commits late can land behind a mark already
+    handed out. Each poll therefore re-reads BUZON_CHANGES_OVERLAP_SECONDS
+    behind the mark and skips the changes the cursor lists as already sent
+    there, keyed by (id, updated_at) so soft deletes and restores, which
+    keep the report version, still count. Saves whose transaction outlasts
+    the overlap can still be missed.
+
+    Idle polls skip the database when a shared cache is configured
+    (BUZON_CHANGES_CACHE_ALIAS). Every committed report save increments a
+    per-user change counter there, and each cursor carries the counter value
+    read before its query. An unchanged counter means nothing new to fetch.
+    Without the alias every poll runs the keyset query.
+    '''
+
+    DEFAULT_LIMIT: int = 100
+    DEFAULT_WINDOW_HOURS: int = 48
+    DEFAULT_OVERLAP_SECONDS: int = 30
+    EPOCH: datetime = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+    VERSION_KEY_PREFIX: str = 'buzon_changes:'
+    VERSION_TTL_SECONDS: int = 24 * 60 * 60
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def get_changes(
+        self,
+        user_id: int,
+        since: BuzonChangeCursor | None = None,
+        limit: int = DEFAULT_LIMIT
+    ) -> BuzonChanges:
+        '''
+        Return the reports of a user that changed after a cursor.
+
+        Args:
+            user_id: ID of the report author (created_by)
+            since: Cursor returned by the previous call; None starts at
+                the beginning of the buzon window
+            limit: Maximum number of reports returned
+
+        Returns:
+            BuzonChanges with the next cursor to poll from
+        '''
+        window_start: datetime = self.window_start()
+        # Read the counter before querying: a save committed afterwards
+        # changes it, so the next poll goes to the database again
+        version: int | None = self._get_version(user_id)
+        if since is None:
+            since = BuzonChangeCursor(updated_at=window_start, id=0)
+        elif version is not None and since.version == version:
+            return BuzonChanges(next_cursor=since)
+        scan_from: datetime = since.updated_at - self._overlap()
+        seen: set[tuple[int, int]] = set(since.seen)
+        # Seen rows are skipped, so read enough to fill the page after them
+        reports: list[PatientTransportReport] = [
+            report
+            for report in self._changes_queryset(user_id, scan_from, window_start)[:limit + 1 + len(seen)]
+            if self._seen_key(report) not in seen
+        ]
+        has_more: bool = len(reports) > limit
+        reports = reports[:limit]
+        # Rows are sorted by updated_at: a late commit behind the mark keeps it
+        mark: BuzonChangeCursor | PatientTransportReport = since
+        if reports and reports[-1].updated_at > since.updated_at:
+            mark = reports[-1]
+        changes: BuzonChanges = BuzonChanges(
+            next_cursor=BuzonChangeCursor(
+                updated_at=mark.updated_at,
+                id=mark.id,
+                # A partial page must be fetched again, so it does not keep the counter
+                version=None if has_more else version,
+                seen=self._seen_in_overlap(seen, reports, mark.updated_at)
+            ),
+            has_more=has_more
+        )
+        for report in reports:
+            if report.is_deleted:
+                changes.removed_ids.append(report.id)
+            else:
+                changes.changed.append(report)
+        return changes
+
+    def mark_changed(
+        self,
+        user_id: int
+    ) -> None:
+        '''Bump the change counter of a user (called once the save commits).'''
+        cache: Any = self._cache()
+        if cache is None:
+            return
+        key: str = self._version_key(user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Missing or evicted: any fresh value differs from every issued cursor
+            cache.add(key, time.time_ns(), timeout=self.VERSION_TTL_SECONDS)
+
+    def window_start(self) -> datetime:
+        '''Oldest created_at shown in the buzon.'''
+        window_hours: int = getattr(settings, 'BUZON_WINDOW_HOURS', self.DEFAULT_WINDOW_HOURS)
+        return timezone.now() - timedelta(hours=window_hours)
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _changes_queryset(
+        self,
+        user_id: int,
+        scan_from: datetime,
+        window_start: datetime
+    ) -> QuerySet[PatientTransportReport]:
+        '''Range scan of the user's reports changed since scan_from, deleted ones included.'''
+        return PatientTransportReport.all_objects.filter(
+            created_by_id=user_id,
+            updated_at__gte=scan_from,
+            created_at__gte=window_start
+        ).summary('is_deleted').order_by('updated_at', 'id')
+
+    def _overlap(self) -> timedelta:
+        '''How far behind the cursor each poll re-reads.'''
+        return timedelta(
+            seconds=getattr(settings, 'BUZON_CHANGES_OVERLAP_SECONDS', self.DEFAULT_OVERLAP_SECONDS)
+        )
+
+    def _seen_key(
+        self,
+        report: PatientTransportReport
+    ) -> tuple[int, int]:
+        '''(id, updated_at in microseconds) of one change of a report.'''
+        return (report.id, (report.updated_at - self.EPOCH) // timedelta(microseconds=1))
+
+    def _seen_in_overlap(
+        self,
+        seen: set[tuple[int, int]],
+        reports: list[PatientTransportReport],
+        updated_at: datetime
+    ) -> tuple[tuple[int, int], ...]:
+        '''Changes sent so far that the next poll re-reads, oldest first.'''
+        oldest: int = (updated_at - self._overlap() - self.EPOCH) // timedelta(microseconds=1)
+        return tuple(sorted(
+            (key for key in seen.union(map(self._seen_key, reports)) if key[1] >= oldest),
+            key=lambda key: (key[1], key[0])
+        ))
+
+    def _cache(self) -> Any:
+        '''Shared cache holding the change counters, or None when not configured.'''
+        alias: str | None = getattr(settings, 'BUZON_CHANGES_CACHE_ALIAS', None)
+        return caches[alias] if alias else None
+
+    def _version_key(
+        self,
+        user_id: int
+    ) -> str:
+        return f'{self.VERSION_KEY_PREFIX}{user_id}'
+
+    def _get_version(
+        self,
+        user_id: int
+    ) -> int | None:
+        '''Current change counter of a user, seeding it when missing.'''
+        cache: Any = self._cache()
+        if cache is None:
+            return None
+        key: str = self._version_key(user_id)
+        version: int | None = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=self.VERSION_TTL_SECONDS)
+            version = cache.get(key)
+        return version
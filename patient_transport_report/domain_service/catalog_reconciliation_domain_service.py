@@ -0,0 +1,84 @@
+from typing import Iterable
+from django.db import (
+    models,
+    transaction
+)
+from ..types.dataclass import CatalogReconciliation
+import logging
+
+class CatalogReconciliationDomainService:
+    '''
+    Domain service that reconciles name-based catalogs (IPS, EPS, ARL, SOAT)
+    against the names read from a loading file.
+
+    Existing rows are fetched with a single query per model and the diff is
+    computed in memory:
+    - created: names in the file that do not exist yet
+    - reactivated: names in the file whose row is inactive
+    - deactivated: active rows missing from the file (only when requested)
+
+    Changes are applied set-based (one INSERT batch and at most two UPDATEs)
+    inside one transaction per model.
+    '''
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def reconcile(
+        self,
+        model: type[models.Model],
+        names: Iterable[str],
+        deactivate_missing: bool = False,
+        dry_run: bool = False
+    ) -> CatalogReconciliation:
+        '''
+        Compute and (unless dry_run) apply the diff for one catalog model.
+
+        Args:
+            model: Catalog model with unique 'name' and 'is_active' fields
+            names: Normalized, unique names read from the file
+            deactivate_missing: Deactivate active rows not present in names
+            dry_run: Only compute the diff, do not write
+
+        Returns:
+            CatalogReconciliation with the names in each set
+        '''
+        existing: dict[str, tuple[int, bool]] = {
+            name: (pk, is_active)
+            for pk, name, is_active in model.objects.values_list('pk', 'name', 'is_active')
+        }
+        ordered_names: list[str] = list(names)
+        wanted: set[str] = set(ordered_names)
+        result: CatalogReconciliation = CatalogReconciliation(catalog=model.__name__)
+        reactivate_ids: list[int] = []
+        deactivate_ids: list[int] = []
+        for name in ordered_names:
+            current: tuple[int, bool] | None = existing.get(name)
+            if current is None:
+                result.created.append(name)
+            elif not current[1]:
+                result.reactivated.append(name)
+                reactivate_ids.append(current[0])
+            else:
+                result.unchanged += 1
+        if deactivate_missing:
+            for name, (pk, is_active) in existing.items():
+                if is_active and name not in wanted:
+                    result.deactivated.append(name)
+                    deactivate_ids.append(pk)
+        if dry_run:
+            return result
+        with transaction.atomic():
+            if result.created:
+                model.objects.bulk_create(
+                    [model(name=name, is_active=True) for name in result.created]
+                )
+            if reactivate_ids:
+                model.objects.filter(pk__in=reactivate_ids).update(is_active=True)
+            if deactivate_ids:
+                model.objects.filter(pk__in=deactivate_ids).update(is_active=False)
+        self.logger.info(
+            f'{result.catalog}: {len(result.created)} created, '
+            f'{len(result.reactivated)} reactivated, {len(result.deactivated)} deactivated'
+        )
+        return result
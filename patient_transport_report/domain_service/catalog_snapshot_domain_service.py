@@ -0,0 +1,216 @@
+from __future__ import annotations
+from typing import (
+    Any,
+    Callable
+)
+from django.db import transaction
+from django.db.models import F
+from rest_framework.renderers import JSONRenderer
+from ..models import (
+    CatalogVersion,
+    Diagnosis,
+    IPS,
+    EPS,
+    ARL,
+    SOAT
+)
+from ..serializers.out import (
+    DiagnosisSerializer,
+    IPSSerializer,
+    EPSSerializer,
+    ARLSerializer,
+    SOATSerializer
+)
+from ..types.dataclass import CatalogSnapshot
+import gzip
+import hashlib
+import logging
+import threading
+
+class CatalogSnapshotDomainService:
+    '''
+    Domain service that keeps pre-serialized, compressed catalog responses.
+
+    Reference catalogs (diagnoses, ips, eps, arl, soat) only change when the
+    loading management commands run. Each worker keeps one snapshot per
+    catalog: the full JSON response body (plain and gzip) plus a strong ETag.
+    The snapshot is rebuilt only when the catalog's CatalogVersion changes,
+    so a steady-state request costs one single-row version lookup.
+
+    Management commands call bump_version() after loading data.
+    '''
+
+    DIAGNOSES: str = 'diagnoses'
+    IPS: str = 'ips'
+    EPS: str = 'eps'
+    ARL: str = 'arl'
+    SOAT: str = 'soat'
+
+    _snapshots: dict[str, CatalogSnapshot] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._builders: dict[str, Callable[[], dict[str, Any]]] = {
+            self.DIAGNOSES: self._build_diagnoses,
+            self.IPS: self._build_ips,
+            self.EPS: self._build_eps,
+            self.ARL: self._build_arl,
+            self.SOAT: self._build_soat
+        }
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def is_known_catalog(
+        self,
+        catalog: str
+    ) -> bool:
+        '''Check whether a catalog name is served by this service.'''
+        return catalog in self._builders
+
+    def get_snapshot(
+        self,
+        catalog: str
+    ) -> CatalogSnapshot:
+        '''
+        Return the snapshot for the current version of a catalog.
+
+        Args:
+            catalog: Catalog name (see class constants)
+
+        Returns:
+            CatalogSnapshot with plain/gzip bodies and strong ETag
+        '''
+        version: int = self.get_version(catalog)
+        snapshot: CatalogSnapshot | None = self._snapshots.get(catalog)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshots.get(catalog)
+            if snapshot is None or snapshot.version != version:
+                snapshot = self._build_snapshot(catalog, version)
+                self._snapshots[catalog] = snapshot
+        return snapshot
+
+    def get_version(
+        self,
+        catalog: str
+    ) -> int:
+        '''Current version of a catalog (1 if it was never bumped).'''
+        version: int | None = CatalogVersion.objects.filter(
+            catalog=catalog
+        ).values_list('version', flat=True).first()
+        return version or 1
+
+    @staticmethod
+    def bump_version(*catalogs: str) -> None:
+        '''
+        Increment the version of the given catalogs.
+
+        Every worker rebuilds its snapshot on the next request.
+        '''
+        with transaction.atomic():
+            for catalog in catalogs:
+                updated: int = CatalogVersion.objects.filter(
+                    catalog=catalog
+                ).update(version=F('version') + 1)
+                if not updated:
+                    # First bump: version 1 is the implicit default
+                    CatalogVersion.objects.get_or_create(
+                        catalog=catalog,
+                        defaults={'version': 2}
+                    )
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _build_snapshot(
+        self,
+        catalog: str,
+        version: int
+    ) -> CatalogSnapshot:
+        '''Serialize, compress and fingerprint one catalog.'''
+        payload: dict[str, Any] = self._builders[catalog]()
+        body: bytes = JSONRenderer().render(payload)
+        digest: str = hashlib.sha256(body).hexdigest()[:16]
+        self.logger.info(f'Built {catalog} snapshot v{version}: {len(body)} bytes')
+        return CatalogSnapshot(
+            catalog=catalog,
+            version=version,
+            etag=f'"{catalog}-v{version}-{digest}"',
+            body=body,
+            gzip_body=gzip.compress(body, mtime=0)
+        )
+
+    def _build_diagnoses(self) -> dict[str, Any]:
+        '''Full CIE-10 list, same shape as a list_diagnoses search response.'''
+        diagnoses: list[dict[str, Any]] = DiagnosisSerializer(
+            Diagnosis.objects.all().order_by('cie_10'),
+            many=True
+        ).data
+        return {
+            'response': 'Exito al recuperar los diagnósticos.',
+            'msg': 1,
+            'status_code_http': 200,
+            'diagnoses': diagnoses,
+            'total': len(diagnoses),
+            'search_applied': False,
+            'search_query': None
+        }
+
+    def _build_ips(self) -> dict[str, Any]:
+        '''Active IPS, same shape as list_ips.'''
+        institutions: list[dict[str, Any]] = IPSSerializer(
+            IPS.objects.filter(is_active=True).order_by('id'),
+            many=True
+        ).data
+        return {
+            'response': 'Exito al recuperar las instituciones activas.',
+            'msg': 1,
+            'status_code_http': 200,
+            'institutions': institutions,
+            'total': len(institutions)
+        }
+
+    def _build_eps(self) -> dict[str, Any]:
+        '''Active EPS ordered by name.'''
+        eps: list[dict[str, Any]] = EPSSerializer(
+            EPS.objects.filter(is_active=True).order_by('name'),
+            many=True
+        ).data
+        return {
+            'response': 'Exito al recuperar las EPS activas.',
+            'msg': 1,
+            'status_code_http': 200,
+            'eps': eps,
+            'total': len(eps)
+        }
+
+    def _build_arl(self) -> dict[str, Any]:
+        '''Active ARL ordered by name.'''
+        arl: list[dict[str, Any]] = ARLSerializer(
+            ARL.objects.filter(is_active=True).order_by('name'),
+            many=True
+        ).data
+        return {
+            'response': 'Exito al recuperar las ARL activas.',
+            'msg': 1,
+            'status_code_http': 200,
+            'arl': arl,
+            'total': len(arl)
+        }
+
+    def _build_soat(self) -> dict[str, Any]:
+        '''Active SOAT insurers ordered by name.'''
+        soat: list[dict[str, Any]] = SOATSerializer(
+            SOAT.objects.filter(is_active=True).order_by('name'),
+            many=True
+        ).data
+        return {
+            'response': 'Exito al recuperar las aseguradoras SOAT activas.',
+            'msg': 1,
+            'status_code_http': 200,
+            'soat': soat,
+            'total': len(soat)
+        }
@@ -0,0 +1,158 @@
+from typing import Any
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models import (
+    Case,
+    F,
+    Func,
+    IntegerField,
+    Q,
+    TextField,
+    Value,
+    When
+)
+from django.db.models.functions import Lower
+from django.db.models.query import QuerySet
+from ..models import Diagnosis
+from ..serializers.out import DiagnosisSerializer
+from .diagnosis_search_index import DiagnosisSearchIndex
+import logging
+
+class ImmutableUnaccent(Func):
+    '''
+    IMMUTABLE wrapper around unaccent() created by migration 0005.
+
+    Postgres only allows immutable functions inside index expressions, so
+    queries must call the same wrapper for the GIN index to be used.
+    '''
+    function = 'f_unaccent'
+    output_field = TextField()
+
+class DiagnosisSearchDomainService:
+    '''
+    Domain service that resolves CIE-10 diagnosis searches.
+
+    Backends (settings.DIAGNOSIS_SEARCH_BACKEND):
+    - 'memory': per-worker DiagnosisSearchIndex (default)
+    - 'trigram': PostgreSQL pg_trgm + unaccent, typo tolerant, GIN indexed;
+      any other database is a configuration error (system check E001)
+    - 'icontains': plain ORM icontains, portable
+
+    Every backend ranks exact code first, then code prefix, then name matches.
+    '''
+
+    BACKEND_MEMORY: str = 'memory'
+    BACKEND_TRIGRAM: str = 'trigram'
+    BACKEND_ICONTAINS: str = 'icontains'
+    BACKENDS: tuple[str, ...] = (BACKEND_MEMORY, BACKEND_TRIGRAM, BACKEND_ICONTAINS)
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def search(
+        self,
+        search_term: str,
+        limit: int = 10
+    ) -> list[dict[str, Any]]:
+        '''
+        Search diagnoses by CIE-10 code or name.
+
+        Args:
+            search_term: Stripped search term (minimum 2 characters)
+            limit: Maximum number of results to return
+
+        Returns:
+            list of dicts with 'id', 'cie_10', 'cie_10_name' and 'display_name'
+        '''
+        backend: str = self.get_backend()
+        if backend == self.BACKEND_MEMORY:
+            return DiagnosisSearchIndex.get_instance().search(search_term, limit=limit)
+        if backend == self.BACKEND_TRIGRAM:
+            diagnoses: QuerySet[Diagnosis] = self._trigram_queryset(search_term)
+        else:
+            diagnoses = self._icontains_queryset(search_term)
+        return DiagnosisSerializer(diagnoses[:limit], many=True).data
+
+    def get_backend(self) -> str:
+        '''
+        Resolve the configured backend.
+
+        Raises:
+            ImproperlyConfigured: If the backend is unknown, or trigram on a
+                database other than PostgreSQL
+        '''
+        error: str | None = self.configuration_error()
+        if error:
+            raise ImproperlyConfigured(error)
+        return getattr(settings, 'DIAGNOSIS_SEARCH_BACKEND', self.BACKEND_MEMORY)
+
+    def configuration_error(self) -> str | None:
+        '''Why DIAGNOSIS_SEARCH_BACKEND cannot be used, None when it can.'''
+        backend: str = getattr(settings, 'DIAGNOSIS_SEARCH_BACKEND', self.BACKEND_MEMORY)
+        if backend not in self.BACKENDS:
+            return f'DIAGNOSIS_SEARCH_BACKEND={backend!r} is not one of {", ".join(self.BACKENDS)}'
+        if backend == self.BACKEND_TRIGRAM and connection.vendor != 'postgresql':
+            return (
+                "DIAGNOSIS_SEARCH_BACKEND='trigram' requires PostgreSQL "
+                f'(pg_trgm indexes of migration 0005), the database is {connection.vendor}'
+            )
+        return None
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _code_rank(
+        self,
+        search_term: str
+    ) -> Case:
+        '''0 for exact code, 1 for code prefix, 2 for anything else.'''
+        return Case(
+            When(cie_10__iexact=search_term, then=Value(0)),
+            When(cie_10__istartswith=search_term, then=Value(1)),
+            default=Value(2),
+            output_field=IntegerField()
+        )
+
+    def _trigram_queryset(
+        self,
+        search_term: str
+    ) -> QuerySet[Diagnosis]:
+        '''
+        Typo tolerant search backed by the pg_trgm GIN indexes.
+
+        - Code: UPPER(cie_10) LIKE 'TERM%' (gin_trgm_ops on UPPER(cie_10))
+        - Name: f_unaccent(lower(cie_10_name)) %> f_unaccent(lower(term)),
+          i.e. word_similarity above pg_trgm.word_similarity_threshold
+          (gin_trgm_ops on the same expression)
+        '''
+        from django.contrib.postgres.lookups import TrigramWordSimilar
+        from django.contrib.postgres.search import TrigramWordSimilarity
+        search_name: ImmutableUnaccent = ImmutableUnaccent(Lower('cie_10_name'))
+        folded_term: ImmutableUnaccent = ImmutableUnaccent(Lower(Value(search_term)))
+        return Diagnosis.objects.annotate(
+            code_rank=self._code_rank(search_term),
+            name_similarity=TrigramWordSimilarity(folded_term, search_name)
+        ).filter(
+            Q(cie_10__istartswith=search_term) |
+            Q(TrigramWordSimilar(search_name, folded_term))
+        ).order_by(
+            'code_rank',
+            F('name_similarity').desc(),
+            'cie_10'
+        )
+
+    def _icontains_queryset(
+        self,
+        search_term: str
+    ) -> QuerySet[Diagnosis]:
+        '''Portable fallback: substring match on code or name.'''
+        return Diagnosis.objects.filter(
+            Q(cie_10__icontains=search_term) |
+            Q(cie_10_name__icontains=search_term)
+        ).annotate(
+            code_rank=self._code_rank(search_term)
+        ).order_by(
+            'code_rank',
+            'cie_10'
+        )
@@ -0,0 +1,220 @@
+from __future__ import annotations
+from typing import Any
+from django.conf import settings
+from ..models import Diagnosis
+import heapq
+import logging
+import threading
+import time
+import unicodedata
+
+class DiagnosisSearchIndex:
+    '''
+    Per-worker, in-memory search index for CIE-10 diagnoses.
+
+    The index is built from the Diagnosis table on first use and kept in the
+    worker process. It is composed of:
+    - A prefix trie over normalized CIE-10 codes (upper-case, without dots)
+    - An inverted index of accent-folded trigrams over diagnosis names;
+      query words shorter than three characters have no trigram and are
+      matched by scanning every name, like icontains
+
+    Ranking:
+    1. Exact code match
+    2. Code prefix match
+    3. Name match (names starting with the query first)
+    Ties are broken by CIE-10 code.
+
+    Invalidation:
+    - Diagnosis post_save/post_delete signals mark the index as stale
+    - DIAGNOSIS_INDEX_TTL_SECONDS forces a periodic rebuild so changes made
+      by other processes (management commands) are eventually picked up
+    '''
+
+    DEFAULT_TTL_SECONDS: int = 300
+
+    _instance: DiagnosisSearchIndex | None = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: list[dict[str, Any]] = []
+        self._codes: list[str] = []
+        self._names: list[str] = []
+        self._code_trie: dict[str, Any] = {}
+        self._trigrams: dict[str, set[int]] = {}
+        self._built_at: float | None = None
+        self._stale: bool = True
+
+    @classmethod
+    def get_instance(cls) -> DiagnosisSearchIndex:
+        '''Return the process-wide index instance.'''
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def invalidate(self) -> None:
+        '''Mark the index as stale so it is rebuilt on next search.'''
+        self._stale = True
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10
+    ) -> list[dict[str, Any]]:
+        '''
+        Search diagnoses by CIE-10 code or name.
+
+        Args:
+            query: Search term (code or part of the name)
+            limit: Maximum number of results to return
+
+        Returns:
+            list of dicts with 'id', 'cie_10', 'cie_10_name' and 'display_name'
+        '''
+        self._ensure_built()
+        code_query: str = self._normalize_code(query)
+        name_words: list[str] = self._fold(query).split()
+        if not code_query and not name_words:
+            return []
+        ranked: list[tuple[int, str, int]] = []
+        seen: set[int] = set()
+        # Tier 0 and 1: exact code and code prefix (trie postings are sorted by code)
+        for position in self._code_prefix_matches(code_query)[:limit]:
+            tier: int = 0 if self._codes[position] == code_query else 1
+            ranked.append((tier, self._codes[position], position))
+            seen.add(position)
+        # Tier 2 and 3: name matches (trigram candidates verified by substring)
+        folded_query: str = ' '.join(name_words)
+        for position in self._name_matches(name_words):
+            if position in seen:
+                continue
+            tier = 2 if self._names[position].startswith(folded_query) else 3
+            ranked.append((tier, self._codes[position], position))
+        return [self._entries[position] for _, _, position in heapq.nsmallest(limit, ranked)]
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _ensure_built(self) -> None:
+        '''Build the index if it was never built, is stale or expired.'''
+        ttl: int = getattr(settings, 'DIAGNOSIS_INDEX_TTL_SECONDS', self.DEFAULT_TTL_SECONDS)
+        expired: bool = self._built_at is None or (time.monotonic() - self._built_at) > ttl
+        if not (self._stale or expired):
+            return
+        with self._lock:
+            expired = self._built_at is None or (time.monotonic() - self._built_at) > ttl
+            if self._stale or expired:
+                self._build()
+
+    def _build(self) -> None:
+        '''Load all diagnoses and rebuild trie and trigram postings.'''
+        # Clear the flag first so changes during the build trigger another rebuild
+        self._stale = False
+        started: float = time.perf_counter()
+        rows: list[tuple[int, str, str]] = list(
+            Diagnosis.objects.order_by('cie_10').values_list('id', 'cie_10', 'cie_10_name')
+        )
+        entries: list[dict[str, Any]] = []
+        codes: list[str] = []
+        names: list[str] = []
+        code_trie: dict[str, Any] = {}
+        trigrams: dict[str, set[int]] = {}
+        for position, (diagnosis_id, cie_10, cie_10_name) in enumerate(rows):
+            entries.append({
+                'id': diagnosis_id,
+                'cie_10': cie_10,
+                'cie_10_name': cie_10_name,
+                'display_name': f'{cie_10} - {cie_10_name}'
+            })
+            code: str = self._normalize_code(cie_10)
+            codes.append(code)
+            # Every trie node keeps the positions below it, already sorted by code
+            node: dict[str, Any] = code_trie
+            for char in code:
+                node = node.setdefault(char, {'_ids': []})
+                node['_ids'].append(position)
+            folded_name: str = ' '.join(self._fold(cie_10_name).split())
+            names.append(folded_name)
+            for word in folded_name.split():
+                for trigram in self._word_trigrams(word):
+                    trigrams.setdefault(trigram, set()).add(position)
+        self._entries, self._codes, self._names = entries, codes, names
+        self._code_trie, self._trigrams = code_trie, trigrams
+        self._built_at = time.monotonic()
+        self.logger.info(
+            f'Diagnosis index built: {len(entries)} codes, {len(trigrams)} trigrams '
+            f'in {(time.perf_counter() - started) * 1000:.1f} ms'
+        )
+
+    def _code_prefix_matches(
+        self,
+        code_query: str
+    ) -> list[int]:
+        '''Return positions whose normalized code starts with code_query.'''
+        if not code_query:
+            return []
+        node: dict[str, Any] | None = self._code_trie
+        for char in code_query:
+            node = node.get(char)
+            if node is None:
+                return []
+        return node['_ids']
+
+    def _name_matches(
+        self,
+        words: list[str]
+    ) -> list[int]:
+        '''
+        Return positions whose folded name contains every query word.
+
+        Candidates come from intersecting trigram postings; each candidate is
+        then verified by substring so results match icontains semantics.
+        Words under three characters have no trigram, so a query made only
+        of them verifies every name.
+        '''
+        query_trigrams: set[str] = set()
+        for word in words:
+            query_trigrams.update(self._word_trigrams(word))
+        candidates: set[int] | range = range(len(self._names))
+        if query_trigrams:
+            # Intersect from the most selective posting list upwards
+            postings: list[set[int]] = sorted(
+                (self._trigrams.get(trigram, set()) for trigram in query_trigrams),
+                key=len
+            )
+            candidates = postings[0]
+            for posting in postings[1:]:
+                if not candidates:
+                    return []
+                candidates = candidates & posting
+        return [
+            position for position in candidates
+            if all(word in self._names[position] for word in words)
+        ]
+
+    @staticmethod
+    def _word_trigrams(word: str) -> list[str]:
+        '''Split a word into overlapping three-character grams.'''
+        return [word[i:i + 3] for i in range(len(word) - 2)]
+
+    @staticmethod
+    def _normalize_code(value: str) -> str:
+        '''Normalize a CIE-10 code: upper-case, no dots or spaces.'''
+        return ''.join(char for char in value.upper() if char.isalnum())
+
+    @staticmethod
+    def _fold(value: str) -> str:
+        '''Lower-case and strip accents; non alphanumerics become spaces.'''
+        decomposed: str = unicodedata.normalize('NFKD', value.lower())
+        return ''.join(
+            char if char.isalnum() else ' '
+            for char in decomposed
+            if not unicodedata.combining(char)
+        )
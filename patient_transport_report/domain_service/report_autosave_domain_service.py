@@ -0,0 +1,300 @@
+from datetime import timedelta
+from typing import Any
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Model
+from django.utils import timezone
+from core.models import AuditedModel
+from ..models import (
+    PatientTransportReport,
+    InformedConsent
+)
+from ..types.dataclass import ReportAutosaveResult
+from .report_creation_domain_service import ReportCreationDomainService
+from .report_sync_domain_service import ReportSyncDomainService
+import logging
+
+class ReportAutosaveDomainService:
+    '''
+    Field-level autosave of draft reports.
+
+    The patch is a JSON merge patch (RFC 7386) of the report sections,
+    validated by AutosaveReportSerializer: an object is merged into the
+    nested record of the same name (inserted when the report has none yet),
+    null clears a field or detaches a nested record and any other value,
+    lists included, replaces the stored one. Each record writes only the
+    columns whose value changes (save(update_fields=...)), so concurrent
+    edits of other fields are kept.
+
+    Every save names the version it is based on. Rapid autosaves of one
+    client are coalesced into a session: while the client is the last
+    writer and saves again within REPORT_AUTOSAVE_COALESCE_SECONDS, any
+    version written by its session is accepted, so requests still in flight
+    never conflict with each other. Anyone else, or the same client once
+    the session expired, must send the current version.
+    '''
+
+    SAVED: str = 'saved'
+    CONFLICT: str = 'conflict'
+    FORBIDDEN: str = 'forbidden'
+    DRAFT_STATUS: str = 'borrador'
+    DEFAULT_COALESCE_SECONDS: int = 10
+
+    # Patch keys holding the ids of a many-to-many list of CareTransferReport
+    M2M_KEYS: dict[str, str] = {
+        'skin_condition_ids': 'skin_conditions',
+        'hemodynamic_status_ids': 'hemodynamic_statuses'
+    }
+    REPORT_UPDATE_FIELDS: list[str] = [
+        'version',
+        'autosave_client',
+        'autosave_base_version',
+        'autosave_version',
+        'updated_by',
+        'updated_at'
+    ]
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.report_creation_service: ReportCreationDomainService = ReportCreationDomainService()
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def autosave(
+        self,
+        report_id: int,
+        patch: dict[str, Any],
+        base_version: int,
+        client_id: str,
+        user: User,
+        staff_id: int | None = None
+    ) -> ReportAutosaveResult:
+        '''
+        Apply a merge patch to a draft report.
+
+        Args:
+            report_id: ID of the report
+            patch: Validated sections (informed_consent, care_transfer_report,
+                satisfaction_survey), each one optional
+            base_version: Version of the report the patch was made on
+            client_id: ID of the editing client (device or browser tab)
+            user: Author of the change (updated_by)
+            staff_id: BaseStaff ID of the user, matched against the crew of
+                the care transfer report
+
+        Returns:
+            ReportAutosaveResult, with status forbidden when the user is
+            neither the author nor part of the assigned crew, and conflict
+            when the report is no longer a draft or was changed by someone else
+
+        Raises:
+            PatientTransportReport.DoesNotExist: If the report does not exist
+            ValueError: If a referenced record does not exist or the patched
+                report is incomplete
+        '''
+        sections: dict[str, dict[str, Any] | None] = {
+            'patient': None,
+            'informed_consent': patch.get('informed_consent'),
+            'care_transfer_report': patch.get('care_transfer_report'),
+            'satisfaction_survey': patch.get('satisfaction_survey')
+        }
+        error: str | None = self.report_creation_service.check_references([sections])[0]
+        if error:
+            raise ValueError(error)
+        with transaction.atomic():
+            report: PatientTransportReport = PatientTransportReport.objects.select_related(
+                *ReportSyncDomainService.NESTED_PATHS
+            ).select_for_update(
+                of=('self',)
+            ).get(pk=report_id)
+            if not self._is_editor(report, user, staff_id):
+                return self._result(report, self.FORBIDDEN, 'El informe pertenece a otro usuario.')
+            if report.status != self.DRAFT_STATUS:
+                return self._result(report, self.CONFLICT, 'Solamente se pueden editar informes en borrador.')
+            coalesced: bool = self._in_session(report, client_id)
+            if base_version != report.version and not (
+                coalesced and report.autosave_base_version <= base_version <= report.version
+            ):
+                return self._result(report, self.CONFLICT, 'El informe fue modificado por otro usuario.')
+
+            self.report_creation_service.store_signatures([sections])
+            report_fields: list[str]
+            changed: list[str]
+            report_fields, changed = self._apply(report, patch, '', user)
+            if not changed:
+                return self._result(report, self.SAVED, 'Sin cambios.', coalesced=coalesced)
+            self._check(report.informed_consent)
+            if not coalesced:
+                report.autosave_client = client_id
+                report.autosave_base_version = base_version
+            report.version += 1
+            report.autosave_version = report.version
+            report.updated_by = user
+            report.save(update_fields=report_fields + self.REPORT_UPDATE_FIELDS)
+        self.logger.info(
+            f'User {user.username} autosaved report #{report.pk} (version {report.version}): {", ".join(changed)}'
+        )
+        return self._result(report, self.SAVED, 'Cambios guardados.', changed, coalesced)
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _is_editor(
+        self,
+        report: PatientTransportReport,
+        user: User,
+        staff_id: int | None
+    ) -> bool:
+        '''Whether the user wrote the report or is its attending or support staff.'''
+        if report.created_by_id == user.pk:
+            return True
+        return staff_id is not None and staff_id in (
+            report.care_transfer_report.attending_staff_id,
+            report.care_transfer_report.support_staff_id
+        )
+
+    def _in_session(
+        self,
+        report: PatientTransportReport,
+        client_id: str
+    ) -> bool:
+        '''Whether the last write was an autosave of this client, recent enough to coalesce.'''
+        window_seconds: int = getattr(settings, 'REPORT_AUTOSAVE_COALESCE_SECONDS', self.DEFAULT_COALESCE_SECONDS)
+        return (
+            report.autosave_client == client_id
+            and report.autosave_version == report.version
+            and report.updated_at >= timezone.now() - timedelta(seconds=window_seconds)
+        )
+
+    def _apply(
+        self,
+        instance: Model,
+        patch: dict[str, Any],
+        path: str,
+        user: User
+    ) -> tuple[list[str], list[str]]:
+        '''
+        Merge a patch into a saved record, saving its changed nested records.
+
+        Returns:
+            (columns of the record to update, dotted paths of every change)
+        '''
+        update_fields: list[str] = []
+        changed: list[str] = []
+        for key, value in patch.items():
+            key_path: str = f'{path}.{key}' if path else key
+            if key in self.M2M_KEYS:
+                if self._set_m2m(instance, self.M2M_KEYS[key], value):
+                    changed.append(key_path)
+                continue
+            field = instance._meta.get_field(key)
+            if field.is_relation and isinstance(value, dict):
+                related: Model | None = getattr(instance, field.name)
+                if related is None:
+                    setattr(instance, field.name, self._create(field.related_model, value, key_path, user))
+                    update_fields.append(field.attname)
+                    changed.append(key_path)
+                else:
+                    changed.extend(self._merge(related, value, key_path, user))
+                continue
+            new_value: Any = value.pk if isinstance(value, Model) else value
+            if getattr(instance, field.attname) != new_value:
+                setattr(instance, field.attname, new_value)
+                update_fields.append(field.attname)
+                changed.append(key_path)
+        return update_fields, changed
+
+    def _merge(
+        self,
+        instance: Model,
+        patch: dict[str, Any],
+        path: str,
+        user: User
+    ) -> list[str]:
+        '''Merge a patch into a nested record and write its changed columns.'''
+        update_fields: list[str]
+        changed: list[str]
+        update_fields, changed = self._apply(instance, patch, path, user)
+        if update_fields:
+            if isinstance(instance, AuditedModel):
+                instance.updated_by = user
+                update_fields += ['updated_by', 'updated_at']
+            instance.save(update_fields=update_fields)
+        return changed
+
+    def _create(
+        self,
+        model: type[Model],
+        data: dict[str, Any],
+        path: str,
+        user: User
+    ) -> Model:
+        '''Insert a nested record the report did not have, given whole in the patch.'''
+        values: dict[str, Any] = {}
+        for key, value in data.items():
+            field = model._meta.get_field(key)
+            if field.is_relation and isinstance(value, dict):
+                value = self._create(field.related_model, value, f'{path}.{key}', user)
+            values[field.attname] = value.pk if isinstance(value, Model) else value
+        instance: Model = model(**values)
+        if isinstance(instance, AuditedModel):
+            instance.created_by = user
+        try:
+            # Related rows were checked or just written: validate columns only
+            instance.full_clean(
+                exclude=[field.name for field in model._meta.fields if field.is_relation],
+                validate_unique=False
+            )
+        except ValidationError as e:
+            raise ValueError('; '.join(
+                f'{path}.{name}: {" ".join(messages)}' for name, messages in e.message_dict.items()
+            ))
+        instance.save()
+        return instance
+
+    def _set_m2m(
+        self,
+        instance: Model,
+        name: str,
+        ids: list[int]
+    ) -> bool:
+        '''Replace a many-to-many list, writing only the difference.'''
+        manager = getattr(instance, name)
+        current: set[int] = set(manager.values_list('pk', flat=True))
+        wanted: set[int] = set(ids)
+        if current == wanted:
+            return False
+        if current - wanted:
+            manager.remove(*(current - wanted))
+        if wanted - current:
+            manager.add(*(wanted - current))
+        return True
+
+    def _check(
+        self,
+        informed_consent: InformedConsent
+    ) -> None:
+        '''Rules spanning fields that a partial patch may change separately.'''
+        if informed_consent.administers_medications and informed_consent.medication_administration_id is None:
+            raise ValueError('medication_administration: Este campo es obligatorio cuando se administran medicamentos.')
+
+    def _result(
+        self,
+        report: PatientTransportReport,
+        status: str,
+        response: str,
+        changed_fields: list[str] | None = None,
+        coalesced: bool = False
+    ) -> ReportAutosaveResult:
+        return ReportAutosaveResult(
+            status=status,
+            report_id=report.pk,
+            version=report.version,
+            updated_at=report.updated_at,
+            response=response,
+            changed_fields=changed_fields or [],
+            coalesced=coalesced
+        )
@@ -0,0 +1,497 @@
+from functools import partial
+from typing import Any
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import (
+    Model,
+    QuerySet
+)
+from django.utils import timezone
+from core.models import AuditedModel
+from staff.models import (
+    Driver,
+    Healthcare
+)
+from daily_monthly_inventory.models import Ambulance
+from ..models import (
+    PatientTransportReport,
+    Patient,
+    PatientHistory,
+    InsuranceProvider,
+    InformedConsent,
+    RequiredProcedures,
+    MedicationAdministration,
+    Companion,
+    OutgoingReceivingEntity,
+    CareTransferReport,
+    Glasgow,
+    PhysicalExam,
+    Treatment,
+    Result,
+    ComplicationsTransfer,
+    Diagnosis,
+    SkinCondition,
+    HemodynamicStatus,
+    SatisfactionSurvey,
+    SignatureBlob
+)
+from .signature_store_domain_service import SignatureStoreDomainService
+from .report_snapshot_domain_service import ReportSnapshotDomainService
+import logging
+
+class ReportCreationDomainService:
+    '''
+    Domain service that writes a full patient transport report.
+
+    The payload validated by CreateReportSerializer becomes unsaved model
+    instances wired to each other, which are then inserted level by level
+    (rows without dependencies first) with one bulk_create per model and
+    level. bulk_create returns the new ids (RETURNING), so a report costs a
+    fixed number of statements whatever its content:
+
+    - one SELECT per referenced table (staff, ambulance, diagnoses,
+      catalogs) plus the patient lookup, before the transaction
+    - up to three statements for the signature blobs
+    - for a returning patient, one UPDATE per table (patient, history,
+      insurance) whose columns changed
+    - one INSERT per table, the report itself and each M2M table
+
+    The report row is inserted with save() so its post_save receivers
+    (buzon change counter) run as for any other write.
+
+    The steps are public and take several payloads at once, so batch
+    writers (ReportSyncDomainService) keep the same number of statements
+    for a whole batch.
+    '''
+
+    # (section, field) of every signature in the payload
+    SIGNATURE_FIELDS: tuple[tuple[str, str], ...] = (
+        ('patient', 'signature'),
+        ('informed_consent', 'patient_signature'),
+        ('informed_consent', 'responsible_signature'),
+        ('informed_consent', 'attending_staff_signature'),
+        ('informed_consent', 'outgoing_entity_signature'),
+        ('care_transfer_report', 'receiving_entity_signature'),
+        ('satisfaction_survey', 'respondent_signature')
+    )
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.signature_store_service: SignatureStoreDomainService = SignatureStoreDomainService()
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def create(
+        self,
+        report_data: dict[str, Any],
+        user: User
+    ) -> PatientTransportReport:
+        '''
+        Create a report with every nested record in one transaction.
+
+        Args:
+            report_data: Validated data of CreateReportSerializer
+            user: Author of the report (created_by)
+
+        Returns:
+            The new PatientTransportReport, with patient and created_by set
+
+        Raises:
+            ValueError: If a referenced record does not exist or the
+                patient was deleted
+        '''
+        sections: dict[str, dict[str, Any] | None] = self.sections(report_data)
+        error: str | None = self.check_references([sections])[0]
+        if error:
+            raise ValueError(error)
+        patient: Patient | None = self.find_patients([sections]).get(
+            sections['patient']['identification_number']
+        )
+        if patient is not None:
+            error = self.check_patient(patient)
+            if error:
+                raise ValueError(error)
+        with transaction.atomic():
+            self.store_signatures([sections])
+            if patient is not None:
+                # Returning patient: linked, with the columns that changed
+                self.update_patients([(patient, sections['patient'])], user)
+            report: PatientTransportReport = self.build(sections, patient, user, report_data['status'])
+            self.insert_nested([report])
+            report.save()
+            self.insert_m2m([(report.care_transfer_report, sections['care_transfer_report'])])
+            if report.status == ReportSnapshotDomainService.COMPLETED_STATUS:
+                transaction.on_commit(partial(ReportSnapshotDomainService().materialize, report.pk))
+        self.logger.info(f'User {user.username} created report #{report.pk}')
+        return report
+
+    def sections(
+        self,
+        report_data: dict[str, Any]
+    ) -> dict[str, dict[str, Any] | None]:
+        '''Working copy of the validated payload, one dict per section.'''
+        return {
+            'patient': dict(report_data['patient']),
+            'informed_consent': dict(report_data['informed_consent']),
+            'care_transfer_report': dict(report_data['care_transfer_report']),
+            'satisfaction_survey': (
+                dict(report_data['satisfaction_survey'])
+                if report_data.get('satisfaction_survey') else None
+            )
+        }
+
+    def check_references(
+        self,
+        sections_list: list[dict[str, dict[str, Any] | None]]
+    ) -> list[str | None]:
+        '''
+        Check the ids referenced by several payloads, one query per table.
+
+        Returns:
+            Error message per payload (None when every reference exists)
+        '''
+        wanted: list[dict[str, set[int]]] = [self._references(sections) for sections in sections_list]
+        found: dict[str, set[int]] = {}
+        for label, queryset in self._reference_querysets().items():
+            ids: set[int] = set().union(*(references[label] for references in wanted))
+            found[label] = set(queryset.filter(pk__in=ids).order_by().values_list('pk', flat=True))
+        errors: list[str | None] = []
+        for references in wanted:
+            error: str | None = None
+            for label, ids in references.items():
+                missing: list[int] = sorted(ids - found[label])
+                if missing:
+                    error = f'No existe {label} con ID {", ".join(map(str, missing))}.'
+                    break
+            errors.append(error)
+        return errors
+
+    def find_patients(
+        self,
+        sections_list: list[dict[str, dict[str, Any] | None]]
+    ) -> dict[str, Patient]:
+        '''Existing patients (deleted included, with history and insurance) by identification number, in one query.'''
+        numbers: set[str] = {
+            sections['patient']['identification_number']
+            for sections in sections_list
+            if sections['patient'] is not None
+        }
+        if not numbers:
+            return {}
+        return {
+            patient.identification_number: patient
+            for patient in Patient.all_objects.select_related(
+                'patient_history',
+                'insurance_provider'
+            ).filter(identification_number__in=numbers)
+        }
+
+    def check_patient(
+        self,
+        patient: Patient
+    ) -> str | None:
+        '''Error message when an existing patient cannot receive new reports.'''
+        if patient.is_deleted:
+            return f'El paciente con identificación {patient.identification_number} fue eliminado.'
+        return None
+
+    def update_patients(
+        self,
+        updates: list[tuple[Patient, dict[str, Any]]],
+        user: User
+    ) -> None:
+        '''
+        Write the changed columns of returning patients, with one bulk_update
+        per table.
+
+        The patient section of a new report is the patient's current data:
+        the columns it carries that differ from the stored ones (history and
+        insurance included) are replaced. An empty signature keeps the
+        stored one.
+
+        Args:
+            updates: (patient from find_patients(), its patient section with
+                signatures stored), in report order; later sections win
+            user: Author of the reports (updated_by)
+        '''
+        now = timezone.now()
+        changed: dict[type[Model], dict[int, Model]] = {}
+        fields: dict[type[Model], set[str]] = {}
+        for patient, patient_data in updates:
+            patient_data = dict(patient_data)
+            signature: SignatureBlob | None = patient_data.pop('signature', None)
+            if signature is not None:
+                patient_data['signature_id'] = signature.pk
+            for instance, data in (
+                (patient.patient_history, patient_data.pop('patient_history')),
+                (patient.insurance_provider, patient_data.pop('insurance_provider')),
+                (patient, patient_data)
+            ):
+                names: list[str] = [name for name, value in data.items() if getattr(instance, name) != value]
+                if not names:
+                    continue
+                model: type[Model] = type(instance)
+                for name in names:
+                    setattr(instance, name, data[name])
+                    fields.setdefault(model, set()).add(model._meta.get_field(name).name)
+                if isinstance(instance, AuditedModel):
+                    instance.updated_by = user
+                    instance.updated_at = now
+                    fields[model].update(('updated_by', 'updated_at'))
+                changed.setdefault(model, {})[instance.pk] = instance
+        for model, instances in changed.items():
+            model._base_manager.bulk_update(list(instances.values()), sorted(fields[model]))
+
+    def store_signatures(
+        self,
+        sections_list: list[dict[str, dict[str, Any] | None]]
+    ) -> None:
+        '''Replace the signature strings present in several payloads with their blobs.'''
+        slots: list[tuple[dict[str, Any], str]] = [
+            (sections[section], field)
+            for sections in sections_list
+            for section, field in self.SIGNATURE_FIELDS
+            if sections[section] is not None and field in sections[section]
+        ]
+        blobs: list[SignatureBlob | None] = self.signature_store_service.store_many(
+            [data.get(field) for data, field in slots]
+        )
+        for (data, field), blob in zip(slots, blobs):
+            data[field] = blob
+
+    def build(
+        self,
+        sections: dict[str, dict[str, Any] | None],
+        patient: Patient | None,
+        user: User,
+        status: str
+    ) -> PatientTransportReport:
+        '''
+        Unsaved report wired to unsaved nested records.
+
+        Args:
+            sections: Result of sections(), with signatures already stored
+            patient: Patient to link; None builds one from the patient section
+            user: Author (created_by)
+            status: Report status
+
+        Returns:
+            PatientTransportReport whose records are written by insert_nested()
+        '''
+        if patient is None:
+            patient = self._build_patient(sections['patient'], user)
+        return self._build_report(sections, patient, user, status)
+
+    def insert_nested(
+        self,
+        reports: list[PatientTransportReport]
+    ) -> None:
+        '''
+        Insert the unsaved records of several reports, level by level, with
+        one bulk_create per model and level. Records that already have a
+        primary key are left alone. The report rows are not inserted.
+        '''
+        levels: list[tuple[tuple[Model | None, ...], ...]] = [self._levels(report) for report in reports]
+        for depth in range(3):
+            self._insert(*(instance for report_levels in levels for instance in report_levels[depth]))
+
+    def insert_m2m(
+        self,
+        care_transfer_reports: list[tuple[CareTransferReport, dict[str, Any]]]
+    ) -> None:
+        '''
+        Insert the skin condition and hemodynamic status rows of several
+        care transfer reports, one bulk_create per M2M table.
+
+        Args:
+            care_transfer_reports: (saved CareTransferReport, its payload section)
+        '''
+        for field, ids_key in (
+            ('skin_conditions', 'skin_condition_ids'),
+            ('hemodynamic_statuses', 'hemodynamic_status_ids')
+        ):
+            m2m_field = CareTransferReport._meta.get_field(field)
+            through: type[Model] = m2m_field.remote_field.through
+            through.objects.bulk_create([
+                through(**{
+                    m2m_field.m2m_field_name(): care_transfer_report,
+                    f'{m2m_field.m2m_reverse_field_name()}_id': target_id
+                })
+                for care_transfer_report, care_data in care_transfer_reports
+                for target_id in dict.fromkeys(care_data[ids_key])
+            ])
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _reference_querysets(self) -> dict[str, QuerySet]:
+        '''Tables referenced by id from the payload, by label.'''
+        return {
+            'personal de salud': Healthcare.objects.all(),
+            'conductor': Driver.objects.all(),
+            'ambulancia': Ambulance.objects.filter(is_active=True),
+            'diagnóstico': Diagnosis.objects.all(),
+            'condición de piel': SkinCondition.objects.filter(is_active=True),
+            'estado hemodinámico': HemodynamicStatus.objects.filter(is_active=True)
+        }
+
+    def _references(
+        self,
+        sections: dict[str, dict[str, Any] | None]
+    ) -> dict[str, set[int]]:
+        '''Ids referenced by one payload (whole or partial, e.g. an autosave), by label.'''
+        consent_data: dict[str, Any] = sections['informed_consent'] or {}
+        care_data: dict[str, Any] = sections['care_transfer_report'] or {}
+        references: dict[str, set[int | None]] = {
+            'personal de salud': {
+                consent_data.get('attending_staff_id'),
+                care_data.get('attending_staff_id'),
+                care_data.get('support_staff_id')
+            },
+            'conductor': {care_data.get('driver_id')},
+            'ambulancia': {care_data.get('ambulance_id')},
+            'diagnóstico': {care_data.get('diagnosis_1_id'), care_data.get('diagnosis_2_id')},
+            'condición de piel': set(care_data.get('skin_condition_ids', ())),
+            'estado hemodinámico': set(care_data.get('hemodynamic_status_ids', ()))
+        }
+        for ids in references.values():
+            ids.discard(None)
+        return references
+
+    def _build_patient(
+        self,
+        patient_data: dict[str, Any],
+        user: User
+    ) -> Patient:
+        '''Unsaved Patient with its history and insurance provider.'''
+        patient_history: PatientHistory = PatientHistory(**patient_data.pop('patient_history'))
+        insurance_provider: InsuranceProvider = InsuranceProvider(**patient_data.pop('insurance_provider'))
+        return Patient(
+            **patient_data,
+            patient_history=patient_history,
+            insurance_provider=insurance_provider,
+            created_by=user
+        )
+
+    def _build_report(
+        self,
+        sections: dict[str, dict[str, Any] | None],
+        patient: Patient,
+        user: User,
+        status: str
+    ) -> PatientTransportReport:
+        '''Unsaved report wired to unsaved nested records.'''
+        consent_data: dict[str, Any] = sections['informed_consent']
+        required_procedures: RequiredProcedures = RequiredProcedures(**consent_data.pop('required_procedures'))
+        medication_data: dict[str, Any] | None = consent_data.pop('medication_administration', None)
+        consent_responsible_data: dict[str, Any] | None = consent_data.pop('responsible', None)
+        outgoing_entity: OutgoingReceivingEntity = OutgoingReceivingEntity(**consent_data.pop('outgoing_entity'))
+        informed_consent: InformedConsent = InformedConsent(
+            **consent_data,
+            required_procedures=required_procedures,
+            medication_administration=MedicationAdministration(**medication_data) if medication_data else None,
+            responsible=Companion(**consent_responsible_data) if consent_responsible_data else None,
+            outgoing_entity=outgoing_entity,
+            created_by=user
+        )
+
+        care_data: dict[str, Any] = dict(sections['care_transfer_report'])
+        care_data.pop('skin_condition_ids')
+        care_data.pop('hemodynamic_status_ids')
+        companion_data: dict[str, Any] | None = care_data.pop('companion', None)
+        responsible_data: dict[str, Any] | None = care_data.pop('responsible', None)
+        companion: Companion | None = Companion(**companion_data) if companion_data else None
+        responsible: Companion | None = Companion(**responsible_data) if responsible_data else None
+        if responsible is None and care_data.get('companion_is_responsible'):
+            responsible = companion
+        initial_exam: PhysicalExam = self._build_physical_exam(care_data.pop('initial_physicial_examination'))
+        final_exam: PhysicalExam = self._build_physical_exam(care_data.pop('final_physical_examination'))
+        treatment: Treatment = Treatment(**care_data.pop('treatment'))
+        result: Result = Result(**care_data.pop('result'))
+        complications_transfer: ComplicationsTransfer = ComplicationsTransfer(**care_data.pop('complications_transfer'))
+        receiving_entity: OutgoingReceivingEntity = OutgoingReceivingEntity(**care_data.pop('receiving_entity'))
+        care_transfer_report: CareTransferReport = CareTransferReport(
+            **care_data,
+            companion=companion,
+            responsible=responsible,
+            initial_physicial_examination=initial_exam,
+            final_physical_examination=final_exam,
+            treatment=treatment,
+            result=result,
+            complications_transfer=complications_transfer,
+            receiving_entity=receiving_entity,
+            created_by=user
+        )
+
+        survey_data: dict[str, Any] | None = sections['satisfaction_survey']
+        return PatientTransportReport(
+            patient=patient,
+            informed_consent=informed_consent,
+            care_transfer_report=care_transfer_report,
+            satisfaction_survey=SatisfactionSurvey(**survey_data) if survey_data else None,
+            status=status,
+            created_by=user
+        )
+
+    def _build_physical_exam(
+        self,
+        exam_data: dict[str, Any]
+    ) -> PhysicalExam:
+        '''Unsaved PhysicalExam with its Glasgow scale.'''
+        exam_data = dict(exam_data)
+        glasgow: Glasgow = Glasgow(**exam_data.pop('glasgow'))
+        return PhysicalExam(**exam_data, glasgow=glasgow)
+
+    def _levels(
+        self,
+        report: PatientTransportReport
+    ) -> tuple[tuple[Model | None, ...], ...]:
+        '''Nested records of a report grouped by insertion level.'''
+        patient: Patient = report.patient
+        informed_consent: InformedConsent = report.informed_consent
+        care_transfer_report: CareTransferReport = report.care_transfer_report
+        # An existing patient's rows are written by update_patients(), not here
+        new_patient: bool = patient.pk is None
+        return (
+            # Level 0: rows without foreign keys to other new rows
+            (
+                patient.patient_history if new_patient else None,
+                patient.insurance_provider if new_patient else None,
+                informed_consent.required_procedures,
+                informed_consent.medication_administration,
+                informed_consent.responsible,
+                informed_consent.outgoing_entity,
+                care_transfer_report.companion,
+                care_transfer_report.responsible,
+                care_transfer_report.receiving_entity,
+                care_transfer_report.initial_physicial_examination.glasgow,
+                care_transfer_report.final_physical_examination.glasgow,
+                care_transfer_report.treatment,
+                care_transfer_report.result,
+                care_transfer_report.complications_transfer,
+                report.satisfaction_survey
+            ),
+            (
+                patient,
+                informed_consent,
+                care_transfer_report.initial_physicial_examination,
+                care_transfer_report.final_physical_examination
+            ),
+            (care_transfer_report,)
+        )
+
+    def _insert(
+        self,
+        *instances: Model | None
+    ) -> None:
+        '''Insert unsaved instances with one bulk_create per model.'''
+        by_model: dict[type[Model], list[Model]] = {}
+        seen: set[int] = set()
+        for instance in instances:
+            if instance is None or instance.pk is not None or id(instance) in seen:
+                continue
+            seen.add(id(instance))
+            by_model.setdefault(type(instance), []).append(instance)
+        for model, objects in by_model.items():
+            model._base_manager.bulk_create(objects)
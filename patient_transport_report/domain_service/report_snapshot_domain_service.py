@@ -0,0 +1,155 @@
+from typing import Any
+from django.db.models import (
+    Model,
+    QuerySet
+)
+from ..models import (
+    PatientTransportReport,
+    PatientTransportReportSnapshot
+)
+from ..serializers.out import PatientTransportReportDetailSerializer
+import logging
+
+class ReportSnapshotDomainService:
+    '''
+    Domain service that materializes the detail document of completed reports.
+
+    A completed report is effectively immutable, so its serialized detail is
+    stored once in PatientTransportReportSnapshot and served with a single
+    primary-key lookup. Draft reports are always rendered live.
+
+    Snapshots are written when a report is completed and rebuilt lazily on
+    the next read after being invalidated (soft_delete, restore or an edit
+    of the report or its patient, consent, care transfer or survey). Bump
+    SNAPSHOT_VERSION whenever the detail serializers change their output.
+    '''
+
+    SNAPSHOT_VERSION: int = 2
+    COMPLETED_STATUS: str = 'completado'
+
+    # Every relation read by PatientTransportReportDetailSerializer.
+    # Staff names come from Healthcare/Driver -> BaseStaff -> User
+    DETAIL_SELECT_RELATED: tuple[str, ...] = (
+        'patient',
+        'patient__insurance_provider',
+        'informed_consent',
+        'informed_consent__required_procedures',
+        'informed_consent__medication_administration',
+        'informed_consent__responsible',
+        'informed_consent__attending_staff__base_staff__system_user',
+        'informed_consent__outgoing_entity',
+        'care_transfer_report',
+        'care_transfer_report__driver__base_staff__system_user',
+        'care_transfer_report__attending_staff__base_staff__system_user',
+        'care_transfer_report__support_staff__base_staff__system_user',
+        'care_transfer_report__ambulance',
+        'care_transfer_report__companion',
+        'care_transfer_report__responsible',
+        'care_transfer_report__diagnosis_1',
+        'care_transfer_report__diagnosis_2',
+        'care_transfer_report__receiving_entity',
+        'satisfaction_survey',
+        'created_by',
+        'updated_by'
+    )
+    DETAIL_PREFETCH_RELATED: tuple[str, ...] = (
+        'care_transfer_report__skin_conditions',
+        'care_transfer_report__hemodynamic_statuses'
+    )
+
+    # Nested records whose edits must drop the snapshot of their reports
+    NESTED_RELATIONS: dict[str, str] = {
+        'Patient': 'patient',
+        'InformedConsent': 'informed_consent',
+        'CareTransferReport': 'care_transfer_report',
+        'SatisfactionSurvey': 'satisfaction_survey'
+    }
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def get_report_queryset(self) -> QuerySet[PatientTransportReport]:
+        '''Reports with every relation read by the detail serializers.'''
+        return PatientTransportReport.objects.select_related(
+            *self.DETAIL_SELECT_RELATED
+        ).prefetch_related(
+            *self.DETAIL_PREFETCH_RELATED
+        )
+
+    def get_document(
+        self,
+        report_id: int
+    ) -> dict[str, Any] | None:
+        '''
+        Return the stored detail document of a report.
+
+        Args:
+            report_id: ID of the report
+
+        Returns:
+            The document, or None when the report has no current snapshot
+            (draft, invalidated, outdated layout or soft-deleted)
+        '''
+        return PatientTransportReportSnapshot.objects.filter(
+            report_id=report_id,
+            report__is_deleted=False,
+            version=self.SNAPSHOT_VERSION
+        ).values_list('document', flat=True).first()
+
+    def render(
+        self,
+        report: PatientTransportReport
+    ) -> dict[str, Any]:
+        '''
+        Serialize a report loaded with get_report_queryset(), storing the
+        document when the report is completed.
+        '''
+        document: dict[str, Any] = PatientTransportReportDetailSerializer(report).data
+        if report.status == self.COMPLETED_STATUS:
+            PatientTransportReportSnapshot.objects.update_or_create(
+                report_id=report.pk,
+                defaults={
+                    'version': self.SNAPSHOT_VERSION,
+                    'document': document
+                }
+            )
+            self.logger.info(f'Materialized snapshot of report #{report.pk}')
+        return document
+
+    def materialize(
+        self,
+        report_id: int
+    ) -> None:
+        '''Load and store the snapshot of a report (no-op for drafts).'''
+        report: PatientTransportReport | None = self.get_report_queryset().filter(
+            pk=report_id
+        ).first()
+        if report is not None:
+            self.render(report)
+
+    def invalidate(
+        self,
+        report_id: int
+    ) -> None:
+        '''Drop the snapshot of one report.'''
+        PatientTransportReportSnapshot.objects.filter(report_id=report_id).delete()
+
+    def invalidate_many(
+        self,
+        report_ids: list[int]
+    ) -> None:
+        '''Drop the snapshots of several reports written in bulk (no signals).'''
+        PatientTransportReportSnapshot.objects.filter(report_id__in=report_ids).delete()
+
+    def invalidate_for(
+        self,
+        instance: Model
+    ) -> None:
+        '''Drop the snapshots of every report that embeds a nested record.'''
+        relation: str = self.NESTED_RELATIONS[instance.__class__.__name__]
+        PatientTransportReportSnapshot.objects.filter(
+            **{f'report__{relation}': instance}
+        ).delete()
@@ -0,0 +1,341 @@
+from datetime import datetime
+from functools import partial
+from typing import Any
+from uuid import UUID
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Model
+from django.utils import timezone
+from core.models import AuditedModel
+from ..models import (
+    PatientTransportReport,
+    Patient,
+    CareTransferReport
+)
+from ..types.dataclass import (
+    ReportSyncItem,
+    ReportSyncResult
+)
+from .report_creation_domain_service import ReportCreationDomainService
+from .report_snapshot_domain_service import ReportSnapshotDomainService
+from .buzon_change_feed_domain_service import BuzonChangeFeedDomainService
+import logging
+
+class ReportSyncDomainService:
+    '''
+    Idempotent upsert of reports captured offline, keyed by client UUID.
+
+    A batch is written in one transaction. New reports go through the
+    bulk insert steps of ReportCreationDomainService for the whole batch
+    at once. Known reports are rebuilt from the payload and written over
+    their existing rows (bulk_update per model), keeping their ids. Either
+    way the number of statements depends on the tables involved, not on
+    the size of the batch.
+
+    Per item rules for a known client_uuid:
+    - same payload as the last sync (digest): unchanged, nothing written
+    - another author: forbidden
+    - deleted or completed on the server: conflict
+    - base_version differs from the server version: conflict (a device
+      that never received a version is at version 1)
+
+    Patients are linked by identification number exactly as on create.
+    Records dropped from a report (e.g. a removed companion) are detached,
+    not deleted.
+    '''
+
+    CREATED: str = 'created'
+    UPDATED: str = 'updated'
+    UNCHANGED: str = 'unchanged'
+    CONFLICT: str = 'conflict'
+    INVALID: str = 'invalid'
+    FORBIDDEN: str = 'forbidden'
+
+    # Nested records rewritten in place when a known report is synced again
+    NESTED_PATHS: tuple[str, ...] = (
+        'informed_consent',
+        'informed_consent__required_procedures',
+        'informed_consent__medication_administration',
+        'informed_consent__responsible',
+        'informed_consent__outgoing_entity',
+        'care_transfer_report',
+        'care_transfer_report__companion',
+        'care_transfer_report__responsible',
+        'care_transfer_report__initial_physicial_examination',
+        'care_transfer_report__initial_physicial_examination__glasgow',
+        'care_transfer_report__final_physical_examination',
+        'care_transfer_report__final_physical_examination__glasgow',
+        'care_transfer_report__treatment',
+        'care_transfer_report__result',
+        'care_transfer_report__complications_transfer',
+        'care_transfer_report__receiving_entity',
+        'satisfaction_survey'
+    )
+    # Audit columns kept from the existing row on rewrite
+    PRESERVED_FIELDS: frozenset[str] = frozenset({
+        'created_at',
+        'created_by',
+        'is_deleted',
+        'deleted_at',
+        'deleted_by'
+    })
+    REPORT_UPDATE_FIELDS: tuple[str, ...] = (
+        'patient',
+        'informed_consent',
+        'care_transfer_report',
+        'satisfaction_survey',
+        'status',
+        'version',
+        'sync_digest',
+        'updated_by',
+        'updated_at'
+    )
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.report_creation_service: ReportCreationDomainService = ReportCreationDomainService()
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def sync(
+        self,
+        items: list[ReportSyncItem],
+        user: User
+    ) -> list[ReportSyncResult]:
+        '''
+        Create or update a batch of reports in one transaction.
+
+        Args:
+            items: Validated reports, with distinct client UUIDs
+            user: Author of the reports
+
+        Returns:
+            One ReportSyncResult per item, in the same order
+        '''
+        results: dict[UUID, ReportSyncResult] = {}
+        with transaction.atomic():
+            current_reports: dict[UUID, PatientTransportReport] = {
+                report.client_uuid: report
+                for report in PatientTransportReport.all_objects.select_related(
+                    *self.NESTED_PATHS
+                ).select_for_update(
+                    of=('self',)
+                ).filter(
+                    client_uuid__in=[item.client_uuid for item in items]
+                )
+            }
+            pending: list[ReportSyncItem] = []
+            for item in items:
+                result: ReportSyncResult | None = self._precheck(item, current_reports.get(item.client_uuid), user)
+                if result is None:
+                    pending.append(item)
+                else:
+                    results[item.client_uuid] = result
+            if pending:
+                self._write(pending, current_reports, user, results)
+        return [results[item.client_uuid] for item in items]
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _precheck(
+        self,
+        item: ReportSyncItem,
+        current: PatientTransportReport | None,
+        user: User
+    ) -> ReportSyncResult | None:
+        '''Result for items that must not be written, None otherwise.'''
+        if current is None:
+            return None
+        if current.created_by_id != user.pk:
+            return self._result(item.client_uuid, self.FORBIDDEN, 'El informe pertenece a otro usuario.')
+        if current.sync_digest == item.digest:
+            return self._result(item.client_uuid, self.UNCHANGED, 'El informe ya estaba sincronizado.', current)
+        if current.is_deleted:
+            return self._result(item.client_uuid, self.CONFLICT, 'El informe fue eliminado.', current)
+        if current.status == ReportSnapshotDomainService.COMPLETED_STATUS:
+            return self._result(item.client_uuid, self.CONFLICT, 'El informe ya fue completado.', current)
+        if (item.base_version or 1) != current.version:
+            return self._result(item.client_uuid, self.CONFLICT, 'El informe fue modificado en el servidor.', current)
+        return None
+
+    def _write(
+        self,
+        items: list[ReportSyncItem],
+        current_reports: dict[UUID, PatientTransportReport],
+        user: User,
+        results: dict[UUID, ReportSyncResult]
+    ) -> None:
+        '''Write every prechecked item with bulk statements.'''
+        creation: ReportCreationDomainService = self.report_creation_service
+        sections_by_uuid: dict[UUID, dict[str, dict[str, Any] | None]] = {
+            item.client_uuid: creation.sections(item.report_data) for item in items
+        }
+        numbers: dict[UUID, str] = {
+            client_uuid: sections['patient']['identification_number']
+            for client_uuid, sections in sections_by_uuid.items()
+        }
+        errors: list[str | None] = creation.check_references(list(sections_by_uuid.values()))
+        patients: dict[str, Patient] = creation.find_patients(list(sections_by_uuid.values()))
+        valid_items: list[ReportSyncItem] = []
+        for item, error in zip(items, errors):
+            patient: Patient | None = patients.get(numbers[item.client_uuid])
+            error = error or (creation.check_patient(patient) if patient is not None else None)
+            if error:
+                results[item.client_uuid] = self._result(item.client_uuid, self.INVALID, error)
+            else:
+                valid_items.append(item)
+        if not valid_items:
+            return
+        # Existing patients are linked and get the columns that changed; a
+        # new one is written by its first report only
+        new_numbers: set[str] = set()
+        for item in valid_items:
+            number: str = numbers[item.client_uuid]
+            if number in new_numbers:
+                sections_by_uuid[item.client_uuid]['patient'] = None
+            elif number not in patients:
+                new_numbers.add(number)
+        creation.store_signatures([sections_by_uuid[item.client_uuid] for item in valid_items])
+        creation.update_patients([
+            (patients[numbers[item.client_uuid]], sections_by_uuid[item.client_uuid]['patient'])
+            for item in valid_items
+            if numbers[item.client_uuid] in patients
+        ], user)
+
+        now: datetime = timezone.now()
+        new_reports: list[PatientTransportReport] = []
+        updated_reports: list[PatientTransportReport] = []
+        rewritten: list[Model] = []
+        for item in valid_items:
+            report: PatientTransportReport = creation.build(
+                sections_by_uuid[item.client_uuid],
+                patients.get(numbers[item.client_uuid]),
+                user,
+                item.report_data['status']
+            )
+            patients[numbers[item.client_uuid]] = report.patient
+            report.client_uuid = item.client_uuid
+            report.sync_digest = item.digest
+            current: PatientTransportReport | None = current_reports.get(item.client_uuid)
+            if current is None:
+                new_reports.append(report)
+            else:
+                rewritten.extend(self._adopt(report, current, user, now))
+                updated_reports.append(report)
+
+        written: list[PatientTransportReport] = new_reports + updated_reports
+        creation.insert_nested(written)
+        self._update(rewritten)
+        PatientTransportReport._base_manager.bulk_create(new_reports)
+        if updated_reports:
+            PatientTransportReport._base_manager.bulk_update(updated_reports, self.REPORT_UPDATE_FIELDS)
+            self._clear_m2m([report.care_transfer_report for report in updated_reports])
+            ReportSnapshotDomainService().invalidate_many([report.pk for report in updated_reports])
+        creation.insert_m2m([
+            (report.care_transfer_report, sections_by_uuid[report.client_uuid]['care_transfer_report'])
+            for report in written
+        ])
+        # Bulk writes send no post_save: do what the report receivers do
+        transaction.on_commit(partial(BuzonChangeFeedDomainService().mark_changed, user.pk))
+        for report in written:
+            if report.status == ReportSnapshotDomainService.COMPLETED_STATUS:
+                transaction.on_commit(partial(ReportSnapshotDomainService().materialize, report.pk))
+        for report in new_reports:
+            results[report.client_uuid] = self._result(report.client_uuid, self.CREATED, 'Informe creado.', report)
+        for report in updated_reports:
+            results[report.client_uuid] = self._result(report.client_uuid, self.UPDATED, 'Informe actualizado.', report)
+        self.logger.info(
+            f'User {user.username} synced {len(new_reports)} new and {len(updated_reports)} updated reports'
+        )
+
+    def _adopt(
+        self,
+        report: PatientTransportReport,
+        current: PatientTransportReport,
+        user: User,
+        now: datetime
+    ) -> list[Model]:
+        '''
+        Give a rebuilt report the ids of its existing rows.
+
+        Returns:
+            Nested records that now point to existing rows (to be updated)
+        '''
+        report.pk = current.pk
+        report.created_at = current.created_at
+        report.version = current.version + 1
+        report.updated_by = user
+        report.updated_at = now
+        rewritten: list[Model] = []
+        adopted: set[tuple[type[Model], int]] = set()
+        for path in self.NESTED_PATHS:
+            instance: Model | None = self._resolve(report, path)
+            existing: Model | None = self._resolve(current, path)
+            if instance is None or existing is None or instance.pk is not None:
+                continue
+            # A row shared by two relations is reused once (e.g. companion and responsible)
+            if (type(existing), existing.pk) in adopted:
+                continue
+            adopted.add((type(existing), existing.pk))
+            instance.pk = existing.pk
+            if isinstance(instance, AuditedModel):
+                instance.updated_by = user
+                instance.updated_at = now
+            rewritten.append(instance)
+        return rewritten
+
+    def _resolve(
+        self,
+        instance: Model | None,
+        path: str
+    ) -> Model | None:
+        '''Follow a select_related path on loaded or unsaved instances.'''
+        for name in path.split('__'):
+            if instance is None:
+                return None
+            instance = getattr(instance, name)
+        return instance
+
+    def _update(
+        self,
+        instances: list[Model]
+    ) -> None:
+        '''Rewrite existing rows with one bulk_update per model.'''
+        by_model: dict[type[Model], list[Model]] = {}
+        for instance in instances:
+            by_model.setdefault(type(instance), []).append(instance)
+        for model, objects in by_model.items():
+            fields: list[str] = [
+                field.name
+                for field in model._meta.concrete_fields
+                if not field.primary_key and field.name not in self.PRESERVED_FIELDS
+            ]
+            model._base_manager.bulk_update(objects, fields)
+
+    def _clear_m2m(
+        self,
+        care_transfer_reports: list[CareTransferReport]
+    ) -> None:
+        '''Delete the skin condition and hemodynamic status rows of rewritten reports.'''
+        for field in ('skin_conditions', 'hemodynamic_statuses'):
+            m2m_field = CareTransferReport._meta.get_field(field)
+            m2m_field.remote_field.through.objects.filter(**{
+                f'{m2m_field.m2m_field_name()}__in': care_transfer_reports
+            }).delete()
+
+    def _result(
+        self,
+        client_uuid: UUID,
+        status: str,
+        response: str,
+        report: PatientTransportReport | None = None
+    ) -> ReportSyncResult:
+        return ReportSyncResult(
+            client_uuid=client_uuid,
+            status=status,
+            report_id=report.pk if report is not None else None,
+            version=report.version if report is not None else None,
+            response=response
+        )
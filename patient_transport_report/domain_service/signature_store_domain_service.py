@@ -0,0 +1,130 @@
+from typing import Iterable
+from django.db import transaction
+from ..models import SignatureBlob
+import base64
+import binascii
+import hashlib
+import logging
+
+class SignatureStoreDomainService:
+    '''
+    Domain service for the content-addressed signature store.
+
+    Incoming signatures are base64 strings or data URLs
+    ("data:image/png;base64,..."). They are decoded and stored once per
+    distinct content (SHA-256) in SignatureBlob. Rows keep only the blob id,
+    so reading a report never loads image bytes.
+    '''
+
+    DEFAULT_CONTENT_TYPE: str = 'image/png'
+    # Raster only: SVG served from this origin could carry scripts
+    ALLOWED_CONTENT_TYPES: frozenset[str] = frozenset({'image/png', 'image/jpeg'})
+    # Decoded size limit; a signature PNG is a few KB
+    MAX_SIZE_BYTES: int = 512 * 1024
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def store(
+        self,
+        value: str | None
+    ) -> SignatureBlob | None:
+        '''
+        Store one signature, reusing the existing blob for known content.
+
+        Args:
+            value: Base64 string or data URL; None/empty means no signature
+
+        Returns:
+            SignatureBlob or None
+
+        Raises:
+            ValueError: If the value is not a valid base64 image
+        '''
+        return self.store_many([value])[0]
+
+    def store_many(
+        self,
+        values: Iterable[str | None]
+    ) -> list[SignatureBlob | None]:
+        '''
+        Store several signatures with one lookup and at most one INSERT batch.
+
+        Args:
+            values: Base64 strings or data URLs (None/empty allowed)
+
+        Returns:
+            Blobs in the same order as values (None for empty values)
+
+        Raises:
+            ValueError: If any value is not a valid base64 image
+        '''
+        decoded: list[tuple[str, bytes, str] | None] = []
+        for value in values:
+            if not value:
+                decoded.append(None)
+                continue
+            content, content_type = self.decode(value)
+            decoded.append((hashlib.sha256(content).hexdigest(), content, content_type))
+        wanted: dict[str, tuple[bytes, str]] = {
+            item[0]: (item[1], item[2]) for item in decoded if item is not None
+        }
+        if not wanted:
+            return [None] * len(decoded)
+        with transaction.atomic():
+            blobs: dict[str, SignatureBlob] = self._load(wanted)
+            missing: list[SignatureBlob] = [
+                SignatureBlob(sha256=sha256, content=content, content_type=content_type, size=len(content))
+                for sha256, (content, content_type) in wanted.items()
+                if sha256 not in blobs
+            ]
+            if missing:
+                # Concurrent writers may insert the same hash: ignore and reload
+                SignatureBlob.objects.bulk_create(missing, ignore_conflicts=True)
+                blobs.update(self._load({blob.sha256: None for blob in missing}))
+        return [blobs[item[0]] if item is not None else None for item in decoded]
+
+    def decode(
+        self,
+        value: str
+    ) -> tuple[bytes, str]:
+        '''
+        Decode a base64 string or data URL.
+
+        Returns:
+            (content, content_type)
+
+        Raises:
+            ValueError: If the value is not valid base64, too large or of
+                an unsupported image type
+        '''
+        content_type: str = self.DEFAULT_CONTENT_TYPE
+        payload: str = value.strip()
+        if payload.startswith('data:') and ',' in payload:
+            header, payload = payload.split(',', 1)
+            content_type = header[len('data:'):].split(';')[0] or content_type
+        if content_type not in self.ALLOWED_CONTENT_TYPES:
+            raise ValueError(f'Tipo de firma no soportado: {content_type}')
+        try:
+            content: bytes = base64.b64decode(payload, validate=True)
+        except (binascii.Error, ValueError) as e:
+            raise ValueError('La firma no es un base64 válido.') from e
+        if len(content) > self.MAX_SIZE_BYTES:
+            raise ValueError('La firma supera el tamaño máximo permitido.')
+        return content, content_type
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _load(
+        self,
+        hashes: dict[str, object]
+    ) -> dict[str, SignatureBlob]:
+        '''Existing blobs by hash, without their content.'''
+        return {
+            blob.sha256: blob
+            for blob in SignatureBlob.objects.filter(sha256__in=list(hashes)).defer('content')
+        }
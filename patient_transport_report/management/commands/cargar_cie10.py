@@ -1,68 +1,80 @@
-import pandas as pd
+import time
+from typing import Iterator
+from django.db import transaction
 from django.core.management.base import BaseCommand
 from ...models import Diagnosis
+from ...domain_service import CatalogSnapshotDomainService
+from ..tabular_file_reader import TabularFileReader
 
 
 class Command(BaseCommand):
-    help: str = 'Carga los códigos CIE-10 desde un archivo Excel'
+    help: str = 'Carga los códigos CIE-10 desde un archivo Excel (.xlsx) o CSV (.csv, .csv.gz)'
 
     def add_arguments(
-        self, 
+        self,
         parser
     ):
         parser.add_argument(
             'excel_file',
             type=str,
-            help='Ruta al archivo Excel con los códigos CIE-10'
+            help='Ruta al archivo Excel o CSV con los códigos CIE-10'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Cantidad de registros por lote y transacción (por defecto 1000)'
+        )
+        parser.add_argument(
+            '--row-by-row',
+            action='store_true',
+            help='Usar el modo anterior (update_or_create por fila) en lugar de la carga masiva'
         )
 
     def handle(
-        self, 
-        *args: tuple, 
+        self,
+        *args: tuple,
         **options: dict
     ):
         excel_file = options['excel_file']
-        
+
         try:
-            # Leer el archivo Excel
-            df = pd.read_excel(excel_file)
-            
-            # Validar que las columnas existan
-            if 'codigo' not in df.columns or 'nombre' not in df.columns:
-                self.stdout.write(
-                    self.style.ERROR('El archivo debe tener columnas "codigo" y "nombre"')
-                )
-                return
-            
-            # Limpiar datos existentes (opcional)
-            # Diagnosis.objects.all().delete()
-            
-            registros_creados = 0
-            registros_actualizados = 0
-            
-            for _, row in df.iterrows():
-                cie_10 = str(row['codigo']).strip()
-                cie_10_name = str(row['nombre']).strip()
-                
-                # Crear o actualizar el registro
-                obj, created = Diagnosis.objects.update_or_create(
-                    cie_10=cie_10,
-                    defaults={'cie_10_name': cie_10_name}
-                )
-                
-                if created:
-                    registros_creados += 1
+            inicio = time.perf_counter()
+            # Leer el archivo fila a fila sin cargarlo completo en memoria
+            with TabularFileReader(excel_file) as reader:
+
+                # Validar que las columnas existan
+                if 'codigo' not in reader.columns or 'nombre' not in reader.columns:
+                    self.stdout.write(
+                        self.style.ERROR('El archivo debe tener columnas "codigo" y "nombre"')
+                    )
+                    return
+
+                # Limpiar datos existentes (opcional)
+                # Diagnosis.objects.all().delete()
+
+                if options['row_by_row']:
+                    resultado = self._cargar_por_fila(self._leer_filas(reader))
                 else:
-                    registros_actualizados += 1
-            
+                    resultado = self._cargar_masivo(self._leer_filas(reader), options['batch_size'])
+
+            # Invalidar los snapshots del catálogo en todos los workers
+            CatalogSnapshotDomainService.bump_version(CatalogSnapshotDomainService.DIAGNOSES)
+
+            duracion = time.perf_counter() - inicio
             self.stdout.write(
                 self.style.SUCCESS(
                     f'Proceso completado:\n'
-                    f'- Registros creados: {registros_creados}\n'
-                    f'- Registros actualizados: {registros_actualizados}'
+                    f'- Filas leídas: {resultado["filas"]}\n'
+                    f'- Registros creados: {resultado["creados"]}\n'
+                    f'- Registros actualizados: {resultado["actualizados"]}\n'
+                    f'- Registros sin cambios: {resultado["sin_cambios"]}\n'
+                    f'- Códigos repetidos omitidos: {resultado["repetidos"]}\n'
+                    f'- Tiempo total: {duracion:.2f} s '
+                    f'({resultado["filas"] / duracion if duracion else 0:.0f} filas/s)'
                 )
             )
-            
+
         except FileNotFoundError:
             self.stdout.write(
                 self.style.ERROR(f'Archivo no encontrado: {excel_file}')
@@ -70,4 +82,111 @@ class Command(BaseCommand):
         except Exception as e:
             self.stdout.write(
                 self.style.ERROR(f'Error al procesar el archivo: {str(e)}')
-            )
\ No newline at end of file
+            )
+
+    def _leer_filas(
+        self,
+        reader: TabularFileReader
+    ) -> Iterator[tuple[str, str]]:
+        '''Normaliza cada fila a (codigo, nombre), omitiendo filas sin código.'''
+        for row in reader:
+            if row.get('codigo') is None:
+                continue
+            yield str(row['codigo']).strip(), str(row.get('nombre') or '').strip()
+
+    def _cargar_masivo(
+        self,
+        filas: Iterator[tuple[str, str]],
+        batch_size: int
+    ) -> dict[str, int]:
+        '''
+        Compara el archivo con la base en memoria y envía solo los cambios.
+
+        Usa INSERT ... ON CONFLICT (cie_10) DO UPDATE en lotes, cada lote en
+        su propia transacción. Solo se mantienen en memoria los códigos
+        existentes, los ya leídos y el lote en curso. Si un código se repite
+        en el archivo gana la primera fila y las demás se informan como
+        repetidas, así ningún lote lleva dos veces el mismo código.
+        '''
+        existentes = dict(Diagnosis.objects.values_list('cie_10', 'cie_10_name'))
+        vistos = set()
+        leidas = 0
+        creados = 0
+        actualizados = 0
+        repetidos = 0
+        lote = {}
+        for cie_10, cie_10_name in filas:
+            leidas += 1
+            if cie_10 in vistos:
+                repetidos += 1
+                continue
+            vistos.add(cie_10)
+            nombre_actual = existentes.get(cie_10)
+            if nombre_actual is None:
+                creados += 1
+            elif nombre_actual != cie_10_name:
+                actualizados += 1
+            else:
+                continue
+            lote[cie_10] = cie_10_name
+            if len(lote) >= batch_size:
+                self._guardar_lote(lote)
+                lote = {}
+        if lote:
+            self._guardar_lote(lote)
+
+        return {
+            'filas': leidas,
+            'creados': creados,
+            'actualizados': actualizados,
+            'sin_cambios': leidas - creados - actualizados - repetidos,
+            'repetidos': repetidos
+        }
+
+    def _guardar_lote(
+        self,
+        lote: dict[str, str]
+    ) -> None:
+        '''Inserta o actualiza un lote de códigos en una transacción.'''
+        with transaction.atomic():
+            Diagnosis.objects.bulk_create(
+                [Diagnosis(cie_10=cie_10, cie_10_name=cie_10_name) for cie_10, cie_10_name in lote.items()],
+                update_conflicts=True,
+                unique_fields=['cie_10'],
+                update_fields=['cie_10_name']
+            )
+
+    def _cargar_por_fila(
+        self,
+        filas: Iterator[tuple[str, str]]
+    ) -> dict[str, int]:
+        '''Modo anterior: un update_or_create por código (la primera fila de cada código).'''
+        vistos = set()
+        leidas = 0
+        creados = 0
+        actualizados = 0
+        repetidos = 0
+        for cie_10, cie_10_name in filas:
+            leidas += 1
+            if cie_10 in vistos:
+                repetidos += 1
+                continue
+            vistos.add(cie_10)
+            # Crear o actualizar el registro
+            obj, created = Diagnosis.objects.update_or_create(
+                cie_10=cie_10,
+                defaults={'cie_10_name': cie_10_name}
+            )
+
+            if created:
+                creados += 1
+            else:
+                actualizados += 1
+
+        return {
+            'filas': leidas,
+            'creados': creados,
+            'actualizados': actualizados,
+            'sin_cambios': 0,
+            'repetidos': repetidos
+        }
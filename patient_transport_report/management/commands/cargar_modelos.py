@@ -1,4 +1,3 @@
-import pandas as pd
 from django.core.management.base import BaseCommand
 from ...models import (
     IPS,
@@ -6,82 +5,109 @@ from ...models import (
     ARL,
     SOAT
 )
+from ...domain_service import (
+    CatalogSnapshotDomainService,
+    CatalogReconciliationDomainService
+)
+from ..tabular_file_reader import TabularFileReader
 
 
 class Command(BaseCommand):
-    help = 'Carga instituciones, EPS, ARL y SOAT desde un archivo Excel'
+    help = 'Carga instituciones, EPS, ARL y SOAT desde un archivo Excel (.xlsx) o CSV (.csv, .csv.gz)'
 
     def add_arguments(self, parser):
         parser.add_argument(
             'excel_file',
             type=str,
-            help='Ruta al archivo Excel con las entidades'
+            help='Ruta al archivo Excel o CSV con las entidades'
+        )
+        parser.add_argument(
+            '--deactivate-missing',
+            action='store_true',
+            help='Desactivar las entidades activas que no aparecen en el archivo'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Mostrar los cambios sin escribir en la base de datos'
         )
 
     def handle(self, *args, **options):
         excel_file = options['excel_file']
         
         try:
-            # Leer el archivo Excel
-            df = pd.read_excel(excel_file)
-            
-            # Validar que las columnas existan
+            # Leer el archivo fila a fila sin cargarlo completo en memoria
             columnas_requeridas = ['institucion receptora', 'soat', 'arl', 'eps']
-            columnas_faltantes = [col for col in columnas_requeridas if col not in df.columns]
-            
-            if columnas_faltantes:
-                self.stdout.write(
-                    self.style.ERROR(
-                        f'El archivo debe tener las columnas: {", ".join(columnas_requeridas)}\n'
-                        f'Columnas faltantes: {", ".join(columnas_faltantes)}'
+            with TabularFileReader(excel_file) as reader:
+
+                # Validar que las columnas existan
+                columnas_faltantes = [col for col in columnas_requeridas if col not in reader.columns]
+
+                if columnas_faltantes:
+                    self.stdout.write(
+                        self.style.ERROR(
+                            f'El archivo debe tener las columnas: {", ".join(columnas_requeridas)}\n'
+                            f'Columnas faltantes: {", ".join(columnas_faltantes)}'
+                        )
                     )
-                )
-                return
-            
-            # Contadores
-            stats = {
-                'institucion': {'creados': 0, 'actualizados': 0},
-                'soat': {'creados': 0, 'actualizados': 0},
-                'arl': {'creados': 0, 'actualizados': 0},
-                'eps': {'creados': 0, 'actualizados': 0},
-            }
-            
-            # Procesar cada columna
-            self.stdout.write(self.style.SUCCESS('Procesando instituciones receptoras...'))
-            stats['institucion'] = self._cargar_entidades(
-                df, 'institucion receptora', IPS
-            )
-            
-            self.stdout.write(self.style.SUCCESS('Procesando SOAT...'))
-            stats['soat'] = self._cargar_entidades(df, 'soat', SOAT)
+                    return
+
+                # Una sola pasada: valores únicos por columna, en orden de aparición
+                valores = {columna: {} for columna in columnas_requeridas}
+                for row in reader:
+                    for columna in columnas_requeridas:
+                        nombre = str(row.get(columna) or '').strip()
+                        if nombre and nombre.lower() not in ['nan', 'none']:
+                            valores[columna][nombre] = None
             
-            self.stdout.write(self.style.SUCCESS('Procesando ARL...'))
-            stats['arl'] = self._cargar_entidades(df, 'arl', ARL)
+            # Conciliar cada catálogo (una transacción por modelo)
+            servicio = CatalogReconciliationDomainService()
+            catalogos = [
+                ('Instituciones Receptoras', 'institucion receptora', IPS),
+                ('EPS', 'eps', EPS),
+                ('ARL', 'arl', ARL),
+                ('SOAT', 'soat', SOAT),
+            ]
+            resultados = []
+            for titulo, columna, modelo in catalogos:
+                self.stdout.write(self.style.SUCCESS(f'Procesando {titulo}...'))
+                resultados.append((
+                    titulo,
+                    servicio.reconcile(
+                        modelo,
+                        valores[columna],
+                        deactivate_missing=options['deactivate_missing'],
+                        dry_run=options['dry_run']
+                    )
+                ))
             
-            self.stdout.write(self.style.SUCCESS('Procesando EPS...'))
-            stats['eps'] = self._cargar_entidades(df, 'eps', EPS)
+            if not options['dry_run']:
+                # Invalidar los snapshots de los catálogos en todos los workers
+                CatalogSnapshotDomainService.bump_version(
+                    CatalogSnapshotDomainService.IPS,
+                    CatalogSnapshotDomainService.SOAT,
+                    CatalogSnapshotDomainService.ARL,
+                    CatalogSnapshotDomainService.EPS
+                )
             
             # Resumen final
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f'\n{"="*60}\n'
-                    f'RESUMEN DE CARGA\n'
-                    f'{"="*60}\n'
-                    f'Instituciones Receptoras:\n'
-                    f'  - Creadas: {stats["institucion"]["creados"]}\n'
-                    f'  - Actualizadas: {stats["institucion"]["actualizados"]}\n'
-                    f'\nEPS:\n'
-                    f'  - Creadas: {stats["eps"]["creados"]}\n'
-                    f'  - Actualizadas: {stats["eps"]["actualizados"]}\n'
-                    f'\nARL:\n'
-                    f'  - Creadas: {stats["arl"]["creados"]}\n'
-                    f'  - Actualizadas: {stats["arl"]["actualizados"]}\n'
-                    f'\nSOAT:\n'
-                    f'  - Creadas: {stats["soat"]["creados"]}\n'
-                    f'  - Actualizadas: {stats["soat"]["actualizados"]}\n'
-                    f'{"="*60}'
+            resumen = [
+                f'\n{"="*60}',
+                'RESUMEN DE CARGA' + (' (DRY RUN: sin cambios en la base de datos)' if options['dry_run'] else ''),
+                f'{"="*60}'
+            ]
+            for titulo, resultado in resultados:
+                resumen.append(
+                    f'{titulo}:\n'
+                    f'  - Creadas: {len(resultado.created)}\n'
+                    f'  - Reactivadas: {len(resultado.reactivated)}\n'
+                    f'  - Desactivadas: {len(resultado.deactivated)}\n'
+                    f'  - Sin cambios: {resultado.unchanged}'
                 )
-            )
+                if options['dry_run']:
+                    resumen.extend(self._detalle_dry_run(resultado))
+            resumen.append(f'{"="*60}')
+            self.stdout.write(self.style.SUCCESS('\n'.join(resumen)))
             
         except FileNotFoundError:
             self.stdout.write(
@@ -92,40 +118,21 @@ class Command(BaseCommand):
                 self.style.ERROR(f'Error al procesar el archivo: {str(e)}')
             )
     
-    def _cargar_entidades(self, df, columna, modelo):
+    def _detalle_dry_run(self, resultado):
         """
-        Carga entidades desde una columna del DataFrame.
+        Lista los nombres de cada conjunto de cambios para el modo --dry-run.
         
         Args:
-            df: DataFrame de pandas
-            columna: Nombre de la columna a procesar
-            modelo: Modelo de Django donde guardar los datos
+            resultado: CatalogReconciliation de un catálogo
         
         Returns:
-            dict: Diccionario con contadores de creados y actualizados
+            list: Líneas a imprimir
         """
-        creados = 0
-        actualizados = 0
-        
-        # Obtener valores únicos y eliminar nulos/vacíos
-        valores = df[columna].dropna().unique()
-        valores = [str(v).strip() for v in valores if str(v).strip()]
-        
-        for nombre in valores:
-            if not nombre or nombre.lower() in ['nan', 'none', '']:
-                continue
-            
-            # Crear o actualizar el registro
-            obj, created = modelo.objects.update_or_create(
-                name=nombre,
-                defaults={'is_active': True}
-            )
-            
-            if created:
-                creados += 1
-                self.stdout.write(f'  ✓ Creado: {nombre}')
-            else:
-                actualizados += 1
-                self.stdout.write(f'  • Actualizado: {nombre}')
-        
-        return {'creados': creados, 'actualizados': actualizados}
\ No newline at end of file
+        lineas = []
+        for simbolo, nombres in (
+            ('+', resultado.created),
+            ('↺', resultado.reactivated),
+            ('-', resultado.deactivated),
+        ):
+            lineas.extend(f'    {simbolo} {nombre}' for nombre in nombres)
+        return lineas
@@ -0,0 +1,97 @@
+from __future__ import annotations
+from typing import (
+    Any,
+    Iterator
+)
+import csv
+import gzip
+import io
+
+class TabularFileReader:
+    '''
+    Streaming row reader for the catalog loading commands.
+
+    Supported inputs:
+    - .xlsx / .xlsm: openpyxl in read-only mode (first sheet)
+    - .csv / .csv.gz: standard library csv module
+
+    The first row is the header. Rows are yielded lazily as dicts keyed by
+    column name, so memory stays flat regardless of file size and pandas is
+    not needed. Use as a context manager so the underlying file is closed.
+
+    Empty cells are returned as None.
+    '''
+
+    EXCEL_EXTENSIONS: tuple[str, ...] = ('.xlsx', '.xlsm')
+    CSV_EXTENSIONS: tuple[str, ...] = ('.csv', '.csv.gz')
+
+    def __init__(
+        self,
+        path: str
+    ):
+        self.path: str = path
+        self.columns: list[str] = []
+        self._rows: Iterator[tuple[Any, ...]] = iter(())
+        self._close: Any = None
+
+    def __enter__(self) -> TabularFileReader:
+        lower_path: str = self.path.lower()
+        if lower_path.endswith(self.EXCEL_EXTENSIONS):
+            self._open_excel()
+        elif lower_path.endswith(self.CSV_EXTENSIONS):
+            self._open_csv(lower_path.endswith('.gz'))
+        else:
+            raise ValueError(
+                f'Formato no soportado: {self.path} '
+                f'(use {", ".join(self.EXCEL_EXTENSIONS + self.CSV_EXTENSIONS)})'
+            )
+        header: tuple[Any, ...] = next(self._rows, ())
+        self.columns = [str(value).strip() if value is not None else '' for value in header]
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        '''Yield each data row as {column: value}, skipping blank rows.'''
+        columns: list[str] = self.columns
+        for values in self._rows:
+            row: dict[str, Any] = {
+                column: self._clean(value) for column, value in zip(columns, values)
+            }
+            if any(value is not None for value in row.values()):
+                yield row
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _open_excel(self) -> None:
+        '''Open the first sheet in read-only mode (rows are parsed on demand).'''
+        # Imported here so CSV loads do not pay for openpyxl
+        from openpyxl import load_workbook
+        workbook = load_workbook(self.path, read_only=True, data_only=True)
+        self._close = workbook.close
+        self._rows = workbook.worksheets[0].iter_rows(values_only=True)
+
+    def _open_csv(
+        self,
+        compressed: bool
+    ) -> None:
+        '''Open a plain or gzip CSV file; utf-8-sig drops Excel's BOM.'''
+        handle: io.TextIOBase = (
+            gzip.open(self.path, 'rt', encoding='utf-8-sig', newline='')
+            if compressed
+            else open(self.path, encoding='utf-8-sig', newline='')
+        )
+        self._close = handle.close
+        self._rows = csv.reader(handle)
+
+    @staticmethod
+    def _clean(value: Any) -> Any:
+        '''Normalize empty strings to None so both formats behave the same.'''
+        if isinstance(value, str):
+            value = value.strip()
+            return value or None
+        return value
@@ -0,0 +1,55 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+from django.db import migrations
+
+# unaccent() is STABLE, so an IMMUTABLE wrapper is needed to use it inside
+# index expressions. Queries must call f_unaccent() to hit the index.
+FORWARD_SQL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    'CREATE EXTENSION IF NOT EXISTS unaccent',
+    '''
+    CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text AS
+    $func$ SELECT public.unaccent('public.unaccent', $1) $func$
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS diagnosis_name_trgm_idx
+    ON patient_transport_report_diagnosis
+    USING gin (f_unaccent(lower(cie_10_name)) gin_trgm_ops)
+    ''',
+    '''
+    CREATE INDEX IF NOT EXISTS diagnosis_code_trgm_idx
+    ON patient_transport_report_diagnosis
+    USING gin (upper(cie_10::text) gin_trgm_ops)
+    ''',
+]
+
+REVERSE_SQL = [
+    'DROP INDEX IF EXISTS diagnosis_code_trgm_idx',
+    'DROP INDEX IF EXISTS diagnosis_name_trgm_idx',
+    'DROP FUNCTION IF EXISTS f_unaccent(text)',
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        # Other databases (SQLite test runs) use the icontains fallback
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient_transport_report', '0004_remove_caretransferreport_companion_1_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run_on_postgres(FORWARD_SQL),
+            _run_on_postgres(REVERSE_SQL),
+        ),
+    ]
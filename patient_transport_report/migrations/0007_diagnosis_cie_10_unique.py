@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient_transport_report', '0007_merge_duplicate_diagnosis_codes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='diagnosis',
+            name='cie_10',
+            field=models.CharField(max_length=10, unique=True),
+        ),
+    ]
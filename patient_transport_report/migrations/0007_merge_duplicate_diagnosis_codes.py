@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:00
+
+from django.db import migrations
+
+
+def merge_duplicate_codes(apps, schema_editor):
+    # update_or_create never guaranteed uniqueness: keep the oldest row per
+    # code, repoint reports to it and drop the rest before adding the constraint
+    Diagnosis = apps.get_model('patient_transport_report', 'Diagnosis')
+    CareTransferReport = apps.get_model('patient_transport_report', 'CareTransferReport')
+    keep_by_code = {}
+    duplicate_ids = {}
+    for diagnosis_id, cie_10 in Diagnosis.objects.order_by('id').values_list('id', 'cie_10'):
+        if cie_10 in keep_by_code:
+            duplicate_ids[diagnosis_id] = keep_by_code[cie_10]
+        else:
+            keep_by_code[cie_10] = diagnosis_id
+    for duplicate_id, keep_id in duplicate_ids.items():
+        CareTransferReport.objects.filter(diagnosis_1_id=duplicate_id).update(diagnosis_1_id=keep_id)
+        CareTransferReport.objects.filter(diagnosis_2_id=duplicate_id).update(diagnosis_2_id=keep_id)
+    Diagnosis.objects.filter(id__in=list(duplicate_ids)).delete()
+
+
+class Migration(migrations.Migration):
+    # The unique constraint is added by the next migration, in its own
+    # transaction: PostgreSQL refuses to ALTER a table with pending trigger
+    # events (the deferred foreign key checks of the rows changed here)
+
+    dependencies = [
+        ('patient_transport_report', '0006_catalogversion'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_codes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:15
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient_transport_report', '0007_diagnosis_cie_10_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PatientTransportReportSnapshot',
+            fields=[
+                ('report', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='snapshot', serialize=False, to='patient_transport_report.patienttransportreport')),
+                ('version', models.PositiveSmallIntegerField(help_text='Layout version of the detail serializers that rendered the document')),
+                ('document', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='Output of PatientTransportReportDetailSerializer')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Patient Transport Report Snapshot',
+                'verbose_name_plural': 'Patient Transport Report Snapshots',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient_transport_report', '0008_patienttransportreportsnapshot'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='patienttransportreport',
+            name='patient_tra_created_4c6a09_idx',
+        ),
+        migrations.AddIndex(
+            model_name='patienttransportreport',
+            index=models.Index(fields=['created_by', '-created_at', 'status'], name='ptr_buzon_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient_transport_report', '0009_buzon_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='patienttransportreport',
+            index=models.Index(fields=['created_by', 'updated_at', 'id'], name='ptr_buzon_changes_idx'),
+        ),
+    ]
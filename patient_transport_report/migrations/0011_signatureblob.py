@@ -0,0 +1,151 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:00
+
+import base64
+import binascii
+import hashlib
+import logging
+from collections import Counter
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# (model, field) pairs whose base64 text moves into SignatureBlob
+SIGNATURE_FIELDS = [
+    ('patient', 'signature'),
+    ('informedconsent', 'patient_signature'),
+    ('informedconsent', 'responsible_signature'),
+    ('informedconsent', 'attending_staff_signature'),
+    ('informedconsent', 'outgoing_entity_signature'),
+    ('caretransferreport', 'receiving_entity_signature'),
+    ('satisfactionsurvey', 'respondent_signature'),
+]
+
+# Same allow-list as SignatureStoreDomainService. Legacy values of any other
+# kind are kept, under their own content type, but never served: SVG from
+# this origin could carry scripts. Text that is not base64 is kept as
+# text/plain.
+DEFAULT_CONTENT_TYPE = 'image/png'
+ALLOWED_CONTENT_TYPES = ('image/png', 'image/jpeg')
+TEXT_CONTENT_TYPE = 'text/plain'
+
+logger = logging.getLogger(__name__)
+
+
+def decode_signature(value):
+    '''Return (bytes, content_type) for a base64 string or data URL; other text as text/plain.'''
+    content_type = DEFAULT_CONTENT_TYPE
+    payload = value.strip()
+    if payload.startswith('data:') and ',' in payload:
+        header, payload = payload.split(',', 1)
+        content_type = header[len('data:'):].split(';')[0] or content_type
+    try:
+        return base64.b64decode(payload, validate=True), content_type
+    except (binascii.Error, ValueError):
+        return value.encode(), TEXT_CONTENT_TYPE
+
+
+def encode_signature(content, content_type):
+    '''Inverse of decode_signature(): data URLs come back unchanged, bare base64 as its data URL.'''
+    if content_type == TEXT_CONTENT_TYPE:
+        return content.decode()
+    return f'data:{content_type};base64,{base64.b64encode(content).decode()}'
+
+
+def move_signatures_to_blobs(apps, schema_editor):
+    SignatureBlob = apps.get_model('patient_transport_report', 'SignatureBlob')
+    blob_ids = dict(SignatureBlob.objects.values_list('sha256', 'id'))
+    not_served = Counter()
+    for model_name, field in SIGNATURE_FIELDS:
+        model = apps.get_model('patient_transport_report', model_name)
+        rows = model._base_manager.exclude(**{f'{field}__isnull': True}).exclude(**{field: ''})
+        for pk, value in rows.values_list('pk', field).iterator():
+            content, content_type = decode_signature(value)
+            if content_type not in ALLOWED_CONTENT_TYPES:
+                not_served[content_type] += 1
+            sha256 = hashlib.sha256(content).hexdigest()
+            if sha256 not in blob_ids:
+                blob_ids[sha256] = SignatureBlob.objects.create(
+                    sha256=sha256,
+                    content=content,
+                    content_type=content_type,
+                    size=len(content)
+                ).id
+            model._base_manager.filter(pk=pk).update(**{f'{field}_blob_id': blob_ids[sha256]})
+    if not_served:
+        logger.warning(
+            'Kept %d signatures that the signature endpoint will not serve: %s',
+            sum(not_served.values()),
+            ', '.join(f'{content_type} ({count})' for content_type, count in sorted(not_served.items()))
+        )
+
+
+def restore_signatures_from_blobs(apps, schema_editor):
+    SignatureBlob = apps.get_model('patient_transport_report', 'SignatureBlob')
+    for model_name, field in SIGNATURE_FIELDS:
+        model = apps.get_model('patient_transport_report', model_name)
+        rows = model._base_manager.exclude(**{f'{field}_blob__isnull': True})
+        for pk, blob_id in rows.values_list('pk', f'{field}_blob_id').iterator():
+            blob = SignatureBlob.objects.get(pk=blob_id)
+            value = encode_signature(bytes(blob.content), blob.content_type)
+            model._base_manager.filter(pk=pk).update(**{field: value})
+
+
+def signature_blob_field():
+    return models.ForeignKey(
+        blank=True,
+        help_text='Signature image, served by the signature endpoint',
+        null=True,
+        on_delete=django.db.models.deletion.PROTECT,
+        related_name='+',
+        to='patient_transport_report.signatureblob'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient_transport_report', '0010_buzon_changes_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SignatureBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(help_text='Hex SHA-256 of content', max_length=64, unique=True)),
+                ('content', models.BinaryField()),
+                ('content_type', models.CharField(default='image/png', max_length=100)),
+                ('size', models.PositiveIntegerField(help_text='Size of content in bytes')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Signature Blob',
+                'verbose_name_plural': 'Signature Blobs',
+            },
+        ),
+        *[
+            migrations.AddField(
+                model_name=model_name,
+                name=f'{field}_blob',
+                field=signature_blob_field(),
+            )
+            for model_name, field in SIGNATURE_FIELDS
+        ],
+        migrations.RunPython(move_signatures_to_blobs, restore_signatures_from_blobs),
+        *[
+            migrations.RemoveField(
+                model_name=model_name,
+                name=field,
+            )
+            for model_name, field in SIGNATURE_FIELDS
+        ],
+        *[
+            migrations.RenameField(
+                model_name=model_name,
+                old_name=f'{field}_blob',
+                new_name=field,
+            )
+            for model_name, field in SIGNATURE_FIELDS
+        ],
+    ]
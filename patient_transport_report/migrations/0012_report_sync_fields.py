@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient_transport_report', '0011_signatureblob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='patienttransportreport',
+            name='client_uuid',
+            field=models.UUIDField(blank=True, editable=False, help_text='ID generated by the capturing device (offline sync)', null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='patienttransportreport',
+            name='version',
+            field=models.PositiveIntegerField(default=1, help_text='Incremented on every content change (sync/autosave precondition)'),
+        ),
+        migrations.AddField(
+            model_name='patienttransportreport',
+            name='sync_digest',
+            field=models.CharField(blank=True, default='', editable=False, help_text='SHA-256 of the last synced payload, to recognize replays', max_length=64),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient_transport_report', '0012_report_sync_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='patienttransportreport',
+            name='autosave_client',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Client ID of the current autosave session', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='patienttransportreport',
+            name='autosave_base_version',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='Version the current autosave session started from', null=True),
+        ),
+        migrations.AddField(
+            model_name='patienttransportreport',
+            name='autosave_version',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='Version written by the last autosave', null=True),
+        ),
+    ]
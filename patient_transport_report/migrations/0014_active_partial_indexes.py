@@ -0,0 +1,73 @@
+# Generated by Django 6.0.1 on 2026-10-18 12:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('patient_transport_report', '0013_report_autosave_fields'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='patient',
+            name='patient_tra_created_20171c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='patient',
+            name='patient_tra_is_dele_c3c607_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='patienttransportreport',
+            name='patient_tra_patient_c3e502_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='patienttransportreport',
+            name='patient_tra_status_5fee65_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='patienttransportreport',
+            name='patient_tra_is_dele_3a82ad_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='patienttransportreport',
+            name='ptr_buzon_idx',
+        ),
+        migrations.AlterField(
+            model_name='caretransferreport',
+            name='is_deleted',
+            field=models.BooleanField(default=False, help_text='Soft delete flag for GDPR compliance'),
+        ),
+        migrations.AlterField(
+            model_name='informedconsent',
+            name='is_deleted',
+            field=models.BooleanField(default=False, help_text='Soft delete flag for GDPR compliance'),
+        ),
+        migrations.AlterField(
+            model_name='patient',
+            name='is_deleted',
+            field=models.BooleanField(default=False, help_text='Soft delete flag for GDPR compliance'),
+        ),
+        migrations.AlterField(
+            model_name='patienttransportreport',
+            name='is_deleted',
+            field=models.BooleanField(default=False, help_text='Soft delete flag for GDPR compliance'),
+        ),
+        migrations.AddIndex(
+            model_name='patient',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['-created_at'], name='patient_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patienttransportreport',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['patient', '-created_at'], name='ptr_active_patient_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patienttransportreport',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['status', '-created_at'], name='ptr_active_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patienttransportreport',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['created_by', '-created_at', 'status'], name='ptr_buzon_idx'),
+        ),
+    ]
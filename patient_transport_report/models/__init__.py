@@ -1,3 +1,4 @@
+from .signature_blob import SignatureBlob
 from .companion import Companion
 from .informed_consent import InformedConsent
 from .insurance_provider import InsuranceProvider
@@ -21,6 +22,8 @@ from .arl import ARL
 from .soat import SOAT
 from .eps import EPS
 from .ips import IPS
+from .catalog_version import CatalogVersion
+from .patient_transport_report_snapshot import PatientTransportReportSnapshot
 
 __all__ = [
     'Companion',
@@ -45,5 +48,8 @@ __all__ = [
     'ARL',
     'SOAT',
     'EPS',
-    'IPS'
+    'IPS',
+    'CatalogVersion',
+    'PatientTransportReportSnapshot',
+    'SignatureBlob'
 ]
\ No newline at end of file
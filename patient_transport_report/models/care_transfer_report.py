@@ -5,6 +5,7 @@ from staff.models import (
     Healthcare
 )
 from daily_monthly_inventory.models import Ambulance
+from .signature_blob import SignatureBlob
 from .patient import Patient
 from .companion import Companion
 from .physical_exam import PhysicalExam
@@ -146,10 +147,13 @@ class CareTransferReport(AuditedModel):
         on_delete=models.CASCADE,
         related_name='receiving_entity_care_transfer_report'
     )
-    receiving_entity_signature = models.TextField(
+    receiving_entity_signature = models.ForeignKey(
+        SignatureBlob,
+        on_delete=models.PROTECT,
+        related_name='+',
         blank=True,
         null=True,
-        help_text='Digital signature in base64 format'
+        help_text='Signature image, served by the signature endpoint'
     )
     
     objects = ActiveManager()
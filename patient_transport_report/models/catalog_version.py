@@ -0,0 +1,27 @@
+from django.db import models
+
+class CatalogVersion(models.Model):
+    '''
+    Version counter per reference catalog (diagnoses, ips, eps, arl, soat).
+
+    Bumped by the loading management commands; workers compare it against
+    their pre-serialized catalog snapshot to know when to rebuild it.
+    '''
+
+    catalog = models.CharField(
+        max_length=50,
+        unique=True,
+        help_text='Catalog name'
+    )
+    version = models.PositiveBigIntegerField(
+        default=1,
+        help_text='Incremented every time the catalog data changes'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Catalog Version'
+        verbose_name_plural = 'Catalog Versions'
+
+    def __str__(self) -> str:
+        return f'{self.catalog} v{self.version}'
@@ -2,7 +2,7 @@ from django.db import models
 
 class Diagnosis(models.Model):
 
-    cie_10 = models.CharField(max_length=10)
+    cie_10 = models.CharField(max_length=10, unique=True)
     cie_10_name = models.TextField()
 
     class Meta:
@@ -1,4 +1,5 @@
 from django.db import models
+from .signature_blob import SignatureBlob
 from .required_procedures import RequiredProcedures
 from .medication_administration import MedicationAdministration
 from .companion import Companion
@@ -40,16 +41,22 @@ class InformedConsent(AuditedModel):
         null=True
     )
     patient_can_sign = models.BooleanField(default=True)
-    patient_signature = models.TextField(
+    patient_signature = models.ForeignKey(
+        SignatureBlob,
+        on_delete=models.PROTECT,
+        related_name='+',
         blank=True,
         null=True,
-        help_text='Digital signature in base64 format'
+        help_text='Signature image, served by the signature endpoint'
     )
     responsible_can_sign = models.BooleanField(default=False)
-    responsible_signature = models.TextField(
+    responsible_signature = models.ForeignKey(
+        SignatureBlob,
+        on_delete=models.PROTECT,
+        related_name='+',
         blank=True,
         null=True,
-        help_text='Digital signature in base64 format'
+        help_text='Signature image, served by the signature endpoint'
     )
     responsible = models.ForeignKey(
         Companion,
@@ -63,20 +70,26 @@ class InformedConsent(AuditedModel):
         on_delete=models.CASCADE,
         related_name='attending_staff_informed_consents'
     )
-    attending_staff_signature = models.TextField(
+    attending_staff_signature = models.ForeignKey(
+        SignatureBlob,
+        on_delete=models.PROTECT,
+        related_name='+',
         blank=True,
         null=True,
-        help_text='Digital signature in base64 format'
+        help_text='Signature image, served by the signature endpoint'
     )
     outgoing_entity = models.ForeignKey(
         OutgoingReceivingEntity,
         on_delete=models.CASCADE,
         related_name='outgoing_entity_informed_consents'
     )
-    outgoing_entity_signature = models.TextField(
+    outgoing_entity_signature = models.ForeignKey(
+        SignatureBlob,
+        on_delete=models.PROTECT,
+        related_name='+',
         blank=True,
         null=True,
-        help_text='Digital signature in base64 format'
+        help_text='Signature image, served by the signature endpoint'
     )
 
     objects = ActiveManager()
@@ -1,9 +1,11 @@
 from django.db import models
+from .signature_blob import SignatureBlob
 from .patient_history import PatientHistory
 from .insurance_provider import InsuranceProvider
 from core.models import (
     AuditedModel,
-    ActiveManager
+    ActiveManager,
+    active_index
 )
 
 class Patient(AuditedModel):
@@ -35,9 +37,13 @@ class Patient(AuditedModel):
     )
     marital_status = models.CharField(max_length=50)
     occupation = models.CharField(max_length=100)
-    signature = models.TextField(
-        blank=True, 
-        null=True
+    signature = models.ForeignKey(
+        SignatureBlob,
+        on_delete=models.PROTECT,
+        related_name='+',
+        blank=True,
+        null=True,
+        help_text='Signature image, served by the signature endpoint'
     )
     patient_history = models.OneToOneField(
         PatientHistory,
@@ -60,9 +66,9 @@ class Patient(AuditedModel):
         verbose_name_plural = 'Patients'
         ordering = ['-created_at']  # Heredado de AuditedModel
         indexes = [
+            # Also looked up among deleted patients (re-linking on create)
             models.Index(fields=['identification_number']),
-            models.Index(fields=['created_at']),
-            models.Index(fields=['is_deleted']),
+            active_index('-created_at', name='patient_active_created_idx'),
         ]
     
     def __str__(self) -> str:
@@ -5,7 +5,9 @@ from .care_transfer_report import CareTransferReport
 from .patient import Patient
 from core.models import (
     AuditedModel,
-    ActiveManager
+    AuditedQuerySet,
+    ActiveManager,
+    active_index
 )
 from django.contrib.auth.models import User
 
@@ -47,19 +49,72 @@ class PatientTransportReport(AuditedModel):
         default='borrador',
         db_index=True
     )
+    client_uuid = models.UUIDField(
+        unique=True,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text='ID generated by the capturing device (offline sync)'
+    )
+    version = models.PositiveIntegerField(
+        default=1,
+        help_text='Incremented on every content change (sync/autosave precondition)'
+    )
+    sync_digest = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        editable=False,
+        help_text='SHA-256 of the last synced payload, to recognize replays'
+    )
+    # Autosave session: the client that wrote the last autosave, the
+    # version its session started from and the version it produced
+    autosave_client = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        editable=False,
+        help_text='Client ID of the current autosave session'
+    )
+    autosave_base_version = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        editable=False,
+        help_text='Version the current autosave session started from'
+    )
+    autosave_version = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        editable=False,
+        help_text='Version written by the last autosave'
+    )
+
+    # Read by PatientTransportReportSummarySerializer (buzon listings)
+    SUMMARY_FIELDS: tuple[str, ...] = (
+        'id',
+        'status',
+        'created_at',
+        'updated_at',
+        'patient__patient_name',
+        'patient__identification_number',
+        'created_by__username'
+    )
 
     objects = ActiveManager()
-    all_objects = models.Manager()
+    all_objects = AuditedQuerySet.as_manager()
     
     class Meta:
         verbose_name = 'Patient Transport Report'
         verbose_name_plural = 'Patient Transport Reports'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['patient', '-created_at']),
-            models.Index(fields=['status', '-created_at']),
-            models.Index(fields=['created_by']),
-            models.Index(fields=['is_deleted']),
+            active_index('patient', '-created_at', name='ptr_active_patient_idx'),
+            active_index('status', '-created_at', name='ptr_active_status_idx'),
+            # Buzon: one user's reports in a time window, split by status
+            active_index('created_by', '-created_at', 'status', name='ptr_buzon_idx'),
+            # Buzon change feed: keyset on (updated_at, id) per user. Full
+            # index: the feed also reports soft-deleted rows
+            models.Index(fields=['created_by', 'updated_at', 'id'], name='ptr_buzon_changes_idx'),
         ]
     
     def __str__(self) -> str:
@@ -72,5 +127,6 @@ class PatientTransportReport(AuditedModel):
         '''Mark report as completed with audit trail'''
         self.status = 'completado'
         self.updated_by = user
-        self.save(update_fields=['status', 'updated_by', 'updated_at'])
+        self.version += 1
+        self.save(update_fields=['status', 'updated_by', 'updated_at', 'version'])
 
@@ -0,0 +1,35 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from .patient_transport_report import PatientTransportReport
+
+class PatientTransportReportSnapshot(models.Model):
+    '''
+    Rendered detail document of a completed PatientTransportReport.
+
+    Written when the report is completed (or lazily on the first detail
+    read after an invalidation) and served by get_detail_report/ with a
+    single primary-key lookup. Deleted on soft_delete/restore and on any
+    later edit of the report or its nested records.
+    '''
+
+    report = models.OneToOneField(
+        PatientTransportReport,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='snapshot'
+    )
+    version = models.PositiveSmallIntegerField(
+        help_text='Layout version of the detail serializers that rendered the document'
+    )
+    document = models.JSONField(
+        encoder=DjangoJSONEncoder,
+        help_text='Output of PatientTransportReportDetailSerializer'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Patient Transport Report Snapshot'
+        verbose_name_plural = 'Patient Transport Report Snapshots'
+
+    def __str__(self) -> str:
+        return f'Snapshot of report #{self.report_id} v{self.version}'
@@ -1,4 +1,5 @@
 from django.db import models
+from .signature_blob import SignatureBlob
 
 class SatisfactionSurvey(models.Model):
 
@@ -27,9 +28,13 @@ class SatisfactionSurvey(models.Model):
         null=True
     )
     respondent_phone = models.CharField(max_length=20)
-    respondent_signature = models.TextField(
+    respondent_signature = models.ForeignKey(
+        SignatureBlob,
+        on_delete=models.PROTECT,
+        related_name='+',
         blank=True,
-        null=True
+        null=True,
+        help_text='Signature image, served by the signature endpoint'
     )
 
     class Meta:
@@ -0,0 +1,31 @@
+from django.db import models
+
+class SignatureBlob(models.Model):
+    '''
+    Decoded signature image shared by every row that references it.
+
+    Signatures arrive as base64 (optionally as a data URL) and are stored
+    once per distinct content, keyed by their SHA-256. Rows hold a foreign
+    key, so report queries never load the image bytes; they are fetched on
+    demand from the signature endpoint. Blobs are immutable.
+    '''
+
+    sha256 = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text='Hex SHA-256 of content'
+    )
+    content = models.BinaryField()
+    content_type = models.CharField(
+        max_length=100,
+        default='image/png'
+    )
+    size = models.PositiveIntegerField(help_text='Size of content in bytes')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Signature Blob'
+        verbose_name_plural = 'Signature Blobs'
+
+    def __str__(self) -> str:
+        return f'Signature #{self.id} ({self.size} bytes)'
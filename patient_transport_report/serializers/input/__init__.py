@@ -0,0 +1,15 @@
+from .list_buzon_changes_serializer import ListBuzonChangesSerializer
+from .signature_field import SignatureField
+from .create_report_serializer import CreateReportSerializer
+from .sync_report_item_serializer import SyncReportItemSerializer
+from .sync_reports_serializer import SyncReportsSerializer
+from .autosave_report_serializer import AutosaveReportSerializer
+
+__all__ = [
+    'ListBuzonChangesSerializer',
+    'SignatureField',
+    'CreateReportSerializer',
+    'SyncReportItemSerializer',
+    'SyncReportsSerializer',
+    'AutosaveReportSerializer'
+]
@@ -0,0 +1,46 @@
+from rest_framework import serializers
+from .create_informed_consent_serializer import CreateInformedConsentSerializer
+from .create_care_transfer_report_serializer import CreateCareTransferReportSerializer
+from .create_satisfaction_survey_serializer import CreateSatisfactionSurveySerializer
+
+class AutosaveReportSerializer(serializers.Serializer):
+    '''
+    Serializer for an autosave of a draft report: a merge patch of its
+    sections plus the version it was made on.
+
+    The serializer is always partial, so the sections only validate the
+    fields they contain (with the rules of create_report/). The patient is
+    shared by every report of that person and is not editable here.
+    '''
+    version: serializers.IntegerField = serializers.IntegerField(
+        min_value=1,
+        help_text='Version of the report the changes were made on'
+    )
+    client_id: serializers.CharField = serializers.CharField(
+        max_length=64,
+        help_text='ID of the editing client (device or browser tab), used to coalesce its autosaves'
+    )
+    informed_consent: CreateInformedConsentSerializer = CreateInformedConsentSerializer(required=False)
+    care_transfer_report: CreateCareTransferReportSerializer = CreateCareTransferReportSerializer(required=False)
+    satisfaction_survey: CreateSatisfactionSurveySerializer = CreateSatisfactionSurveySerializer(
+        required=False,
+        allow_null=True
+    )
+
+    def __init__(self, *args, **kwargs):
+        kwargs['partial'] = True
+        super().__init__(*args, **kwargs)
+
+    def validate(
+        self,
+        data: dict
+    ) -> dict:
+        '''Partial validation skips missing fields: the precondition is still required.'''
+        missing: dict[str, str] = {
+            name: 'Este campo es requerido.'
+            for name in ('version', 'client_id')
+            if name not in data
+        }
+        if missing:
+            raise serializers.ValidationError(missing)
+        return data
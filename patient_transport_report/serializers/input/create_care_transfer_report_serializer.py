@@ -0,0 +1,179 @@
+from rest_framework import serializers
+from patient_transport_report.models import (
+    CareTransferReport,
+    Glasgow,
+    PhysicalExam,
+    Treatment,
+    Result,
+    ComplicationsTransfer
+)
+from .create_informed_consent_serializer import (
+    CreateCompanionSerializer,
+    CreateOutgoingReceivingEntitySerializer
+)
+from .signature_field import SignatureField
+
+class CreateGlasgowSerializer(serializers.ModelSerializer):
+    '''Glasgow scale of a physical exam.'''
+
+    class Meta:
+        model = Glasgow
+        fields = [
+            'motor',
+            'motor_text',
+            'verbal',
+            'verbal_text',
+            'eyes_opening',
+            'eyes_opening_text',
+            'total'
+        ]
+
+
+class CreatePhysicalExamSerializer(serializers.ModelSerializer):
+    '''Initial or final physical exam of a new care transfer report.'''
+
+    glasgow: CreateGlasgowSerializer = CreateGlasgowSerializer()
+
+    class Meta:
+        model = PhysicalExam
+        fields = [
+            'systolic',
+            'diastolic',
+            'map_pam',
+            'heart_rate',
+            'respiratory_rate',
+            'oxygen_saturation',
+            'temperature',
+            'blood_glucose',
+            'glasgow'
+        ]
+
+
+class CreateTreatmentSerializer(serializers.ModelSerializer):
+    '''Treatment of a new care transfer report.'''
+
+    class Meta:
+        model = Treatment
+        fields = [
+            'monitors_vital_signs',
+            'oxygen',
+            'liter_minute',
+            'nasal_cannula',
+            'simple_face_mask',
+            'non_rebreather_mask'
+        ]
+
+
+class CreateResultSerializer(serializers.ModelSerializer):
+    '''Result of a new care transfer report.'''
+
+    class Meta:
+        model = Result
+        fields = [
+            'no_vital_signs',
+            'denies_transportation',
+            'schelud_transfer',
+            'receiving_institution'
+        ]
+
+
+class CreateComplicationsTransferSerializer(serializers.ModelSerializer):
+    '''Transfer complications of a new care transfer report.'''
+
+    class Meta:
+        model = ComplicationsTransfer
+        fields = [
+            'description_complication',
+            'register_code',
+            'code',
+            'record_waiting_time',
+            'waiting_time',
+            'time_code'
+        ]
+
+
+class CreateCareTransferReportSerializer(serializers.ModelSerializer):
+    '''
+    Care transfer section of a new report.
+
+    Staff, ambulance, diagnoses and catalog entries are referenced by id;
+    their existence is checked in bulk before anything is written.
+    '''
+
+    driver_id: serializers.IntegerField = serializers.IntegerField()
+    attending_staff_id: serializers.IntegerField = serializers.IntegerField()
+    support_staff_id: serializers.IntegerField = serializers.IntegerField(
+        required=False,
+        allow_null=True
+    )
+    ambulance_id: serializers.IntegerField = serializers.IntegerField()
+    companion: CreateCompanionSerializer = CreateCompanionSerializer(
+        required=False,
+        allow_null=True
+    )
+    responsible: CreateCompanionSerializer = CreateCompanionSerializer(
+        required=False,
+        allow_null=True
+    )
+    initial_physicial_examination: CreatePhysicalExamSerializer = CreatePhysicalExamSerializer()
+    final_physical_examination: CreatePhysicalExamSerializer = CreatePhysicalExamSerializer()
+    skin_condition_ids: serializers.ListField = serializers.ListField(
+        child=serializers.IntegerField(),
+        min_length=1,
+        max_length=2,
+        help_text='1 or 2 SkinCondition ids'
+    )
+    hemodynamic_status_ids: serializers.ListField = serializers.ListField(
+        child=serializers.IntegerField(),
+        min_length=1,
+        max_length=2,
+        help_text='1 or 2 HemodynamicStatus ids'
+    )
+    treatment: CreateTreatmentSerializer = CreateTreatmentSerializer()
+    diagnosis_1_id: serializers.IntegerField = serializers.IntegerField()
+    diagnosis_2_id: serializers.IntegerField = serializers.IntegerField(
+        required=False,
+        allow_null=True
+    )
+    result: CreateResultSerializer = CreateResultSerializer()
+    complications_transfer: CreateComplicationsTransferSerializer = CreateComplicationsTransferSerializer()
+    receiving_entity: CreateOutgoingReceivingEntitySerializer = CreateOutgoingReceivingEntitySerializer()
+    receiving_entity_signature: SignatureField = SignatureField()
+
+    class Meta:
+        model = CareTransferReport
+        fields = [
+            'patient_one_of',
+            'transfer_type',
+            'initial_address',
+            'landmark',
+            'service_type',
+            'dispatch_time',
+            'patient_arrival_time',
+            'patient_departure_time',
+            'arrival_time_patient',
+            'double_departure_time',
+            'double_arrival_time',
+            'end_attention_time',
+            'driver_id',
+            'attending_staff_id',
+            'reg_number',
+            'support_staff_id',
+            'attending_staff_tittle',
+            'ambulance_id',
+            'companion',
+            'companion_is_responsible',
+            'responsible',
+            'initial_physicial_examination',
+            'final_physical_examination',
+            'skin_condition_ids',
+            'hemodynamic_status_ids',
+            'treatment',
+            'diagnosis_1_id',
+            'diagnosis_2_id',
+            'result',
+            'complications_transfer',
+            'notes',
+            'receiving_entity',
+            'receiving_entity_signature'
+        ]
@@ -0,0 +1,123 @@
+from rest_framework import serializers
+from patient_transport_report.models import (
+    InformedConsent,
+    RequiredProcedures,
+    MedicationAdministration,
+    Companion,
+    OutgoingReceivingEntity
+)
+from .signature_field import SignatureField
+
+class CreateRequiredProceduresSerializer(serializers.ModelSerializer):
+    '''Required procedures of a new informed consent.'''
+
+    class Meta:
+        model = RequiredProcedures
+        fields = [
+            'immovilization',
+            'streatcher_transfer',
+            'ambulance_transport',
+            'assessment',
+            'other_procedures_details'
+        ]
+
+
+class CreateMedicationAdministrationSerializer(serializers.ModelSerializer):
+    '''Medication administration of a new informed consent.'''
+
+    class Meta:
+        model = MedicationAdministration
+        fields = [
+            'oxygen',
+            'iv_fluids',
+            'admin_route_type',
+            'other_medication_details'
+        ]
+
+
+class CreateCompanionSerializer(serializers.ModelSerializer):
+    '''Companion or responsible person of a new report.'''
+
+    class Meta:
+        model = Companion
+        fields = [
+            'name',
+            'identification_type',
+            'identification_number',
+            'kindship',
+            'phone_number',
+            'email'
+        ]
+
+
+class CreateOutgoingReceivingEntitySerializer(serializers.ModelSerializer):
+    '''Outgoing or receiving entity of a new report.'''
+
+    class Meta:
+        model = OutgoingReceivingEntity
+        fields = [
+            'name',
+            'document',
+            'staff_title'
+        ]
+
+
+class CreateInformedConsentSerializer(serializers.ModelSerializer):
+    '''Informed consent section of a new report.'''
+
+    required_procedures: CreateRequiredProceduresSerializer = CreateRequiredProceduresSerializer()
+    medication_administration: CreateMedicationAdministrationSerializer = CreateMedicationAdministrationSerializer(
+        required=False,
+        allow_null=True
+    )
+    responsible: CreateCompanionSerializer = CreateCompanionSerializer(
+        required=False,
+        allow_null=True
+    )
+    attending_staff_id: serializers.IntegerField = serializers.IntegerField(
+        help_text='ID of the attending Healthcare staff'
+    )
+    outgoing_entity: CreateOutgoingReceivingEntitySerializer = CreateOutgoingReceivingEntitySerializer()
+    patient_signature: SignatureField = SignatureField()
+    responsible_signature: SignatureField = SignatureField()
+    attending_staff_signature: SignatureField = SignatureField()
+    outgoing_entity_signature: SignatureField = SignatureField()
+
+    class Meta:
+        model = InformedConsent
+        fields = [
+            'consent_timestamp',
+            'guardian_type',
+            'guardian_name',
+            'responsible_for',
+            'guardian_id_type',
+            'guardian_id_number',
+            'required_procedures',
+            'administers_medications',
+            'medication_administration',
+            'service_type',
+            'other_implications',
+            'patient_can_sign',
+            'patient_signature',
+            'responsible_can_sign',
+            'responsible_signature',
+            'responsible',
+            'attending_staff_id',
+            'attending_staff_signature',
+            'outgoing_entity',
+            'outgoing_entity_signature'
+        ]
+
+    def validate(
+        self,
+        data: dict
+    ) -> dict:
+        '''Medication details are required when medications are administered.'''
+        # Partial updates (autosave) are checked against the stored consent instead
+        if self.root.partial and 'medication_administration' not in data:
+            return data
+        if data.get('administers_medications') and not data.get('medication_administration'):
+            raise serializers.ValidationError({
+                'medication_administration': 'Este campo es obligatorio cuando se administran medicamentos.'
+            })
+        return data
@@ -0,0 +1,81 @@
+from rest_framework import serializers
+from patient_transport_report.models import (
+    Patient,
+    PatientHistory,
+    InsuranceProvider
+)
+from .signature_field import SignatureField
+
+class CreatePatientHistorySerializer(serializers.ModelSerializer):
+    '''Patient history section of a new report.'''
+
+    class Meta:
+        model = PatientHistory
+        fields = [
+            'has_pathology',
+            'pathology',
+            'has_allergies',
+            'allergies',
+            'has_surgies',
+            'surgeries',
+            'has_medicines',
+            'medicines',
+            'tobacco_use',
+            'alcohol_use',
+            'substance_use',
+            'substances',
+            'other_history'
+        ]
+
+
+class CreateInsuranceProviderSerializer(serializers.ModelSerializer):
+    '''Insurance section of a new report.'''
+
+    class Meta:
+        model = InsuranceProvider
+        fields = [
+            'coverage_type',
+            'provider_name',
+            'other_coverage_type',
+            'other_coverage_details'
+        ]
+
+
+class CreatePatientSerializer(serializers.ModelSerializer):
+    '''
+    Patient section of a new report.
+
+    identification_number is not checked for uniqueness here: an existing
+    patient with the same number is linked to the report instead.
+    '''
+
+    patient_history: CreatePatientHistorySerializer = CreatePatientHistorySerializer()
+    insurance_provider: CreateInsuranceProviderSerializer = CreateInsuranceProviderSerializer()
+    signature: SignatureField = SignatureField()
+
+    class Meta:
+        model = Patient
+        fields = [
+            'patient_name',
+            'identification_type',
+            'other_identification_type',
+            'identification_number',
+            'issue_date',
+            'issue_place',
+            'birth_date',
+            'age',
+            'sex',
+            'home_address',
+            'residence_city',
+            'cell_phone',
+            'landline_phone',
+            'marital_status',
+            'occupation',
+            'membership_category',
+            'signature',
+            'patient_history',
+            'insurance_provider'
+        ]
+        extra_kwargs = {
+            'identification_number': {'validators': []}
+        }
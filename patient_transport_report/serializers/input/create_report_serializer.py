@@ -0,0 +1,25 @@
+from rest_framework import serializers
+from .create_patient_serializer import CreatePatientSerializer
+from .create_informed_consent_serializer import CreateInformedConsentSerializer
+from .create_care_transfer_report_serializer import CreateCareTransferReportSerializer
+from .create_satisfaction_survey_serializer import CreateSatisfactionSurveySerializer
+
+class CreateReportSerializer(serializers.Serializer):
+    '''
+    Serializer for the full payload of a new patient transport report.
+
+    Every section is validated before any row is written.
+    '''
+    patient: CreatePatientSerializer = CreatePatientSerializer()
+    informed_consent: CreateInformedConsentSerializer = CreateInformedConsentSerializer()
+    care_transfer_report: CreateCareTransferReportSerializer = CreateCareTransferReportSerializer()
+    satisfaction_survey: CreateSatisfactionSurveySerializer = CreateSatisfactionSurveySerializer(
+        required=False,
+        allow_null=True
+    )
+    status: serializers.ChoiceField = serializers.ChoiceField(
+        required=False,
+        default='borrador',
+        choices=['borrador', 'completado'],
+        help_text='Initial status of the report (default borrador)'
+    )
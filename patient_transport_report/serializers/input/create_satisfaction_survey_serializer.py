@@ -0,0 +1,32 @@
+from rest_framework import serializers
+from patient_transport_report.models import SatisfactionSurvey
+from .signature_field import SignatureField
+
+class CreateSatisfactionSurveySerializer(serializers.ModelSerializer):
+    '''Satisfaction survey section of a new report.'''
+
+    respondent_signature: SignatureField = SignatureField()
+
+    class Meta:
+        model = SatisfactionSurvey
+        fields = [
+            'ambulance_request_ease',
+            'phone_support_quality',
+            'service_punctuality',
+            'clear_info_provided',
+            'staff_appearance',
+            'ambulance_cleanliness',
+            'driving_quality',
+            'return_trip_timeliness',
+            'safety_and_reassurance',
+            'staff_empathy',
+            'overall_satisfaction',
+            'would_recommend',
+            'comments',
+            'respondent_can_sign',
+            'respondent_name',
+            'respondent_id_number',
+            'respondent_email',
+            'respondent_phone',
+            'respondent_signature'
+        ]
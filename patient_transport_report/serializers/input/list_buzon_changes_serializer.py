@@ -0,0 +1,29 @@
+from rest_framework import serializers
+from patient_transport_report.types.dataclass import BuzonChangeCursor
+
+class ListBuzonChangesSerializer(serializers.Serializer):
+    '''Serializer for buzon change feed query parameters.'''
+    since: serializers.CharField = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text='next_since value returned by the previous call (empty: whole buzon window)'
+    )
+    limit: serializers.IntegerField = serializers.IntegerField(
+        required=False,
+        default=100,
+        min_value=1,
+        max_value=200,
+        help_text='Maximum number of changed reports (1-200, default 100)'
+    )
+
+    def validate_since(
+        self,
+        value: str
+    ) -> BuzonChangeCursor | None:
+        '''Decode the opaque cursor into its (updated_at, id) position.'''
+        if not value:
+            return None
+        try:
+            return BuzonChangeCursor.decode(value)
+        except ValueError:
+            raise serializers.ValidationError('Cursor inválido.')
@@ -0,0 +1,26 @@
+from rest_framework import serializers
+from patient_transport_report.domain_service import SignatureStoreDomainService
+
+class SignatureField(serializers.CharField):
+    '''
+    Optional signature given as base64 or data URL.
+
+    The value is only checked here (type, size, encoding); it is stored
+    through SignatureStoreDomainService once the whole payload is valid.
+    '''
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('required', False)
+        kwargs.setdefault('allow_null', True)
+        kwargs.setdefault('allow_blank', True)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data) -> str | None:
+        value: str = super().to_internal_value(data)
+        if not value:
+            return None
+        try:
+            SignatureStoreDomainService().decode(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
+        return value
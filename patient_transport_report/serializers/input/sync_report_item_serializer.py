@@ -0,0 +1,14 @@
+from rest_framework import serializers
+from .create_report_serializer import CreateReportSerializer
+
+class SyncReportItemSerializer(CreateReportSerializer):
+    '''One report of an offline sync batch: the create payload plus its device identity.'''
+    client_uuid: serializers.UUIDField = serializers.UUIDField(
+        help_text='UUID generated by the device when the report was captured'
+    )
+    base_version: serializers.IntegerField = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        min_value=1,
+        help_text='Server version last received for this report (omitted: never synced)'
+    )
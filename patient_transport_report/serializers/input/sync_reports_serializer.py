@@ -0,0 +1,28 @@
+from django.conf import settings
+from rest_framework import serializers
+
+class SyncReportsSerializer(serializers.Serializer):
+    '''
+    Serializer for an offline sync batch.
+
+    Items are validated one by one by the application service, so an
+    invalid report is reported in its own result instead of failing the
+    whole batch.
+    '''
+    DEFAULT_MAX_ITEMS: int = 50
+
+    reports: serializers.ListField = serializers.ListField(
+        child=serializers.DictField(),
+        min_length=1,
+        help_text='Reports in SyncReportItemSerializer format'
+    )
+
+    def validate_reports(
+        self,
+        value: list[dict]
+    ) -> list[dict]:
+        '''Limit the batch size (REPORT_SYNC_MAX_ITEMS).'''
+        max_items: int = getattr(settings, 'REPORT_SYNC_MAX_ITEMS', self.DEFAULT_MAX_ITEMS)
+        if len(value) > max_items:
+            raise serializers.ValidationError(f'Se permiten como máximo {max_items} informes por lote.')
+        return value
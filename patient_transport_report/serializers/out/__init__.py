@@ -1,19 +1,31 @@
 from .diagnosis_serializer import DiagnosisSerializer
 from .ips_serializer import IPSSerializer
+from .eps_serializer import EPSSerializer
+from .arl_serializer import ARLSerializer
+from .soat_serializer import SOATSerializer
 from .patient_transport_report_summary_serializer import PatientTransportReportSummarySerializer
+from .signature_url_field import SignatureUrlField
 from .patient_detail_serializer import PatientDetailSerializer
 from .informed_consent_detail_serializer import InformedConsentDetailSerializer
 from .care_transfer_report_detail_serializer import CareTransferReportDetailSerializer
 from .satisfaction_survey_detail_serializer import SatisfactionSurveyDetailSerializer
 from .patient_transport_report_detail_serializer import PatientTransportReportDetailSerializer
+from .report_sync_result_serializer import ReportSyncResultSerializer
+from .report_autosave_result_serializer import ReportAutosaveResultSerializer
 
 __all__ = [
     'DiagnosisSerializer',
     'IPSSerializer',
+    'EPSSerializer',
+    'ARLSerializer',
+    'SOATSerializer',
     'PatientTransportReportSummarySerializer',
+    'SignatureUrlField',
     'PatientDetailSerializer',
     'InformedConsentDetailSerializer',
     'CareTransferReportDetailSerializer',
     'SatisfactionSurveyDetailSerializer',
-    'PatientTransportReportDetailSerializer'
+    'PatientTransportReportDetailSerializer',
+    'ReportSyncResultSerializer',
+    'ReportAutosaveResultSerializer'
 ]
\ No newline at end of file
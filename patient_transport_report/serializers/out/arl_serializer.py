@@ -0,0 +1,18 @@
+from rest_framework import serializers
+from patient_transport_report.models import ARL
+
+class ARLSerializer(serializers.ModelSerializer):
+    '''
+    Serializer for ARL output (Occupational Risk Managements).
+    
+    Returns active ARL information.
+    '''
+    
+    class Meta:
+        model = ARL
+        fields = [
+            'id',
+            'name',
+            'is_active'
+        ]
+        read_only_fields = ['id']
\ No newline at end of file
@@ -1,31 +1,38 @@
 from rest_framework import serializers
 from patient_transport_report.models import CareTransferReport
+from .signature_url_field import SignatureUrlField
 
 class CareTransferReportDetailSerializer(serializers.ModelSerializer):
-    '''Serializer for CareTransferReport details in report view.'''
+    '''
+    Serializer for CareTransferReport details in report view.
+
+    Reads only relations loaded by GetDetailsReportApplicationService
+    (select_related for FKs, prefetch_related for the M2M lists), so
+    serializing a report issues no extra queries.
+    '''
     
     driver_name: serializers.CharField = serializers.CharField(
-        source='driver.name', 
+        source='driver.base_staff.system_user.get_full_name', 
         read_only=True
     )
     attending_staff_name: serializers.CharField = serializers.CharField(
-        source='attending_staff.name', 
+        source='attending_staff.base_staff.system_user.get_full_name', 
         read_only=True
     )
     support_staff_name: serializers.CharField = serializers.CharField(
-        source='support_staff.name', 
+        source='support_staff.base_staff.system_user.get_full_name', 
         read_only=True
     )
     ambulance_plate: serializers.CharField = serializers.CharField(
-        source='ambulance.plate_number', 
+        source='ambulance.license_plate', 
         read_only=True
     )
-    companion_1_name: serializers.CharField = serializers.CharField(
-        source='companion_1.full_name', 
+    companion_name: serializers.CharField = serializers.CharField(
+        source='companion.name', 
         read_only=True
     )
-    companion_2_name: serializers.CharField = serializers.CharField(
-        source='companion_2.full_name', 
+    responsible_name: serializers.CharField = serializers.CharField(
+        source='responsible.name', 
         read_only=True
     )
     receiving_entity_name: serializers.CharField = serializers.CharField(
@@ -48,6 +55,7 @@ class CareTransferReportDetailSerializer(serializers.ModelSerializer):
         source='diagnosis_2.cie_10_name', 
         read_only=True
     )
+    receiving_entity_signature: SignatureUrlField = SignatureUrlField()
     skin_conditions_list: serializers.SerializerMethodField = serializers.SerializerMethodField()
     hemodynamic_statuses_list: serializers.SerializerMethodField = serializers.SerializerMethodField()
     
@@ -77,10 +85,11 @@ class CareTransferReportDetailSerializer(serializers.ModelSerializer):
             'attending_staff_tittle',
             'ambulance',
             'ambulance_plate',
-            'companion_1',
-            'companion_1_name',
-            'companion_2',
-            'companion_2_name',
+            'companion',
+            'companion_name',
+            'companion_is_responsible',
+            'responsible',
+            'responsible_name',
             'initial_physicial_examination',
             'final_physical_examination',
             'skin_conditions_list',
@@ -96,7 +105,8 @@ class CareTransferReportDetailSerializer(serializers.ModelSerializer):
             'complications_transfer',
             'notes',
             'receiving_entity',
-            'receiving_entity_name'
+            'receiving_entity_name',
+            'receiving_entity_signature'
         ]
         read_only_fields = fields
     
@@ -104,12 +114,18 @@ class CareTransferReportDetailSerializer(serializers.ModelSerializer):
         self, 
         obj: CareTransferReport
     ) -> list[dict]:
-        '''Get list of skin conditions'''
-        return list(obj.skin_conditions.values('id', 'condition_name'))
+        '''Get list of skin conditions (from the prefetch cache)'''
+        return [
+            {'id': skin_condition.id, 'name': skin_condition.name}
+            for skin_condition in obj.skin_conditions.all()
+        ]
     
     def get_hemodynamic_statuses_list(
         self, 
         obj: CareTransferReport
     ) -> list[dict]:
-        '''Get list of hemodynamic statuses'''
-        return list(obj.hemodynamic_statuses.values('id', 'status_name'))
\ No newline at end of file
+        '''Get list of hemodynamic statuses (from the prefetch cache)'''
+        return [
+            {'id': hemodynamic_status.id, 'name': hemodynamic_status.name}
+            for hemodynamic_status in obj.hemodynamic_statuses.all()
+        ]
\ No newline at end of file
@@ -0,0 +1,18 @@
+from rest_framework import serializers
+from patient_transport_report.models import EPS
+
+class EPSSerializer(serializers.ModelSerializer):
+    '''
+    Serializer for EPS output (Health Promoting Entities).
+    
+    Returns active EPS information.
+    '''
+    
+    class Meta:
+        model = EPS
+        fields = [
+            'id',
+            'name',
+            'is_active'
+        ]
+        read_only_fields = ['id']
\ No newline at end of file
@@ -1,44 +1,76 @@
+from django.forms.models import model_to_dict
 from rest_framework import serializers
 from patient_transport_report.models import InformedConsent
+from .signature_url_field import SignatureUrlField
 
 class InformedConsentDetailSerializer(serializers.ModelSerializer):
-    '''Serializer for InformedConsent details in report view.'''
-    
-    required_procedures_list: serializers.SerializerMethodField = serializers.SerializerMethodField()
-    medication_administration_list: serializers.SerializerMethodField = serializers.SerializerMethodField()
-    companion_name: serializers.CharField = serializers.CharField(source='companion.full_name', read_only=True)
-    healthcare_staff_name: serializers.CharField = serializers.CharField(source='healthcare_staff.name', read_only=True)
+    '''
+    Serializer for InformedConsent details in report view.
+
+    required_procedures and medication_administration are one-to-one
+    relations loaded with select_related, serialized as nested objects.
+    Signatures are returned as links to the signature endpoint.
+    '''
+
+    required_procedures_detail: serializers.SerializerMethodField = serializers.SerializerMethodField()
+    medication_administration_detail: serializers.SerializerMethodField = serializers.SerializerMethodField()
+    responsible_name: serializers.CharField = serializers.CharField(source='responsible.name', read_only=True)
+    attending_staff_name: serializers.CharField = serializers.CharField(
+        source='attending_staff.base_staff.system_user.get_full_name',
+        read_only=True
+    )
     outgoing_entity_name: serializers.CharField = serializers.CharField(source='outgoing_entity.name', read_only=True)
-    receiving_entity_name: serializers.CharField = serializers.CharField(source='receiving_entity.name', read_only=True)
-    
+    patient_signature: SignatureUrlField = SignatureUrlField()
+    responsible_signature: SignatureUrlField = SignatureUrlField()
+    attending_staff_signature: SignatureUrlField = SignatureUrlField()
+    outgoing_entity_signature: SignatureUrlField = SignatureUrlField()
+
     class Meta:
         model = InformedConsent
         fields = [
             'id',
-            'required_procedures_list',
-            'medication_administration_list',
-            'companion',
-            'companion_name',
-            'healthcare_staff',
-            'healthcare_staff_name',
+            'consent_timestamp',
+            'guardian_type',
+            'guardian_name',
+            'responsible_for',
+            'guardian_id_type',
+            'guardian_id_number',
+            'required_procedures',
+            'required_procedures_detail',
+            'administers_medications',
+            'medication_administration',
+            'medication_administration_detail',
+            'service_type',
+            'other_implications',
+            'patient_can_sign',
+            'patient_signature',
+            'responsible_can_sign',
+            'responsible_signature',
+            'responsible',
+            'responsible_name',
+            'attending_staff',
+            'attending_staff_name',
+            'attending_staff_signature',
             'outgoing_entity',
             'outgoing_entity_name',
-            'receiving_entity',
-            'receiving_entity_name',
-            'signature'
+            'outgoing_entity_signature'
         ]
         read_only_fields = fields
-    
-    def get_required_procedures_list(
-        self, 
+
+    def get_required_procedures_detail(
+        self,
         obj: InformedConsent
-    ) -> list[dict]:
-        '''Get list of required procedures'''
-        return list(obj.required_procedures.values('id', 'procedure_name'))
-    
-    def get_medication_administration_list(
-        self, 
+    ) -> dict | None:
+        '''Get required procedures (from the select_related cache)'''
+        if obj.required_procedures is None:
+            return None
+        return model_to_dict(obj.required_procedures)
+
+    def get_medication_administration_detail(
+        self,
         obj: InformedConsent
-    ) -> list[dict]:
-        '''Get list of medication administrations'''
-        return list(obj.medication_administration.values('id', 'medication_name', 'dose', 'route'))
\ No newline at end of file
+    ) -> dict | None:
+        '''Get medication administration (from the select_related cache)'''
+        if obj.medication_administration is None:
+            return None
+        return model_to_dict(obj.medication_administration)
@@ -1,13 +1,15 @@
 from rest_framework import serializers
 from patient_transport_report.models import Patient
+from .signature_url_field import SignatureUrlField
 
 class PatientDetailSerializer(serializers.ModelSerializer):
     '''Serializer for Patient details in report view.'''
     
     insurance_provider_name: serializers.CharField = serializers.CharField(
-        source='insurance_provider.name', 
+        source='insurance_provider.provider_name', 
         read_only=True
     )
+    signature: SignatureUrlField = SignatureUrlField()
     
     class Meta:
         model = Patient
@@ -18,10 +20,11 @@ class PatientDetailSerializer(serializers.ModelSerializer):
             'identification_number',
             'age',
             'sex',
-            'phone',
+            'cell_phone',
             'insurance_provider',
             'insurance_provider_name',
-            'affiliate_type',
-            'address'
+            'membership_category',
+            'home_address',
+            'signature'
         ]
         read_only_fields = fields
\ No newline at end of file
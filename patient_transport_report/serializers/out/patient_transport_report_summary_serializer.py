@@ -5,7 +5,9 @@ class PatientTransportReportSummarySerializer(serializers.ModelSerializer):
     '''
     Serializer for PatientTransportReport summary (for inbox/buzon listing).
     
-    Returns minimal information for list views.
+    Returns minimal information for list views. Querysets are loaded with
+    summary(), so every field read here must be listed in
+    PatientTransportReport.SUMMARY_FIELDS.
     '''
     
     patient_name: serializers.CharField = serializers.CharField(
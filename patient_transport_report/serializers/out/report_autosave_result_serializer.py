@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+class ReportAutosaveResultSerializer(serializers.Serializer):
+    '''Serializer for the outcome of an autosave of a draft report (ReportAutosaveResult).'''
+    status: serializers.CharField = serializers.CharField()
+    report_id: serializers.IntegerField = serializers.IntegerField()
+    version: serializers.IntegerField = serializers.IntegerField()
+    updated_at: serializers.DateTimeField = serializers.DateTimeField()
+    changed_fields: serializers.ListField = serializers.ListField(child=serializers.CharField())
+    coalesced: serializers.BooleanField = serializers.BooleanField()
@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+class ReportSyncResultSerializer(serializers.Serializer):
+    '''Serializer for the per-report outcome of an offline sync batch (ReportSyncResult).'''
+    client_uuid: serializers.UUIDField = serializers.UUIDField(allow_null=True)
+    status: serializers.CharField = serializers.CharField()
+    report_id: serializers.IntegerField = serializers.IntegerField(allow_null=True)
+    version: serializers.IntegerField = serializers.IntegerField(allow_null=True)
+    response: serializers.CharField = serializers.CharField()
+    errors: serializers.DictField = serializers.DictField()
@@ -1,15 +1,34 @@
 from rest_framework import serializers
 from patient_transport_report.models import SatisfactionSurvey
+from .signature_url_field import SignatureUrlField
 
 class SatisfactionSurveyDetailSerializer(serializers.ModelSerializer):
     '''Serializer for SatisfactionSurvey details in report view.'''
     
+    respondent_signature: SignatureUrlField = SignatureUrlField()
+    
     class Meta:
         model = SatisfactionSurvey
         fields = [
             'id',
-            'rating',
+            'ambulance_request_ease',
+            'phone_support_quality',
+            'service_punctuality',
+            'clear_info_provided',
+            'staff_appearance',
+            'ambulance_cleanliness',
+            'driving_quality',
+            'return_trip_timeliness',
+            'safety_and_reassurance',
+            'staff_empathy',
+            'overall_satisfaction',
+            'would_recommend',
             'comments',
-            'created_at'
+            'respondent_can_sign',
+            'respondent_name',
+            'respondent_id_number',
+            'respondent_email',
+            'respondent_phone',
+            'respondent_signature'
         ]
         read_only_fields = fields
\ No newline at end of file
@@ -0,0 +1,19 @@
+from django.urls import reverse
+from rest_framework import serializers
+
+class SignatureUrlField(serializers.RelatedField):
+    '''
+    Read-only link to a SignatureBlob instead of the image itself.
+
+    Only the foreign key value is read, so serializing never loads the blob.
+    '''
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def use_pk_only_optimization(self) -> bool:
+        return True
+
+    def to_representation(self, value) -> str:
+        return reverse('get_signature', args=[value.pk])
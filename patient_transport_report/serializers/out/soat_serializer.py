@@ -0,0 +1,18 @@
+from rest_framework import serializers
+from patient_transport_report.models import SOAT
+
+class SOATSerializer(serializers.ModelSerializer):
+    '''
+    Serializer for SOAT output (Mandatory Traffic Accident Insurances).
+    
+    Returns active SOAT information.
+    '''
+    
+    class Meta:
+        model = SOAT
+        fields = [
+            'id',
+            'name',
+            'is_active'
+        ]
+        read_only_fields = ['id']
\ No newline at end of file
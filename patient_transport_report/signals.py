@@ -0,0 +1,98 @@
+from functools import partial
+from django.db import transaction
+from django.db.models.signals import (
+    post_save,
+    post_delete,
+    m2m_changed
+)
+from django.dispatch import receiver
+from .models import (
+    Diagnosis,
+    PatientTransportReport,
+    Patient,
+    InformedConsent,
+    CareTransferReport,
+    SatisfactionSurvey
+)
+from .domain_service import (
+    BuzonChangeFeedDomainService,
+    DiagnosisSearchIndex,
+    ReportSnapshotDomainService
+)
+
+# Fields written by PatientTransportReport.complete()
+REPORT_COMPLETION_FIELDS: frozenset[str] = frozenset({'status', 'updated_by', 'updated_at', 'version'})
+
+@receiver(post_save, sender=Diagnosis)
+@receiver(post_delete, sender=Diagnosis)
+def invalidate_diagnosis_index(
+    sender: type[Diagnosis],
+    **kwargs
+) -> None:
+    '''Mark the in-memory diagnosis index as stale when the table changes.'''
+    DiagnosisSearchIndex.get_instance().invalidate()
+
+
+@receiver(post_save, sender=PatientTransportReport)
+def sync_report_snapshot(
+    sender: type[PatientTransportReport],
+    instance: PatientTransportReport,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs
+) -> None:
+    '''
+    Materialize the detail snapshot when a report is completed; any other
+    save of an existing report (soft_delete, restore, admin edit) drops it.
+    '''
+    if created:
+        return
+    snapshot_service: ReportSnapshotDomainService = ReportSnapshotDomainService()
+    if (
+        update_fields
+        and update_fields <= REPORT_COMPLETION_FIELDS
+        and instance.status == ReportSnapshotDomainService.COMPLETED_STATUS
+    ):
+        transaction.on_commit(partial(snapshot_service.materialize, instance.pk))
+    else:
+        snapshot_service.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=PatientTransportReport)
+def bump_buzon_change_counter(
+    sender: type[PatientTransportReport],
+    instance: PatientTransportReport,
+    **kwargs
+) -> None:
+    '''Tell idle buzon pollers of the author that something changed.'''
+    if instance.created_by_id is not None:
+        transaction.on_commit(partial(BuzonChangeFeedDomainService().mark_changed, instance.created_by_id))
+
+
+@receiver(post_save, sender=Patient)
+@receiver(post_save, sender=InformedConsent)
+@receiver(post_save, sender=CareTransferReport)
+@receiver(post_save, sender=SatisfactionSurvey)
+def invalidate_nested_report_snapshots(
+    sender: type,
+    instance: Patient | InformedConsent | CareTransferReport | SatisfactionSurvey,
+    created: bool,
+    **kwargs
+) -> None:
+    '''Drop the snapshots that embed an edited nested record.'''
+    if not created:
+        ReportSnapshotDomainService().invalidate_for(instance)
+
+
+@receiver(m2m_changed, sender=CareTransferReport.skin_conditions.through)
+@receiver(m2m_changed, sender=CareTransferReport.hemodynamic_statuses.through)
+def invalidate_report_snapshot_on_m2m_change(
+    sender: type,
+    instance: CareTransferReport,
+    action: str,
+    reverse: bool,
+    **kwargs
+) -> None:
+    '''Drop the snapshot when the skin/hemodynamic lists of a report change.'''
+    if action.startswith('post_') and not reverse:
+        ReportSnapshotDomainService().invalidate_for(instance)
@@ -0,0 +1,1335 @@
+from contextlib import contextmanager
+from datetime import (
+    date,
+    timedelta
+)
+from io import StringIO
+import base64
+import gzip
+import importlib
+import os
+import re
+import tempfile
+import uuid
+from unittest import mock
+from django.contrib.auth.models import User
+from django.core.checks import run_checks
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import (
+    IntegrityError,
+    connection
+)
+from django.db.models import (
+    Model,
+    Q
+)
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgreSQLDatabaseWrapper
+from django.db.migrations.executor import MigrationExecutor
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings
+)
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from daily_monthly_inventory.models import Ambulance
+from staff.domain_service import AuthTokenCache
+from staff.models import (
+    BaseStaff,
+    Healthcare,
+    Driver
+)
+from patient_transport_report.domain_service import (
+    CatalogSnapshotDomainService,
+    CatalogReconciliationDomainService,
+    DiagnosisSearchDomainService,
+    DiagnosisSearchIndex,
+    ReportSnapshotDomainService,
+    SignatureStoreDomainService,
+    BuzonChangeFeedDomainService
+)
+from patient_transport_report.models import (
+    PatientTransportReport,
+    Patient,
+    PatientHistory,
+    InsuranceProvider,
+    InformedConsent,
+    RequiredProcedures,
+    MedicationAdministration,
+    Companion,
+    OutgoingReceivingEntity,
+    CareTransferReport,
+    PhysicalExam,
+    Glasgow,
+    Treatment,
+    Diagnosis,
+    Result,
+    ComplicationsTransfer,
+    SkinCondition,
+    HemodynamicStatus,
+    SatisfactionSurvey,
+    PatientTransportReportSnapshot,
+    SignatureBlob,
+    IPS,
+    EPS,
+    ARL,
+    SOAT
+)
+from patient_transport_report.types.dataclass import (
+    BuzonChangeCursor,
+    BuzonChanges
+)
+from patient_transport_report.management.tabular_file_reader import TabularFileReader
+from patient_transport_report.serializers.out import (
+    PatientTransportReportDetailSerializer,
+    PatientTransportReportSummarySerializer
+)
+
+# SQL budgets of GET get_detail_report/ once the token cache is warm.
+# Live rendering: snapshot probe, joined report query, one per M2M list
+DETAIL_REPORT_QUERY_BUDGET: int = 4
+# Completed report with a stored snapshot: one primary-key lookup
+SNAPSHOT_REPORT_QUERY_BUDGET: int = 1
+# POST create_report/ once the token cache is warm: 7 reference/patient
+# lookups, 3 signature statements, 17 inserts and 4 savepoint statements
+REPORT_CREATION_QUERY_BUDGET: int = 31
+
+
+class QueryBudgetMixin:
+    '''assertNumQueries variant that fails when a block exceeds a budget.'''
+
+    @contextmanager
+    def assertQueryBudget(self, budget: int):
+        with CaptureQueriesContext(connection) as context:
+            yield context
+        executed: int = len(context.captured_queries)
+        if executed > budget:
+            statements: str = '\n'.join(
+                f'{index}. {query["sql"]}'
+                for index, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(f'{executed} queries executed, budget is {budget}:\n{statements}')
+
+    @contextmanager
+    def assertNoDeferredLoads(self):
+        '''Fail when a field deferred by only()/defer() is lazily loaded.'''
+        def refresh_from_db(instance, using=None, fields=None, from_queryset=None):
+            self.fail(f'Deferred field loaded lazily: {instance.__class__.__name__}.{", ".join(fields or [])}')
+        with mock.patch.object(Model, 'refresh_from_db', refresh_from_db):
+            yield
+
+
+class ReportFixtureMixin:
+    '''Fixture: one draft report with every detail relation populated.'''
+
+    @classmethod
+    def create_report_fixture(cls):
+        cls.healthcare_user = User.objects.create_user('nurse', 'nurse@test.com', 'secret', first_name='Ana', last_name='Ruiz')
+        healthcare = Healthcare.objects.create(
+            base_staff=BaseStaff.objects.create(
+                system_user=cls.healthcare_user,
+                document_type='CC',
+                document_number='200',
+                type_personnel='Healthcare'
+            ),
+            professional_registration='RM-1',
+            professional_position='Enfermera'
+        )
+        driver_user = User.objects.create_user('driver', 'driver@test.com', 'secret', first_name='Luis', last_name='Gómez')
+        driver = Driver.objects.create(
+            base_staff=BaseStaff.objects.create(
+                system_user=driver_user,
+                document_type='CC',
+                document_number='300',
+                type_personnel='Driver'
+            ),
+            license_number='LIC-1',
+            license_category='C2',
+            license_issue_date=date(2020, 1, 1),
+            license_expiry_date=date(2030, 1, 1),
+            blood_type='O+'
+        )
+        cls.token = Token.objects.create(user=cls.healthcare_user)
+
+        patient = Patient.objects.create(
+            patient_name='Juan Pérez',
+            identification_type='CC',
+            identification_number='1234567890',
+            issue_date=date(2000, 1, 1),
+            issue_place='Bogotá',
+            birth_date=date(1980, 1, 1),
+            age=45,
+            sex='M',
+            home_address='Calle 123 #45-67',
+            residence_city='Bogotá',
+            cell_phone='3001234567',
+            marital_status='Soltero',
+            occupation='Docente',
+            patient_history=PatientHistory.objects.create(),
+            insurance_provider=InsuranceProvider.objects.create(coverage_type='EPS', provider_name='EPS Sura'),
+            membership_category='Contributivo'
+        )
+        companion = Companion.objects.create(
+            name='María Pérez',
+            identification_type='CC',
+            identification_number='555',
+            kindship='Hermana',
+            phone_number='3000000000'
+        )
+        entity = OutgoingReceivingEntity.objects.create(name='Hospital Central', document='900', staff_title='Médico')
+        now = timezone.now()
+        informed_consent = InformedConsent.objects.create(
+            consent_timestamp=now,
+            guardian_type='Familiar',
+            guardian_name='María Pérez',
+            responsible_for='Paciente',
+            guardian_id_type='CC',
+            guardian_id_number='555',
+            required_procedures=RequiredProcedures.objects.create(ambulance_transport=True),
+            administers_medications=True,
+            medication_administration=MedicationAdministration.objects.create(oxygen=True),
+            service_type='Traslado',
+            responsible=companion,
+            attending_staff=healthcare,
+            outgoing_entity=entity
+        )
+        care_transfer_report = CareTransferReport.objects.create(
+            patient_one_of=1,
+            transfer_type='Primario',
+            initial_address='Calle 1',
+            landmark='Parque',
+            service_type='Básico',
+            dispatch_time=now,
+            patient_arrival_time=now,
+            patient_departure_time=now,
+            arrival_time_patient=now,
+            double_departure_time=now,
+            double_arrival_time=now,
+            end_attention_time=now,
+            driver=driver,
+            attending_staff=healthcare,
+            reg_number='REG-1',
+            support_staff=healthcare,
+            attending_staff_tittle='Enfermera',
+            ambulance=Ambulance.objects.create(mobile_number=1, license_plate='ABC123'),
+            companion=companion,
+            responsible=companion,
+            initial_physicial_examination=cls._physical_exam(),
+            final_physical_examination=cls._physical_exam(),
+            treatment=Treatment.objects.create(),
+            diagnosis_1=Diagnosis.objects.create(cie_10='A00', cie_10_name='Cólera'),
+            result=Result.objects.create(),
+            complications_transfer=ComplicationsTransfer.objects.create(description_complication='Ninguna'),
+            receiving_entity=entity
+        )
+        cls.skin_conditions = [
+            SkinCondition.objects.create(name=name) for name in ('Normal', 'Pálida', 'Cianótica')
+        ]
+        cls.hemodynamic_statuses = [
+            HemodynamicStatus.objects.create(name=name) for name in ('Estable', 'Inestable')
+        ]
+        care_transfer_report.skin_conditions.set(cls.skin_conditions[:2])
+        care_transfer_report.hemodynamic_statuses.set(cls.hemodynamic_statuses[:1])
+        cls.care_transfer_report = care_transfer_report
+        cls.report = PatientTransportReport.objects.create(
+            patient=patient,
+            informed_consent=informed_consent,
+            care_transfer_report=care_transfer_report,
+            satisfaction_survey=SatisfactionSurvey.objects.create(
+                ambulance_request_ease='5',
+                phone_support_quality='5',
+                service_punctuality='5',
+                clear_info_provided='5',
+                staff_appearance='5',
+                ambulance_cleanliness='5',
+                driving_quality='5',
+                return_trip_timeliness='5',
+                safety_and_reassurance='5',
+                staff_empathy='5',
+                overall_satisfaction='5',
+                would_recommend='Sí',
+                respondent_name='María Pérez',
+                respondent_id_number='555',
+                respondent_phone='3000000000'
+            ),
+            created_by=cls.healthcare_user
+        )
+
+    @staticmethod
+    def _physical_exam() -> PhysicalExam:
+        return PhysicalExam.objects.create(
+            systolic=120,
+            diastolic=80,
+            map_pam=93,
+            heart_rate=70,
+            respiratory_rate=16,
+            oxygen_saturation=98,
+            temperature=36.5,
+            blood_glucose=90,
+            glasgow=Glasgow.objects.create(
+                motor=6,
+                motor_text='Obedece',
+                verbal=5,
+                verbal_text='Orientado',
+                eyes_opening=4,
+                eyes_opening_text='Espontánea',
+                total=15
+            )
+        )
+
+
+class ReportDetailTestCase(ReportFixtureMixin, QueryBudgetMixin, TestCase):
+    '''Detail endpoint tests over the report fixture.'''
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.create_report_fixture()
+
+    def setUp(self):
+        AuthTokenCache.get_instance().clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = reverse('get_detail_report', args=[self.report.id])
+
+
+class GetDetailReportQueryBudgetTests(ReportDetailTestCase):
+    '''Keeps get_detail_report/ within a fixed number of SQL statements.'''
+
+    def test_serializer_reads_only_loaded_relations(self):
+        with self.assertQueryBudget(len(ReportSnapshotDomainService.DETAIL_PREFETCH_RELATED) + 1):
+            report = ReportSnapshotDomainService().get_report_queryset().get(id=self.report.id)
+        with self.assertNumQueries(0):
+            data = PatientTransportReportDetailSerializer(report).data
+        care_transfer_report = data['care_transfer_report']
+        self.assertEqual(
+            [item['name'] for item in care_transfer_report['skin_conditions_list']],
+            ['Normal', 'Pálida']
+        )
+        self.assertEqual(
+            [item['name'] for item in care_transfer_report['hemodynamic_statuses_list']],
+            ['Estable']
+        )
+        self.assertEqual(care_transfer_report['driver_name'], 'Luis Gómez')
+        self.assertEqual(care_transfer_report['ambulance_plate'], 'ABC123')
+        self.assertTrue(data['informed_consent']['required_procedures_detail']['ambulance_transport'])
+        self.assertEqual(data['patient']['insurance_provider_name'], 'EPS Sura')
+
+    def test_get_detail_report_endpoint_within_budget(self):
+        # First request warms the token cache (token, user and role)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        with self.assertQueryBudget(DETAIL_REPORT_QUERY_BUDGET):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['report']['id'], self.report.id)
+
+    def test_get_detail_report_budget_does_not_grow_with_m2m_rows(self):
+        self.care_transfer_report.skin_conditions.set(self.skin_conditions)
+        self.care_transfer_report.hemodynamic_statuses.set(self.hemodynamic_statuses)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        with self.assertQueryBudget(DETAIL_REPORT_QUERY_BUDGET):
+            response = self.client.get(self.url)
+        care_transfer_report = response.json()['report']['care_transfer_report']
+        self.assertEqual(len(care_transfer_report['skin_conditions_list']), 3)
+        self.assertEqual(len(care_transfer_report['hemodynamic_statuses_list']), 2)
+
+
+class ReportSnapshotTests(ReportDetailTestCase):
+    '''Completed reports are served from their materialized snapshot.'''
+
+    def setUp(self):
+        super().setUp()
+        # Warm the token cache
+        self.client.get(self.url)
+
+    def _complete_report(self) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            self.report.complete(self.healthcare_user)
+
+    def _has_snapshot(self) -> bool:
+        return PatientTransportReportSnapshot.objects.filter(report_id=self.report.id).exists()
+
+    def test_draft_reports_are_not_materialized(self):
+        self.assertFalse(self._has_snapshot())
+
+    def test_complete_materializes_snapshot_served_with_one_query(self):
+        self._complete_report()
+        self.assertTrue(self._has_snapshot())
+        with self.assertNumQueries(SNAPSHOT_REPORT_QUERY_BUDGET):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['report']['status'], 'completado')
+        self.assertEqual(
+            [item['name'] for item in response.json()['report']['care_transfer_report']['skin_conditions_list']],
+            ['Normal', 'Pálida']
+        )
+
+    def test_soft_delete_and_restore_invalidate_snapshot(self):
+        self._complete_report()
+        self.report.soft_delete(self.healthcare_user)
+        self.assertFalse(self._has_snapshot())
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.report.restore()
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        # Rebuilt on the first read after restore
+        self.assertTrue(self._has_snapshot())
+        with self.assertNumQueries(SNAPSHOT_REPORT_QUERY_BUDGET):
+            self.client.get(self.url)
+
+    def test_edits_invalidate_snapshot(self):
+        self._complete_report()
+        self.care_transfer_report.notes = 'Corrección administrativa'
+        self.care_transfer_report.save()
+        self.assertFalse(self._has_snapshot())
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()['report']['care_transfer_report']['notes'], 'Corrección administrativa')
+
+        self.care_transfer_report.skin_conditions.set(self.skin_conditions)
+        self.assertFalse(self._has_snapshot())
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.json()['report']['care_transfer_report']['skin_conditions_list']), 3)
+
+        self.report.save()
+        self.assertFalse(self._has_snapshot())
+
+
+class DiagnosisSearchIndexTests(TestCase):
+    '''The in-memory index returns what icontains would, ranked by tier.'''
+
+    @classmethod
+    def setUpTestData(cls):
+        Diagnosis.objects.bulk_create([
+            Diagnosis(cie_10=code, cie_10_name=name)
+            for code, name in (
+                ('A00', 'Cólera'),
+                ('A01', 'Fiebre tifoidea y paratifoidea'),
+                ('A010', 'Fiebre tifoidea'),
+                ('A02', 'Otras infecciones con fiebre'),
+                ('E10', 'Diabetes mellitus tipo 1'),
+                ('E11', 'Diabetes mellitus tipo 2'),
+                ('J00', 'Rinofaringitis aguda'),
+                ('K35', 'Apendicitis aguda'),
+                ('R50', 'Fiebre no especificada')
+            )
+        ])
+
+    def setUp(self):
+        self.index = DiagnosisSearchIndex.get_instance()
+        self.index.invalidate()
+
+    def _codes(self, query: str, limit: int = 10) -> list[str]:
+        return [entry['cie_10'] for entry in self.index.search(query, limit=limit)]
+
+    def test_matches_orm_icontains(self):
+        # Two-letter terms inside words ('de' in paratifoidea) included
+        for query in ('fiebre', 'tifoidea', 'aguda', 'itis', 'tipo', 'ti', 'de', 'ab', 'E1', 'A01'):
+            expected = Diagnosis.objects.filter(
+                Q(cie_10__istartswith=query) | Q(cie_10_name__icontains=query)
+            ).order_by('cie_10').values_list('cie_10', flat=True)
+            self.assertEqual(sorted(self._codes(query, limit=100)), list(expected), query)
+
+    def test_tier_ordering(self):
+        # Exact code, code prefix, then names
+        self.assertEqual(self._codes('A01'), ['A01', 'A010'])
+        # Names starting with the term before names containing it
+        self.assertEqual(self._codes('fiebre'), ['A01', 'A010', 'R50', 'A02'])
+        self.assertEqual(self._codes('fiebre', limit=2), ['A01', 'A010'])
+        self.assertEqual(self._codes('COLERA'), ['A00'])
+
+    def test_diagnosis_writes_invalidate_the_index(self):
+        self.assertEqual(self._codes('paludismo'), [])
+        diagnosis = Diagnosis.objects.create(cie_10='B50', cie_10_name='Paludismo')
+        self.assertEqual(self._codes('paludismo'), ['B50'])
+        diagnosis.cie_10_name = 'Malaria'
+        diagnosis.save()
+        self.assertEqual((self._codes('paludismo'), self._codes('malaria')), ([], ['B50']))
+        diagnosis.delete()
+        self.assertEqual(self._codes('malaria'), [])
+
+
+class DiagnosisTrigramBackendTests(TestCase):
+    '''The trigram backend queries the expressions indexed by migration 0005.'''
+
+    def _normalize(self, sql: str) -> str:
+        return ' '.join(sql.lower().replace('"patient_transport_report_diagnosis".', '').replace('"', '').split())
+
+    def test_trigram_query_uses_indexed_expressions(self):
+        # Compiled for PostgreSQL without connecting to one
+        postgresql = PostgreSQLDatabaseWrapper({**connection.settings_dict, 'ENGINE': 'django.db.backends.postgresql'})
+        queryset = DiagnosisSearchDomainService()._trigram_queryset('diabetes')
+        sql, _ = queryset.query.get_compiler(connection=postgresql).as_sql()
+        select, where = self._normalize(sql).split(' where ', 1)
+        self.assertIn('word_similarity(f_unaccent(lower(%s)), f_unaccent(lower(cie_10_name)))', select)
+
+        migration = importlib.import_module('patient_transport_report.migrations.0005_diagnosis_trigram_search')
+        indexed = [
+            self._normalize(expression)
+            for statement in migration.FORWARD_SQL
+            for expression in re.findall(r'USING gin \((.+) gin_trgm_ops\)', statement)
+        ]
+        self.assertEqual(indexed, ['f_unaccent(lower(cie_10_name))', 'upper(cie_10::text)'])
+        self.assertIn('f_unaccent(lower(cie_10_name)) %%> (f_unaccent(lower(%s)))', where)
+        self.assertIn('upper(cie_10::text) like upper(%s)', where)
+
+    @override_settings(DIAGNOSIS_SEARCH_BACKEND='trigram')
+    def test_trigram_without_postgresql_fails_loudly(self):
+        errors = [error.id for error in run_checks()]
+        self.assertIn('patient_transport_report.E001', errors)
+        with self.assertRaises(ImproperlyConfigured):
+            DiagnosisSearchDomainService().search('diabetes')
+
+    @override_settings(DIAGNOSIS_SEARCH_BACKEND='elastic')
+    def test_unknown_backend_fails_loudly(self):
+        self.assertIn('patient_transport_report.E001', [error.id for error in run_checks()])
+
+
+class CatalogSnapshotTests(ReportDetailTestCase):
+    '''Catalog endpoints answer from versioned snapshots with strong ETags.'''
+
+    def setUp(self):
+        super().setUp()
+        # Snapshots are per worker: drop the ones built for other tests' data
+        CatalogSnapshotDomainService._snapshots.clear()
+
+    def test_etag_and_not_modified(self):
+        url = reverse('list_ips')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['institutions'], [])
+        etag = response['ETag']
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+
+        compressed = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+        self.assertNotEqual(compressed['ETag'], etag)
+        self.assertEqual(gzip.decompress(compressed.content), response.content)
+
+        for tag in (etag, compressed['ETag'], f'W/{etag}', '*'):
+            with self.assertNumQueries(1):
+                not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=tag)
+            self.assertEqual(not_modified.status_code, 304)
+            self.assertEqual(not_modified.content, b'')
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH='"ips-v0-x"').status_code, 200)
+        self.assertEqual(APIClient().get(url).status_code, 401)
+
+    def test_catalog_load_bumps_version(self):
+        url = reverse('list_diagnoses')
+        response = self.client.get(url)
+        self.assertEqual([item['cie_10'] for item in response.json()['diagnoses']], ['A00'])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cie10.csv')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write('codigo,nombre\nA01,Fiebre tifoidea\n')
+            call_command('cargar_cie10', path, stdout=StringIO())
+        self.assertEqual(CatalogSnapshotDomainService().get_version(CatalogSnapshotDomainService.DIAGNOSES), 2)
+
+        reloaded = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(reloaded.status_code, 200)
+        self.assertNotEqual(reloaded['ETag'], response['ETag'])
+        self.assertEqual([item['cie_10'] for item in reloaded.json()['diagnoses']], ['A00', 'A01'])
+        search = self.client.get(url, {'q': 'tifoidea'}).json()
+        self.assertEqual(([item['cie_10'] for item in search['diagnoses']], search['search_applied']), (['A01'], True))
+
+
+class CargarCie10Tests(TestCase):
+    '''cargar_cie10 loads each code once, whatever the batch size.'''
+
+    def test_repeated_codes_are_skipped(self):
+        Diagnosis.objects.create(cie_10='A00', cie_10_name='Cólera')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cie10.csv')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(
+                    'codigo,nombre\n'
+                    'A00,Cólera\n'
+                    'A01,Fiebre tifoidea\n'
+                    'A01,Fiebre paratifoidea\n'
+                    'A00,Cólera clásico\n'
+                    'A02,Otras salmonelosis\n'
+                )
+            outputs = []
+            for options in (['--batch-size', '2'], ['--row-by-row']):
+                outputs.append(StringIO())
+                call_command('cargar_cie10', path, *options, stdout=outputs[-1])
+                # The first row of each code wins
+                self.assertEqual(dict(Diagnosis.objects.values_list('cie_10', 'cie_10_name')), {
+                    'A00': 'Cólera',
+                    'A01': 'Fiebre tifoidea',
+                    'A02': 'Otras salmonelosis'
+                })
+        bulk, row_by_row = (output.getvalue() for output in outputs)
+        for line in ('creados: 2', 'actualizados: 0', 'sin cambios: 1', 'repetidos omitidos: 2'):
+            self.assertIn(line, bulk)
+        for line in ('creados: 0', 'actualizados: 3', 'repetidos omitidos: 2'):
+            self.assertIn(line, row_by_row)
+
+
+class CatalogReconciliationTests(TestCase):
+    '''cargar_modelos reconciles the name catalogs with the loading file.'''
+
+    def setUp(self):
+        IPS.objects.bulk_create([
+            IPS(name='Clínica Norte', is_active=True),
+            IPS(name='Clínica Sur', is_active=False),
+            IPS(name='Hospital Central', is_active=True)
+        ])
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'entidades.csv')
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write(
+                'institucion receptora,soat,arl,eps\n'
+                'Clínica Norte,Seguros Bolívar,Positiva,Sura\n'
+                'Clínica Sur,,,Sura\n'
+                'Clínica Oriente,,,\n'
+            )
+
+    def _active(self, model):
+        return dict(model.objects.values_list('name', 'is_active'))
+
+    def test_reconcile_inserts_and_reactivates(self):
+        service = CatalogReconciliationDomainService()
+        names = ['Clínica Norte', 'Clínica Sur', 'Clínica Oriente']
+        with self.assertNumQueries(1):
+            preview = service.reconcile(IPS, names, deactivate_missing=True, dry_run=True)
+        result = service.reconcile(IPS, names)
+        self.assertEqual(
+            (result.created, result.reactivated, result.deactivated, result.unchanged),
+            (['Clínica Oriente'], ['Clínica Sur'], [], 1)
+        )
+        self.assertEqual(preview.deactivated, ['Hospital Central'])
+        # Without --deactivate-missing rows missing from the file are left as they are
+        self.assertEqual(self._active(IPS), {
+            'Clínica Norte': True,
+            'Clínica Sur': True,
+            'Hospital Central': True,
+            'Clínica Oriente': True
+        })
+
+        again = service.reconcile(IPS, names)
+        self.assertEqual((again.created, again.reactivated, again.unchanged), ([], [], 3))
+
+    def test_command_dry_run_writes_nothing(self):
+        output = StringIO()
+        call_command('cargar_modelos', self.path, '--dry-run', '--deactivate-missing', stdout=output)
+        self.assertEqual(self._active(IPS), {'Clínica Norte': True, 'Clínica Sur': False, 'Hospital Central': True})
+        self.assertFalse(EPS.objects.exists())
+        self.assertEqual(CatalogSnapshotDomainService().get_version(CatalogSnapshotDomainService.IPS), 1)
+        for line in ('+ Clínica Oriente', '↺ Clínica Sur', '- Hospital Central', '+ Sura'):
+            self.assertIn(line, output.getvalue())
+
+    def test_command_deactivates_only_missing_rows(self):
+        call_command('cargar_modelos', self.path, '--deactivate-missing', stdout=StringIO())
+        self.assertEqual(self._active(IPS), {
+            'Clínica Norte': True,
+            'Clínica Sur': True,
+            'Hospital Central': False,
+            'Clínica Oriente': True
+        })
+        self.assertEqual(
+            (self._active(SOAT), self._active(ARL), self._active(EPS)),
+            ({'Seguros Bolívar': True}, {'Positiva': True}, {'Sura': True})
+        )
+        self.assertEqual(IPS.objects.filter(name='Hospital Central').count(), 1)
+        self.assertEqual(CatalogSnapshotDomainService().get_version(CatalogSnapshotDomainService.IPS), 2)
+
+
+class TabularFileReaderTests(SimpleTestCase):
+    '''The loading commands read xlsx, csv and csv.gz files the same way.'''
+
+    ROWS: list[dict] = [
+        {'codigo': 'A00', 'nombre': 'Cólera'},
+        {'codigo': 'A01', 'nombre': None}
+    ]
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def _read(self, name):
+        with TabularFileReader(os.path.join(self.directory, name)) as reader:
+            return reader.columns, list(reader)
+
+    def test_csv_and_gzip(self):
+        # BOM and padded headers, padded and empty cells, blank rows
+        text = '\ufeff codigo ,nombre\nA00, Cólera \n,\n\nA01,\n'
+        with open(os.path.join(self.directory, 'cie10.csv'), 'w', encoding='utf-8') as file:
+            file.write(text)
+        with gzip.open(os.path.join(self.directory, 'cie10.csv.gz'), 'wt', encoding='utf-8') as file:
+            file.write(text)
+        for name in ('cie10.csv', 'cie10.csv.gz'):
+            self.assertEqual(self._read(name), (['codigo', 'nombre'], self.ROWS))
+
+    def test_xlsx(self):
+        from openpyxl import Workbook
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append([' codigo ', 'nombre', None])
+        sheet.append(['A00', ' Cólera ', None])
+        sheet.append([None, '  ', None])
+        sheet.append(['A01', None, 7])
+        workbook.save(os.path.join(self.directory, 'cie10.xlsx'))
+        columns, rows = self._read('cie10.xlsx')
+        self.assertEqual(columns, ['codigo', 'nombre', ''])
+        # Non-text cells keep their type
+        self.assertEqual(rows, [
+            {'codigo': 'A00', 'nombre': 'Cólera', '': None},
+            {'codigo': 'A01', 'nombre': None, '': 7}
+        ])
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            self._read('cie10.json')
+
+
+class ReportSummaryProjectionTests(ReportDetailTestCase):
+    '''Buzon listings load only PatientTransportReport.SUMMARY_FIELDS.'''
+
+    def test_summary_serializer_reads_only_projected_fields(self):
+        with self.assertNumQueries(1) as context:
+            reports = list(PatientTransportReport.objects.summary())
+        sql = context.captured_queries[0]['sql']
+        self.assertNotIn('password', sql)
+        self.assertNotIn('home_address', sql)
+        with self.assertNumQueries(0), self.assertNoDeferredLoads():
+            data = PatientTransportReportSummarySerializer(reports, many=True).data
+        self.assertEqual(data[0]['patient_name'], 'Juan Pérez')
+        self.assertEqual(data[0]['created_by_username'], 'nurse')
+
+    def test_deferred_field_access_fails(self):
+        report = PatientTransportReport.objects.summary().get(id=self.report.id)
+        with self.assertRaises(AssertionError), self.assertNoDeferredLoads():
+            report.patient.home_address
+
+    def test_list_buzon_uses_summary_projection(self):
+        # First request warms the token cache
+        self.assertEqual(self.client.get(reverse('list_buzon')).status_code, 200)
+        with self.assertNoDeferredLoads(), CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('list_buzon'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['list_report_draft'][0]['patient_identification'], '1234567890')
+        for query in context.captured_queries:
+            self.assertNotIn('password', query['sql'])
+
+    def test_change_feed_uses_summary_projection(self):
+        with self.assertNoDeferredLoads():
+            changes = BuzonChangeFeedDomainService().get_changes(self.healthcare_user.id)
+            data = PatientTransportReportSummarySerializer(changes.changed, many=True).data
+        self.assertEqual(changes.removed_ids, [])
+        self.assertEqual([item['id'] for item in data], [self.report.id])
+
+
+class ReportPayloadTestCase(ReportDetailTestCase):
+    '''Fixture plus a complete create_report/ payload for new reports.'''
+
+    SIGNATURE: str = 'data:image/png;base64,' + base64.b64encode(b'\x89PNG\r\n\x1a\nfirma').decode()
+
+    def setUp(self):
+        super().setUp()
+        # Warm the token cache
+        self.client.get(self.url)
+
+    def _payload(self, identification_number: str = '999') -> dict:
+        care_transfer_report = self.care_transfer_report
+        exam = {
+            'systolic': 120, 'diastolic': 80, 'map_pam': 93, 'heart_rate': 70,
+            'respiratory_rate': 16, 'oxygen_saturation': 98, 'temperature': 36.5,
+            'blood_glucose': 90,
+            'glasgow': {
+                'motor': 6, 'motor_text': 'Obedece', 'verbal': 5, 'verbal_text': 'Orientado',
+                'eyes_opening': 4, 'eyes_opening_text': 'Espontánea', 'total': 15
+            }
+        }
+        companion = {
+            'name': 'Rosa Díaz', 'identification_type': 'CC', 'identification_number': '777',
+            'kindship': 'Madre', 'phone_number': '3010000000'
+        }
+        entity = {'name': 'Clínica Norte', 'document': '901', 'staff_title': 'Enfermera'}
+        now = timezone.now().isoformat()
+        return {
+            'patient': {
+                'patient_name': 'Carlos Ruiz',
+                'identification_type': 'CC',
+                'identification_number': identification_number,
+                'issue_date': '2001-01-01',
+                'issue_place': 'Medellín',
+                'birth_date': '1983-01-01',
+                'age': 42,
+                'sex': 'M',
+                'home_address': 'Carrera 1',
+                'residence_city': 'Medellín',
+                'cell_phone': '3009999999',
+                'marital_status': 'Casado',
+                'occupation': 'Ingeniero',
+                'membership_category': 'Contributivo',
+                'signature': self.SIGNATURE,
+                'patient_history': {'has_allergies': True, 'allergies': 'Penicilina'},
+                'insurance_provider': {'coverage_type': 'EPS', 'provider_name': 'EPS Sura'}
+            },
+            'informed_consent': {
+                'consent_timestamp': now,
+                'guardian_type': 'Familiar',
+                'guardian_name': 'Rosa Díaz',
+                'responsible_for': 'Paciente',
+                'guardian_id_type': 'CC',
+                'guardian_id_number': '777',
+                'required_procedures': {'ambulance_transport': True},
+                'administers_medications': True,
+                'medication_administration': {'oxygen': True},
+                'service_type': 'Traslado',
+                'patient_signature': self.SIGNATURE,
+                'responsible': companion,
+                'responsible_signature': self.SIGNATURE,
+                'attending_staff_id': self.report.informed_consent.attending_staff_id,
+                'outgoing_entity': entity
+            },
+            'care_transfer_report': {
+                'patient_one_of': 1,
+                'transfer_type': 'Primario',
+                'initial_address': 'Calle 1',
+                'landmark': 'Parque',
+                'service_type': 'Básico',
+                'dispatch_time': now,
+                'patient_arrival_time': now,
+                'patient_departure_time': now,
+                'arrival_time_patient': now,
+                'double_departure_time': now,
+                'double_arrival_time': now,
+                'end_attention_time': now,
+                'driver_id': care_transfer_report.driver_id,
+                'attending_staff_id': care_transfer_report.attending_staff_id,
+                'reg_number': 'REG-2',
+                'attending_staff_tittle': 'Enfermera',
+                'ambulance_id': care_transfer_report.ambulance_id,
+                'companion': companion,
+                'companion_is_responsible': True,
+                'initial_physicial_examination': exam,
+                'final_physical_examination': exam,
+                'skin_condition_ids': [condition.id for condition in self.skin_conditions[:2]],
+                'hemodynamic_status_ids': [self.hemodynamic_statuses[0].id],
+                'treatment': {'oxygen': True, 'liter_minute': 2},
+                'diagnosis_1_id': care_transfer_report.diagnosis_1_id,
+                'result': {'schelud_transfer': True},
+                'complications_transfer': {'description_complication': 'Ninguna'},
+                'receiving_entity': entity,
+                'receiving_entity_signature': self.SIGNATURE
+            }
+        }
+
+
+class CreateReportTests(ReportPayloadTestCase):
+    '''create_report/ writes a whole report within a fixed statement budget.'''
+
+    def setUp(self):
+        super().setUp()
+        self.create_url = reverse('create_report')
+
+    def test_create_report_within_budget(self):
+        with self.assertQueryBudget(REPORT_CREATION_QUERY_BUDGET):
+            response = self.client.post(self.create_url, self._payload(), format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        report = PatientTransportReport.objects.get(id=response.json()['report']['id'])
+        self.assertEqual(report.created_by, self.healthcare_user)
+        self.assertEqual(report.patient.patient_name, 'Carlos Ruiz')
+        self.assertEqual(report.care_transfer_report.responsible_id, report.care_transfer_report.companion_id)
+        self.assertEqual(report.care_transfer_report.skin_conditions.count(), 2)
+        self.assertTrue(report.informed_consent.medication_administration.oxygen)
+        # Five identical signatures share one blob
+        self.assertEqual(report.patient.signature_id, report.care_transfer_report.receiving_entity_signature_id)
+        detail = self.client.get(reverse('get_detail_report', args=[report.id])).json()['report']
+        self.assertEqual(detail['care_transfer_report']['driver_name'], 'Luis Gómez')
+
+    def test_existing_patient_is_linked_and_updated(self):
+        patient = self.report.patient
+        payload = self._payload(identification_number=patient.identification_number)
+        payload['patient']['patient_name'] = 'Juan Pérez'
+        response = self.client.post(self.create_url, payload, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(Patient.objects.count(), 1)
+        report = PatientTransportReport.objects.get(id=response.json()['report']['id'])
+        self.assertEqual(report.patient_id, patient.id)
+        # The columns that changed are written, the new signature included
+        patient = Patient.objects.get(id=patient.id)
+        self.assertEqual(
+            (patient.patient_name, patient.home_address, patient.cell_phone, patient.updated_by),
+            ('Juan Pérez', 'Carrera 1', '3009999999', self.healthcare_user)
+        )
+        self.assertEqual(patient.signature_id, report.informed_consent.patient_signature_id)
+        self.assertEqual(patient.patient_history.allergies, 'Penicilina')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.create_url, payload, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertFalse([
+            query for query in queries.captured_queries
+            if query['sql'].startswith(f'UPDATE "{Patient._meta.db_table}"')
+        ])
+
+    def test_invalid_references_write_nothing(self):
+        payload = self._payload()
+        payload['care_transfer_report']['ambulance_id'] = 999
+        response = self.client.post(self.create_url, payload, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['response'], 'No existe ambulancia con ID 999.')
+
+        payload = self._payload()
+        payload['informed_consent']['patient_signature'] = 'no es base64'
+        response = self.client.post(self.create_url, payload, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(PatientTransportReport.all_objects.count(), 1)
+        self.assertEqual(Patient.objects.count(), 1)
+
+
+class SyncReportsTests(ReportPayloadTestCase):
+    '''sync_reports/ upserts offline reports idempotently by client UUID.'''
+
+    def setUp(self):
+        super().setUp()
+        self.sync_url = reverse('sync_reports')
+
+    def _item(self, identification_number: str = '999', **extra) -> dict:
+        return {'client_uuid': str(uuid.uuid4()), **self._payload(identification_number), **extra}
+
+    def _sync(self, *items: dict) -> list[dict]:
+        response = self.client.post(self.sync_url, {'reports': list(items)}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()['results']
+
+    def test_replayed_batch_writes_nothing(self):
+        item = self._item()
+        [created] = self._sync(item)
+        self.assertEqual((created['status'], created['version']), ('created', 1))
+        report = PatientTransportReport.objects.get(client_uuid=item['client_uuid'])
+        self.assertEqual(report.id, created['report_id'])
+        self.assertEqual(report.care_transfer_report.skin_conditions.count(), 2)
+
+        [replayed] = self._sync(item)
+        self.assertEqual(replayed['status'], 'unchanged')
+        self.assertEqual(replayed['report_id'], created['report_id'])
+        self.assertEqual(PatientTransportReport.all_objects.count(), 2)
+        self.assertEqual(Patient.objects.count(), 2)
+
+    def test_update_rewrites_rows_in_place(self):
+        item = self._item()
+        [created] = self._sync(item)
+        report = PatientTransportReport.objects.get(id=created['report_id'])
+
+        item['base_version'] = created['version']
+        item['care_transfer_report']['landmark'] = 'Iglesia'
+        item['care_transfer_report']['skin_condition_ids'] = [self.skin_conditions[2].id]
+        [updated] = self._sync(item)
+        self.assertEqual((updated['status'], updated['report_id'], updated['version']), ('updated', report.id, 2))
+
+        rewritten = PatientTransportReport.objects.get(id=report.id)
+        self.assertEqual(rewritten.care_transfer_report_id, report.care_transfer_report_id)
+        self.assertEqual(rewritten.informed_consent_id, report.informed_consent_id)
+        self.assertEqual(rewritten.patient_id, report.patient_id)
+        self.assertEqual(rewritten.created_at, report.created_at)
+        self.assertEqual(rewritten.care_transfer_report.landmark, 'Iglesia')
+        self.assertEqual(
+            list(rewritten.care_transfer_report.skin_conditions.values_list('id', flat=True)),
+            [self.skin_conditions[2].id]
+        )
+        self.assertEqual(CareTransferReport.objects.count(), 2)
+
+    def test_returning_patient_is_updated(self):
+        patient = self.report.patient
+        item = self._item(patient.identification_number)
+        item['patient']['home_address'] = 'Calle 9'
+        [created] = self._sync(item)
+        self.assertEqual(created['status'], 'created')
+        patient = Patient.objects.get(id=patient.id)
+        self.assertEqual((patient.home_address, patient.patient_history.allergies), ('Calle 9', 'Penicilina'))
+        self.assertIsNotNone(patient.signature_id)
+        self.assertEqual(Patient.objects.count(), 1)
+
+    def test_stale_version_and_other_author_are_rejected(self):
+        item = self._item()
+        [created] = self._sync(item)
+        item['base_version'] = created['version']
+        item['care_transfer_report']['landmark'] = 'Iglesia'
+        self._sync(item)
+
+        item['care_transfer_report']['landmark'] = 'Hospital'
+        [stale] = self._sync(item)
+        self.assertEqual((stale['status'], stale['version']), ('conflict', 2))
+
+
+        other_author = User.objects.get(username='driver')
+        PatientTransportReport.objects.filter(id=self.report.id).update(
+            client_uuid=uuid.uuid4(),
+            created_by=other_author
+        )
+        self.report.refresh_from_db()
+        [forbidden] = self._sync(self._item(client_uuid=str(self.report.client_uuid)))
+        self.assertEqual(forbidden['status'], 'forbidden')
+        self.assertEqual(PatientTransportReport.objects.get(id=self.report.id).version, 1)
+
+    def test_invalid_items_do_not_block_the_batch(self):
+        invalid = self._item()
+        invalid['care_transfer_report']['ambulance_id'] = 999
+        duplicated = self._item()
+        results = self._sync(invalid, duplicated, duplicated)
+        self.assertEqual([result['status'] for result in results], ['invalid', 'created', 'invalid'])
+        self.assertEqual(PatientTransportReport.all_objects.count(), 2)
+
+    def test_statements_do_not_grow_with_batch_size(self):
+        # Store the signature blob first: both batches then only look it up
+        self._sync(self._item('1000'))
+        with CaptureQueriesContext(connection) as single:
+            self._sync(self._item('1001'))
+        with CaptureQueriesContext(connection) as batch:
+            self._sync(self._item('1002'), self._item('1003'), self._item('1004'))
+        self.assertEqual(len(batch.captured_queries), len(single.captured_queries))
+        self.assertEqual(PatientTransportReport.all_objects.count(), 6)
+
+
+class AutosaveReportTests(ReportDetailTestCase):
+    '''autosave/ merges field-level patches into drafts under a version precondition.'''
+
+    def setUp(self):
+        super().setUp()
+        self.autosave_url = reverse('autosave_report', args=[self.report.id])
+
+    def _autosave(self, version: int, client_id: str = 'tablet-1', **sections):
+        return self.client.patch(
+            self.autosave_url,
+            {'version': version, 'client_id': client_id, **sections},
+            format='json'
+        )
+
+    def test_patch_writes_only_changed_columns(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self._autosave(1, care_transfer_report={
+                'landmark': 'Iglesia',
+                'initial_physicial_examination': {'heart_rate': 88, 'glasgow': {'motor': 6}}
+            })
+        self.assertEqual(response.status_code, 200, response.content)
+        autosave = response.json()['autosave']
+        self.assertEqual(autosave['version'], 2)
+        self.assertEqual(autosave['changed_fields'], [
+            'care_transfer_report.landmark',
+            'care_transfer_report.initial_physicial_examination.heart_rate'
+        ])
+        updates = {
+            query['sql'].split('"')[1]: query['sql']
+            for query in context.captured_queries
+            if query['sql'].startswith('UPDATE')
+        }
+        self.assertEqual(set(updates), {
+            'patient_transport_report_caretransferreport',
+            'patient_transport_report_physicalexam',
+            'patient_transport_report_patienttransportreport'
+        })
+        self.assertNotIn('initial_address', updates['patient_transport_report_caretransferreport'])
+        self.assertNotIn('systolic', updates['patient_transport_report_physicalexam'])
+        care_transfer_report = CareTransferReport.objects.get(id=self.care_transfer_report.id)
+        self.assertEqual(care_transfer_report.landmark, 'Iglesia')
+        self.assertEqual(care_transfer_report.initial_physicial_examination.heart_rate, 88)
+        self.assertEqual(care_transfer_report.final_physical_examination.heart_rate, 70)
+
+    def test_null_clears_and_lists_replace(self):
+        response = self._autosave(1, satisfaction_survey=None, care_transfer_report={
+            'support_staff_id': None,
+            'skin_condition_ids': [self.skin_conditions[2].id]
+        })
+        self.assertEqual(response.status_code, 200, response.content)
+        report = PatientTransportReport.objects.get(id=self.report.id)
+        self.assertIsNone(report.satisfaction_survey_id)
+        self.assertIsNone(report.care_transfer_report.support_staff_id)
+        self.assertEqual(
+            list(report.care_transfer_report.skin_conditions.values_list('id', flat=True)),
+            [self.skin_conditions[2].id]
+        )
+        self.assertEqual(report.care_transfer_report.hemodynamic_statuses.count(), 1)
+
+    def test_missing_nested_record_is_inserted(self):
+        response = self._autosave(1, informed_consent={'medication_administration': None})
+        self.assertEqual(response.status_code, 400)
+
+        response = self._autosave(1, informed_consent={
+            'administers_medications': False,
+            'medication_administration': None
+        })
+        self.assertEqual(response.json()['autosave']['version'], 2)
+        response = self._autosave(2, informed_consent={
+            'administers_medications': True,
+            'medication_administration': {'iv_fluids': True}
+        })
+        self.assertEqual(response.status_code, 200, response.content)
+        consent = InformedConsent.objects.get(id=self.report.informed_consent_id)
+        self.assertTrue(consent.medication_administration.iv_fluids)
+        self.assertEqual(MedicationAdministration.objects.count(), 2)
+
+    def test_autosaves_of_one_client_coalesce(self):
+        first = self._autosave(1, care_transfer_report={'landmark': 'Iglesia'}).json()['autosave']
+        # Sent before the first response arrived: still based on version 1
+        second = self._autosave(1, care_transfer_report={'notes': 'Paciente estable'}).json()['autosave']
+        self.assertEqual((first['version'], first['coalesced']), (2, False))
+        self.assertEqual((second['version'], second['coalesced']), (3, True))
+
+        response = self._autosave(2, client_id='tablet-2', care_transfer_report={'landmark': 'Hospital'})
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['autosave']['version'], 3)
+        response = self._autosave(3, client_id='tablet-2', care_transfer_report={'landmark': 'Hospital'})
+        self.assertEqual(response.status_code, 200, response.content)
+        # Another client wrote: the session of tablet-1 is over
+        response = self._autosave(3, care_transfer_report={'landmark': 'Iglesia'})
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(CareTransferReport.objects.get(id=self.care_transfer_report.id).landmark, 'Hospital')
+
+    def test_only_drafts_with_valid_references_are_saved(self):
+        response = self._autosave(1, care_transfer_report={'driver_id': 999})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['response'], 'No existe conductor con ID 999.')
+
+        self.report.complete(self.healthcare_user)
+        response = self._autosave(2, care_transfer_report={'landmark': 'Iglesia'})
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(CareTransferReport.objects.get(id=self.care_transfer_report.id).landmark, 'Parque')
+
+    def test_only_author_and_crew_can_autosave(self):
+        nurse = User.objects.create_user('nurse2', 'nurse2@test.com', 'secret')
+        crew_member = Healthcare.objects.create(
+            base_staff=BaseStaff.objects.create(
+                system_user=nurse,
+                document_type='CC',
+                document_number='400',
+                type_personnel='Healthcare'
+            ),
+            professional_registration='RM-2',
+            professional_position='Enfermero'
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=nurse).key}')
+        response = self._autosave(1, care_transfer_report={'landmark': 'Iglesia'})
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(CareTransferReport.objects.get(id=self.care_transfer_report.id).landmark, 'Parque')
+
+        CareTransferReport.objects.filter(id=self.care_transfer_report.id).update(support_staff=crew_member)
+        response = self._autosave(1, care_transfer_report={'landmark': 'Iglesia'})
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(PatientTransportReport.objects.get(id=self.report.id).updated_by, nurse)
+
+
+class SignatureStoreTests(ReportDetailTestCase):
+    '''Signatures are stored once per content and served as immutable images.'''
+
+    PNG: bytes = b'\x89PNG\r\n\x1a\nfirma'
+
+    def setUp(self):
+        super().setUp()
+        self.store = SignatureStoreDomainService()
+        self.encoded = base64.b64encode(self.PNG).decode()
+
+    def test_store_deduplicates_by_content(self):
+        jpeg = 'data:image/jpeg;base64,' + base64.b64encode(b'\xff\xd8firma').decode()
+        blobs = self.store.store_many([self.encoded, f'data:image/png;base64,{self.encoded}', None, jpeg, self.encoded])
+        self.assertEqual(len({blobs[0].pk, blobs[1].pk, blobs[4].pk}), 1)
+        self.assertIsNone(blobs[2])
+        self.assertEqual(blobs[3].content_type, 'image/jpeg')
+        self.assertEqual(self.store.store(self.encoded).pk, blobs[0].pk)
+        self.assertEqual(SignatureBlob.objects.count(), 2)
+        for invalid in ('data:image/svg+xml;base64,' + base64.b64encode(b'<svg/>').decode(), 'no es base64'):
+            with self.assertRaises(ValueError):
+                self.store.store(invalid)
+        self.assertEqual(SignatureBlob.objects.count(), 2)
+
+    def test_get_signature_view(self):
+        blob = self.store.store(self.encoded)
+        url = reverse('get_signature', args=[blob.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, self.PNG)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertEqual(response['ETag'], f'"signature-{blob.pk}"')
+        self.assertEqual(response['Cache-Control'], 'private, max-age=31536000, immutable')
+        self.assertEqual(response['X-Content-Type-Options'], 'nosniff')
+        self.assertEqual(response['Content-Security-Policy'], "default-src 'none'")
+        # Cached token and matching ETag: one existence check, the bytes are not read
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=f'"signature-{blob.pk}"')
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+        missing = reverse('get_signature', args=[blob.pk + 1])
+        self.assertEqual(self.client.get(missing).status_code, 404)
+        self.assertEqual(self.client.get(missing, HTTP_IF_NONE_MATCH=f'"signature-{blob.pk + 1}"').status_code, 404)
+        # Legacy blobs outside the png/jpeg allow-list are kept but never served
+        legacy = SignatureBlob.objects.create(sha256='0' * 64, content=b'<svg/>', content_type='image/svg+xml', size=6)
+        self.assertEqual(self.client.get(reverse('get_signature', args=[legacy.pk])).status_code, 404)
+        self.assertEqual(APIClient().get(url).status_code, 401)
+        driver = APIClient()
+        driver.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=User.objects.get(username="driver")).key}')
+        self.assertEqual(driver.get(url).status_code, 403)
+        # A matching ETag does not let a driver probe which ids exist
+        self.assertEqual(driver.get(url, HTTP_IF_NONE_MATCH=f'"signature-{blob.pk}"').status_code, 403)
+        self.assertEqual(driver.get(missing, HTTP_IF_NONE_MATCH=f'"signature-{blob.pk + 1}"').status_code, 403)
+
+
+class BuzonChangeFeedTests(ReportPayloadTestCase):
+    '''list_buzon/changes/ hands out every change once, late commits included.'''
+
+    def _poll(self, since: BuzonChangeCursor | None = None) -> BuzonChanges:
+        return BuzonChangeFeedDomainService().get_changes(self.healthcare_user.id, since)
+
+    def _stamp(self, report_id: int, updated_at) -> None:
+        PatientTransportReport.all_objects.filter(id=report_id).update(updated_at=updated_at)
+
+    def test_cursor_round_trip(self):
+        cursor = BuzonChangeCursor(updated_at=timezone.now(), id=7, version=3, seen=((7, 123), (8, 456)))
+        self.assertEqual(BuzonChangeCursor.decode(cursor.encode()), cursor)
+        legacy = base64.urlsafe_b64encode(b'["2026-01-01T00:00:00+00:00", 7, null]').decode()
+        self.assertEqual(BuzonChangeCursor.decode(legacy).seen, ())
+        with self.assertRaises(ValueError):
+            BuzonChangeCursor.decode('no-es-un-cursor')
+
+        response = self.client.get(reverse('list_buzon_changes'))
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual([item['id'] for item in response.json()['list_report_changed']], [self.report.id])
+        response = self.client.get(reverse('list_buzon_changes'), {'since': response.json()['next_since']})
+        self.assertEqual(response.json()['list_report_changed'], [])
+        self.assertEqual(response.json()['removed_report_ids'], [])
+
+    def test_soft_deleted_rows_are_sent_once(self):
+        first = self._poll()
+        self.assertEqual(first.changed, [self.report])
+        self.report.soft_delete(self.healthcare_user)
+        second = self._poll(first.next_cursor)
+        self.assertEqual((second.changed, second.removed_ids), ([], [self.report.id]))
+        third = self._poll(second.next_cursor)
+        self.assertEqual((third.changed, third.removed_ids), ([], []))
+        # Restoring keeps the report version, the change is still new
+        self.report.restore()
+        self.assertEqual(self._poll(third.next_cursor).changed, [self.report])
+
+    def test_late_commit_behind_cursor_is_delivered(self):
+        response = self.client.post(reverse('create_report'), self._payload(), format='json')
+        late_id = response.json()['report']['id']
+        now = timezone.now()
+        self._stamp(self.report.id, now)
+        self._stamp(late_id, now - timedelta(seconds=20))
+        first = self._poll()
+        self.assertEqual([report.id for report in first.changed], [late_id, self.report.id])
+        self.assertEqual(first.next_cursor.updated_at, now)
+
+        # Written before the mark, committed after the poll
+        self._stamp(late_id, now - timedelta(seconds=5))
+        second = self._poll(first.next_cursor)
+        self.assertEqual([report.id for report in second.changed], [late_id])
+        self.assertEqual(second.next_cursor.updated_at, now)
+        self.assertEqual(self._poll(second.next_cursor).changed, [])
+
+
+class MigrationTestCase(ReportFixtureMixin, TransactionTestCase):
+    '''
+    Runs migrations of this app backwards and forwards over the report fixture.
+
+    migrate_from is the state the test data is written in; tearDown always
+    leaves the database fully migrated for the next tests.
+    '''
+
+    migrate_from: str = ''
+
+    def setUp(self):
+        self.create_report_fixture()
+        self.apps = self._migrate(self.migrate_from)
+
+    def tearDown(self):
+        executor: MigrationExecutor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def _migrate(self, name: str):
+        '''Migrate this app to a migration and return its historical apps.'''
+        target: list[tuple[str, str]] = [('patient_transport_report', name)]
+        executor: MigrationExecutor = MigrationExecutor(connection)
+        executor.migrate(target)
+        return MigrationExecutor(connection).loader.project_state(target).apps
+
+
+class DiagnosisCodeMigrationTests(MigrationTestCase):
+    '''0007 merges duplicate CIE-10 codes, then makes cie_10 unique in a later migration.'''
+
+    migrate_from = '0006_catalogversion'
+
+    def test_duplicate_codes_are_merged_before_the_constraint(self):
+        HistoricalDiagnosis = self.apps.get_model('patient_transport_report', 'Diagnosis')
+        HistoricalCareTransferReport = self.apps.get_model('patient_transport_report', 'CareTransferReport')
+        original = HistoricalDiagnosis.objects.get(cie_10='A00')
+        duplicate = HistoricalDiagnosis.objects.create(cie_10='A00', cie_10_name='Cólera (repetido)')
+        HistoricalCareTransferReport.objects.filter(id=self.care_transfer_report.id).update(
+            diagnosis_1_id=duplicate.id,
+            diagnosis_2_id=duplicate.id
+        )
+
+        self._migrate('0007_merge_duplicate_diagnosis_codes')
+        apps = self._migrate('0007_diagnosis_cie_10_unique')
+
+        HistoricalDiagnosis = apps.get_model('patient_transport_report', 'Diagnosis')
+        care_transfer_report = apps.get_model(
+            'patient_transport_report', 'CareTransferReport'
+        ).objects.get(id=self.care_transfer_report.id)
+        self.assertEqual(
+            (care_transfer_report.diagnosis_1_id, care_transfer_report.diagnosis_2_id),
+            (original.id, original.id)
+        )
+        self.assertEqual(list(HistoricalDiagnosis.objects.filter(cie_10='A00').values_list('id', flat=True)), [original.id])
+        with self.assertRaises(IntegrityError):
+            HistoricalDiagnosis.objects.create(cie_10='A00', cie_10_name='Cólera')
+
+
+class SignatureBlobMigrationTests(MigrationTestCase):
+    '''0011 moves signatures into deduplicated blobs and back without losing any.'''
+
+    migrate_from = '0010_buzon_changes_index'
+    PNG: bytes = b'\x89PNG\r\n\x1a\nfirma'
+    SVG: bytes = b'<svg onload="alert(1)"/>'
+
+    def test_forward_and_reverse(self):
+        png = base64.b64encode(self.PNG).decode()
+        svg = 'data:image/svg+xml;base64,' + base64.b64encode(self.SVG).decode()
+        self.apps.get_model('patient_transport_report', 'Patient').objects.filter(
+            id=self.report.patient_id
+        ).update(signature=f'data:image/png;base64,{png}')
+        self.apps.get_model('patient_transport_report', 'InformedConsent').objects.filter(
+            id=self.report.informed_consent_id
+        ).update(
+            patient_signature=png,
+            responsible_signature=svg,
+            attending_staff_signature='no es base64'
+        )
+
+        with self.assertLogs('patient_transport_report.migrations.0011_signatureblob', 'WARNING') as logs:
+            apps = self._migrate('0011_signatureblob')
+        self.assertIn('Kept 2 signatures', logs.output[0])
+        self.assertIn('image/svg+xml (1), text/plain (1)', logs.output[0])
+        patient = apps.get_model('patient_transport_report', 'Patient').objects.get(id=self.report.patient_id)
+        consent = apps.get_model('patient_transport_report', 'InformedConsent').objects.get(
+            id=self.report.informed_consent_id
+        )
+        HistoricalSignatureBlob = apps.get_model('patient_transport_report', 'SignatureBlob')
+        self.assertEqual(patient.signature_id, consent.patient_signature_id)
+        blobs = {
+            blob.id: (blob.content_type, bytes(blob.content))
+            for blob in HistoricalSignatureBlob.objects.all()
+        }
+        self.assertEqual(blobs, {
+            patient.signature_id: ('image/png', self.PNG),
+            consent.responsible_signature_id: ('image/svg+xml', self.SVG),
+            consent.attending_staff_signature_id: ('text/plain', b'no es base64')
+        })
+
+        apps = self._migrate(self.migrate_from)
+        patient = apps.get_model('patient_transport_report', 'Patient').objects.get(id=self.report.patient_id)
+        consent = apps.get_model('patient_transport_report', 'InformedConsent').objects.get(
+            id=self.report.informed_consent_id
+        )
+        # Data URLs and text come back unchanged, bare base64 as its data URL
+        self.assertEqual(patient.signature, f'data:image/png;base64,{png}')
+        self.assertEqual(consent.patient_signature, f'data:image/png;base64,{png}')
+        self.assertEqual(consent.responsible_signature, svg)
+        self.assertEqual(consent.attending_staff_signature, 'no es base64')
@@ -0,0 +1,17 @@
+from .catalog_snapshot import CatalogSnapshot
+from .catalog_reconciliation import CatalogReconciliation
+from .buzon_change_cursor import BuzonChangeCursor
+from .buzon_changes import BuzonChanges
+from .report_sync_item import ReportSyncItem
+from .report_sync_result import ReportSyncResult
+from .report_autosave_result import ReportAutosaveResult
+
+__all__ = [
+    'CatalogSnapshot',
+    'CatalogReconciliation',
+    'BuzonChangeCursor',
+    'BuzonChanges',
+    'ReportSyncItem',
+    'ReportSyncResult',
+    'ReportAutosaveResult'
+]
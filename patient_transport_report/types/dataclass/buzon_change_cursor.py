@@ -0,0 +1,47 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime
+import base64
+import json
+
+@dataclass(frozen=True)
+class BuzonChangeCursor:
+    '''
+    High-water mark (updated_at, id) of the last buzon change sent to a
+    client, the user's change counter observed when it was issued and the
+    changes already sent inside the overlap window behind the mark, as
+    (report id, updated_at in microseconds) pairs
+    '''
+    updated_at: datetime
+    id: int
+    version: int | None = None
+    seen: tuple[tuple[int, int], ...] = ()
+
+    def encode(self) -> str:
+        '''Opaque, URL-safe representation sent to the client.'''
+        raw: bytes = json.dumps(
+            [self.updated_at.isoformat(), self.id, self.version, [list(item) for item in self.seen]],
+            separators=(',', ':')
+        ).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def decode(
+        cls,
+        value: str
+    ) -> BuzonChangeCursor:
+        '''Inverse of encode(); raises ValueError on malformed input.'''
+        try:
+            padded: str = value + '=' * (-len(value) % 4)
+            # Cursors issued before the overlap window have no seen list
+            updated_at, report_id, version, *seen = json.loads(base64.urlsafe_b64decode(padded))
+            if len(seen) > 1:
+                raise ValueError('Invalid cursor')
+            return cls(
+                updated_at=datetime.fromisoformat(updated_at),
+                id=int(report_id),
+                version=int(version) if version is not None else None,
+                seen=tuple((int(seen_id), int(stamp)) for seen_id, stamp in (seen[0] if seen else ()))
+            )
+        except (TypeError, ValueError, json.JSONDecodeError) as e:
+            raise ValueError('Invalid cursor') from e
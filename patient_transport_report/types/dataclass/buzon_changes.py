@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+from ...models import PatientTransportReport
+from .buzon_change_cursor import BuzonChangeCursor
+
+@dataclass
+class BuzonChanges:
+    '''Data Transfer Object for the buzon reports of one user changed after a cursor'''
+    next_cursor: BuzonChangeCursor
+    changed: list[PatientTransportReport] = field(default_factory=list)
+    removed_ids: list[int] = field(default_factory=list)
+    has_more: bool = False
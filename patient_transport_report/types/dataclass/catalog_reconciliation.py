@@ -0,0 +1,10 @@
+from dataclasses import dataclass, field
+
+@dataclass
+class CatalogReconciliation:
+    '''Data Transfer Object for the diff between a catalog file and one catalog table'''
+    catalog: str
+    created: list[str] = field(default_factory=list)
+    reactivated: list[str] = field(default_factory=list)
+    deactivated: list[str] = field(default_factory=list)
+    unchanged: int = 0
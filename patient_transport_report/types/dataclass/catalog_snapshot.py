@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    '''Pre-serialized catalog response for one catalog version'''
+    catalog: str
+    version: int
+    etag: str
+    body: bytes
+    gzip_body: bytes
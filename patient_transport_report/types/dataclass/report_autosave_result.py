@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+@dataclass
+class ReportAutosaveResult:
+    '''Data Transfer Object for the outcome of an autosave of a draft report'''
+    # saved or conflict
+    status: str
+    report_id: int
+    # Current version of the report (the new one when saved)
+    version: int
+    updated_at: datetime
+    response: str = ''
+    # Dotted paths of the fields written, e.g. care_transfer_report.landmark
+    changed_fields: list[str] = field(default_factory=list)
+    # Whether the save joined the client's ongoing autosave session
+    coalesced: bool = False
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+@dataclass
+class ReportSyncItem:
+    '''Data Transfer Object for one report of an offline sync batch'''
+    client_uuid: UUID
+    report_data: dict[str, Any]
+    # SHA-256 of the item as sent by the device, to recognize replays
+    digest: str
+    # Server version the device last received (None: never synced)
+    base_version: int | None = None
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+@dataclass
+class ReportSyncResult:
+    '''Data Transfer Object for the outcome of one report of a sync batch'''
+    client_uuid: UUID | None
+    # created, updated, unchanged, conflict, invalid or forbidden
+    status: str
+    report_id: int | None = None
+    version: int | None = None
+    response: str = ''
+    errors: dict[str, Any] = field(default_factory=dict)
@@ -3,12 +3,26 @@ from .views import (
     ListDiagnosisView,
     ListIPSView,
     ListBuzonView,
-    GetDetailsReportView
+    GetDetailsReportView,
+    GetCatalogView,
+    ListBuzonChangesView,
+    BuzonChangeStreamView,
+    GetSignatureView,
+    CreateReportView,
+    SyncReportsView,
+    AutosaveReportView
 )
 
 urlpatterns = [
     path('list_diagnoses/', ListDiagnosisView.as_view(), name='list_diagnoses'),
     path('list_ips/', ListIPSView.as_view(), name='list_ips'),
     path('list_buzon/', ListBuzonView.as_view(), name='list_buzon'),
+    path('list_buzon/changes/', ListBuzonChangesView.as_view(), name='list_buzon_changes'),
+    path('list_buzon/stream/', BuzonChangeStreamView.as_view(), name='list_buzon_stream'),
+    path('create_report/', CreateReportView.as_view(), name='create_report'),
+    path('sync_reports/', SyncReportsView.as_view(), name='sync_reports'),
     path('<int:report_id>/get_detail_report/', GetDetailsReportView.as_view(), name='get_detail_report'),
+    path('<int:report_id>/autosave/', AutosaveReportView.as_view(), name='autosave_report'),
+    path('signatures/<int:signature_id>/', GetSignatureView.as_view(), name='get_signature'),
+    path('catalogs/<str:catalog_name>/', GetCatalogView.as_view(), name='get_catalog'),
 ]
\ No newline at end of file
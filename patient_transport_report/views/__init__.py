@@ -2,10 +2,24 @@ from .list_diagnosis_view import ListDiagnosisView
 from .list_ips_view import ListIPSView
 from .list_buzon_view import ListBuzonView
 from .get_detail_report_view import GetDetailsReportView
+from .get_catalog_view import GetCatalogView
+from .list_buzon_changes_view import ListBuzonChangesView
+from .buzon_change_stream_view import BuzonChangeStreamView
+from .get_signature_view import GetSignatureView
+from .create_report_view import CreateReportView
+from .sync_reports_view import SyncReportsView
+from .autosave_report_view import AutosaveReportView
 
 __all__ = [
     'ListDiagnosisView',
     'ListIPSView',
     'ListBuzonView',
-    'GetDetailsReportView'
+    'GetDetailsReportView',
+    'GetCatalogView',
+    'ListBuzonChangesView',
+    'BuzonChangeStreamView',
+    'GetSignatureView',
+    'CreateReportView',
+    'SyncReportsView',
+    'AutosaveReportView'
 ]
\ No newline at end of file
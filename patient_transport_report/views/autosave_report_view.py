@@ -0,0 +1,91 @@
+from rest_framework.request import Request
+from rest_framework.response import Response
+from typing import Any
+from django.contrib.auth.models import User
+from rest_framework.permissions import IsAuthenticated
+from core.views.base_view import BaseView
+from patient_transport_report.application_service import AutosaveReportApplicationService
+from patient_transport_report.serializers.input import AutosaveReportSerializer
+
+class AutosaveReportView(BaseView):
+    '''
+    API endpoint for the autosave of draft reports.
+
+    Clients send only what changed since the version they hold, as a JSON
+    merge patch per section, and get the new version back.
+    '''
+
+    permission_classes = [IsAuthenticated]
+
+    def patch(
+        self,
+        request: Request,
+        report_id: int
+    ) -> Response:
+        '''
+        Save changes of a draft report.
+
+        PATCH /api/patient-transport-report/{report_id}/autosave/
+
+        Headers:
+            Authorization: Token <token_value>
+            Content-Type: application/json
+
+        Request Body:
+            {
+                "version": 3,
+                "client_id": "tablet-07",
+                "care_transfer_report": {
+                    "landmark": "Frente al parque",
+                    "initial_physicial_examination": {"heart_rate": 88},
+                    "skin_condition_ids": [2]
+                },
+                "satisfaction_survey": null
+            }
+
+            Objects are merged into the stored record, null clears a field
+            (or removes an optional record) and lists are replaced. version
+            is the last version received; client_id identifies the editing
+            client so that its rapid successive autosaves do not conflict.
+
+        Success Response (200 OK):
+            {
+                "response": "Cambios guardados.",
+                "msg": 1,
+                "autosave": {
+                    "status": "saved",
+                    "report_id": 12,
+                    "version": 4,
+                    "updated_at": "2026-10-18T14:03:11.520Z",
+                    "changed_fields": ["care_transfer_report.landmark"],
+                    "coalesced": false
+                }
+            }
+
+        Error Response (409 Conflict):
+            {
+                "response": "El informe fue modificado por otro usuario.",
+                "msg": -1,
+                "autosave": {"status": "conflict", "report_id": 12, "version": 5, ...}
+            }
+
+        Error Response (404 Not Found):
+            {
+                "response": "Informe con ID 12 no encontrado.",
+                "msg": -1
+            }
+        '''
+        def service_callback(validated_data: dict[str, Any], user: User) -> dict[str, Any]:
+            autosave_service: AutosaveReportApplicationService = AutosaveReportApplicationService()
+            return autosave_service.autosave_report(
+                report_id=report_id,
+                autosave_data=validated_data,
+                user=user
+            )
+
+        return self._handle_request(
+            request=request,
+            serializer_class=AutosaveReportSerializer,
+            service_method_callback=service_callback,
+            requires_auth=True
+        )
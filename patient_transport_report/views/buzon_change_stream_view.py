@@ -0,0 +1,152 @@
+from typing import (
+    Any,
+    AsyncIterator
+)
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse
+)
+from django.views import View
+from rest_framework import exceptions
+from staff.authentication import CachedTokenAuthentication
+from patient_transport_report.application_service import ListBuzonChangesApplicationService
+from patient_transport_report.types.dataclass import BuzonChangeCursor
+import asyncio
+import json
+import logging
+import time
+
+class BuzonChangeStreamView(View):
+    '''
+    Server-sent events stream of the user's buzon changes (ASGI only).
+
+    Pushes the same payload as list_buzon/changes/ as `changes` events
+    whenever something changed, and a keep-alive comment otherwise. Each
+    event id is the next_since cursor, so EventSource reconnections resume
+    through the Last-Event-ID header. Streams close after
+    BUZON_SSE_MAX_SECONDS so workers recycle connections.
+
+    Under WSGI (gunicorn sync workers) a stream would pin a worker, so the
+    endpoint answers 501 and clients fall back to polling the delta endpoint.
+    '''
+
+    DEFAULT_POLL_SECONDS: int = 5
+    DEFAULT_MAX_SECONDS: int = 300
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def get(
+        self,
+        request: HttpRequest
+    ) -> HttpResponse:
+        '''
+        Open the change stream.
+
+        GET /api/patient-transport-report/list_buzon/stream/?since=<next_since>
+
+        Headers:
+            Authorization: Token <token_value>
+            Last-Event-ID (optional): Sent by EventSource when reconnecting
+
+        Events:
+            event: changes
+            id: <next_since>
+            data: {"list_report_changed": [...], "removed_report_ids": [...], "next_since": "...", "has_more": false}
+        '''
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse(
+                {'response': 'El stream de cambios solo está disponible en el servidor ASGI.', 'msg': -1},
+                status=501
+            )
+        try:
+            user: User | None = await sync_to_async(self._authenticate)(request)
+        except exceptions.AuthenticationFailed as e:
+            return JsonResponse({'response': str(e.detail), 'msg': -1}, status=401)
+        if user is None:
+            return JsonResponse(
+                {'response': 'Authentication credentials were not provided or are invalid.', 'msg': -1},
+                status=401
+            )
+        raw_since: str = request.headers.get('Last-Event-ID') or request.GET.get('since') or ''
+        since: BuzonChangeCursor | None = None
+        if raw_since:
+            try:
+                since = BuzonChangeCursor.decode(raw_since)
+            except ValueError:
+                return JsonResponse(
+                    {'response': 'Invalid input data.', 'msg': -1, 'errors': {'since': ['Cursor inválido.']}},
+                    status=400
+                )
+        # Check the role up front so a forbidden stream is never opened
+        first_poll: dict[str, Any] = await sync_to_async(self._poll)(user, since)
+        if first_poll['msg'] != 1:
+            return JsonResponse(
+                {'response': first_poll['response'], 'msg': -1},
+                status=first_poll['status_code_http']
+            )
+        response: StreamingHttpResponse = StreamingHttpResponse(
+            self._events(user, first_poll),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _authenticate(
+        self,
+        request: HttpRequest
+    ) -> User | None:
+        '''Same token authentication as the REST endpoints.'''
+        result: tuple[User, Any] | None = CachedTokenAuthentication().authenticate(request)
+        return result[0] if result is not None else None
+
+    def _poll(
+        self,
+        user: User,
+        since: BuzonChangeCursor | None
+    ) -> dict[str, Any]:
+        return ListBuzonChangesApplicationService().list_changes(user=user, since=since)
+
+    async def _events(
+        self,
+        user: User,
+        poll: dict[str, Any]
+    ) -> AsyncIterator[str]:
+        '''Yield SSE frames until the stream's lifetime runs out.'''
+        poll_seconds: int = getattr(settings, 'BUZON_SSE_POLL_SECONDS', self.DEFAULT_POLL_SECONDS)
+        deadline: float = time.monotonic() + getattr(settings, 'BUZON_SSE_MAX_SECONDS', self.DEFAULT_MAX_SECONDS)
+        yield f'retry: {poll_seconds * 1000}\n\n'
+        while True:
+            if poll['msg'] != 1:
+                self.logger.warning(f'Buzon stream of user {user.pk} stopped: {poll["response"]}')
+                return
+            if poll['list_report_changed'] or poll['removed_report_ids']:
+                payload: str = json.dumps(
+                    {
+                        'list_report_changed': poll['list_report_changed'],
+                        'removed_report_ids': poll['removed_report_ids'],
+                        'next_since': poll['next_since'],
+                        'has_more': poll['has_more']
+                    },
+                    cls=DjangoJSONEncoder
+                )
+                yield f'event: changes\nid: {poll["next_since"]}\ndata: {payload}\n\n'
+            else:
+                yield ': keep-alive\n\n'
+            if time.monotonic() >= deadline:
+                return
+            if not poll['has_more']:
+                await asyncio.sleep(poll_seconds)
+            poll = await sync_to_async(self._poll)(user, BuzonChangeCursor.decode(poll['next_since']))
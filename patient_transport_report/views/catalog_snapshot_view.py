@@ -0,0 +1,94 @@
+from django.http import (
+    HttpResponse,
+    HttpResponseNotModified
+)
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.throttling import UserRateThrottle
+from core.views.base_view import BaseView
+from patient_transport_report.domain_service import CatalogSnapshotDomainService
+from patient_transport_report.types.dataclass import CatalogSnapshot
+
+class CatalogSnapshotView(BaseView):
+    '''
+    Base view for catalog endpoints served from pre-serialized snapshots.
+
+    Responses carry a strong ETag tied to the catalog version. Clients that
+    send a matching If-None-Match receive 304 Not Modified with no body;
+    otherwise the stored bytes are returned as-is (gzip when accepted).
+    '''
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    # ------------------------------------------------------------------
+    # PROTECTED METHODS - Usage by child classes only
+    # ------------------------------------------------------------------
+    def _serve_snapshot(
+        self,
+        request: Request,
+        catalog: str
+    ) -> HttpResponse | Response:
+        '''
+        Return the catalog snapshot honoring If-None-Match and Accept-Encoding.
+
+        Args:
+            request: The incoming HTTP request object
+            catalog: Catalog name (see CatalogSnapshotDomainService)
+
+        Returns:
+            HttpResponse (200 or 304) or error Response
+        '''
+        try:
+            auth_error: Response | None = self._validate_authentication(request)
+            if auth_error:
+                return auth_error
+            snapshot: CatalogSnapshot = CatalogSnapshotDomainService().get_snapshot(catalog)
+            use_gzip: bool = 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', '')
+            etag: str = self._representation_etag(snapshot, use_gzip)
+            if self._etag_matches(request, snapshot):
+                response: HttpResponse = HttpResponseNotModified()
+            else:
+                response = HttpResponse(
+                    snapshot.gzip_body if use_gzip else snapshot.body,
+                    content_type='application/json'
+                )
+                if use_gzip:
+                    response['Content-Encoding'] = 'gzip'
+            response['ETag'] = etag
+            # Always revalidate; the 304 path makes that almost free
+            response['Cache-Control'] = 'private, no-cache'
+            response['Vary'] = 'Accept-Encoding, Authorization'
+            return response
+        except Exception as e:
+            return self._handle_unexpected_error(e)
+
+    def _representation_etag(
+        self,
+        snapshot: CatalogSnapshot,
+        use_gzip: bool
+    ) -> str:
+        '''Strong ETags must differ between content encodings.'''
+        return f'{snapshot.etag[:-1]}-gzip"' if use_gzip else snapshot.etag
+
+    def _etag_matches(
+        self,
+        request: Request,
+        snapshot: CatalogSnapshot
+    ) -> bool:
+        '''Check If-None-Match against both encodings of the snapshot.'''
+        header: str = request.META.get('HTTP_IF_NONE_MATCH', '')
+        if not header:
+            return False
+        if header.strip() == '*':
+            return True
+        current: set[str] = {
+            self._representation_etag(snapshot, False),
+            self._representation_etag(snapshot, True)
+        }
+        # If-None-Match uses weak comparison: ignore W/ prefixes
+        candidates: set[str] = {
+            tag.strip().removeprefix('W/') for tag in header.split(',')
+        }
+        return bool(current & candidates)
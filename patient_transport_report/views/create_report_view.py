@@ -0,0 +1,111 @@
+from rest_framework.request import Request
+from rest_framework.response import Response
+from typing import Any
+from django.contrib.auth.models import User
+from rest_framework.permissions import IsAuthenticated
+from core.views.base_view import BaseView
+from patient_transport_report.application_service import CreateReportApplicationService
+from patient_transport_report.serializers.input import CreateReportSerializer
+
+class CreateReportView(BaseView):
+    '''
+    API endpoint to create a full patient transport report.
+
+    The whole nested payload (patient, informed consent, care transfer,
+    satisfaction survey) is validated first and then written in a single
+    transaction with bulk inserts, within a fixed number of statements.
+    '''
+
+    permission_classes = [IsAuthenticated]
+
+    def post(
+        self,
+        request: Request
+    ) -> Response:
+        '''
+        Create a patient transport report.
+
+        POST /api/patient-transport-report/create_report/
+
+        Headers:
+            Authorization: Token <token_value>
+            Content-Type: application/json
+
+        Request Body (abridged; sections mirror the models):
+            {
+                "status": "borrador",
+                "patient": {
+                    "patient_name": "Juan Pérez",
+                    "identification_number": "1234567890",
+                    ...,
+                    "signature": "data:image/png;base64,iVBORw0...",
+                    "patient_history": {"has_allergies": true, "allergies": "Penicilina"},
+                    "insurance_provider": {"coverage_type": "EPS", "provider_name": "EPS Sura"}
+                },
+                "informed_consent": {
+                    "consent_timestamp": "2026-01-25T10:30:00Z",
+                    ...,
+                    "attending_staff_id": 3,
+                    "required_procedures": {"ambulance_transport": true},
+                    "medication_administration": null,
+                    "responsible": null,
+                    "outgoing_entity": {"name": "Hospital Central", "document": "900", "staff_title": "Médico"}
+                },
+                "care_transfer_report": {
+                    ...,
+                    "driver_id": 2,
+                    "attending_staff_id": 3,
+                    "ambulance_id": 1,
+                    "initial_physicial_examination": {..., "glasgow": {...}},
+                    "final_physical_examination": {..., "glasgow": {...}},
+                    "skin_condition_ids": [1],
+                    "hemodynamic_status_ids": [1],
+                    "diagnosis_1_id": 10,
+                    "treatment": {...},
+                    "result": {...},
+                    "complications_transfer": {"description_complication": "Ninguna"},
+                    "receiving_entity": {...}
+                },
+                "satisfaction_survey": null
+            }
+
+        Success Response (201 Created):
+            {
+                "response": "Informe creado con éxito.",
+                "msg": 1,
+                "report": {
+                    "id": 1,
+                    "patient_name": "Juan Pérez",
+                    "patient_identification": "1234567890",
+                    "status": "borrador",
+                    "created_at": "2026-01-25T10:30:00Z",
+                    "updated_at": "2026-01-25T10:30:00Z",
+                    "created_by_username": "john_doe"
+                }
+            }
+
+        Error Response (400 Bad Request):
+            {
+                "response": "No existe ambulancia con ID 7.",
+                "msg": -1
+            }
+
+        Error Response (403 Forbidden):
+            {
+                "response": "Solamente el personal de salud puede crear informes.",
+                "msg": -1
+            }
+        '''
+        def service_callback(validated_data: dict[str, Any], user: User) -> dict[str, Any]:
+            create_report_service: CreateReportApplicationService = CreateReportApplicationService()
+            return create_report_service.create_report(
+                report_data=validated_data,
+                user=user
+            )
+
+        return self._handle_request(
+            request=request,
+            serializer_class=CreateReportSerializer,
+            service_method_callback=service_callback,
+            requires_auth=True
+        )
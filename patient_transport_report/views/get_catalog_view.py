@@ -0,0 +1,67 @@
+from django.http import HttpResponse
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import HTTP_404_NOT_FOUND
+from patient_transport_report.domain_service import CatalogSnapshotDomainService
+from .catalog_snapshot_view import CatalogSnapshotView
+
+class GetCatalogView(CatalogSnapshotView):
+    '''
+    API endpoint to download a full reference catalog (diagnoses, ips, eps, arl, soat).
+
+    This is a protected endpoint that requires authentication.
+    Catalogs are served from versioned snapshots with strong ETags, so
+    clients with a cached copy only pay for a 304 Not Modified.
+    '''
+
+    def get(
+        self,
+        request: Request,
+        catalog_name: str
+    ) -> HttpResponse | Response:
+        '''
+        Get a complete catalog.
+
+        GET /patient_transport_report/catalogs/{catalog_name}/
+
+        URL Parameters:
+            catalog_name: One of 'diagnoses', 'ips', 'eps', 'arl', 'soat'
+
+        Headers:
+            Authorization: Token <token_value>
+            If-None-Match (optional): ETag from a previous response
+            Accept-Encoding (optional): gzip to receive the compressed body
+
+        Success Response (200 OK):
+            {
+                "response": "Exito al recuperar las EPS activas.",
+                "msg": 1,
+                "status_code_http": 200,
+                "eps": [
+                    {
+                        "id": 1,
+                        "name": "EPS Sura",
+                        "is_active": true
+                    }
+                ],
+                "total": 1
+            }
+
+        Not Modified Response (304):
+            Empty body, same ETag header
+
+        Error Response (404 Not Found):
+            {
+                "response": "Catálogo 'xyz' no encontrado.",
+                "msg": -1
+            }
+        '''
+        if not CatalogSnapshotDomainService().is_known_catalog(catalog_name):
+            return Response(
+                {
+                    'response': f"Catálogo '{catalog_name}' no encontrado.",
+                    'msg': self.ERROR
+                },
+                status=HTTP_404_NOT_FOUND
+            )
+        return self._serve_snapshot(request, catalog_name)
@@ -53,11 +53,11 @@ class GetDetailsReportView(BaseView):
                             "identification_number": "1234567890",
                             "age": 45,
                             "sex": "M",
-                            "phone": "3001234567",
+                            "cell_phone": "3001234567",
                             "insurance_provider": 1,
                             "insurance_provider_name": "EPS Sura",
-                            "affiliate_type": "contributivo",
-                            "address": "Calle 123 #45-67"
+                            "membership_category": "contributivo",
+                            "home_address": "Calle 123 #45-67"
                         },
                         "informed_consent": { ... },
                         "care_transfer_report": { ... },
@@ -0,0 +1,87 @@
+from typing import Any
+from django.http import (
+    HttpResponse,
+    HttpResponseNotModified
+)
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from core.views.base_view import BaseView
+from patient_transport_report.application_service import GetSignatureApplicationService
+
+class GetSignatureView(BaseView):
+    '''
+    API endpoint that serves one stored signature image.
+
+    Signature blobs are immutable, so responses are cacheable for a year
+    (private: they contain patient data). The ETag is derived from the id;
+    a matching If-None-Match is answered with 304 after the role check,
+    without reading the blob's bytes. Detail responses link here instead of
+    embedding base64 images.
+    '''
+
+    permission_classes = [IsAuthenticated]
+
+    CACHE_CONTROL: str = 'private, max-age=31536000, immutable'
+
+    def get(
+        self,
+        request: Request,
+        signature_id: int
+    ) -> HttpResponse | Response:
+        '''
+        Get a signature image.
+
+        GET /api/patient-transport-report/signatures/{signature_id}/
+
+        Headers:
+            Authorization: Token <token_value>
+            If-None-Match (optional): ETag from a previous response
+
+        Success Response (200 OK):
+            Raw image bytes (Content-Type image/png or image/jpeg)
+
+        Success Response (304 Not Modified):
+            Empty body, when If-None-Match matches the signature's ETag
+
+        Error Response (403 Forbidden):
+            {
+                "response": "Solamente el personal de salud o administrativo puede acceder a este recurso.",
+                "msg": -1
+            }
+
+        Error Response (404 Not Found):
+            {
+                "response": "Firma con ID 123 no encontrada.",
+                "msg": -1
+            }
+        '''
+        try:
+            auth_error: Response | None = self._validate_authentication(request)
+            if auth_error:
+                return auth_error
+            etag: str = f'"signature-{signature_id}"'
+            service_response: dict[str, Any] = GetSignatureApplicationService().get_signature(
+                signature_id=signature_id,
+                user=request.user,
+                etag_matches=etag in request.META.get('HTTP_IF_NONE_MATCH', '')
+            )
+            if service_response['msg'] != self.SUCCESS:
+                return self._handle_service_response(service_response)
+            response: HttpResponse
+            if service_response['status_code_http'] == 304:
+                response = HttpResponseNotModified()
+            else:
+                response = HttpResponse(
+                    bytes(service_response['signature'].content),
+                    content_type=service_response['signature'].content_type
+                )
+            response['ETag'] = etag
+            response['Cache-Control'] = self.CACHE_CONTROL
+            response['Vary'] = 'Authorization'
+            # Defense in depth on top of the png/jpeg allow-list: never render or sniff the bytes
+            response['Content-Security-Policy'] = "default-src 'none'"
+            response['X-Content-Type-Options'] = 'nosniff'
+            return response
+        except Exception as e:
+            return self._handle_unexpected_error(e)
@@ -0,0 +1,95 @@
+from rest_framework.request import Request
+from rest_framework.response import Response
+from typing import Any
+from django.contrib.auth.models import User
+from rest_framework.permissions import IsAuthenticated
+from core.views.base_view import BaseView
+from patient_transport_report.application_service import ListBuzonChangesApplicationService
+from patient_transport_report.serializers.input import ListBuzonChangesSerializer
+from rest_framework.throttling import UserRateThrottle
+
+class ListBuzonChangesView(BaseView):
+    '''
+    API endpoint with the incremental change feed of the user's buzon.
+
+    Replaces re-polling list_buzon/: the client keeps the returned
+    next_since cursor and only receives the reports that changed after it.
+    With BUZON_CHANGES_CACHE_ALIAS configured, polls with nothing new do
+    not touch the database.
+    '''
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserRateThrottle]
+
+    def get(
+        self,
+        request: Request
+    ) -> Response:
+        '''
+        List buzon reports changed after a cursor.
+
+        GET /api/patient-transport-report/list_buzon/changes/?since=<next_since>
+
+        Query Parameters (all optional):
+            since: next_since returned by the previous call; omitted or
+                empty starts at the beginning of the buzon window
+            limit: Maximum number of changed reports, 1-200 (default 100)
+
+        Headers:
+            Authorization: Token <token_value>
+
+        Success Response (200 OK):
+            {
+                "response": "Exito al recuperar los cambios del buzón.",
+                "msg": 1,
+                "list_report_changed": [
+                    {
+                        "id": 1,
+                        "patient_name": "Juan Pérez",
+                        "patient_identification": "1234567890",
+                        "status": "completado",
+                        "created_at": "2024-01-25T10:30:00Z",
+                        "updated_at": "2024-01-25T12:00:00Z",
+                        "created_by_username": "john_doe"
+                    }
+                ],
+                "removed_report_ids": [3],
+                "next_since": "WyIyMDI0LTAxLTI1VDEyOjAwOjAwKzAwOjAwIiwgMSwgN10",
+                "has_more": false
+            }
+
+        Error Response (400 Bad Request):
+            {
+                "response": "Invalid input data.",
+                "msg": -1,
+                "errors": {"since": ["Cursor inválido."]}
+            }
+
+        Error Response (403 Forbidden):
+            {
+                "response": "Solamente el personal de salud puede acceder a este recurso.",
+                "msg": -1
+            }
+        '''
+        validated_data: dict[str, Any] | None
+        validated_data, validation_error = self._validate_serializer(
+            ListBuzonChangesSerializer,
+            request.query_params
+        )
+        if validation_error:
+            return validation_error
+
+        def service_callback(user: User) -> dict[str, Any]:
+            list_changes_service: ListBuzonChangesApplicationService = ListBuzonChangesApplicationService()
+            return list_changes_service.list_changes(
+                user=user,
+                since=validated_data.get('since'),
+                limit=validated_data['limit']
+            )
+
+        return self._handle_request(
+            request=request,
+            serializer_class=None,
+            service_method_callback=service_callback,
+            requires_auth=True
+        )
@@ -11,7 +11,8 @@ class ListBuzonView(BaseView):
     API endpoint to list authenticated user's transport reports (inbox/buzon).
     
     This is a protected endpoint that requires authentication.
-    Returns only reports created by the logged-in user within the last 48 hours.
+    Returns only reports created by the logged-in user within the last
+    BUZON_WINDOW_HOURS hours (48 by default).
     Reports are separated by status: draft and completed.
     '''
     
@@ -23,7 +24,7 @@ class ListBuzonView(BaseView):
         request: Request
     ) -> Response:
         '''
-        List user's own transport reports from last 48 hours.
+        List user's own transport reports from the buzon window.
         
         GET /api/patient-transport-report/buzon/
         
@@ -32,7 +33,7 @@ class ListBuzonView(BaseView):
         
         Filters Applied:
             - created_by: Only reports created by authenticated user
-            - created_at: Only reports from last 48 hours
+            - created_at: Only reports from the last BUZON_WINDOW_HOURS hours
             - Separated by status: 'borrador' and 'completado'
         
         Success Response (200 OK):
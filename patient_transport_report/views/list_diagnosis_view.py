@@ -1,12 +1,12 @@
 from rest_framework.request import Request
 from rest_framework.response import Response
 from typing import Any
-from rest_framework.permissions import IsAuthenticated
-from core.views.base_view import BaseView
+from django.http import HttpResponse
 from patient_transport_report.application_service import ListDiagnosisApplicationService
-from rest_framework.throttling import UserRateThrottle
+from patient_transport_report.domain_service import CatalogSnapshotDomainService
+from .catalog_snapshot_view import CatalogSnapshotView
 
-class ListDiagnosisView(BaseView):
+class ListDiagnosisView(CatalogSnapshotView):
     '''
     API endpoint to list and search available diagnoses (CIE-10 codes).
     
@@ -14,15 +14,14 @@ class ListDiagnosisView(BaseView):
     Used for populating diagnosis dropdowns and autocomplete searches in forms.
     
     Supports search by CIE-10 code or diagnosis name (case-insensitive).
+    The unfiltered list is served from a versioned catalog snapshot
+    (ETag / 304 Not Modified supported).
     '''
-    
-    permission_classes = [IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
 
     def get(
         self, 
         request: Request
-    ) -> Response:
+    ) -> HttpResponse | Response:
         '''
         List or search diagnosis codes (CIE-10).
         
@@ -36,6 +35,7 @@ class ListDiagnosisView(BaseView):
         
         Headers:
             Authorization: Token <token_value>
+            If-None-Match (optional, without search): ETag from a previous response
         
         Success Response (200 OK) - Without search:
             {
@@ -94,10 +94,14 @@ class ListDiagnosisView(BaseView):
                 "msg": -1
             }
         '''
+        # Get search query from URL parameters
+        search_query: str | None = request.query_params.get('q', None)
+        if not search_query or len(search_query.strip()) < 2:
+            return self._serve_snapshot(request, CatalogSnapshotDomainService.DIAGNOSES)
 
         def service_callback(validated_data: dict | None = None) -> dict[str, Any]:
             '''
-            Execute business logic to list or search diagnoses.
+            Execute business logic to search diagnoses.
             
             Args:
                 validated_data: Not used for GET requests (no input serializer)
@@ -105,11 +109,9 @@ class ListDiagnosisView(BaseView):
             Returns:
                 dict: Service response with diagnoses data
             '''
-            # Get search query from URL parameters
-            search_query: str | None = request.query_params.get('q', None)
             # Call application service with search parameter
             list_diagnosis_service = ListDiagnosisApplicationService()
-            return list_diagnosis_service.list_diagnoses(search_query=search_query)
+            return list_diagnosis_service.search_diagnoses(search_query=search_query)
 
         return self._handle_request(
             request=request,
@@ -1,28 +1,24 @@
 from rest_framework.request import Request
 from rest_framework.response import Response
-from typing import Any
-from rest_framework.permissions import IsAuthenticated
-from core.views.base_view import BaseView
-from patient_transport_report.application_service import ListIPSApplicationService
-from rest_framework.throttling import UserRateThrottle
+from django.http import HttpResponse
+from patient_transport_report.domain_service import CatalogSnapshotDomainService
+from .catalog_snapshot_view import CatalogSnapshotView
 
-class ListIPSView(BaseView):
+class ListIPSView(CatalogSnapshotView):
     '''
     API endpoint to list all active receiving institutions (IPS).
     
     This is a protected endpoint that requires authentication.
     Used for populating IPS dropdowns in forms.
     
-    Returns only institutions with is_active=True.
+    Returns only institutions with is_active=True, served from a versioned
+    catalog snapshot (ETag / 304 Not Modified supported).
     '''
-    
-    permission_classes = [IsAuthenticated]
-    throttle_classes = [UserRateThrottle]
 
     def get(
         self, 
         request: Request
-    ) -> Response:
+    ) -> HttpResponse | Response:
         '''
         List all active receiving institutions (IPS).
         
@@ -30,6 +26,7 @@ class ListIPSView(BaseView):
         
         Headers:
             Authorization: Token <token_value>
+            If-None-Match (optional): ETag from a previous response
         
         Success Response (200 OK):
             {
@@ -69,23 +66,4 @@ class ListIPSView(BaseView):
                 "msg": -1
             }
         '''
-
-        def service_callback(validated_data: dict | None = None) -> dict[str, Any]:
-            '''
-            Execute business logic to list active institutions.
-            
-            Args:
-                validated_data: Not used for GET requests (no input data)
-            
-            Returns:
-                dict: Service response with institutions data
-            '''
-            list_ips_service: ListIPSApplicationService = ListIPSApplicationService()
-            return list_ips_service.list_active_ips()
-
-        return self._handle_request(
-            request=request,
-            serializer_class=None,
-            service_method_callback=service_callback,
-            requires_auth=True
-        )
\ No newline at end of file
+        return self._serve_snapshot(request, CatalogSnapshotDomainService.IPS)
\ No newline at end of file
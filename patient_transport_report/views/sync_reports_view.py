@@ -0,0 +1,90 @@
+from rest_framework.request import Request
+from rest_framework.response import Response
+from typing import Any
+from django.contrib.auth.models import User
+from rest_framework.permissions import IsAuthenticated
+from core.views.base_view import BaseView
+from patient_transport_report.application_service import SyncReportsApplicationService
+from patient_transport_report.serializers.input import SyncReportsSerializer
+
+class SyncReportsView(BaseView):
+    '''
+    API endpoint for the offline sync of reports captured in the ambulance.
+
+    The device flushes its whole queue in one request. Reports are
+    identified by a UUID generated on the device, so resending a batch
+    (e.g. after a lost response) never duplicates anything.
+    '''
+
+    permission_classes = [IsAuthenticated]
+
+    def post(
+        self,
+        request: Request
+    ) -> Response:
+        '''
+        Create or update a batch of reports.
+
+        POST /api/patient-transport-report/sync_reports/
+
+        Headers:
+            Authorization: Token <token_value>
+            Content-Type: application/json
+
+        Request Body:
+            {
+                "reports": [
+                    {
+                        "client_uuid": "9b2f6a1e-3c1d-4e8a-9f5b-1a2b3c4d5e6f",
+                        "base_version": null,
+                        "status": "borrador",
+                        "patient": {...},
+                        "informed_consent": {...},
+                        "care_transfer_report": {...},
+                        "satisfaction_survey": null
+                    }
+                ]
+            }
+
+            Sections use the create_report/ format. base_version is the
+            version last returned for the report (omitted: never synced).
+
+        Success Response (200 OK):
+            {
+                "response": "Sincronización completada.",
+                "msg": 1,
+                "results": [
+                    {
+                        "client_uuid": "9b2f6a1e-3c1d-4e8a-9f5b-1a2b3c4d5e6f",
+                        "status": "created",
+                        "report_id": 12,
+                        "version": 1,
+                        "response": "Informe creado.",
+                        "errors": {}
+                    }
+                ]
+            }
+
+            status is one of created, updated, unchanged (already synced),
+            conflict (changed, completed or deleted on the server; version
+            is the server one), invalid (see errors) or forbidden.
+
+        Error Response (403 Forbidden):
+            {
+                "response": "Solamente el personal de salud puede sincronizar informes.",
+                "msg": -1
+            }
+        '''
+        def service_callback(validated_data: dict[str, Any], user: User) -> dict[str, Any]:
+            sync_reports_service: SyncReportsApplicationService = SyncReportsApplicationService()
+            return sync_reports_service.sync_reports(
+                reports=validated_data['reports'],
+                user=user
+            )
+
+        return self._handle_request(
+            request=request,
+            serializer_class=SyncReportsSerializer,
+            service_method_callback=service_callback,
+            requires_auth=True
+        )
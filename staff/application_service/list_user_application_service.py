@@ -5,7 +5,10 @@ from staff.domain_service import (
     UserDomainService,
     AuthDomainService
 )
-from staff.types.dataclass import UserListResponse
+from staff.types.dataclass import (
+    UserListRequest,
+    UserListResponse
+)
 
 class ListUsersApplicationService:
     '''
@@ -20,13 +23,15 @@ class ListUsersApplicationService:
     
     def list_users(
         self, 
-        requesting_user: User
+        requesting_user: User,
+        list_request: UserListRequest
     ) -> dict[str, Any]:
         '''
-        List all staff users if requesting user is administrative.
+        List one page of staff users if requesting user is administrative.
         
         Args:
             requesting_user: User making the request
+            list_request: UserListRequest with filters, page size and cursor
             
         Returns:
             dictionary with response data and status
@@ -43,8 +48,8 @@ class ListUsersApplicationService:
                     'msg': -1,
                     'status_code_http': 403
                 }
-            # Step 2: Get all staff users
-            user_items: list[UserListResponse] = self.user_domain_service.get_all_staff_users()
+            # Step 2: Get one page of staff users (filtered server side)
+            user_list: UserListResponse = self.user_domain_service.list_staff_users(list_request)
             # Step 3: Build response
             users_data: list[dict[str, Any]] = [
                 {
@@ -55,10 +60,10 @@ class ListUsersApplicationService:
                     'document_number': item.document_number,
                     'type_personnel': item.type_personnel
                 }
-                for item in user_items
+                for item in user_list.users
             ]
             self.logger.info(
-                f'User {requesting_user.username} successfully retrieved {len(user_items)} users'
+                f'User {requesting_user.username} successfully retrieved {user_list.count} of {user_list.total_count} users'
             )
             return {
                 'response': 'Usuarios recuperados exitosamente.',
@@ -66,7 +71,10 @@ class ListUsersApplicationService:
                 'status_code_http': 200,
                 'data': {
                     'users': users_data,
-                    'total_count': len(user_items)
+                    'count': user_list.count,
+                    'total_count': user_list.total_count,
+                    'next_cursor': user_list.next_cursor,
+                    'has_more': user_list.has_more
                 }
             }
         except Exception as e:
@@ -1,5 +1,6 @@
 import logging
 from django.contrib.auth.models import User
+from rest_framework.authtoken.models import Token
 from staff.domain_service import AuthDomainService
 from staff.types.dataclass import ValidateSessionResponse
 
@@ -15,13 +16,15 @@ class ValidateSessionApplicationService:
     
     def validate_session(
         self, 
-        authenticated_user: User
+        authenticated_user: User,
+        token: Token | None = None
     ) -> ValidateSessionResponse:
         '''
         Validate if user's session (token) is still valid.
         
         Args:
             authenticated_user: User authenticated via token
+            token: Token used to authenticate the request (request.auth)
             
         Returns:
             dictionary with response data and status
@@ -31,7 +34,8 @@ class ValidateSessionApplicationService:
             is_valid: bool
             message: str
             is_valid, message = self.auth_domain_service.validate_user_session(
-                user=authenticated_user
+                user=authenticated_user,
+                token=token
             )
             if not is_valid:
                 self.logger.warning(
@@ -0,0 +1,7 @@
+from .staff_token_authentication import StaffTokenAuthentication
+from .cached_token_authentication import CachedTokenAuthentication
+
+__all__ = [
+    'StaffTokenAuthentication',
+    'CachedTokenAuthentication'
+]
@@ -0,0 +1,36 @@
+from django.contrib.auth.models import User
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authtoken.models import Token
+from staff.domain_service import (
+    AuthTokenCache,
+    StaffRoleResolver
+)
+from .staff_token_authentication import StaffTokenAuthentication
+
+class CachedTokenAuthentication(StaffTokenAuthentication):
+    '''
+    Drop-in replacement for TokenAuthentication backed by AuthTokenCache.
+
+    A cache hit rebuilds the user, token and staff role from the snapshot,
+    so a steady-state authenticated request costs zero database queries.
+    On a miss the token is validated against the database (token JOIN user
+    plus the joined role query) and the result is cached.
+    '''
+
+    def authenticate_credentials(
+        self,
+        key: str
+    ) -> tuple[User, Token]:
+        token_cache: AuthTokenCache = AuthTokenCache.get_instance()
+        cached: tuple[User, Token] | None = token_cache.get(key)
+        if cached is not None:
+            user: User = cached[0]
+            if not user.is_active:
+                token_cache.invalidate_token(key)
+                raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+            return cached
+        token: Token
+        user, token = super().authenticate_credentials(key)
+        token_cache.set(token, StaffRoleResolver().for_user(user))
+        return (user, token)
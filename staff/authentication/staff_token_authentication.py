@@ -0,0 +1,33 @@
+from django.contrib.auth.models import User
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from staff.domain_service import StaffRoleResolver
+
+class StaffTokenAuthentication(TokenAuthentication):
+    '''
+    Token authentication that also resolves the user's staff role.
+
+    The token, its user, the BaseStaff row and the three profiles are loaded
+    in a single joined query. The role is memoized on request.user, so
+    application services read it through StaffRoleResolver().for_user(user)
+    without extra queries.
+    '''
+
+    def authenticate_credentials(
+        self,
+        key: str
+    ) -> tuple[User, Token]:
+        model = self.get_model()
+        try:
+            token: Token = model.objects.select_related(
+                'user',
+                *(f'user__{path}' for path in StaffRoleResolver.USER_SELECT_RELATED)
+            ).get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+        StaffRoleResolver().resolve_loaded(token.user)
+        return (token.user, token)
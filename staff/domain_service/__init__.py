@@ -1,9 +1,13 @@
 from .auth_domain_service import AuthDomainService
 from .user_domain_service import UserDomainService
 from .list_drivers_domain_service import ListDriversDomainService
+from .staff_role_resolver import StaffRoleResolver
+from .auth_token_cache import AuthTokenCache
 
 __all__ = [
     'AuthDomainService',
     'UserDomainService',
-    'ListDriversDomainService'
-]
\ No newline at end of file
+    'ListDriversDomainService',
+    'StaffRoleResolver',
+    'AuthTokenCache'
+]
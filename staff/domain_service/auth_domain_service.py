@@ -1,6 +1,8 @@
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from rest_framework.authtoken.models import Token
+from .staff_role_resolver import StaffRoleResolver
+from .auth_token_cache import AuthTokenCache
 import logging
 
 class AuthDomainService:
@@ -11,6 +13,7 @@ class AuthDomainService:
     
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.staff_role_resolver: StaffRoleResolver = StaffRoleResolver()
     
     def authenticate_user(
         self, 
@@ -71,16 +74,7 @@ class AuthDomainService:
             Staff type string ('healthcare', 'driver', 'administrative') or None
         '''
         try:
-            if hasattr(user, 'staff_profile'):
-                base_staff = user.staff_profile
-                if hasattr(base_staff, 'healthcare_profile'):
-                    return 'healthcare'
-                elif hasattr(base_staff, 'driver_profile'):
-                    return 'driver'
-                elif hasattr(base_staff, 'administrative_profile'):
-                    return 'administrative'
-            else:
-                return 'superuser' if user.is_superuser else None
+            return self.staff_role_resolver.for_user(user).role
         except Exception as e:
             self.logger.error(f'Error determining staff type: {str(e)}')
         return None
@@ -100,7 +94,9 @@ class AuthDomainService:
         '''
         try:
             token: Token = Token.objects.get(user=user)
+            token_key: str = token.key
             token.delete()
+            AuthTokenCache.get_instance().invalidate_token(token_key)
             self.logger.info(f'Token revoked for user: {user.username}')
             return True
         except Token.DoesNotExist:
@@ -143,25 +139,23 @@ class AuthDomainService:
             True if user is administrative staff, False otherwise
         '''
         try:
-            if hasattr(user, 'staff_profile'):
-                base_staff = user.staff_profile
-                return hasattr(base_staff, 'administrative_profile')
-            if user.is_superuser:
-                return True
-            return False
+            return self.staff_role_resolver.for_user(user).is_admin
         except Exception as e:
             self.logger.error(f'Error checking administrative user: {str(e)}')
             return False  
 
     def validate_user_session(
         self, 
-        user: User
+        user: User,
+        token: Token | None = None
     ) -> tuple[bool, str]:
         '''
         Validate if user session is active and valid.
         
         Args:
             user: Authenticated user object
+            token: Token the request was authenticated with, if any.
+                When given, the token lookup query is skipped.
             
         Returns:
             tuple of (is_valid, message)
@@ -171,6 +165,10 @@ class AuthDomainService:
             if not user.is_active:
                 self.logger.warning(f'Inactive user attempted to validate session: {user.username}')
                 return (False, 'La cuenta de usuario está inactiva.')
+            # The authentication class already validated this token
+            if isinstance(token, Token) and token.user_id == user.id:
+                self.logger.info(f'Valid session for user: {user.username}')
+                return (True, 'La sesión es válida.')
             # Check if user has a valid token
             try:
                 token = Token.objects.get(user=user)
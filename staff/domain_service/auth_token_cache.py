@@ -0,0 +1,253 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework.authtoken.models import Token
+from staff.models import (
+    BaseStaff,
+    Healthcare,
+    Driver,
+    Administrative
+)
+from staff.types.dataclass import StaffRole
+from .staff_role_resolver import StaffRoleResolver
+import logging
+import threading
+import time
+
+class AuthTokenCache:
+    '''
+    Two-tier cache of token -> (user snapshot, staff role).
+
+    Tiers:
+    - Per-worker LRU bounded by AUTH_TOKEN_CACHE_LOCAL_MAX_ENTRIES, entries
+      expire after AUTH_TOKEN_CACHE_LOCAL_TTL_SECONDS
+    - Optional shared Django cache (AUTH_TOKEN_CACHE_ALIAS), entries expire
+      after AUTH_TOKEN_CACHE_SHARED_TTL_SECONDS
+
+    Snapshots are plain field values; User, BaseStaff and profile instances
+    are rebuilt with Model.from_db() on every hit so requests never share
+    mutable model instances. The password hash is never cached: the rebuilt
+    User has it deferred, so save() only writes the loaded fields and
+    check_password() loads it on demand.
+
+    Invalidation is explicit (revoke_token, change_user_active_status and
+    password changes). Other workers drop their local copy when the local
+    TTL expires, which bounds how long a revoked token can still be used.
+    '''
+
+    DEFAULT_LOCAL_MAX_ENTRIES: int = 1024
+    DEFAULT_LOCAL_TTL_SECONDS: int = 60
+    DEFAULT_SHARED_TTL_SECONDS: int = 300
+    SHARED_KEY_PREFIX: str = 'auth_token:'
+
+    PROFILE_MODELS: dict[str, type] = {
+        'healthcare': Healthcare,
+        'driver': Driver,
+        'administrative': Administrative
+    }
+
+    _instance: AuthTokenCache | None = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._user_fields: list[str] = [
+            field.attname for field in User._meta.concrete_fields
+            if field.attname != 'password'
+        ]
+
+    @classmethod
+    def get_instance(cls) -> AuthTokenCache:
+        '''Return the process-wide cache instance.'''
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------
+    def get(
+        self,
+        key: str
+    ) -> tuple[User, Token] | None:
+        '''
+        Look a token up in the local tier, then in the shared tier.
+
+        Args:
+            key: Token key sent by the client
+
+        Returns:
+            (user, token) rebuilt from the snapshot, or None on miss
+        '''
+        snapshot: dict[str, Any] | None = self._get_local(key)
+        if snapshot is None:
+            shared_cache = self._shared_cache()
+            if shared_cache is not None:
+                snapshot = shared_cache.get(self.SHARED_KEY_PREFIX + key)
+                if snapshot is not None:
+                    self._set_local(key, snapshot)
+        if snapshot is None:
+            return None
+        return self._rebuild(key, snapshot)
+
+    def set(
+        self,
+        token: Token,
+        staff_role: StaffRole
+    ) -> None:
+        '''Store a freshly authenticated token in both tiers.'''
+        snapshot: dict[str, Any] = self._snapshot(token, staff_role)
+        self._set_local(token.key, snapshot)
+        shared_cache = self._shared_cache()
+        if shared_cache is not None:
+            shared_cache.set(
+                self.SHARED_KEY_PREFIX + token.key,
+                snapshot,
+                timeout=self._setting('AUTH_TOKEN_CACHE_SHARED_TTL_SECONDS', self.DEFAULT_SHARED_TTL_SECONDS)
+            )
+
+    def invalidate_token(
+        self,
+        key: str
+    ) -> None:
+        '''Drop a token from both tiers.'''
+        with self._lock:
+            self._entries.pop(key, None)
+        shared_cache = self._shared_cache()
+        if shared_cache is not None:
+            shared_cache.delete(self.SHARED_KEY_PREFIX + key)
+
+    def invalidate_user(
+        self,
+        user_id: int
+    ) -> None:
+        '''Drop every cached token that belongs to a user.'''
+        keys: set[str] = set(Token.objects.filter(user_id=user_id).values_list('key', flat=True))
+        with self._lock:
+            keys.update(
+                key for key, (_, snapshot) in self._entries.items()
+                if snapshot['user_id'] == user_id
+            )
+        for key in keys:
+            self.invalidate_token(key)
+
+    def clear(self) -> None:
+        '''Empty the local tier (the shared tier expires on its own).'''
+        with self._lock:
+            self._entries.clear()
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _get_local(
+        self,
+        key: str
+    ) -> dict[str, Any] | None:
+        '''Return a non-expired local entry and mark it as recently used.'''
+        with self._lock:
+            entry: tuple[float, dict[str, Any]] | None = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, snapshot = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return snapshot
+
+    def _set_local(
+        self,
+        key: str,
+        snapshot: dict[str, Any]
+    ) -> None:
+        '''Insert into the local LRU, evicting the least recently used entries.'''
+        ttl: int = self._setting('AUTH_TOKEN_CACHE_LOCAL_TTL_SECONDS', self.DEFAULT_LOCAL_TTL_SECONDS)
+        max_entries: int = self._setting('AUTH_TOKEN_CACHE_LOCAL_MAX_ENTRIES', self.DEFAULT_LOCAL_MAX_ENTRIES)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def _snapshot(
+        self,
+        token: Token,
+        staff_role: StaffRole
+    ) -> dict[str, Any]:
+        '''Capture token, user and role as plain (picklable) values.'''
+        user: User = token.user
+        return {
+            'user_id': user.pk,
+            'token_created': token.created,
+            'user': [getattr(user, attname) for attname in self._user_fields],
+            'role': staff_role.role,
+            'base_staff': self._field_values(staff_role.base_staff),
+            'profile': self._field_values(staff_role.profile)
+        }
+
+    def _rebuild(
+        self,
+        key: str,
+        snapshot: dict[str, Any]
+    ) -> tuple[User, Token]:
+        '''Rebuild user, token and staff role without touching the database.'''
+        user: User = User.from_db(DEFAULT_DB_ALIAS, self._user_fields, snapshot['user'])
+        token: Token = Token(key=key, user=user, created=snapshot['token_created'])
+        token._state.adding = False
+        base_staff: BaseStaff | None = None
+        profile: Any = None
+        if snapshot['base_staff'] is not None:
+            base_staff = self._from_values(BaseStaff, snapshot['base_staff'])
+            user.staff_profile = base_staff
+            for role, relation in StaffRoleResolver.PROFILE_RELATIONS:
+                # Cache every reverse one-to-one so hasattr() checks stay query free
+                if role == snapshot['role'] and snapshot['profile'] is not None:
+                    profile = self._from_values(self.PROFILE_MODELS[role], snapshot['profile'])
+                    setattr(base_staff, relation, profile)
+                else:
+                    getattr(BaseStaff, relation).related.set_cached_value(base_staff, None)
+        StaffRoleResolver().attach(
+            user,
+            StaffRole(role=snapshot['role'], base_staff=base_staff, profile=profile)
+        )
+        return (user, token)
+
+    @staticmethod
+    def _field_values(instance: Any) -> list[Any] | None:
+        '''Concrete field values of a model instance, in _meta order.'''
+        if instance is None:
+            return None
+        return [getattr(instance, field.attname) for field in instance._meta.concrete_fields]
+
+    @staticmethod
+    def _from_values(
+        model: type,
+        values: list[Any]
+    ) -> Any:
+        '''Inverse of _field_values().'''
+        return model.from_db(
+            DEFAULT_DB_ALIAS,
+            [field.attname for field in model._meta.concrete_fields],
+            values
+        )
+
+    def _shared_cache(self) -> Any:
+        '''Shared cache tier, or None when AUTH_TOKEN_CACHE_ALIAS is not set.'''
+        alias: str | None = getattr(settings, 'AUTH_TOKEN_CACHE_ALIAS', None)
+        return caches[alias] if alias else None
+
+    @staticmethod
+    def _setting(
+        name: str,
+        default: int
+    ) -> int:
+        '''Read a tuning setting, falling back to the class default.'''
+        return getattr(settings, name, default)
@@ -0,0 +1,153 @@
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
+from staff.models import BaseStaff
+from staff.types.dataclass import StaffRole
+import logging
+
+class StaffRoleResolver:
+    '''
+    Resolves the staff role of a user with a single joined query.
+
+    BaseStaff is loaded together with its three one-to-one profiles
+    (healthcare, driver, administrative) through LEFT JOINs. The result is
+    memoized on the user instance, so within one request every application
+    service that asks for the role reuses it without touching the database.
+
+    The authentication class calls for_user() right after authenticating,
+    which attaches the role to request.user.
+
+    for_system_user_id() is the shared loader for any other staff member
+    (user detail endpoints): User, BaseStaff and the three profiles come
+    back in one query and are memoized per resolver instance, i.e. per
+    request.
+    '''
+
+    CACHE_ATTRIBUTE: str = '_staff_role'
+    # Checked in this order, same precedence as the former hasattr() probes
+    PROFILE_RELATIONS: tuple[tuple[str, str], ...] = (
+        ('healthcare', 'healthcare_profile'),
+        ('driver', 'driver_profile'),
+        ('administrative', 'administrative_profile')
+    )
+
+    # select_related() paths that load a User together with its role
+    USER_SELECT_RELATED: tuple[str, ...] = (
+        'staff_profile',
+        'staff_profile__healthcare_profile',
+        'staff_profile__driver_profile',
+        'staff_profile__administrative_profile'
+    )
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._loaded: dict[int, StaffRole | None] = {}
+
+    def for_user(
+        self,
+        user: User
+    ) -> StaffRole:
+        '''
+        Return the role of a user, resolving it at most once per instance.
+
+        Args:
+            user: Authenticated user object
+
+        Returns:
+            StaffRole with role, base_staff and specific profile
+        '''
+        staff_role: StaffRole | None = getattr(user, self.CACHE_ATTRIBUTE, None)
+        if staff_role is None:
+            staff_role = self.resolve(user)
+            self.attach(user, staff_role)
+        return staff_role
+
+    def for_system_user_id(
+        self,
+        system_user_id: int
+    ) -> StaffRole | None:
+        '''
+        Load any staff member with User, BaseStaff and profiles in one query.
+
+        Args:
+            system_user_id: ID of the system_user (User model)
+
+        Returns:
+            StaffRole (base_staff.system_user already loaded) or None when
+            the user does not exist or has no staff profile
+        '''
+        if system_user_id not in self._loaded:
+            base_staff: BaseStaff | None = self._staff_queryset().select_related(
+                'system_user'
+            ).filter(system_user_id=system_user_id).first()
+            self._loaded[system_user_id] = (
+                self._role_from_base_staff(base_staff) if base_staff is not None else None
+            )
+        return self._loaded[system_user_id]
+
+    def resolve(
+        self,
+        user: User
+    ) -> StaffRole:
+        '''Load staff profile and all three profile tables in one query.'''
+        if user is None or not user.is_authenticated:
+            return StaffRole(role=None)
+        base_staff: BaseStaff | None = self._staff_queryset().filter(system_user_id=user.pk).first()
+        if base_staff is None:
+            return StaffRole(role='superuser' if user.is_superuser else None)
+        # Cache both sides so user.staff_profile and base_staff.system_user need no query
+        user.staff_profile = base_staff
+        return self._role_from_base_staff(base_staff)
+
+    def resolve_loaded(
+        self,
+        user: User
+    ) -> StaffRole:
+        '''
+        Build and memoize the role of a user whose staff profile and
+        profiles were already joined (see USER_SELECT_RELATED); no query.
+        '''
+        base_staff: BaseStaff | None = getattr(user, 'staff_profile', None)
+        if base_staff is None:
+            staff_role: StaffRole = StaffRole(role='superuser' if user.is_superuser else None)
+        else:
+            staff_role = self._role_from_base_staff(base_staff)
+        self.attach(user, staff_role)
+        return staff_role
+
+    def attach(
+        self,
+        user: User,
+        staff_role: StaffRole
+    ) -> None:
+        '''Memoize a resolved role on the user instance.'''
+        setattr(user, self.CACHE_ATTRIBUTE, staff_role)
+
+    def invalidate(
+        self,
+        user: User
+    ) -> None:
+        '''Drop the memoized role (e.g. after the user's profile changes).'''
+        if hasattr(user, self.CACHE_ATTRIBUTE):
+            delattr(user, self.CACHE_ATTRIBUTE)
+
+    # ------------------------------------------------------------------
+    # PRIVATE METHODS
+    # ------------------------------------------------------------------
+    def _staff_queryset(self) -> QuerySet[BaseStaff]:
+        '''BaseStaff joined with its three one-to-one profiles.'''
+        return BaseStaff.objects.select_related(
+            'healthcare_profile',
+            'driver_profile',
+            'administrative_profile'
+        )
+
+    def _role_from_base_staff(
+        self,
+        base_staff: BaseStaff
+    ) -> StaffRole:
+        '''Pick the specific profile already loaded by _staff_queryset().'''
+        for role, relation in self.PROFILE_RELATIONS:
+            profile = getattr(base_staff, relation, None)
+            if profile is not None:
+                return StaffRole(role=role, base_staff=base_staff, profile=profile)
+        return StaffRole(role=None, base_staff=base_staff)
@@ -1,17 +1,28 @@
+from typing import Any
 from django.db import transaction
+from django.db.models import (
+    Q,
+    QuerySet
+)
 from django.contrib.auth.models import User
 from staff.models.base_staff import BaseStaff
 from staff.models.healthcare import Healthcare
 from staff.models.driver import Driver
 from staff.models.administrative import Administrative
+from .auth_token_cache import AuthTokenCache
+from .staff_role_resolver import StaffRoleResolver
 from staff.types.dataclass import (
     UserListItem, 
+    UserListCursor,
+    UserListRequest,
+    UserListResponse,
     UserDetailResponse,
     ProfileInformationResponse,
     CreateUserRequest,
     CreateUserResponse,
     EditProfileRequest,
-    EditProfileResponse
+    EditProfileResponse,
+    StaffRole
 ) 
 from datetime import datetime
 import logging
@@ -21,33 +32,97 @@ class UserDomainService:
     
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Shared loader for staff profiles, memoized for the lifetime of this service (one request)
+        self.staff_role_resolver: StaffRoleResolver = StaffRoleResolver()
     
-    def get_all_staff_users(self) -> list[UserListItem]:
+    def list_staff_users(
+        self,
+        list_request: UserListRequest
+    ) -> UserListResponse:
         '''
-        Retrieve all staff users with their basic information.
+        Retrieve one page of staff users using keyset pagination.
         
+        Users are ordered newest first by (created_at, id); the cursor is the
+        position of the last row of the previous page, so every page costs
+        the same regardless of how deep the client has paged. Only the
+        columns needed for the list are fetched.
+        
+        total_count costs a second query: a COUNT over every user matching
+        the filters (the cursor is ignored), which grows with the table.
+        
+        Args:
+            list_request: UserListRequest with filters, page size and cursor
+            
         Returns:
-            list of UserListItem dataclasses
+            UserListResponse with the page, its size, the total matching the
+            filters and the next cursor
         '''
         try:
-            # Query all BaseStaff with related system_user
-            base_staff_list: list[BaseStaff] = BaseStaff.objects.select_related('system_user').all()
-            user_items: list[UserListItem] = []
-            for base_staff in base_staff_list:
-                user: User = base_staff.system_user
-                # Build full name
-                full_name: str = user.get_full_name() or user.username
-                user_item: UserListItem = UserListItem(
-                    system_user_id=user.id,
-                    full_name=full_name,
-                    is_active=user.is_active,
-                    document_type=base_staff.document_type,
-                    document_number=base_staff.document_number,
-                    type_personnel=base_staff.type_personnel
+            queryset: QuerySet[BaseStaff] = BaseStaff.objects.all()
+            if list_request.type_personnel:
+                queryset = queryset.filter(type_personnel=list_request.type_personnel)
+            if list_request.is_active is not None:
+                queryset = queryset.filter(system_user__is_active=list_request.is_active)
+            if list_request.search:
+                # Every word must match the name, username or document number
+                for word in list_request.search.split():
+                    queryset = queryset.filter(
+                        Q(system_user__first_name__icontains=word) |
+                        Q(system_user__last_name__icontains=word) |
+                        Q(system_user__username__icontains=word) |
+                        Q(document_number__istartswith=word)
+                    )
+            total_count: int = queryset.count()
+            if list_request.cursor is not None:
+                queryset = queryset.filter(
+                    Q(created_at__lt=list_request.cursor.created_at) |
+                    Q(created_at=list_request.cursor.created_at, id__lt=list_request.cursor.id)
+                )
+            # One extra row tells whether another page exists
+            rows: list[dict[str, Any]] = list(
+                queryset.order_by('-created_at', '-id').values(
+                    'id',
+                    'created_at',
+                    'document_type',
+                    'document_number',
+                    'type_personnel',
+                    'system_user_id',
+                    'system_user__username',
+                    'system_user__first_name',
+                    'system_user__last_name',
+                    'system_user__is_active'
+                )[:list_request.limit + 1]
+            )
+            has_more: bool = len(rows) > list_request.limit
+            rows = rows[:list_request.limit]
+            user_items: list[UserListItem] = [
+                UserListItem(
+                    system_user_id=row['system_user_id'],
+                    full_name=(
+                        f"{row['system_user__first_name']} {row['system_user__last_name']}".strip()
+                        or row['system_user__username']
+                    ),
+                    is_active=row['system_user__is_active'],
+                    document_type=row['document_type'],
+                    document_number=row['document_number'],
+                    type_personnel=row['type_personnel']
                 )
-                user_items.append(user_item)
-            self.logger.info(f'Retrieved {len(user_items)} staff users')
-            return user_items
+                for row in rows
+            ]
+            next_cursor: str | None = None
+            if has_more:
+                next_cursor = UserListCursor(
+                    created_at=rows[-1]['created_at'],
+                    id=rows[-1]['id']
+                ).encode()
+            self.logger.info(f'Retrieved {len(user_items)} of {total_count} staff users (has_more={has_more})')
+            return UserListResponse(
+                users=user_items,
+                count=len(user_items),
+                total_count=total_count,
+                next_cursor=next_cursor,
+                has_more=has_more
+            )
         except Exception as e:
             self.logger.error(f'Error retrieving staff users: {str(e)}', exc_info=True)
             raise
@@ -66,59 +141,21 @@ class UserDomainService:
             UserDetailResponse dataclass with all user information or None
         '''
         try:
-            # Get User directly by system_user_id
-            user: User = User.objects.get(id=system_user_id)
-            # Check if user has a BaseStaff profile
-            try:
-                base_staff: BaseStaff = BaseStaff.objects.select_related('system_user').get(system_user=user)
-            except BaseStaff.DoesNotExist:
-                self.logger.warning(f'User {user.username} (id: {system_user_id}) does not have a staff profile')
+            # User, BaseStaff and the three profiles in a single query
+            staff_role: StaffRole | None = self.staff_role_resolver.for_system_user_id(system_user_id)
+            if staff_role is None:
+                self.logger.warning(f'No staff profile found for system_user_id: {system_user_id}')
                 return None
-            # Check if user is superuser
-            if user.is_superuser:
-                staff_type = 'superuser'
-                specific_data = {
-                    'is_superuser': True,
-                    'permissions': 'full_access',
-                    'role': 'System Administrator'
-                }
-                self.logger.info(f'Retrieved superuser detail for system_user_id: {system_user_id}')
-            else:
-                # Determine staff type and get specific data
-                staff_type: str | None = None
-                specific_data: dict | None = None
-                # Check Healthcare
-                if hasattr(base_staff, 'healthcare_profile'):
-                    staff_type = 'healthcare'
-                    healthcare: Healthcare = base_staff.healthcare_profile
-                    specific_data = {
-                        'professional_registration': healthcare.professional_registration,
-                        'professional_position': healthcare.professional_position,
-                    }
-                # Check Driver
-                elif hasattr(base_staff, 'driver_profile'):
-                    staff_type = 'driver'
-                    driver: Driver = base_staff.driver_profile
-                    specific_data = {
-                        'license_number': driver.license_number,
-                        'license_category': driver.license_category,
-                        'license_issue_date': driver.license_issue_date.isoformat() if driver.license_issue_date else None,
-                        'license_expiry_date': driver.license_expiry_date.isoformat() if driver.license_expiry_date else None,
-                        'blood_type': getattr(driver, 'blood_type', None)
-                    }
-                # Check Administrative
-                elif hasattr(base_staff, 'administrative_profile'):
-                    staff_type = 'administrative'
-                    administrative: Administrative = base_staff.administrative_profile
-                    specific_data = {
-                        'department': administrative.department,
-                        'role': administrative.role,
-                        'access_level': administrative.access_level
-                    }
+            base_staff: BaseStaff = staff_role.base_staff
+            user: User = base_staff.system_user
+            # Determine staff type and get specific data
+            staff_type: str | None
+            specific_data: dict | None
+            staff_type, specific_data = self._specific_profile_data(user, staff_role)
             # Build full name
             full_name: str = user.get_full_name() or user.username
-            # Get signature URL
-            signature_url: str | None = base_staff.signature if base_staff.signature else None
+            # BaseStaff.signature was removed (migration 0002)
+            signature_url: str | None = None
             # Build response
             user_detail: UserDetailResponse = UserDetailResponse(
                 # System User data
@@ -148,9 +185,6 @@ class UserDomainService:
             )
             self.logger.info(f'Retrieved user detail for system_user_id: {system_user_id}, staff_type: {staff_type}')
             return user_detail
-        except User.DoesNotExist:
-            self.logger.warning(f'User not found with system_user_id: {system_user_id}')
-            return None
         except Exception as e:
             self.logger.error(f'Error retrieving user detail: {str(e)}', exc_info=True)
             raise
@@ -187,7 +221,9 @@ class UserDomainService:
             # Update user status
             old_status: bool = user.is_active
             user.is_active = new_status
-            user.save()
+            user.save(update_fields=['is_active'])
+            # Deactivated users must stop authenticating from cached tokens
+            self._invalidate_cached_tokens(user.id)
             status_text = 'activo' if new_status else 'inactivo'
             self.logger.info(
                 f'User {user.username} (system_user_id: {system_user_id}) status changed from {old_status} to {new_status}'
@@ -215,56 +251,20 @@ class UserDomainService:
             ProfileInformationResponse dataclass with user profile information or None
         '''
         try:
-            # Check if user has a BaseStaff profile
-            try:
-                base_staff: BaseStaff = BaseStaff.objects.select_related('system_user').get(system_user=user)
-            except BaseStaff.DoesNotExist:
+            # Memoized on the user by the authentication class (single joined query otherwise)
+            staff_role: StaffRole = self.staff_role_resolver.for_user(user)
+            if staff_role.base_staff is None:
                 self.logger.warning(f'User {user.username} (id: {user.id}) does not have a staff profile')
                 return None
+            base_staff: BaseStaff = staff_role.base_staff
             # Build full name
             full_name: str = user.get_full_name() or user.username
-            # Get signature URL
-            signature_url: str | None = base_staff.signature if base_staff.signature else None
+            # BaseStaff.signature was removed (migration 0002)
+            signature_url: str | None = None
             # Determine staff type and get specific data
-            staff_type: str | None = None
-            specific_data: dict | None = None
-            # Check if user is superuser
-            if user.is_superuser:
-                staff_type = 'superuser'
-                specific_data = {
-                    'is_superuser': True,
-                    'permissions': 'full_access',
-                    'role': 'System Administrator'
-                }
-                self.logger.info(f'Retrieved superuser profile for user: {user.username}')
-            # Check Healthcare
-            elif hasattr(base_staff, 'healthcare_profile'):
-                staff_type = 'healthcare'
-                healthcare: Healthcare = base_staff.healthcare_profile
-                specific_data = {
-                    'professional_registration': healthcare.professional_registration,
-                    'professional_position': healthcare.professional_position
-                }
-            # Check Driver
-            elif hasattr(base_staff, 'driver_profile'):
-                staff_type = 'driver'
-                driver: Driver = base_staff.driver_profile
-                specific_data = {
-                    'license_number': driver.license_number,
-                    'license_category': driver.license_category,
-                    'license_issue_date': driver.license_issue_date.isoformat() if driver.license_issue_date else None,
-                    'license_expiry_date': driver.license_expiry_date.isoformat() if driver.license_expiry_date else None,
-                    'blood_type': getattr(driver, 'blood_type', None)
-                }
-            # Check Administrative
-            elif hasattr(base_staff, 'administrative_profile'):
-                staff_type = 'administrative'
-                administrative: Administrative = base_staff.administrative_profile
-                specific_data = {
-                    'department': administrative.department,
-                    'role': administrative.role,
-                    'access_level': administrative.access_level
-                }
+            staff_type: str | None
+            specific_data: dict | None
+            staff_type, specific_data = self._specific_profile_data(user, staff_role)
             # Build response
             profile_info: ProfileInformationResponse = ProfileInformationResponse(
                 # System User data (sin campos sensibles)
@@ -463,9 +463,14 @@ class UserDomainService:
             if profile_request.password is not None:
                 user.set_password(profile_request.password)
                 fields_updated.append('password')
-            # Save user if any field was updated
-            if any(field in fields_updated for field in ['username', 'email', 'first_name', 'last_name', 'password']):
-                user.save()
+            # Save only the changed columns: `user` is the (possibly cached) request
+            # user, whose is_active/is_staff/last_login snapshot may be stale
+            user_fields: list[str] = [
+                field for field in fields_updated
+                if field in ('username', 'email', 'first_name', 'last_name', 'password')
+            ]
+            if user_fields:
+                user.save(update_fields=user_fields)
                 self.logger.info(f'Updated system user fields for: {user.username}')
             # Step 4: Update Base Staff fields
             if profile_request.document_type is not None:
@@ -543,6 +548,9 @@ class UserDomainService:
                 if any(field in fields_updated for field in ['department', 'role', 'access_level']):
                     specific_profile.save()
                     self.logger.info(f'Updated administrative profile for: {user.username}')
+            # Cached tokens hold a snapshot of the user and profile (password changes included)
+            if fields_updated:
+                self._invalidate_cached_tokens(user.id)
             # Step 6: Build response
             response: EditProfileResponse = EditProfileResponse(
                 system_user_id=user.id,
@@ -635,9 +643,13 @@ class UserDomainService:
             if profile_request.password is not None:
                 user.set_password(profile_request.password)
                 fields_updated.append('password')
-            # Save user if any field was updated
-            if any(field in fields_updated for field in ['username', 'email', 'first_name', 'last_name', 'password']):
-                user.save()
+            # Save only the changed columns so concurrent status changes are kept
+            user_fields: list[str] = [
+                field for field in fields_updated
+                if field in ('username', 'email', 'first_name', 'last_name', 'password')
+            ]
+            if user_fields:
+                user.save(update_fields=user_fields)
                 self.logger.info(f'Admin {admin_user.username} updated system user fields for: {user.username}')
             # Step 5: Update Base Staff fields
             if profile_request.document_type is not None:
@@ -715,6 +727,9 @@ class UserDomainService:
                 if any(field in fields_updated for field in ['department', 'role', 'access_level']):
                     specific_profile.save()
                     self.logger.info(f'Admin {admin_user.username} updated administrative profile for: {user.username}')
+            # Cached tokens hold a snapshot of the user and profile (password changes included)
+            if fields_updated:
+                self._invalidate_cached_tokens(user.id)
             # Step 7: Build response
             response: EditProfileResponse = EditProfileResponse(
                 system_user_id=user.id,
@@ -734,4 +749,62 @@ class UserDomainService:
             self.logger.error(f'Error updating user profile by admin: {str(e)}', exc_info=True)
             # Transaction will be rolled back automatically
             return (False, f'Ocurrió un error al actualizar el perfil de usuario: {str(e)}', None)
-        
\ No newline at end of file
+        
+
+    def _specific_profile_data(
+        self,
+        user: User,
+        staff_role: StaffRole
+    ) -> tuple[str | None, dict | None]:
+        '''
+        Build staff type and profile specific data from a resolved role.
+        Superusers take precedence over any staff profile.
+        
+        Args:
+            user: System user the role belongs to
+            staff_role: StaffRole with the profile already loaded
+            
+        Returns:
+            tuple of (staff_type, specific_data)
+        '''
+        if user.is_superuser:
+            return ('superuser', {
+                'is_superuser': True,
+                'permissions': 'full_access',
+                'role': 'System Administrator'
+            })
+        if staff_role.is_healthcare:
+            healthcare: Healthcare = staff_role.profile
+            return ('healthcare', {
+                'professional_registration': healthcare.professional_registration,
+                'professional_position': healthcare.professional_position
+            })
+        if staff_role.is_driver:
+            driver: Driver = staff_role.profile
+            return ('driver', {
+                'license_number': driver.license_number,
+                'license_category': driver.license_category,
+                'license_issue_date': driver.license_issue_date.isoformat() if driver.license_issue_date else None,
+                'license_expiry_date': driver.license_expiry_date.isoformat() if driver.license_expiry_date else None,
+                'blood_type': getattr(driver, 'blood_type', None)
+            })
+        if staff_role.role == 'administrative':
+            administrative: Administrative = staff_role.profile
+            return ('administrative', {
+                'department': administrative.department,
+                'role': administrative.role,
+                'access_level': administrative.access_level
+            })
+        return (None, None)
+
+    def _invalidate_cached_tokens(
+        self,
+        system_user_id: int
+    ) -> None:
+        '''
+        Drop the user's cached tokens once the current transaction commits,
+        so a concurrent request cannot re-cache the old snapshot.
+        '''
+        transaction.on_commit(
+            lambda: AuthTokenCache.get_instance().invalidate_user(system_user_id)
+        )
\ No newline at end of file
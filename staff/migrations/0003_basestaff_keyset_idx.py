@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('staff', '0002_remove_basestaff_signature_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='basestaff',
+            index=models.Index(fields=['-created_at', '-id'], name='basestaff_keyset_idx'),
+        ),
+    ]
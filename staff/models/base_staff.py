@@ -39,6 +39,10 @@ class BaseStaff(TimeStampedModel):
         verbose_name = 'Base Staff'
         verbose_name_plural = 'Base Staffs'
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination of the users list: ORDER BY created_at DESC, id DESC
+            models.Index(fields=['-created_at', '-id'], name='basestaff_keyset_idx'),
+        ]
 
 
     def __str__(self):
@@ -2,10 +2,12 @@ from .login_serializer import LoginSerializer
 from .change_status_serializer import ChangeUserStatusSerializer
 from .create_user_serializer import CreateUserSerializer
 from .edit_profile_serializer import EditProfileSerializer
+from .list_users_serializer import ListUsersSerializer
 
 __all__ = [
     'LoginSerializer',
     'ChangeUserStatusSerializer',
     'CreateUserSerializer',
-    'EditProfileSerializer'
-]
\ No newline at end of file
+    'EditProfileSerializer',
+    'ListUsersSerializer'
+]
@@ -0,0 +1,46 @@
+from rest_framework import serializers
+from staff.types.dataclass import UserListCursor
+
+class ListUsersSerializer(serializers.Serializer):
+    '''Serializer for list users query parameters (filters and keyset cursor).'''
+    limit: serializers.IntegerField = serializers.IntegerField(
+        required=False,
+        default=20,
+        min_value=1,
+        max_value=100,
+        help_text='Page size (1-100, default 20)'
+    )
+    cursor: serializers.CharField = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text='next_cursor value returned by the previous page'
+    )
+    type_personnel: serializers.ChoiceField = serializers.ChoiceField(
+        required=False,
+        choices=['Healthcare', 'Administrative', 'Driver'],
+        help_text='Filter by type of staff personnel'
+    )
+    is_active: serializers.BooleanField = serializers.BooleanField(
+        required=False,
+        allow_null=True,
+        default=None,
+        help_text='Filter by active status (true/false)'
+    )
+    search: serializers.CharField = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        max_length=100,
+        help_text='Search by name, username or document number'
+    )
+
+    def validate_cursor(
+        self,
+        value: str
+    ) -> UserListCursor | None:
+        '''Decode the opaque cursor into its (created_at, id) position.'''
+        if not value:
+            return None
+        try:
+            return UserListCursor.decode(value)
+        except ValueError:
+            raise serializers.ValidationError('Cursor inválido.')
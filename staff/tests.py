@@ -0,0 +1,185 @@
+from datetime import date
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from staff.domain_service import (
+    AuthTokenCache,
+    UserDomainService
+)
+from staff.models import (
+    BaseStaff,
+    Healthcare,
+    Driver,
+    Administrative
+)
+
+
+class StaffFixtureMixin:
+    '''One user per staff type, with tokens for the admin and healthcare users.'''
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_user('admin', 'admin@test.com', 'secret')
+        admin_staff = BaseStaff.objects.create(
+            system_user=cls.admin_user,
+            document_type='CC',
+            document_number='100',
+            type_personnel='Administrative'
+        )
+        Administrative.objects.create(
+            base_staff=admin_staff,
+            department='Operaciones',
+            role='Coordinador',
+            access_level='full'
+        )
+        cls.healthcare_user = User.objects.create_user('nurse', 'nurse@test.com', 'secret')
+        healthcare_staff = BaseStaff.objects.create(
+            system_user=cls.healthcare_user,
+            document_type='CC',
+            document_number='200',
+            type_personnel='Healthcare'
+        )
+        Healthcare.objects.create(
+            base_staff=healthcare_staff,
+            professional_registration='RM-1',
+            professional_position='Enfermera'
+        )
+        cls.driver_user = User.objects.create_user('driver', 'driver@test.com', 'secret')
+        driver_staff = BaseStaff.objects.create(
+            system_user=cls.driver_user,
+            document_type='CC',
+            document_number='300',
+            type_personnel='Driver'
+        )
+        Driver.objects.create(
+            base_staff=driver_staff,
+            license_number='LIC-1',
+            license_category='C2',
+            license_issue_date=date(2020, 1, 1),
+            license_expiry_date=date(2030, 1, 1),
+            blood_type='O+'
+        )
+        cls.admin_token = Token.objects.create(user=cls.admin_user)
+        cls.healthcare_token = Token.objects.create(user=cls.healthcare_user)
+
+    def setUp(self):
+        AuthTokenCache.get_instance().clear()
+
+
+class StaffDetailQueryCountTests(StaffFixtureMixin, TestCase):
+    '''Pins the staff detail loaders to a single SQL statement.'''
+
+    def test_get_user_detail_by_system_user_id_uses_one_query(self):
+        expected = {
+            self.admin_user.id: 'administrative',
+            self.healthcare_user.id: 'healthcare',
+            self.driver_user.id: 'driver'
+        }
+        for system_user_id, staff_type in expected.items():
+            with self.assertNumQueries(1):
+                user_detail = UserDomainService().get_user_detail_by_system_user_id(system_user_id)
+            self.assertEqual(user_detail.staff_type, staff_type)
+
+    def test_get_user_detail_by_system_user_id_missing_user_uses_one_query(self):
+        with self.assertNumQueries(1):
+            self.assertIsNone(UserDomainService().get_user_detail_by_system_user_id(999999))
+
+    def test_get_profile_information_uses_one_query(self):
+        for user in (self.admin_user, self.healthcare_user, self.driver_user):
+            fresh_user = User.objects.get(pk=user.pk)
+            with self.assertNumQueries(1):
+                profile_info = UserDomainService().get_profile_information(fresh_user)
+            self.assertEqual(profile_info.system_user_id, user.id)
+            self.assertIsNotNone(profile_info.specific_data)
+
+    def test_get_detail_user_endpoint_uses_one_query(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {self.admin_token.key}')
+        url = reverse('staff_get_detail_user', args=[self.driver_user.id])
+        # First request warms the token cache (token, user and role)
+        self.assertEqual(client.get(url).status_code, 200)
+        with self.assertNumQueries(1):
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_get_profile_information_endpoint_uses_one_query(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {self.healthcare_token.key}')
+        url = reverse('staff_get_profile_information')
+        # Cold cache: token, user, staff profile and role in one joined query
+        with self.assertNumQueries(1):
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        # Warm cache: profile comes from the token snapshot
+        with self.assertNumQueries(0):
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+
+class AuthTokenCacheInvalidationTests(StaffFixtureMixin, TestCase):
+    '''Token revocation, deactivation and password changes must evict cached tokens.'''
+
+    def _warm(self, token):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        self.assertEqual(client.get(reverse('staff_get_profile_information')).status_code, 200)
+        self.assertIsNotNone(AuthTokenCache.get_instance().get(token.key))
+        return client
+
+    def test_logout_evicts_cached_token(self):
+        client = self._warm(self.healthcare_token)
+        self.assertEqual(client.post(reverse('staff_logout')).status_code, 200)
+        self.assertIsNone(AuthTokenCache.get_instance().get(self.healthcare_token.key))
+        self.assertEqual(client.get(reverse('staff_get_profile_information')).status_code, 401)
+
+    def test_deactivation_evicts_cached_token(self):
+        client = self._warm(self.healthcare_token)
+        admin_client = APIClient()
+        admin_client.credentials(HTTP_AUTHORIZATION=f'Token {self.admin_token.key}')
+        with self.captureOnCommitCallbacks(execute=True):
+            response = admin_client.put(
+                reverse('staff_change_user_status', args=[self.healthcare_user.id]),
+                {'status': False},
+                format='json'
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(AuthTokenCache.get_instance().get(self.healthcare_token.key))
+        self.assertEqual(client.get(reverse('staff_get_profile_information')).status_code, 401)
+
+    def test_password_change_evicts_cached_token(self):
+        client = self._warm(self.healthcare_token)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.put(reverse('staff_edit_profile'), {'password': 'new-secret-1'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(AuthTokenCache.get_instance().get(self.healthcare_token.key))
+        self.assertTrue(User.objects.get(pk=self.healthcare_user.pk).check_password('new-secret-1'))
+
+    def test_profile_update_keeps_status_changed_elsewhere(self):
+        client = self._warm(self.healthcare_token)
+        # Another worker changes the status flags; this worker's local cache
+        # still holds the old snapshot until its TTL expires
+        User.objects.filter(pk=self.healthcare_user.pk).update(is_active=False, is_staff=True)
+        response = client.put(reverse('staff_edit_profile'), {'first_name': 'Ana'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        user = User.objects.get(pk=self.healthcare_user.pk)
+        self.assertEqual(user.first_name, 'Ana')
+        self.assertFalse(user.is_active)
+        self.assertTrue(user.is_staff)
+
+
+class ListUsersTests(StaffFixtureMixin, TestCase):
+    '''list_users/ pages with count (page size) and total_count (all matches).'''
+
+    def test_count_and_total_count(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {self.admin_token.key}')
+        url = reverse('staff_list_users')
+        data = client.get(url, {'limit': 2}).json()['data']
+        self.assertEqual((data['count'], data['total_count'], data['has_more']), (2, 3, True))
+        data = client.get(url, {'limit': 2, 'cursor': data['next_cursor']}).json()['data']
+        self.assertEqual((data['count'], data['total_count'], data['has_more']), (1, 3, False))
+        data = client.get(url, {'type_personnel': 'Driver'}).json()['data']
+        self.assertEqual((data['count'], data['total_count']), (1, 1))
+        self.assertEqual(data['users'][0]['system_user_id'], self.driver_user.id)
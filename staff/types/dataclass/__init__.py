@@ -4,6 +4,7 @@ from .logout_request import LogoutRequest
 from .change_user_status_request import ChangeUserStatusRequest
 from .create_user_request import CreateUserRequest
 from .edit_profile_request import EditProfileRequest
+from .user_list_request import UserListRequest
 
 # Response
 from .login_response import LoginResponse
@@ -19,6 +20,8 @@ from .driver_response import DriverResponse
 
 # Other types
 from .user_list_item import UserListItem
+from .user_list_cursor import UserListCursor
+from .staff_role import StaffRole
 
 __all__ = [
     # Request
@@ -27,6 +30,7 @@ __all__ = [
     'ChangeUserStatusRequest',
     'CreateUserRequest',
     'EditProfileRequest',
+    'UserListRequest',
     # Response
     'LoginResponse',
     'LogoutResponse',
@@ -39,5 +43,7 @@ __all__ = [
     'EditProfileResponse',
     'DriverResponse',
     # Other types
-    'UserListItem'
+    'UserListItem',
+    'UserListCursor',
+    'StaffRole'
 ]
\ No newline at end of file
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Any
+
+@dataclass(frozen=True)
+class StaffRole:
+    '''Resolved role of the authenticated user, shared by every application service'''
+    role: str | None
+    base_staff: Any = None
+    profile: Any = None
+
+    @property
+    def is_healthcare(self) -> bool:
+        return self.role == 'healthcare'
+
+    @property
+    def is_driver(self) -> bool:
+        return self.role == 'driver'
+
+    @property
+    def is_admin(self) -> bool:
+        # Superusers without a staff profile keep administrative rights
+        return self.role in ('administrative', 'superuser')
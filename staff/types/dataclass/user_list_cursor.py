@@ -0,0 +1,29 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime
+import base64
+import json
+
+@dataclass(frozen=True)
+class UserListCursor:
+    '''Keyset position (created_at, id) of the last user returned in a page'''
+    created_at: datetime
+    id: int
+
+    def encode(self) -> str:
+        '''Opaque, URL-safe representation sent to the client.'''
+        raw: bytes = json.dumps([self.created_at.isoformat(), self.id]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def decode(
+        cls,
+        value: str
+    ) -> UserListCursor:
+        '''Inverse of encode(); raises ValueError on malformed input.'''
+        try:
+            padded: str = value + '=' * (-len(value) % 4)
+            created_at, staff_id = json.loads(base64.urlsafe_b64decode(padded))
+            return cls(created_at=datetime.fromisoformat(created_at), id=int(staff_id))
+        except (TypeError, ValueError, json.JSONDecodeError) as e:
+            raise ValueError('Invalid cursor') from e
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from .user_list_cursor import UserListCursor
+
+@dataclass
+class UserListRequest:
+    '''Data Transfer Object for user list request (filters and keyset cursor)'''
+    limit: int = 20
+    cursor: UserListCursor | None = None
+    type_personnel: str | None = None
+    is_active: bool | None = None
+    search: str | None = None
@@ -5,4 +5,9 @@ from .user_list_item import UserListItem
 class UserListResponse:
     '''Data Transfer Object for user list response'''
     users: list[UserListItem]
-    total_count: int
\ No newline at end of file
+    # Users in this page
+    count: int
+    # Users matching the filters across all pages
+    total_count: int
+    next_cursor: str | None = None
+    has_more: bool = False
@@ -1,6 +1,6 @@
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.authentication import TokenAuthentication
+from staff.authentication import CachedTokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from core.views.base_view import BaseView
 from staff.application_service.get_detail_user_application_service import GetDetailUserApplicationService
@@ -9,7 +9,7 @@ from django.contrib.auth.models import User
 
 class GetDetailUserView(BaseView):
     
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
     
     def get(
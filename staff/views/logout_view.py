@@ -1,6 +1,6 @@
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.authentication import TokenAuthentication
+from staff.authentication import CachedTokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from typing import Any
 from django.contrib.auth.models import User
@@ -10,7 +10,7 @@ from staff.types.dataclass import LogoutRequest
 
 class LogoutView(BaseView):
 
-    authentication_classes = [TokenAuthentication]  # Protected endpoint
+    authentication_classes = [CachedTokenAuthentication]  # Protected endpoint
     permission_classes = [IsAuthenticated]  # Requires authentication
     
     def post(
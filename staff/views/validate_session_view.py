@@ -1,6 +1,6 @@
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.authentication import TokenAuthentication
+from staff.authentication import CachedTokenAuthentication
 from rest_framework.permissions import IsAuthenticated
 from core.views.base_view import BaseView
 from staff.application_service import ValidateSessionApplicationService
@@ -53,7 +53,7 @@ class ValidateSessionView(BaseView):
         }
     '''
     
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [IsAuthenticated]
     
     def get(
@@ -72,7 +72,7 @@ class ValidateSessionView(BaseView):
         '''
         def service_callback(user: User) -> dict[str, Any]:
             validate_session_service: ValidateSessionApplicationService = ValidateSessionApplicationService()
-            return validate_session_service.validate_session(user)
+            return validate_session_service.validate_session(user, request.auth)
         
         return self._handle_request(
             request=request,